@@ -0,0 +1,7 @@
+"""
+Scaling benchmarks of the FLYNC SDK.
+
+:mod:`benchmarks.synthetic` generates deterministic workspaces of any size from ``examples/flync_example``, and
+:mod:`benchmarks.run` times the SDK's hot paths against them, appending every run to a JSON history file so that
+regressions show up as changed scaling curves. Run ``python -m benchmarks.run --help`` from the repository root.
+"""
@@ -0,0 +1,323 @@
+"""
+Time the FLYNC SDK's hot paths against synthetic workspaces of growing size.
+
+For every scale factor a workspace is generated with :func:`benchmarks.synthetic.generate_workspace` and each benchmark in
+:data:`BENCHMARKS` is run ``--repeat`` times. The best and median wall times are printed and appended, together with the
+workspace size and the environment, to a JSON history file (a list of runs, oldest first). The memory the object map
+adds per object is measured once per scale as well, unless ``--no-memory`` is given.
+
+Example::
+
+    python -m benchmarks.run --scales 1 2 4 8 --repeat 3
+"""
+
+import argparse
+import datetime
+import gc
+import importlib.metadata
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from flync.sdk.context.workspace_config import WorkspaceConfiguration
+from flync.sdk.helpers.generation_helpers import dump_flync_workspace
+from flync.sdk.workspace.flync_workspace import FLYNCWorkspace
+from flync.sdk.workspace.ids import ObjectId
+from flync_converter.converters.dbc_converter import write_dbc_files
+
+from .synthetic import SyntheticScale, generate_workspace
+
+DEFAULT_HISTORY = Path(__file__).resolve().parent / "results" / "history.json"
+
+#: Number of object ids sampled for the per-object lookups, spread evenly over the workspace.
+LOOKUP_SAMPLE = 1000
+
+#: The document rewritten by the ``update_document`` benchmark, and the two contents it alternates between.
+_UPDATED_DOCUMENT = "ecus/syn_ecu_0001/ports.flync.yaml"
+_UPDATED_FIELD = ("      role: slave\n", "      role: master\n")
+#: Number of ECUs whose ports documents the ``update_documents`` benchmark rewrites in one batch.
+_BATCH_ECUS = 10
+
+
+@dataclass
+class BenchmarkSubject(object):
+    """
+    A generated workspace and what the benchmarks need to run against it.
+
+    Attributes:
+        path (Path): Root of the generated workspace.
+        workspace (FLYNCWorkspace): The workspace loaded with object mapping, shared by the non-loading benchmarks.
+        scratch (Path): Directory the writing benchmarks may use freely; it also holds the parse cache of ``warm_load``.
+        sample (List[ObjectId]): Object ids the per-object lookups query.
+    """
+
+    path: Path
+    workspace: FLYNCWorkspace
+    scratch: Path
+    sample: List[ObjectId]
+
+
+def _load(path: Path, parse_cache_dir: Optional[Path] = None) -> FLYNCWorkspace:
+    # a parse cache of its own, so the runs neither reuse nor fill the user's cache
+    config = WorkspaceConfiguration(
+        map_objects=True, parse_cache=parse_cache_dir is not None, parse_cache_dir=str(parse_cache_dir) if parse_cache_dir else None
+    )
+    return FLYNCWorkspace.load_workspace("benchmark", path, workspace_config=config)
+
+
+def bench_cold_load(subject: BenchmarkSubject) -> None:
+    _load(subject.path)
+
+
+def bench_warm_load(subject: BenchmarkSubject) -> None:
+    _load(subject.path, parse_cache_dir=subject.scratch)
+
+
+def bench_snapshot_load(subject: BenchmarkSubject) -> None:
+    snapshot = subject.scratch / "benchmark.snapshot"
+    if FLYNCWorkspace.load_snapshot(subject.path, WorkspaceConfiguration(map_objects=True), snapshot) is None:
+        raise RuntimeError("the benchmark snapshot is stale")
+
+
+def bench_subtree_load(subject: BenchmarkSubject) -> None:
+    config = WorkspaceConfiguration(map_objects=True)
+    FLYNCWorkspace.safe_load_subtree("benchmark", subject.path, "ecus.syn_ecu_0001", workspace_config=config)
+
+
+def _toggle(document: Path) -> None:
+    text = document.read_text()
+    old, new = _UPDATED_FIELD if _UPDATED_FIELD[0] in text else reversed(_UPDATED_FIELD)
+    document.write_text(text.replace(old, new, 1))
+
+
+def bench_update_document(subject: BenchmarkSubject) -> None:
+    document = subject.path / _UPDATED_DOCUMENT
+    _toggle(document)
+    subject.workspace.update_document(document)
+
+
+def bench_update_documents(subject: BenchmarkSubject) -> None:
+    documents = [subject.path / f"ecus/syn_ecu_{ecu:04d}/ports.flync.yaml" for ecu in range(1, _BATCH_ECUS + 1)]
+    for document in documents:
+        _toggle(document)
+    subject.workspace.update_documents(documents)
+
+
+def bench_objects_at(subject: BenchmarkSubject) -> None:
+    for object_id in subject.sample:
+        start = subject.workspace.sources[object_id].range.start
+        subject.workspace.objects_at(subject.workspace.sources[object_id].uri, start.line, start.character)
+
+
+def bench_get_references_of(subject: BenchmarkSubject) -> None:
+    for object_id in subject.sample:
+        subject.workspace.get_references_of(object_id)
+
+
+def bench_dump_flync_workspace(subject: BenchmarkSubject) -> None:
+    output = subject.scratch / "dump"
+    shutil.rmtree(output, ignore_errors=True)
+    dump_flync_workspace(subject.workspace.flync_model, output, "benchmark_dump")
+
+
+def bench_dump_fast_write(subject: BenchmarkSubject) -> None:
+    output = subject.scratch / "dump_fast"
+    shutil.rmtree(output, ignore_errors=True)
+    dump_flync_workspace(subject.workspace.flync_model, output, "benchmark_dump", WorkspaceConfiguration(fast_write=True))
+
+
+def bench_dump_unchanged(subject: BenchmarkSubject) -> None:
+    # run_scale dumps the workspace here up front, so the timed runs find (nearly) every file up to date
+    dump_flync_workspace(
+        subject.workspace.flync_model, subject.scratch / "dump_unchanged", "benchmark_dump", WorkspaceConfiguration(fast_write=True)
+    )
+
+
+def bench_dbc_export(subject: BenchmarkSubject) -> None:
+    output = subject.scratch / "dbc"
+    shutil.rmtree(output, ignore_errors=True)
+    output.mkdir()
+    write_dbc_files(subject.workspace.flync_model, str(output))
+
+
+#: Benchmark name -> callable timed against a :class:`BenchmarkSubject`.
+BENCHMARKS: Dict[str, Callable[[BenchmarkSubject], None]] = {
+    "cold_load": bench_cold_load,
+    "warm_load": bench_warm_load,
+    "snapshot_load": bench_snapshot_load,
+    "subtree_load": bench_subtree_load,
+    "update_document": bench_update_document,
+    "update_documents": bench_update_documents,
+    "objects_at": bench_objects_at,
+    "get_references_of": bench_get_references_of,
+    "dump_flync_workspace": bench_dump_flync_workspace,
+    "dump_fast_write": bench_dump_fast_write,
+    "dump_unchanged": bench_dump_unchanged,
+    "dbc_export": bench_dbc_export,
+}
+
+
+def _sample(workspace: FLYNCWorkspace, size: int) -> List[ObjectId]:
+    """Return up to ``size`` object ids with a source position, evenly spread in load order."""
+    ids = [object_id for object_id, source in workspace.sources.items() if source.range.start.line > 0]
+    step = max(1, len(ids) // size)
+    return ids[::step][:size]
+
+
+def measure_object_map_bytes(path: Path) -> int:
+    """
+    Return the memory a workspace loaded with object mapping retains on top of the same workspace loaded without it.
+
+    Both loads are traced with :mod:`tracemalloc`, which slows them down considerably; the difference covers the object
+    map, the source positions and the model-to-id index.
+
+    Args:
+        path (Path): Root of the workspace.
+
+    Returns:
+        int: The additional bytes retained by the object mapping.
+    """
+
+    retained = {}
+    for map_objects in (False, True):
+        config = WorkspaceConfiguration(map_objects=map_objects)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            workspace = FLYNCWorkspace.load_workspace("benchmark", path, workspace_config=config)
+            gc.collect()
+            retained[map_objects] = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        del workspace
+    return retained[True] - retained[False]
+
+
+def _time(benchmark: Callable[[BenchmarkSubject], None], subject: BenchmarkSubject, repeat: int) -> dict:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        benchmark(subject)
+        timings.append(time.perf_counter() - start)
+    return {"best_s": min(timings), "median_s": statistics.median(timings), "runs": len(timings)}
+
+
+def run_scale(factor: int, repeat: int, names: List[str], workdir: Path, memory: bool = True) -> dict:
+    """
+    Generate the workspace of one scale factor and run the selected benchmarks on it.
+
+    Args:
+        factor (int): Scale factor passed to :meth:`SyntheticScale.scaled`.
+        repeat (int): Timed runs per benchmark.
+        names (List[str]): Names of the benchmarks to run, keys of :data:`BENCHMARKS`.
+        workdir (Path): Directory for the generated workspace and the benchmarks' output.
+        memory (bool): Also measure the memory of the object map with :func:`measure_object_map_bytes`.
+
+    Returns:
+        dict: The scale, the workspace size, the object map memory and the timings per benchmark.
+    """
+
+    scale = SyntheticScale.scaled(factor)
+    path = generate_workspace(workdir / f"scale_{factor}", scale)
+    workspace = _load(path)
+    if workspace.flync_model is None:
+        raise RuntimeError(f"synthetic workspace of scale {factor} failed to load: {workspace.load_errors[:3]}")
+    scratch = workdir / f"scratch_{factor}"
+    scratch.mkdir(parents=True, exist_ok=True)
+    if "warm_load" in names:
+        _load(path, parse_cache_dir=scratch)  # fills the parse cache the timed runs hit
+    if "snapshot_load" in names:
+        workspace.save_snapshot(scratch / "benchmark.snapshot")  # before update_document changes the workspace
+    if "dump_unchanged" in names:
+        dump_flync_workspace(workspace.flync_model, scratch / "dump_unchanged", "benchmark_dump", WorkspaceConfiguration(fast_write=True))
+    subject = BenchmarkSubject(path, workspace, scratch, _sample(workspace, LOOKUP_SAMPLE))
+    result = {
+        "factor": factor,
+        "scale": scale.as_dict(),
+        "documents": len(workspace.documents),
+        "objects": len(workspace.objects),
+        "lookups": len(subject.sample),
+    }
+    if memory:
+        # before the benchmarks, which leave their own state (e.g. the parse cache of update_document) behind
+        object_map_bytes = measure_object_map_bytes(path)
+        result["object_map_bytes"] = object_map_bytes
+        result["object_map_bytes_per_object"] = object_map_bytes / max(1, len(workspace.objects))
+    result["benchmarks"] = {name: _time(BENCHMARKS[name], subject, repeat) for name in names}
+    return result
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, cwd=Path(__file__).parent, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def _flync_version() -> str:
+    try:
+        return importlib.metadata.version("flync")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def append_history(history: Path, run: dict) -> None:
+    """Append ``run`` to the JSON list stored in ``history``, creating the file if needed."""
+    runs = json.loads(history.read_text()) if history.exists() else []
+    runs.append(run)
+    history.parent.mkdir(parents=True, exist_ok=True)
+    history.write_text(json.dumps(runs, indent=2) + "\n")
+
+
+def print_table(run: dict) -> None:
+    """Print the best time of every benchmark and the object map memory per object, one column per scale."""
+    scales = run["scales"]
+    names = list(scales[0]["benchmarks"]) if scales else []
+    width = max([len(name) for name in names] + [len("bytes/object")])
+    print(f"{'':{width}}" + "".join(f"{'x' + str(scale['factor']):>12}" for scale in scales))
+    print(f"{'objects':{width}}" + "".join(f"{scale['objects']:>12}" for scale in scales))
+    if scales and "object_map_bytes_per_object" in scales[0]:
+        print(f"{'bytes/object':{width}}" + "".join(f"{scale['object_map_bytes_per_object']:>12.0f}" for scale in scales))
+    for name in names:
+        print(f"{name:{width}}" + "".join(f"{scale['benchmarks'][name]['best_s'] * 1000:>10.1f}ms" for scale in scales))
+
+
+def main(argv: Optional[List[str]] = None) -> dict:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 2, 4], help="scale factors to run (default: 1 2 4)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per benchmark (default: 3)")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS), help="benchmarks to run (default: all)")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY, help=f"JSON history file to append to (default: {DEFAULT_HISTORY})")
+    parser.add_argument("--workdir", type=Path, help="keep the generated workspaces here instead of a temporary directory")
+    parser.add_argument("--no-memory", action="store_true", help="skip the (slow, traced) object map memory measurement")
+    args = parser.parse_args(argv)
+
+    run = {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "revision": _git_revision(),
+        "flync_version": _flync_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "scales": [],
+    }
+    with tempfile.TemporaryDirectory(prefix="flync_benchmarks_") as temporary:
+        workdir = args.workdir or Path(temporary)
+        for factor in args.scales:
+            run["scales"].append(run_scale(factor, args.repeat, args.only, workdir, memory=not args.no_memory))
+    append_history(args.history, run)
+    print_table(run)
+    return run
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""
+Deterministic synthetic FLYNC workspaces for the benchmark suite.
+
+:func:`generate_workspace` scales ``examples/flync_example`` up: it copies the example and adds synthetic ECUs cloned from
+its ``eth_ecu``, each with a configurable number of controllers and UDP sockets, plus SOME/IP services, PDUs and CAN
+frames. Every name, address and id is derived from the clone's position, so the same :class:`SyntheticScale` always
+produces byte-identical files.
+"""
+
+import re
+import shutil
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+EXAMPLE_WORKSPACE = Path(__file__).resolve().parents[1] / "examples" / "flync_example"
+
+#: The example ECU every synthetic ECU is cloned from, and the name prefix of its objects.
+_TEMPLATE_ECU = "eth_ecu"
+#: First SOME/IP service id and first CAN id handed out to synthetic objects, clear of the example's own ids.
+_FIRST_SERVICE_ID = 0x2000
+_FIRST_CAN_ID = 0x100
+
+
+@dataclass(frozen=True)
+class SyntheticScale(object):
+    """
+    Size of a synthetic workspace, on top of the example it extends.
+
+    Attributes:
+        ecus (int): Number of synthetic ECUs.
+        controllers (int): Controllers per synthetic ECU, each behind its own ECU port.
+        sockets (int): UDP sockets per controller interface.
+        services (int): SOME/IP service interfaces.
+        pdus (int): Standard PDUs.
+        can_frames (int): Frames on the synthetic CAN bus; frame ``i`` carries PDU ``i % pdus``.
+    """
+
+    ecus: int = 10
+    controllers: int = 2
+    sockets: int = 4
+    services: int = 4
+    pdus: int = 20
+    can_frames: int = 20
+
+    @classmethod
+    def scaled(cls, factor: int) -> "SyntheticScale":
+        """Return the default scale with every count multiplied by ``factor``, controllers excepted."""
+        base = cls()
+        return cls(
+            ecus=base.ecus * factor,
+            controllers=base.controllers,
+            sockets=base.sockets * factor,
+            services=base.services * factor,
+            pdus=base.pdus * factor,
+            can_frames=base.can_frames * factor,
+        )
+
+    def as_dict(self) -> dict:
+        """Return the counts as a plain dict, e.g. for a results file."""
+        return asdict(self)
+
+
+def _host_address(network: int, index: int) -> str:
+    """Return a unique ``10.<network>.x.y`` host address for ``index``, never a network or broadcast address."""
+    return f"10.{network}.{index // 250}.{index % 250 + 1}"
+
+
+def _mac_address(ecu: int, controller: int, host: int) -> str:
+    """Return a unique, locally administered MAC address."""
+    return f"02:{controller:02x}:{ecu >> 8:02x}:{ecu & 0xFF:02x}:01:{host:02x}"
+
+
+class _WorkspaceWriter(object):
+    """Writes the synthetic part of one workspace."""
+
+    def __init__(self, root: Path, scale: SyntheticScale):
+        self.root = root
+        self.scale = scale
+        template = EXAMPLE_WORKSPACE / "ecus" / _TEMPLATE_ECU
+        controller = template / "controllers" / f"{_TEMPLATE_ECU}_controller1"
+        self.ecu_metadata = (template / "ecu_metadata.flync.yaml").read_text()
+        self.controller_metadata = (controller / "controller_metadata.flync.yaml").read_text()
+        self.virtual_switch = (controller / "virtual_switch.flync.yaml").read_text()
+        self.interface_config = (controller / "ethernet_interfaces" / f"{_TEMPLATE_ECU}_c1_iface1" / "interface_config.flync.yaml").read_text()
+        port = (template / "ports.flync.yaml").read_text()
+        self.port = port[port.index("  - name:") :]
+        self.service = (EXAMPLE_WORKSPACE / "communication" / "someip" / "services" / "ets.flync.yaml").read_text()
+        self.pdu = (EXAMPLE_WORKSPACE / "communication" / "channels" / "pdus" / "PDU_CabinLight.flync.yaml").read_text()
+
+    def write(self, relative: str, text: str) -> None:
+        path = self.root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+    def ecu(self, ecu: int) -> None:
+        name = f"syn{ecu}"
+        folder = f"ecus/syn_ecu_{ecu:04d}"
+        self.write(f"{folder}/ecu_metadata.flync.yaml", self.ecu_metadata)
+        ports, connections = ["ports:\n"], ["connections:\n"]
+        for controller in range(1, self.scale.controllers + 1):
+            prefix = f"{name}_c{controller}"
+            interface = f"{prefix}_iface1"
+            ports.append(self.port.replace(f"{_TEMPLATE_ECU}_p1", f"{name}_p{controller}"))
+            connections.append(
+                f"  - type: ecu_port_to_controller_interface\n"
+                f"    id: conn{controller}\n"
+                f"    ecu_port: {name}_p{controller}\n"
+                f"    controller_interface: {interface}\n"
+            )
+            self.controller(ecu, controller, f"{folder}/controllers/{prefix}", prefix)
+        self.write(f"{folder}/ports.flync.yaml", "".join(ports))
+        self.write(f"{folder}/topology.flync.yaml", "".join(connections))
+
+    def controller(self, ecu: int, controller: int, folder: str, prefix: str) -> None:
+        index = (ecu - 1) * self.scale.controllers + controller - 1
+        self.write(f"{folder}/controller_metadata.flync.yaml", self.controller_metadata)
+        self.write(
+            f"{folder}/virtual_switch.flync.yaml", self.virtual_switch.replace(f"{_TEMPLATE_ECU}_c1_", f"{prefix}_").replace(_TEMPLATE_ECU, prefix)
+        )
+
+        config = self.interface_config.replace(f"{_TEMPLATE_ECU}_c1_", f"{prefix}_").replace(_TEMPLATE_ECU, prefix)
+        for host in (1, 2, 3):
+            config = config.replace(f"00:11:01:01:01:{host:02x}", _mac_address(ecu, controller, host))
+        config = config.replace("10.0.40.7", _host_address(40, index)).replace("10.0.50.7", _host_address(50, index))
+        # one IPv6 address per clone would make every interface a solicited-node multicast receiver of every other
+        config = config.replace("          - address: 2001:db8:85a3::8a2e:370:7334\n            ipv6prefix: 64\n", "")
+        config = config.replace("        multicast:\n          - 224.0.0.1\n", "")
+        address = _host_address(60, index)
+        config += (
+            f"virtual_interfaces:\n"
+            f"  - name: {prefix}_viface1\n"
+            f"    vlanid: 60\n"
+            f"    addresses:\n"
+            f"      - address: {address}\n"
+            f"        ipv4netmask: 255.255.0.0\n"
+        )
+        interface = f"{folder}/ethernet_interfaces/{prefix}_iface1"
+        self.write(f"{interface}/interface_config.flync.yaml", config)
+        if self.scale.sockets:
+            sockets = ["vlan_id: 60\nsockets:\n"]
+            for socket in range(self.scale.sockets):
+                sockets.append(
+                    f"  - name: {prefix}_socket{socket}\n"
+                    f"    endpoint_address: {address}\n"
+                    f"    endpoint_type: unicast\n"
+                    f"    port_no: {40000 + socket}\n"
+                    f"    protocol: udp\n"
+                )
+            self.write(f"{interface}/sockets/synthetic_sockets.flync.yaml", "".join(sockets))
+
+    def service_interface(self, service: int) -> None:
+        text = self.service.replace("name: Enhanced Testability Services", f"name: Synthetic Service {service}")
+        text = text.replace("id: 0x0101", f"id: {_FIRST_SERVICE_ID + service:#06x}", 1)
+        # E2E data ids are unique per profile across all services
+        text = re.sub(r"data_id: (0x[0-9a-fA-F]+)", lambda match: f"data_id: {int(match.group(1), 16) + ((service + 1) << 8):#x}", text)
+        self.write(f"communication/someip/services/synthetic_service_{service:04d}.flync.yaml", text)
+
+    def pdu_definition(self, pdu: int) -> None:
+        text = self.pdu.replace("PDU_CabinLight", f"PDU_Synthetic{pdu}").replace("CabinLight", f"Synthetic{pdu}")
+        self.write(f"communication/channels/pdus/PDU_Synthetic{pdu}.flync.yaml", text)
+
+    def can_bus(self) -> None:
+        frames = []
+        for frame in range(self.scale.can_frames):
+            frames.append(
+                f"  - name: Frame_Synthetic{frame}\n"
+                f"    type: can\n"
+                f"    length: 8\n"
+                f"    can_id: {_FIRST_CAN_ID + frame}\n"
+                f"    id_format: standard_11bit\n"
+                f"    packed_pdus:\n"
+                f"      - pdu_ref: PDU_Synthetic{frame % self.scale.pdus}\n"
+                f"        bit_position: 0\n"
+                f"    timing:\n"
+                f"      cyclic_timings:\n"
+                f"        - cycle: 0.1\n"
+                f"      event_timings: []\n"
+            )
+        header = 'name: SyntheticCAN\nversion: "1.0"\nbaud_rate: 500000\n\nframes:\n'
+        self.write("communication/channels/can/synthetic_can.flync.yaml", header + "".join(frames))
+
+
+def generate_workspace(destination: Path, scale: SyntheticScale) -> Path:
+    """
+    Write a synthetic workspace of the given scale, replacing whatever is at ``destination``.
+
+    Args:
+        destination (Path): Directory to create the workspace in.
+        scale (SyntheticScale): Number of synthetic objects of every kind.
+
+    Returns:
+        Path: ``destination``.
+    """
+
+    destination = Path(destination)
+    if destination.exists():
+        shutil.rmtree(destination)
+    shutil.copytree(EXAMPLE_WORKSPACE, destination, ignore=shutil.ignore_patterns("*.md"))
+    writer = _WorkspaceWriter(destination, scale)
+    for ecu in range(1, scale.ecus + 1):
+        writer.ecu(ecu)
+    for service in range(scale.services):
+        writer.service_interface(service)
+    for pdu in range(scale.pdus):
+        writer.pdu_definition(pdu)
+    if scale.can_frames and scale.pdus:
+        writer.can_bus()
+    return destination
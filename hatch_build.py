@@ -0,0 +1,44 @@
+"""
+Hatch build hook shipping the FLYNC model dependency graphs with the wheel.
+
+Building the graphs needs the model, so the hook runs with the runtime dependencies installed
+(``require-runtime-dependencies``) and builds them in a subprocess that imports the sources being packaged. Editable
+installs are skipped; they cache the graphs at runtime.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+# flync.sdk.utils.model_dependencies.GRAPH_ARTIFACT, as placed in the wheel
+ARTIFACT = "flync/sdk/utils/model_dependency_graphs.bin"
+
+_BUILD = "import sys; from flync.sdk.utils.model_dependencies import write_graph_artifact; print(write_graph_artifact(*sys.argv[1:]))"
+
+
+class ModelDependencyGraphHook(BuildHookInterface):
+    """Writes the graphs of the package version being built and force-includes them in the wheel."""
+
+    PLUGIN_NAME = "custom"
+
+    def initialize(self, version, build_data):
+        if self.target_name != "wheel" or version == "editable":
+            return
+        self._tmp = tempfile.TemporaryDirectory()
+        artifact = Path(self._tmp.name) / Path(ARTIFACT).name
+        python_path = [str(Path(self.root) / "src"), *filter(None, os.environ.get("PYTHONPATH", "").split(os.pathsep))]
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(python_path)}
+        result = subprocess.run(
+            [sys.executable, "-c", _BUILD, str(artifact), self.metadata.version], env=env, check=True, capture_output=True, text=True
+        )
+        self.app.display_info(f"Shipping {result.stdout.strip()} model dependency graphs")
+        build_data["force_include"][str(artifact)] = ARTIFACT
+
+    def finalize(self, version, build_data, artifact_path):
+        tmp = getattr(self, "_tmp", None)
+        if tmp is not None:
+            tmp.cleanup()
@@ -1,7 +1,17 @@
-"""FLYNC - FLexible Yaml-based Network Configuration; top-level package exposing the FLYNC model."""
+"""FLYNC - FLexible Yaml-based Network Configuration; top-level package exposing the FLYNC model.
 
-from . import model
+``flync.model`` is imported on first access, so tools that only need the core helpers (e.g. ``flync errors``) do not
+pay for building the model's validation schemas.
+"""
+
+import importlib
 
 __all__ = [
     "model",
 ]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 from enum import IntFlag
+from functools import lru_cache
 from typing import Optional
 
 
@@ -50,3 +51,19 @@ def resolve_reference(model, field_name: str) -> Optional[object]:
     if ref is None or ReferenceStrategy.PRIVATE_ATTR not in ref.reference_strategy:
         return None
     return getattr(model, ref.source, None)
+
+
+@lru_cache(maxsize=None)
+def reference_sources(model_type: type) -> dict[str, tuple[str, ...]]:
+    """
+    Return the ``Reference`` fields of ``model_type`` keyed by the private attr they resolve through.
+
+    Only fields resolved through a private attr (:attr:`ReferenceStrategy.PRIVATE_ATTR`) are listed. The result is
+    computed once per class.
+    """
+    sources: dict[str, tuple[str, ...]] = {}
+    for field_name, info in (getattr(model_type, "model_fields", None) or {}).items():
+        ref = next((m for m in info.metadata if isinstance(m, Reference)), None)
+        if ref is not None and ReferenceStrategy.PRIVATE_ATTR in ref.reference_strategy:
+            sources[ref.source] = sources.get(ref.source, ()) + (field_name,)
+    return sources
@@ -1,12 +1,16 @@
 """Provides utilities for validating models and handling errors."""
 
-from typing import Any, List, Optional, Set, Tuple, Type, get_args, get_origin
+import threading
+import types
+from collections import OrderedDict
+from typing import Annotated, Any, Dict, List, NamedTuple, Optional, Set, Tuple, Type, Union, get_args, get_origin
 
-from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic import BaseModel, BeforeValidator, PlainValidator, RootModel, TypeAdapter, ValidationError, WrapValidator
 from pydantic_core import ErrorDetails, InitErrorDetails, PydanticCustomError
 
 from flync.core.base_models.base_model import FLYNCBaseModel
 from flync.core.utils.exceptions import _validation_warnings
+from flync.core.utils.validation_profile import profile_scope
 
 FATAL_ERROR_TYPES = {"extra_forbid", "extra_forbidden", "fatal", "missing"}
 
@@ -15,6 +19,109 @@ FATAL_ERROR_TYPES = {"extra_forbid", "extra_forbidden", "fatal", "missing"}
 # a major error so it follows the standard FLYNC display format.
 FLYNC_ERROR_TYPES = FATAL_ERROR_TYPES | {"minor", "major", "warning"}
 
+# Upper bound of cached TypeAdapter instances. A workspace validates a few dozen distinct types (model classes plus the
+# dict/list wrappers built by ModelDependencyGraph.rebuild_type_from_parent), so this only bounds pathological callers.
+TYPE_ADAPTER_CACHE_SIZE = 512
+
+
+class TypeAdapterCacheInfo(NamedTuple):
+    """Statistics of the TypeAdapter cache, in the spirit of ``functools.lru_cache``'s ``cache_info()``."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def _is_model_class(tp: Any) -> bool:
+    return isinstance(tp, type) and issubclass(tp, BaseModel)
+
+
+class _TypeAdapterCache(object):
+    """
+    Bounded LRU cache of TypeAdapter instances, keyed by the identity of the adapted type.
+
+    Generic aliases such as ``dict[str, Model]`` compare equal but are rebuilt on every subscription, and ``Annotated``
+    metadata is not always hashable, so entries are keyed by ``id()``; the type itself is kept alive in the entry, so its
+    id cannot be reused while cached. Callers that build such types must hand the same object back to hit the cache.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[int, Tuple[Any, TypeAdapter]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, tp: Any) -> TypeAdapter:
+        key = id(tp)
+        with self._lock:
+            entry = self._entries.get(key)
+            # a forced model_rebuild() swaps the validator of a model class, which a cached adapter would not notice
+            if entry is not None and (not _is_model_class(tp) or entry[1].validator is tp.__pydantic_validator__):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        adapter = TypeAdapter(tp)
+        with self._lock:
+            self._entries[key] = (tp, adapter)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return adapter
+
+    def info(self) -> TypeAdapterCacheInfo:
+        return TypeAdapterCacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_type_adapter_cache = _TypeAdapterCache(TYPE_ADAPTER_CACHE_SIZE)
+
+
+def get_type_adapter(tp: Any) -> TypeAdapter:
+    """
+    Return a cached TypeAdapter for ``tp``, building it on first use.
+
+    Parameters
+    ----------
+    tp : Any
+        The type to adapt: a model class or a type built around one.
+
+    Returns
+    -------
+    TypeAdapter
+        The adapter, shared by every caller passing the same type object.
+    """
+    return _type_adapter_cache.get(tp)
+
+
+def type_adapter_cache_info() -> TypeAdapterCacheInfo:
+    """
+    Report hits, misses and size of the TypeAdapter cache used by :func:`validate_with_policy`.
+
+    Returns
+    -------
+    TypeAdapterCacheInfo
+        The current statistics.
+    """
+    return _type_adapter_cache.info()
+
+
+def clear_type_adapter_cache() -> None:
+    """
+    Drop every cached TypeAdapter and reset the statistics.
+
+    Adapters of composite types embed the schema of the models they wrap, so this must be called after a model is
+    rebuilt with ``model_rebuild(force=True)``.
+    """
+    _type_adapter_cache.clear()
+
 
 def is_semantic_validation_error(err: ErrorDetails) -> bool:
     """
@@ -440,14 +547,20 @@ def _enrich_validation_error(
     model: type,
     working: Any,
     path,
+    loc_prefix: Tuple = (),
 ) -> ValidationError:
     """
     Return ``ve`` re-raised with YAML source locations injected.
+
+    ``loc_prefix`` is prepended to every error location, for errors raised while validating a sub-object of ``working``.
     """
 
+    errors = ve.errors()
+    if loc_prefix:
+        errors = [{**e, "loc": loc_prefix + tuple(e.get("loc", ()))} for e in errors]  # type: ignore[misc]
     try:
         enriched = errors_to_init_errors(
-            get_unique_errors(ve.errors()),
+            get_unique_errors(errors),
             model=model,
             yaml_data=working,
             yaml_path=path,
@@ -503,16 +616,20 @@ def _process_error_list(
     - minor/major: remove the exact offending field.
     - cascade from an earlier removal: escalate to parent silently.
     - cascade from a major-removed field: stop the chain, do not escalate.
+    - further FLYNC error at a location removed in this round (e.g. one per finding of a model validator): collect it too.
 
     Returns True if at least one location was removed (progress made).
     """
 
     made_progress = False
+    removed_now: Set[Tuple] = set()
     for err in errs:
         loc = err.get("loc", ())
         is_fatal = err.get("type") in FATAL_ERROR_TYPES
         remove_loc = loc[:-1] if is_fatal and len(loc) > 1 else loc
         if remove_loc in removed_locs:
+            if remove_loc in removed_now and loc == remove_loc and err.get("type") in FLYNC_ERROR_TYPES:
+                collected_errors.append(err)
             continue
         is_cascade = loc in removed_locs
         if is_cascade:
@@ -531,11 +648,216 @@ def _process_error_list(
                 removed_locs,
                 major_removed_locs,
             )
+            removed_now.add(remove_loc)
             made_progress = True
     return made_progress
 
 
-def validate_with_policy(model: Type[FLYNCBaseModel], data: Any, path) -> Tuple[Optional[FLYNCBaseModel], List[ErrorDetails]]:
+# Validators that receive the raw input of their field or model. Such a validator on the way from the root model to a
+# sub-object may reshape the sub-object's data before it is validated, and would be handed an already validated instance
+# once that sub-object is spliced back, so no sub-object below it is re-validated on its own.
+_RAW_INPUT_VALIDATORS = (BeforeValidator, WrapValidator, PlainValidator)
+_RAW_INPUT_MODES = {"before", "wrap", "plain"}
+
+
+def _strip_annotation(annotation: Any) -> Any:
+    """
+    Strip ``Annotated`` and ``Optional`` wrappers from ``annotation``.
+
+    Returns ``None`` when a wrapper carries a raw-input validator or the annotation is a union of several types, whose
+    validation cannot be attributed to a single type.
+    """
+
+    while True:
+        origin = get_origin(annotation)
+        if origin is Annotated:
+            args = get_args(annotation)
+            if any(isinstance(m, _RAW_INPUT_VALIDATORS) for m in args[1:]):
+                return None
+            annotation = args[0]
+        elif origin is Union or origin is types.UnionType:
+            members = [a for a in get_args(annotation) if a is not type(None)]
+            if len(members) != 1:
+                return None
+            annotation = members[0]
+        else:
+            return annotation
+
+
+def _has_raw_input_model_validator(model: type[BaseModel]) -> bool:
+    """
+    Return True when ``model`` has a ``before`` or ``wrap`` model validator.
+    """
+
+    return any(d.info.mode in _RAW_INPUT_MODES for d in model.__pydantic_decorators__.model_validators.values())
+
+
+def _field_annotation_at(model: type[BaseModel], part: Any) -> Any:
+    """
+    Return the annotation of the field of ``model`` named (or aliased) ``part``.
+
+    Returns ``None`` when there is no such field or a raw-input validator is attached to it.
+    """
+
+    for name, field in model.model_fields.items():
+        if part not in (name, field.alias):
+            continue
+        if any(isinstance(m, _RAW_INPUT_VALIDATORS) for m in field.metadata):
+            return None
+        for decorator in model.__pydantic_decorators__.field_validators.values():
+            if decorator.info.mode in _RAW_INPUT_MODES and (name in decorator.info.fields or "*" in decorator.info.fields):
+                return None
+        return field.annotation
+    return None
+
+
+def _local_model_at(model: Any, loc: Tuple) -> Optional[Tuple[Tuple, type[BaseModel]]]:
+    """
+    Find the deepest sub-object on ``loc`` that can be validated on its own and spliced back.
+
+    Walks the type of ``model`` along ``loc``. A sub-object qualifies when it is an instance of a plain model class and no
+    validator above it sees raw input containing it (see :data:`_RAW_INPUT_VALIDATORS`): its validation on its own is then
+    exactly the validation it gets as part of ``model``, and the instance is accepted as-is when spliced back.
+
+    Parameters
+    ----------
+    model : Any
+        The type validated by :func:`validate_with_policy`.
+
+    loc : Tuple
+        Location of the sub-object whose field was removed.
+
+    Returns
+    -------
+    Optional[Tuple[Tuple, type[BaseModel]]]
+        The location and model class of the sub-object to re-validate, or ``None`` when only the root qualifies.
+    """
+
+    found = None
+    annotation = model
+    for depth, part in enumerate(loc):
+        annotation = _strip_annotation(annotation)
+        if annotation is None:
+            break
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            if issubclass(annotation, RootModel) or _has_raw_input_model_validator(annotation):
+                break
+            annotation = _field_annotation_at(annotation, part)
+        else:
+            origin, args = get_origin(annotation), get_args(annotation)
+            if origin is list and isinstance(part, int) and args:
+                annotation = args[0]
+            elif origin is dict and len(args) == 2:
+                annotation = args[1]
+            else:
+                break
+        stripped = _strip_annotation(annotation)
+        if isinstance(stripped, type) and issubclass(stripped, BaseModel) and not issubclass(stripped, RootModel):
+            found = (loc[: depth + 1], stripped)
+    return found
+
+
+def _splice_at(working: Any, loc: Tuple, value: Any, owned: Set[int]) -> Any:
+    """
+    Replace the item at ``loc`` in ``working`` with ``value``, copying every container on the way.
+
+    Containers are copied once (their ids are recorded in ``owned``), so the caller's data never receives model instances.
+
+    Returns
+    -------
+    Any
+        ``working``, or its copy when the root container had to be copied.
+    """
+
+    if id(working) not in owned:
+        working = working.copy()
+        owned.add(id(working))
+    parent = working
+    for key in loc[:-1]:
+        child = parent[key]
+        if id(child) not in owned:
+            child = child.copy()
+            owned.add(id(child))
+            parent[key] = child
+        parent = child
+    parent[loc[-1]] = value
+    return working
+
+
+def _value_at(data: Any, loc: Tuple) -> Tuple[bool, Any]:
+    """
+    Return ``(True, value)`` for the item at ``loc`` in ``data``, or ``(False, None)`` when it no longer exists.
+    """
+
+    current = data
+    for key in loc:
+        if not isinstance(current, (dict, list)):
+            return False, None
+        found, current = _child_at(current, key)
+        if not found:
+            return False, None
+    return True, current
+
+
+def _revalidate_locally(
+    model: Any,
+    working: Any,
+    changed_locs: Set[Tuple],
+    removed_locs: Set[Tuple],
+    major_removed_locs: Set[Tuple],
+    collected_errors: List[ErrorDetails],
+    path,
+    owned: Set[int],
+) -> Any:
+    """
+    Prune the sub-objects that lost a field without re-validating the whole of ``working``.
+
+    Each sub-object around a location in ``changed_locs`` (see :func:`_local_model_at`) is validated on its own, deepest
+    first; its errors are pruned like those of a full pass, and the sub-object is validated again until it succeeds. The
+    resulting instance is then spliced into ``working``, so the next full pass accepts it without running its validators
+    again. A sub-object that cannot be settled locally (top-level fatal error, no progress, unexpected exception) is left as
+    raw data for the full pass to report.
+
+    Returns
+    -------
+    Any
+        The working data, copied where instances were spliced into it.
+    """
+
+    pending: Dict[Tuple, type[BaseModel]] = {}
+
+    def schedule(locs):
+        for removed in locs:
+            target = _local_model_at(model, removed[:-1])
+            if target is not None:
+                pending[target[0]] = target[1]
+
+    schedule(changed_locs)
+    while pending:
+        loc = max(pending, key=len)
+        sub_model = pending.pop(loc)
+        found, sub_data = _value_at(working, loc)
+        if not found or isinstance(sub_data, BaseModel):
+            continue
+        try:
+            instance = get_type_adapter(sub_model).validate_python(sub_data)
+        except ValidationError as ve:
+            errs = _enrich_validation_error(ve, model, working, path, loc_prefix=loc).errors()
+            if _has_top_level_fatal(errs, removed_locs):
+                continue
+            previously_removed = set(removed_locs)
+            if _process_error_list(errs, removed_locs, major_removed_locs, collected_errors, working):
+                schedule(removed_locs - previously_removed)
+            continue
+        except Exception:
+            continue
+        working = _splice_at(working, loc, instance, owned)
+    return working
+
+
+def validate_with_policy(
+    model: Type[FLYNCBaseModel], data: Any, path, incremental: bool = True
+) -> Tuple[Optional[FLYNCBaseModel], List[ErrorDetails]]:
     """
     Helper function to perform model validation from the given data, collect errors with different severity and perform action based on severity.
 
@@ -543,13 +865,21 @@ def validate_with_policy(model: Type[FLYNCBaseModel], data: Any, path) -> Tuple[
     model can still be constructed without the invalid field. The loop continues until either validation succeeds, a fatal error is encountered,
     or no further progress can be made (all error locations already removed).
 
+    In ``incremental`` mode, the sub-objects that lost a field are re-validated on their own and spliced back as instances
+    before the next full pass (see :func:`_revalidate_locally`), so cascading errors inside one sub-object no longer cost a
+    full pass each. Sub-objects below a validator that sees their raw data, such as a ``before`` model validator, are left
+    to the full loop.
+
     Parameters
     ----------
     model : Type[FLYNCBaseModel]
         Flync model class.
 
     data : Any
-        Data to validate and instantiate the model with.
+        Data to validate and instantiate the model with. Offending fields are deleted from it in place.
+
+    incremental : bool
+        Re-validate only the affected sub-objects between full passes, where possible.
 
     Returns
     -------
@@ -565,11 +895,13 @@ def validate_with_policy(model: Type[FLYNCBaseModel], data: Any, path) -> Tuple[
     collected_errors: List[ErrorDetails] = []
     removed_locs: Set[Tuple] = set()
     major_removed_locs: Set[Tuple] = set()
+    owned: Set[int] = set()
     warnings_token = _validation_warnings.set([])
     try:
         while True:
             try:
-                result = TypeAdapter(model).validate_python(working)
+                with profile_scope("phase", "validation round"):
+                    result = get_type_adapter(model).validate_python(working)
                 accumulated = _validation_warnings.get() or []
                 _tag_warnings_with_path(accumulated, path)
                 return result, get_unique_errors(collected_errors + accumulated)
@@ -578,6 +910,7 @@ def validate_with_policy(model: Type[FLYNCBaseModel], data: Any, path) -> Tuple[
                 errs = ve_enriched.errors()
                 if _has_top_level_fatal(errs, removed_locs):
                     raise ve_enriched
+                previously_removed = set(removed_locs)
                 if not _process_error_list(
                     errs,
                     removed_locs,
@@ -586,6 +919,17 @@ def validate_with_policy(model: Type[FLYNCBaseModel], data: Any, path) -> Tuple[
                     working,
                 ):
                     break
+                if incremental:
+                    working = _revalidate_locally(
+                        model,
+                        working,
+                        removed_locs - previously_removed,
+                        removed_locs,
+                        major_removed_locs,
+                        collected_errors,
+                        path,
+                        owned,
+                    )
             except Exception as e:
                 fatal_ctx = {"ex": e.with_traceback(None)}
                 raise ValidationError.from_exception_data(
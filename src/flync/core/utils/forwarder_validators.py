@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Tuple, Union
 
-from pydantic_core import PydanticCustomError
+from pydantic import ValidationError
+from pydantic_core import InitErrorDetails, PydanticCustomError
 
 from flync.core.utils.exceptions import Category, err_major, err_minor
+from flync.core.utils.system_index import SystemIndex
 from flync.model.flync_4_ecu.can_interface import CANInterface
 from flync.model.flync_4_signal.forwarder import (
     CANFrameEgress,
@@ -81,173 +83,6 @@ def _can_forwarder_locator(controller: "Controller", iface: CANInterface, fwd: C
     return f"controllers/{controller.name}/can_interfaces/{iface.bus_ref}/forwarder_frames/{fwd.frame_ref}"
 
 
-# ---------------------------------------------------------------------------
-# Tree walking
-# ---------------------------------------------------------------------------
-
-
-def _iter_sockets_on_controller(controller: "Controller"):
-    """Yield every :class:`Socket` owned by *controller* (across all eth interfaces / VLAN containers)."""
-
-    for eth_iface in controller.ethernet_interfaces or []:
-        for socket_container in eth_iface.sockets or []:
-            for socket in socket_container.sockets or []:
-                yield socket
-
-
-def _iter_pdu_forwarders_on_socket(socket: "Socket"):
-    """Yield every :class:`PDUForwarder` deployment carried by *socket*."""
-
-    for dep_root in socket.deployments or []:
-        dep = dep_root.root
-        if isinstance(dep, PDUForwarder):
-            yield dep
-
-
-def _collect_pdu_forwarders(model: "FLYNCModel") -> List[Tuple["Controller", "Socket", PDUForwarder]]:
-    """Collect every PDUForwarder in the workspace alongside its parent socket and owning controller."""
-
-    out: List[Tuple["Controller", "Socket", PDUForwarder]] = []
-    for ecu in model.ecus:
-        for controller in ecu.controllers:
-            for socket in _iter_sockets_on_controller(controller):
-                for fwd in _iter_pdu_forwarders_on_socket(socket):
-                    out.append((controller, socket, fwd))
-    return out
-
-
-def _iter_pdu_deployments_on_socket(socket: "Socket"):
-    """Yield every :class:`PDUSender` / :class:`PDUReceiver` deployment carried by *socket*."""
-
-    from flync.model.flync_4_signal.pdu_deployment import PDUReceiver, PDUSender  # local import — avoid module cycle
-
-    for dep_root in socket.deployments or []:
-        dep = dep_root.root
-        if isinstance(dep, (PDUSender, PDUReceiver)):
-            yield dep
-
-
-def _collect_pdu_deployments(model: "FLYNCModel") -> List[Tuple["Controller", "Socket", "Union[PDUSender, PDUReceiver]"]]:
-    """Collect every PDUSender / PDUReceiver in the workspace alongside its parent socket and owning controller.
-
-    Deployments are collected unconditionally — standalone senders/receivers (plain ECU-to-ECU
-    PDU exchange with no forwarder involved) are included exactly like forwarder-adjacent ones.
-    """
-
-    out: List[Tuple["Controller", "Socket", "Union[PDUSender, PDUReceiver]"]] = []
-    for ecu in model.ecus:
-        for controller in ecu.controllers:
-            for socket in _iter_sockets_on_controller(controller):
-                for dep in _iter_pdu_deployments_on_socket(socket):
-                    out.append((controller, socket, dep))
-    return out
-
-
-def _iter_can_interfaces(model: "FLYNCModel"):
-    """Yield ``(controller, can_interface)`` for every CAN interface in the workspace."""
-
-    for ecu in model.ecus:
-        for controller in ecu.controllers:
-            for can_iface in controller.can_interfaces or []:
-                yield controller, can_iface
-
-
-def _collect_can_frame_forwarders(model: "FLYNCModel"):
-    """Collect every CANFrameForwarder in the workspace alongside its parent CAN interface and owning controller."""
-
-    out = []
-    for controller, can_iface in _iter_can_interfaces(model):
-        for fwd in can_iface.forwarder_frames or []:
-            out.append((controller, can_iface, fwd))
-    return out
-
-
-def _build_socket_indexes(model: "FLYNCModel"):
-    """Build controller-scoped indexes for socket and PDUForwarder lookup (socket names may collide across controllers)."""
-
-    socket_by_controller_name: Dict[Tuple[str, str], Tuple["Controller", "Socket"]] = {}
-    pdu_forwarder_by_controller_socket_pdu: Dict[Tuple[str, str, str], PDUForwarder] = {}
-
-    for ecu in model.ecus:
-        for controller in ecu.controllers:
-            for socket in _iter_sockets_on_controller(controller):
-                socket_by_controller_name[(controller.name, socket.name)] = (controller, socket)
-                for fwd in _iter_pdu_forwarders_on_socket(socket):
-                    pdu_forwarder_by_controller_socket_pdu[(controller.name, socket.name, fwd.pdu_ref)] = fwd
-    return socket_by_controller_name, pdu_forwarder_by_controller_socket_pdu
-
-
-def _index_can_forwarders_by_bus_id(
-    can_iface: CANInterface,
-    can_frame_catalog: Dict[str, CANAnyFrame],
-    out: Dict[Tuple[str, int], CANFrameForwarder],
-) -> None:
-    """Add every forwarder frame of *can_iface* to *out*, keyed by ``(bus_ref, can_id)``."""
-
-    for fwd in can_iface.forwarder_frames or []:
-        frame = can_frame_catalog.get(fwd.frame_ref)
-        if frame is not None:
-            out[(can_iface.bus_ref, frame.can_id)] = fwd
-
-
-def _build_can_indexes(model: "FLYNCModel", can_frame_catalog: Optional[Dict[str, CANAnyFrame]] = None):
-    """Build indexes for CAN interface lookup ``(controller, bus)`` and CAN forwarder lookup ``(bus, can_id)``."""
-
-    can_iface_by_controller_bus: Dict[Tuple[str, str], CANInterface] = {}
-    can_forwarder_by_bus_id: Dict[Tuple[str, int], CANFrameForwarder] = {}
-
-    for controller, can_iface in _iter_can_interfaces(model):
-        can_iface_by_controller_bus[(controller.name, can_iface.bus_ref)] = can_iface
-        if can_frame_catalog is not None:
-            _index_can_forwarders_by_bus_id(can_iface, can_frame_catalog, can_forwarder_by_bus_id)
-    return can_iface_by_controller_bus, can_forwarder_by_bus_id
-
-
-# ---------------------------------------------------------------------------
-# PDU and frame catalogs (built from FLYNCModel.communication.channels)
-# ---------------------------------------------------------------------------
-
-
-def _build_pdu_catalog(model: "FLYNCModel") -> Dict[str, PDU]:
-    """Return a name-keyed dict of every Standard / Multiplexed / Container PDU declared under ``communication.channels``."""
-
-    out: Dict[str, PDU] = {}
-    channels = getattr(model.communication, "channels", None) if model.communication else None
-    if channels is None:
-        return out
-    for pdu in channels.pdus or []:
-        out[pdu.name] = pdu
-    for container in channels.ethernet_pdu_containers or []:
-        out[container.name] = container
-    return out
-
-
-def _build_can_frame_catalog(model: "FLYNCModel") -> Dict[str, CANAnyFrame]:
-    """Return a name-keyed dict of every CAN / CAN FD frame declared under ``communication.channels.can_buses``."""
-
-    out: Dict[str, CANAnyFrame] = {}
-    channels = getattr(model.communication, "channels", None) if model.communication else None
-    if channels is None or channels.can_buses is None:
-        return out
-    for bus in channels.can_buses:
-        for frame in bus.frames or []:
-            out[frame.name] = frame
-    return out
-
-
-def _build_can_frame_catalog_by_bus_id(model: "FLYNCModel") -> Dict[Tuple[str, int], CANAnyFrame]:
-    """Return a ``(bus_name, can_id)``-keyed dict of every CAN / CAN FD frame, for egress lookups by CAN ID."""
-
-    out: Dict[Tuple[str, int], CANAnyFrame] = {}
-    channels = getattr(model.communication, "channels", None) if model.communication else None
-    if channels is None or channels.can_buses is None:
-        return out
-    for bus in channels.can_buses:
-        for frame in bus.frames or []:
-            out[(bus.name, frame.can_id)] = frame
-    return out
-
-
 # ---------------------------------------------------------------------------
 # Per-forwarder reference resolution + payload fit
 # ---------------------------------------------------------------------------
@@ -388,19 +223,17 @@ def _resolve_sinks_for(
 def validate_forwarder_refs(model: "FLYNCModel") -> None:
     """Workspace pass: resolve every forwarder's PDU / frame / extract refs and assert payload-fit on CAN egresses."""
 
-    pdu_catalog = _build_pdu_catalog(model)
-    can_frame_catalog = _build_can_frame_catalog(model)
-    can_frame_by_bus_id = _build_can_frame_catalog_by_bus_id(model)
+    index = SystemIndex.of(model)
 
-    for ctrl, socket, fwd in _collect_pdu_forwarders(model):
+    for ctrl, socket, fwd in index.pdu_forwarders:
         try:
-            _validate_pdu_forwarder_refs_for(fwd, pdu_catalog, can_frame_by_bus_id)
+            _validate_pdu_forwarder_refs_for(fwd, index.pdus, index.can_frames_by_bus_id)
         except PydanticCustomError as err:
             raise _with_source(err, _pdu_forwarder_locator(ctrl, socket, fwd)) from None
 
-    for ctrl, iface, fwd in _collect_can_frame_forwarders(model):
+    for ctrl, iface, fwd in index.can_frame_forwarders:
         try:
-            _validate_can_frame_forwarder_refs_for(fwd, pdu_catalog, can_frame_catalog, can_frame_by_bus_id)
+            _validate_can_frame_forwarder_refs_for(fwd, index.pdus, index.can_frames, index.can_frames_by_bus_id)
         except PydanticCustomError as err:
             raise _with_source(err, _can_forwarder_locator(ctrl, iface, fwd)) from None
 
@@ -412,9 +245,9 @@ def validate_pdu_deployment_refs(model: "FLYNCModel") -> None:
     deployments, whether they take part in a forwarder chain or are standalone senders/receivers.
     """
 
-    pdu_catalog = _build_pdu_catalog(model)
-    for controller, socket, dep in _collect_pdu_deployments(model):
-        if dep.pdu_ref not in pdu_catalog:
+    index = SystemIndex.of(model)
+    for controller, socket, dep in index.pdu_deployments:
+        if dep.pdu_ref not in index.pdus:
             err = err_major(
                 "{owner}: pdu_ref '{ref}' does not name any PDU declared under communication.channels.",
                 owner=f"{type(dep).__name__}(socket={socket.name}, pdu_ref={dep.pdu_ref})",
@@ -582,27 +415,26 @@ def _validate_can_frame_forwarder_locality(
 def validate_forwarder_locality(model: "FLYNCModel") -> None:
     """Workspace pass: assert every egress is same-controller and the target carries the matching ``pdu_sender`` / ``sender_frames``."""
 
-    socket_by_controller_name, _ = _build_socket_indexes(model)
-    can_iface_by_controller_bus, _ = _build_can_indexes(model)
-    can_frame_catalog = _build_can_frame_catalog(model)
-    can_frame_by_bus_id = _build_can_frame_catalog_by_bus_id(model)
+    index = SystemIndex.of(model)
 
-    for controller, socket, fwd in _collect_pdu_forwarders(model):
+    for controller, socket, fwd in index.pdu_forwarders:
         try:
-            _validate_pdu_forwarder_locality(controller, socket, fwd, socket_by_controller_name, can_iface_by_controller_bus, can_frame_by_bus_id)
+            _validate_pdu_forwarder_locality(
+                controller, socket, fwd, index.sockets_by_controller, index.can_interfaces_by_controller_bus, index.can_frames_by_bus_id
+            )
         except PydanticCustomError as err:
             raise _with_source(err, _pdu_forwarder_locator(controller, socket, fwd)) from None
 
-    for controller, parent_iface, fwd in _collect_can_frame_forwarders(model):
+    for controller, parent_iface, fwd in index.can_frame_forwarders:
         try:
             _validate_can_frame_forwarder_locality(
                 controller,
                 parent_iface,
                 fwd,
-                socket_by_controller_name,
-                can_iface_by_controller_bus,
-                can_frame_catalog,
-                can_frame_by_bus_id,
+                index.sockets_by_controller,
+                index.can_interfaces_by_controller_bus,
+                index.can_frames,
+                index.can_frames_by_bus_id,
             )
         except PydanticCustomError as err:
             raise _with_source(err, _can_forwarder_locator(controller, parent_iface, fwd)) from None
@@ -623,129 +455,253 @@ def _egress_pdu_for_can_forwarder(
 
 
 # ---------------------------------------------------------------------------
-# Cycle detection (three-colour DFS)
+# Forwarder graph + cycle detection (iterative Tarjan SCC)
 # ---------------------------------------------------------------------------
 
 
-_WHITE, _GRAY, _BLACK = 0, 1, 2
+AnyForwarder = Union[PDUForwarder, CANFrameForwarder]
 
 
-class _ForwarderCycleDetector(object):
-    """Three-colour DFS over the workspace forwarder graph."""
+class ForwarderNode(NamedTuple):
+    """
+    One forwarder of a :class:`ForwarderGraph`.
 
-    def __init__(self, model: "FLYNCModel") -> None:
-        _, self._pdu_forwarder_idx = _build_socket_indexes(model)
-        self._can_frame_catalog = _build_can_frame_catalog(model)
-        _, self._can_forwarder_idx = _build_can_indexes(model, self._can_frame_catalog)
+    Attributes:
+        forwarder (PDUForwarder | CANFrameForwarder): The forwarder deployment.
+        controller (Controller): The controller running it.
+        locator (str): Path-style Source locator naming its socket or CAN interface.
+    """
 
-        pdu_fwds = _collect_pdu_forwarders(model)
-        can_fwds = _collect_can_frame_forwarders(model)
+    forwarder: AnyForwarder
+    controller: "Controller"
+    locator: str
 
-        self._nodes: List[object] = [fwd for _, _, fwd in pdu_fwds]
-        self._nodes.extend(fwd for _, _, fwd in can_fwds)
+    @property
+    def label(self) -> str:
+        """Short label of the forwarder, as used in cycle-path error messages."""
+        if isinstance(self.forwarder, PDUForwarder):
+            return f"PDUForwarder(pdu_ref={self.forwarder.pdu_ref})"
+        return f"CANFrameForwarder(frame_ref={self.forwarder.frame_ref})"
 
-        self._controller_of: Dict[int, "Controller"] = {id(fwd): ctrl for ctrl, _, fwd in pdu_fwds}
-        self._controller_of.update({id(fwd): ctrl for ctrl, _, fwd in can_fwds})
 
-        # Full path-style Source locator per node, so a detected cycle can name the
-        # interface (and socket) of every forwarder on the loop, not just the controller.
-        self._locator_of: Dict[int, str] = {id(fwd): _pdu_forwarder_locator(ctrl, socket, fwd) for ctrl, socket, fwd in pdu_fwds}
-        self._locator_of.update({id(fwd): _can_forwarder_locator(ctrl, iface, fwd) for ctrl, iface, fwd in can_fwds})
+class ForwarderCycle(NamedTuple):
+    """
+    A forwarding loop: a closed walk through the forwarder graph.
 
-        self._state: Dict[int, int] = {id(n): _WHITE for n in self._nodes}
-        self._parent: Dict[int, object] = {}
+    Attributes:
+        nodes (Tuple[ForwarderNode, ...]): The forwarders on the loop, the first one repeated at the end.
+        source (str): Source locator of the socket or CAN interface of the first forwarder, where the loop is entered.
+    """
+
+    nodes: Tuple[ForwarderNode, ...]
+    source: str
 
-    def _ingress_pdu_ref(self, fwd) -> Optional[str]:
-        """Return the PDU name received by ``fwd``."""
-        if isinstance(fwd, PDUForwarder):
-            return fwd.pdu_ref
-        return _egress_pdu_for_can_forwarder(fwd, self._can_frame_catalog)
+    @property
+    def path(self) -> str:
+        """The loop as ``A -> B -> A``."""
+        return " -> ".join(node.label for node in self.nodes)
 
-    def _resolve_eth_neighbour(self, fwd, egress: EthSocketEgress) -> Optional[object]:
-        """Resolve the PDU-forwarder reached via an ``eth_socket`` egress, or ``None`` if unresolvable."""
-        egress_pdu_ref = egress.extract_pdu_ref if egress.extract_pdu_ref is not None else self._ingress_pdu_ref(fwd)
-        src_controller = self._controller_of.get(id(fwd))
-        if egress_pdu_ref is None or src_controller is None:
-            return None
-        return self._pdu_forwarder_idx.get((src_controller.name, egress.socket_ref, egress_pdu_ref))
 
-    def _resolve_neighbour(self, fwd, egress) -> Optional[object]:
-        """Resolve the forwarder reached via one egress, or ``None`` if it does not target one."""
-        if isinstance(egress, EthSocketEgress):
-            return self._resolve_eth_neighbour(fwd, egress)
-        return self._can_forwarder_idx.get((egress.bus_ref, egress.frame_ref))
+class ForwarderGraph(object):
+    """
+    Directed graph of every PDU and CAN-frame forwarder of a model; an edge leads from a forwarder to each forwarder
+    one of its egresses feeds.
 
-    def _neighbours(self, fwd) -> List[object]:
-        """Return forwarders reachable via ``fwd``'s egresses (graph adjacency for the DFS)."""
-        out: List[object] = []
-        for egress_root in fwd.egresses:
-            nxt = self._resolve_neighbour(fwd, egress_root.root)
-            if nxt is not None:
-                out.append(nxt)
-        return out
+    Nodes are addressed by their position in :attr:`nodes` (PDU forwarders first, then CAN-frame forwarders, both in
+    model order). Adjacency is resolved once, so routing tools can walk the graph, or ask for fan-in and fan-out,
+    without re-deriving it from the egresses.
+
+    Attributes:
+        nodes (List[ForwarderNode]): Every forwarder of the model.
+    """
+
+    def __init__(self, nodes: List[ForwarderNode], successors: List[List[int]]):
+        """
+        Create a graph from its nodes and, per node, the positions of the distinct nodes it feeds.
+
+        Prefer :meth:`from_model`.
+        """
+
+        self.nodes = nodes
+        self._successors = successors
+        self._position = {id(node.forwarder): i for i, node in enumerate(nodes)}
+        self._predecessors: List[List[int]] = [[] for _ in nodes]
+        for node, targets in enumerate(successors):
+            for target in targets:
+                self._predecessors[target].append(node)
+
+    @classmethod
+    def from_model(cls, model: "FLYNCModel") -> "ForwarderGraph":
+        """
+        Build the forwarder graph of ``model``.
+
+        Args:
+            model (FLYNCModel): The model whose forwarders and egress targets are resolved.
+
+        Returns:
+            ForwarderGraph: The graph; egresses that do not lead to another forwarder add no edge.
+        """
+
+        index = SystemIndex.of(model)
+        nodes = [ForwarderNode(fwd, ctrl, _pdu_forwarder_locator(ctrl, socket, fwd)) for ctrl, socket, fwd in index.pdu_forwarders]
+        nodes.extend(ForwarderNode(fwd, ctrl, _can_forwarder_locator(ctrl, iface, fwd)) for ctrl, iface, fwd in index.can_frame_forwarders)
+        position = {id(node.forwarder): i for i, node in enumerate(nodes)}
+
+        successors: List[List[int]] = []
+        for node in nodes:
+            targets: Dict[int, None] = {}
+            for egress_root in node.forwarder.egresses:
+                target = _egress_target(node, egress_root.root, index)
+                if target is not None and id(target) in position:
+                    targets[position[id(target)]] = None
+            successors.append(list(targets))
+        return cls(nodes, successors)
+
+    def index_of(self, forwarder: AnyForwarder) -> Optional[int]:
+        """Return the position of ``forwarder`` in :attr:`nodes`, or ``None`` if it is not part of the graph."""
+        return self._position.get(id(forwarder))
+
+    def successors(self, node: int) -> List[int]:
+        """Return the positions of the forwarders ``node`` feeds, in egress order."""
+        return self._successors[node]
+
+    def predecessors(self, node: int) -> List[int]:
+        """Return the positions of the forwarders feeding ``node``."""
+        return self._predecessors[node]
+
+    def fan_out(self, node: int) -> int:
+        """Return the number of distinct forwarders ``node`` feeds."""
+        return len(self._successors[node])
+
+    def fan_in(self, node: int) -> int:
+        """Return the number of distinct forwarders feeding ``node``."""
+        return len(self._predecessors[node])
+
+    def strongly_connected_components(self) -> List[List[int]]:
+        """
+        Return the strongly connected components of the graph, each as sorted node positions.
+
+        Iterative Tarjan: linear in nodes plus edges, and independent of the recursion limit however long the
+        forwarding chains get. Components come out in reverse topological order.
+        """
+
+        order = [-1] * len(self.nodes)
+        low = [0] * len(self.nodes)
+        on_stack = [False] * len(self.nodes)
+        stack: List[int] = []
+        components: List[List[int]] = []
+        counter = 0
+        for root in range(len(self.nodes)):
+            if order[root] != -1:
+                continue
+            order[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [(root, 0)]
+            while work:
+                node, edge = work[-1]
+                if edge < len(self._successors[node]):
+                    work[-1] = (node, edge + 1)
+                    target = self._successors[node][edge]
+                    if order[target] == -1:
+                        order[target] = low[target] = counter
+                        counter += 1
+                        stack.append(target)
+                        on_stack[target] = True
+                        work.append((target, 0))
+                    elif on_stack[target]:
+                        low[node] = min(low[node], order[target])
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == order[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(sorted(component))
+        return components
+
+    def cycles(self) -> List[ForwarderCycle]:
+        """
+        Return one forwarding loop per cyclic strongly connected component, ordered by their first forwarder.
+
+        A component is cyclic when it holds more than one forwarder or a forwarder feeding itself. Every loop of the
+        graph lies within one such component, so an empty result means the graph is acyclic; listing every elementary
+        loop instead would be exponential in the worst case.
+        """
+
+        cyclic = [
+            component for component in self.strongly_connected_components() if len(component) > 1 or component[0] in self._successors[component[0]]
+        ]
+        return [self._cycle_through(component) for component in sorted(cyclic)]
+
+    def _cycle_through(self, component: List[int]) -> ForwarderCycle:
+        """Return a loop through the first forwarder of ``component``, found by an iterative DFS confined to it."""
+
+        start, members = component[0], set(component)
+        parent: Dict[int, int] = {start: start}
+        work = [(start, iter(self._successors[start]))]
+        while work:
+            node, targets = work[-1]
+            for target in targets:
+                if target == start:
+                    walk = [node]
+                    while walk[-1] != start:
+                        walk.append(parent[walk[-1]])
+                    nodes = [self.nodes[i] for i in reversed(walk)] + [self.nodes[start]]
+                    return ForwarderCycle(tuple(nodes), self._cycle_source(nodes))
+                if target in members and target not in parent:
+                    parent[target] = node
+                    work.append((target, iter(self._successors[target])))
+                    break
+            else:
+                work.pop()
+        raise AssertionError("a strongly connected component always has a loop through each of its members")
 
     @staticmethod
-    def _fmt(fwd) -> str:
-        """Format ``fwd`` as a short label for cycle-path error messages."""
-        if isinstance(fwd, PDUForwarder):
-            return f"PDUForwarder(pdu_ref={fwd.pdu_ref})"
-        return f"CANFrameForwarder(frame_ref={fwd.frame_ref})"
-
-    def _cycle_nodes(self, start, end) -> List[object]:
-        """Ordered forwarder nodes forming the detected cycle (``end ... start ... end``), via the DFS parent map."""
-        nodes: List[object] = [end]
-        cur = start
-        while cur is not None and cur is not end:
-            nodes.append(cur)
-            cur = self._parent.get(id(cur))
-        nodes.append(end)
-        return list(reversed(nodes))
-
-    def _cycle_path(self, start, end) -> List[str]:
-        """Short labels for each forwarder on the cycle (for the error message)."""
-        return [self._fmt(node) for node in self._cycle_nodes(start, end)]
-
-    def _cycle_source(self, start, end) -> str:
-        """Source locator spanning every distinct interface/socket the cycle passes through."""
-        seen: List[str] = []
-        for node in self._cycle_nodes(start, end):
-            locator = self._locator_of.get(id(node))
-            if locator and locator not in seen:
-                seen.append(locator)
-        return " ; ".join(seen)
-
-    def _visit_neighbour(self, u, v) -> None:
-        """Apply DFS edge rules for ``u -> v``; raise on a GRAY back-edge."""
-        v_state = self._state.get(id(v), _WHITE)
-        if v_state == _GRAY:
-            raise _with_source(
-                err_major(
-                    "Forwarder cycle detected: {path}",
-                    path=" -> ".join(self._cycle_path(u, v)),
-                    category=Category.STRUCTURAL,
-                    error_number="047",
-                ),
-                self._cycle_source(u, v),
-            )
-        if v_state == _WHITE:
-            self._parent[id(v)] = u
-            self._dfs(v)
+    def _cycle_source(nodes: List[ForwarderNode]) -> str:
+        """
+        Source locator of the cycle: the socket or CAN interface of its first forwarder.
+
+        A ``yaml_path`` names a single location; the other forwarders of the loop are listed in the message.
+        """
+        return nodes[0].locator
 
-    def _dfs(self, u) -> None:
-        """Recursive three-colour DFS body."""
-        self._state[id(u)] = _GRAY
-        for v in self._neighbours(u):
-            self._visit_neighbour(u, v)
-        self._state[id(u)] = _BLACK
 
-    def detect(self) -> None:
-        """Run DFS from every still-WHITE node."""
-        for n in self._nodes:
-            if self._state[id(n)] == _WHITE:
-                self._dfs(n)
+def _egress_target(node: ForwarderNode, egress, index: SystemIndex) -> Optional[AnyForwarder]:
+    """Resolve the forwarder reached via one egress of ``node``, or ``None`` if it does not target one."""
+
+    if not isinstance(egress, EthSocketEgress):
+        return index.can_forwarders_by_bus_id.get((egress.bus_ref, egress.frame_ref))
+    if egress.extract_pdu_ref is not None:
+        egress_pdu_ref: Optional[str] = egress.extract_pdu_ref
+    elif isinstance(node.forwarder, PDUForwarder):
+        egress_pdu_ref = node.forwarder.pdu_ref
+    else:
+        egress_pdu_ref = _egress_pdu_for_can_forwarder(node.forwarder, index.can_frames)
+    if egress_pdu_ref is None:
+        return None
+    return index.pdu_forwarders_by_key.get((node.controller.name, egress.socket_ref, egress_pdu_ref))
 
 
 def detect_forwarder_cycles(model: "FLYNCModel") -> None:
-    """Workspace pass: three-colour DFS over the forwarder graph; raises ``err_major`` with the cycle path on a back-edge."""
+    """Workspace pass: SCC analysis of the forwarder graph; raises one ``err_major`` per forwarding loop, all at once."""
 
-    _ForwarderCycleDetector(model).detect()
+    errors = [
+        _with_source(
+            err_major("Forwarder cycle detected: {path}", path=cycle.path, category=Category.STRUCTURAL, error_number="047"),
+            cycle.source,
+        )
+        for cycle in ForwarderGraph.from_model(model).cycles()
+    ]
+    if len(errors) == 1:
+        raise errors[0]
+    if errors:
+        raise ValidationError.from_exception_data(type(model).__name__, [InitErrorDetails(type=err, input=model) for err in errors])
@@ -13,6 +13,7 @@ from typing import TYPE_CHECKING, Dict, Iterator, Tuple, Union
 from pydantic_core import PydanticCustomError
 
 from flync.core.utils.exceptions import Category, err_major
+from flync.core.utils.system_index import SystemIndex
 from flync.model.flync_4_ecu.can_interface import CANFrameRef, CANInterface
 from flync.model.flync_4_ecu.lin_interface import LINFrameRef, LINMasterInterface, LINSlaveInterface
 from flync.model.flync_4_signal.frame import CANFDFrame, CANFrame, LINFrame
@@ -55,57 +56,11 @@ def _interface_locator(controller: "Controller", iface: AnyBusInterface, kind: s
     return f"controllers/{controller.name}/{kind}_interfaces/{iface.name}"
 
 
-# ---------------------------------------------------------------------------
-# Catalogs
-# ---------------------------------------------------------------------------
-
-
-def _channels(model: "FLYNCModel"):
-    """Return ``communication.channels`` or ``None`` when the model declares no communication."""
-
-    return getattr(model.communication, "channels", None) if model.communication else None
-
-
-def _build_can_frames_by_bus(model: "FLYNCModel") -> Dict[str, Dict[int, CANAnyFrame]]:
-    """Return ``{bus_name: {can_id: frame}}`` for every CAN / CAN FD bus under ``communication.channels``."""
-
-    out: Dict[str, Dict[int, CANAnyFrame]] = {}
-    channels = _channels(model)
-    if channels is None or channels.can_buses is None:
-        return out
-    for bus in channels.can_buses:
-        out[bus.name] = {frame.can_id: frame for frame in bus.frames or []}
-    return out
-
-
-def _build_lin_frames_by_bus(model: "FLYNCModel") -> Dict[str, Dict[int, LINFrame]]:
-    """Return ``{bus_name: {lin_id: frame}}`` for every LIN bus under ``communication.channels``."""
-
-    out: Dict[str, Dict[int, LINFrame]] = {}
-    channels = _channels(model)
-    if channels is None or channels.lin_buses is None:
-        return out
-    for bus in channels.lin_buses:
-        out[bus.name] = {frame.lin_id: frame for frame in bus.frames or []}
-    return out
-
-
 # ---------------------------------------------------------------------------
 # Tree walking
 # ---------------------------------------------------------------------------
 
 
-def _iter_bus_interfaces(model: "FLYNCModel") -> Iterator[Tuple["Controller", AnyBusInterface, str]]:
-    """Yield ``(controller, interface, kind)`` for every CAN and LIN interface in the model."""
-
-    for ecu in model.ecus or []:
-        for controller in ecu.controllers or []:
-            for can_iface in controller.can_interfaces or []:
-                yield controller, can_iface, "can"
-            for lin_iface in controller.lin_interfaces or []:
-                yield controller, lin_iface, "lin"
-
-
 def _iter_frame_refs(iface: AnyBusInterface) -> Iterator[Tuple[str, AnyFrameRef]]:
     """Yield ``(field_name, frame_ref)`` for the sender / receiver declarations present on *iface*.
 
@@ -195,11 +150,12 @@ def validate_interface_frame_refs(model: "FLYNCModel") -> None:
     Once a workspace declares buses of a kind, every interface of that kind must resolve.
     """
 
-    can_frames_by_bus = _build_can_frames_by_bus(model)
-    lin_frames_by_bus = _build_lin_frames_by_bus(model)
+    index = SystemIndex.of(model)
 
-    for controller, iface, kind in _iter_bus_interfaces(model):
-        frames_by_bus: Dict[str, Dict[int, AnyFrame]] = can_frames_by_bus if kind == "can" else lin_frames_by_bus  # type: ignore[assignment]
+    for _, controller, iface, kind in index.bus_interfaces:
+        frames_by_bus: Dict[str, Dict[int, AnyFrame]] = (
+            index.can_frames_by_bus if kind == "can" else index.lin_frames_by_bus  # type: ignore[assignment]
+        )
         if not frames_by_bus:
             continue
         try:
@@ -4,9 +4,10 @@ from .group_membership_handlers import (
     collect_ipv6_solicited_node_rx,
     collect_ipv6_solicited_node_tx,
 )
-from .multicast_paths import compute_path, serialize_components
+from .multicast_paths import MulticastPathIndex, compute_path, serialize_components
 
 __all__ = [
+    "MulticastPathIndex",
     "collect_ipv6_solicited_node_rx",
     "collect_ipv6_solicited_node_tx",
     "compute_path",
@@ -5,18 +5,97 @@ Computes and validates multicast paths through a FLYNC network.
 within a given VLAN; :func:`serialize_components` renders the result for diagnostics. The
 ``get_*_connected_component`` helpers add the neighbours of a switch port, ECU port or controller interface
 and :func:`check_vlan_conn_valid` decides whether a connection may be followed for the given VLAN.
+
+:class:`MulticastPathIndex` keeps the per-VLAN adjacency of switch ports and the computed paths, so the
+multicast groups of a whole system are served by one walk per ``(VLAN, start component)``.
 """
 
-from flync.core.utils.base_utils import check_obj_in_list
 
+def component_key(comp):
+    """
+    Return a hashable key identifying a network component.
+
+    Two components share a key exactly when :func:`~flync.core.utils.base_utils.check_obj_in_list` considers them
+    the same: switch ports and controller interfaces by their own and their owner's name, ECU ports by name.
+    """
+
+    if comp.type == "switch_port":
+        return ("switch_port", comp.get_switch().name, comp.name)
+    if comp.type == "controller_interface":
+        return ("controller_interface", comp.get_controller().name, comp.name)
+    return (comp.type, None, comp.name)
+
+
+class MulticastPathIndex(object):
+    """
+    Reachability index of the Ethernet graph for multicast path computation.
+
+    Switch VLAN memberships are indexed once per switch, and every path is computed once per
+    ``(VLAN, start component)`` and then shared by all multicast groups using it. The index holds references to
+    the model objects it was built from, so it must only live as long as one validation of the model.
+    """
 
-def get_switch_port_connected_component(
-    comp,
-    connected_components,
-    new_connected_components,
-    new_list,
-    vlan,
-):
+    def __init__(self):
+        """Create an empty index; switches and paths are indexed on first use."""
+        self._switch_vlans = {}
+        self._paths = {}
+        self._path_keys = {}
+
+    def _vlans_of(self, switch):
+        """Return ``{vlan id: ports in VLAN entry order}`` and ``{vlan id: port names}`` for ``switch``."""
+        entry = self._switch_vlans.get(id(switch))
+        if entry is None:
+            ports_by_name = {}
+            for sport in switch.ports:
+                ports_by_name.setdefault(sport.name, []).append(sport)
+            vlan_ports = {}
+            vlan_names = {}
+            for vlan_entry in switch.vlans:
+                vlan_ports.setdefault(vlan_entry.id, []).extend(sp for name in vlan_entry.ports for sp in ports_by_name.get(name, ()))
+                vlan_names.setdefault(vlan_entry.id, set()).update(vlan_entry.ports)
+            # the switch is kept alive with its entry, so its id cannot be reused while indexed
+            entry = self._switch_vlans[id(switch)] = (switch, vlan_ports, vlan_names)
+        return entry[1], entry[2]
+
+    def vlan_connected_ports(self, sport, vlan):
+        """Return the switch ports in the same VLAN as ``sport``, like :meth:`SwitchPort.get_vlan_connected_ports`."""
+        return self._vlans_of(sport.get_switch())[0].get(vlan, [])
+
+    def is_part_of_vlan(self, comp, vlan):
+        """Return whether ``comp`` is a member of ``vlan``, like its own ``is_part_of_vlan``."""
+        if comp.type == "switch_port":
+            return comp.name in self._vlans_of(comp.get_switch())[1].get(vlan, ())
+        return comp.is_part_of_vlan(vlan)
+
+    def compute_path(self, vlan, interface):
+        """
+        Return the components reachable from ``interface`` within ``vlan``, computing them on first use.
+
+        The returned list is shared between callers and must not be modified.
+        """
+
+        key = (vlan, component_key(interface))
+        path = self._paths.get(key)
+        if path is None:
+            path, visited = _walk(vlan, interface, self)
+            self._paths[key] = path
+            self._path_keys[id(path)] = visited
+        return path
+
+    def path_contains(self, path, comp):
+        """
+        Return whether ``comp`` is on ``path``, in constant time for paths returned by :meth:`compute_path`.
+
+        Membership follows :func:`component_key`, like :func:`~flync.core.utils.base_utils.check_obj_in_list`.
+        """
+
+        keys = self._path_keys.get(id(path))
+        if keys is None:
+            keys = {component_key(c) for c in path if c is not None}
+        return component_key(comp) in keys
+
+
+def get_switch_port_connected_component(comp, visited, new_list, vlan, index):
     """
     Helper function to help validate multicast paths.
 
@@ -24,20 +103,16 @@ def get_switch_port_connected_component(
     """
 
     conn = comp.connected_component
-    if check_vlan_conn_valid(conn, connected_components, new_connected_components, vlan):
+    if check_vlan_conn_valid(conn, visited, vlan, index):
         new_list.append(conn)
-    mcast_ports = comp.get_vlan_connected_ports(vlan)
+    mcast_ports = index.vlan_connected_ports(comp, vlan)
     for sport_obj in mcast_ports:
 
-        if (
-            not check_obj_in_list(sport_obj, connected_components)
-            and not check_obj_in_list(sport_obj, new_connected_components)
-            and sport_obj.name != comp.name
-        ):
+        if component_key(sport_obj) not in visited and sport_obj.name != comp.name:
             new_list.append(sport_obj)
 
 
-def get_ecu_port_connected_component(comp, connected_components, new_connected_components, new_list, vlan):
+def get_ecu_port_connected_component(comp, visited, new_list, vlan, index):
     """
     Helper function to help validate multicast paths.
 
@@ -46,11 +121,11 @@ def get_ecu_port_connected_component(comp, connected_components, new_connected_c
 
     conn = comp.connected_components
     for conn1 in conn:
-        if check_vlan_conn_valid(conn1, connected_components, new_connected_components, vlan):
+        if check_vlan_conn_valid(conn1, visited, vlan, index):
             new_list.append(conn1)
 
 
-def get_controller_interface_connected_component(comp, connected_components, new_connected_components, new_list, vlan):
+def get_controller_interface_connected_component(comp, visited, new_list, vlan, index):
     """
     Helper function to help validate multicast paths.
 
@@ -59,82 +134,79 @@ def get_controller_interface_connected_component(comp, connected_components, new
 
     conn = comp.connected_component
     for c1 in conn:
-        if check_vlan_conn_valid(c1, connected_components, new_connected_components, vlan):
+        if check_vlan_conn_valid(c1, visited, vlan, index):
             new_list.append(c1)
     connected_interfaces = comp.get_other_interfaces()
 
     for iface in connected_interfaces:
-        if check_vlan_conn_valid(iface, connected_components, new_connected_components, vlan) and iface.name != conn.name:
+        if check_vlan_conn_valid(iface, visited, vlan, index) and iface.name != conn.name:
             new_list.append(iface)
 
 
-def check_vlan_conn_valid(comp, list1, list2, vlan):
+def check_vlan_conn_valid(comp, visited, vlan, index):
     """
     Helper to help compute multicast paths
     """
 
-    flag = True
     if not comp:
         return False
-    if check_obj_in_list(comp, list1):
-        flag = False
-    if check_obj_in_list(comp, list2):
-        flag = False
-    if comp.type == "switch_port" and not comp.is_part_of_vlan(vlan):
-        flag = False
-    if comp.type == "controller_interface" and not comp.is_part_of_vlan(vlan):
-        flag = False
-    return flag
+    if component_key(comp) in visited:
+        return False
+    if comp.type in ("switch_port", "controller_interface") and not index.is_part_of_vlan(comp, vlan):
+        return False
+    return True
 
 
-def compute_path(vlan, interface):
+def compute_path(vlan, interface, index=None):
     """
     Compute multicast path
+
+    Pass a shared :class:`MulticastPathIndex` to reuse switch VLAN indexes and paths across calls.
+    """
+
+    if index is None:
+        index = MulticastPathIndex()
+    return index.compute_path(vlan, interface)
+
+
+def _walk(vlan, interface, index):
+    """
+    Breadth-first walk from ``interface`` within ``vlan``.
+
+    ``visited`` holds the keys of the components already on the path or in the current frontier; a component
+    reached twice from the same frontier is listed twice, as before the index was introduced.
+
+    Returns:
+        tuple[list, set]: The components in visiting order and the set of their keys.
     """
 
-    connected_components = []
+    connected_components = [interface]
+    visited = {component_key(interface)}
     new_connected_components = []
-    connected_components.append(interface)
 
     direct_conn = interface.get_connected_components()
     for c1 in direct_conn:
-        if check_vlan_conn_valid(c1, connected_components, new_connected_components, vlan):
+        if check_vlan_conn_valid(c1, visited, vlan, index):
             new_connected_components.append(c1)
+            visited.add(component_key(c1))
 
     while len(new_connected_components) != 0:
 
         new_list = []
         for comp in new_connected_components:
             if comp._type == "switch_port":
-                get_switch_port_connected_component(
-                    comp,
-                    connected_components,
-                    new_connected_components,
-                    new_list,
-                    vlan,
-                )
+                get_switch_port_connected_component(comp, visited, new_list, vlan, index)
 
             if comp._type == "controller_interface":
-                get_controller_interface_connected_component(
-                    comp,
-                    connected_components,
-                    new_connected_components,
-                    new_list,
-                    vlan,
-                )
+                get_controller_interface_connected_component(comp, visited, new_list, vlan, index)
 
             if comp._type == "ecu_port":
-                get_ecu_port_connected_component(
-                    comp,
-                    connected_components,
-                    new_connected_components,
-                    new_list,
-                    vlan,
-                )
+                get_ecu_port_connected_component(comp, visited, new_list, vlan, index)
 
         connected_components.extend(new_connected_components)
         new_connected_components = new_list
-    return connected_components
+        visited.update(component_key(c) for c in new_list)
+    return connected_components, visited
 
 
 def serialize_components(list):
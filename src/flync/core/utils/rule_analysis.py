@@ -0,0 +1,399 @@
+"""Shadowing, redundancy and conflict analysis of ordered packet-matching rules (TCAM rules and firewall chains)."""
+
+from __future__ import annotations
+
+import json
+from bisect import bisect_left, bisect_right
+from ipaddress import IPv4Address, IPv6Address
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, NamedTuple, Optional, Sequence, Tuple
+
+from flync.core.datatypes.ipaddress import IPv4AddressEntry, IPv6AddressEntry
+from flync.core.datatypes.macaddress import MACAddressEntry
+from flync.core.datatypes.value_range import ValueRange
+
+if TYPE_CHECKING:
+    from flync.core.datatypes import Bitmask
+    from flync.model.flync_4_ecu.switch import FrameMask, TCAMRule
+    from flync.model.flync_4_security.firewall import FirewallRule
+    from flync.model.flync_4_tsn.qos import FrameFilter
+
+_MAC_BITS, _IPV4_BITS, _IPV6_BITS = 48, 32, 128
+_ETHERTYPE_IPV4, _ETHERTYPE_IPV6 = 0x0800, 0x86DD
+
+#: Rules named per finding before the rest is summarised as "and N more".
+MAX_LISTED_RULES = 5
+
+
+# ---------------------------------------------------------------------------
+# Frame filter constraints
+#
+# A FrameFilter is read as one constraint per field: "exact" value sets, "interval"
+# ranges or "masked" (value, mask) pairs. The packet classifier of the SDK indexes the
+# same constraints, so both agree on what a filter matches.
+# ---------------------------------------------------------------------------
+
+
+def _as_list(value: Any) -> List[Any]:
+    return value if isinstance(value, list) else [value]
+
+
+def _mac(value: str | MACAddressEntry) -> Tuple[int, int]:
+    """``(address, mask)`` of a MAC string or entry; a ``macmask`` of ``x`` placeholders means all bits."""
+    full = (1 << _MAC_BITS) - 1
+    if isinstance(value, MACAddressEntry):
+        mask = value.macmask or ""
+        mask = full if "x" in mask.lower() or not mask else int(mask.replace(":", "").replace("-", ""), 16)
+        return int(str(value.address).replace(":", "").replace("-", ""), 16) & mask, mask
+    return int(value.replace(":", "").replace("-", ""), 16), full
+
+
+def _ip(value: IPv4AddressEntry | IPv6AddressEntry | IPv4Address | IPv6Address) -> Tuple[int, int]:
+    """``(address, mask)`` of an IP address, or of an entry with a netmask / prefix."""
+    if isinstance(value, IPv4AddressEntry):
+        mask = int(value.ipv4netmask)
+        return int(value.address) & mask, mask
+    if isinstance(value, IPv6AddressEntry):
+        mask = ((1 << value.ipv6prefix) - 1) << (_IPV6_BITS - value.ipv6prefix)
+        return int(value.address) & mask, mask
+    width = _IPV4_BITS if isinstance(value, IPv4Address) else _IPV6_BITS
+    return int(value), (1 << width) - 1
+
+
+def _range(value: int | ValueRange) -> Tuple[int, int]:
+    return (value.from_value, value.to_value) if isinstance(value, ValueRange) else (value, value)
+
+
+def filter_constraints(match: FrameFilter) -> Dict[str, Tuple[str, List[Any]]]:
+    """
+    Return the constraints of a frame filter as ``{field: (kind, accepted values)}``.
+
+    ``kind`` is ``"exact"`` (hashable values), ``"interval"`` (inclusive ``(low, high)`` ranges) or ``"masked"``
+    (``(value, mask)`` pairs). Fields left ``None`` accept every frame and are omitted.
+    """
+
+    constraints: Dict[str, Tuple[str, List[Any]]] = {}
+    if match.ethertype is not None:
+        constraints["ethertype"] = ("exact", [ethertype.value for ethertype in _as_list(match.ethertype)])
+    if match.vlan_tagged is not None:
+        constraints["vlan_tagged"] = ("exact", [match.vlan_tagged])
+    if match.pcp is not None:
+        constraints["pcp"] = ("exact", _as_list(match.pcp))
+    if match.protocol is not None:
+        constraints["protocol"] = ("exact", [match.protocol])
+    for name in ("vlanid", "src_port", "dst_port"):
+        if getattr(match, name) is not None:
+            constraints[name] = ("interval", [_range(value) for value in _as_list(getattr(match, name))])
+    for name in ("src_mac", "dst_mac"):
+        if getattr(match, name) is not None:
+            constraints[name] = ("masked", [_mac(value) for value in _as_list(getattr(match, name))])
+    for name in ("src_ipv4", "dst_ipv4", "src_ipv6", "dst_ipv6"):
+        if getattr(match, name) is not None:
+            constraints[name] = ("masked", [_ip(value) for value in _as_list(getattr(match, name))])
+    return constraints
+
+
+def _implied_constraints(constraints: Dict[str, Tuple[str, List[Any]]]) -> Dict[str, Tuple[str, List[Any]]]:
+    """Add what other fields imply: a VLAN ID or PCP needs a tagged frame, a port TCP or UDP, and those an IP frame."""
+    if ("vlanid" in constraints or "pcp" in constraints) and "vlan_tagged" not in constraints:
+        constraints["vlan_tagged"] = ("exact", [True])
+    if ("src_port" in constraints or "dst_port" in constraints) and "protocol" not in constraints:
+        constraints["protocol"] = ("exact", ["tcp", "udp"])
+    if "ethertype" not in constraints:
+        if "src_ipv4" in constraints or "dst_ipv4" in constraints:
+            constraints["ethertype"] = ("exact", [_ETHERTYPE_IPV4])
+        elif "src_ipv6" in constraints or "dst_ipv6" in constraints:
+            constraints["ethertype"] = ("exact", [_ETHERTYPE_IPV6])
+        elif "protocol" in constraints:
+            constraints["ethertype"] = ("exact", [_ETHERTYPE_IPV4, _ETHERTYPE_IPV6])
+    return constraints
+
+
+def _frame_mask_entry(frame_masks: Sequence[FrameMask], extent: int) -> Tuple[int, int]:
+    """Fold the byte patterns of one rule into a single ``(value, mask)`` over the first ``extent`` frame bytes."""
+    value = mask = 0
+    for frame_mask in frame_masks:
+        shift = 8 * (extent - frame_mask.offset - frame_mask.byte_length)
+        value |= frame_mask.data << shift
+        mask |= frame_mask.mask << shift
+    return value, mask
+
+
+# ---------------------------------------------------------------------------
+# Per-field indexes
+#
+# Rules are bits of an int in priority order. For the constraint of one rule, every
+# index answers two questions in bit-parallel form: which rules accept *some* value
+# the constraint accepts (they intersect), and which accept *every* such value (they
+# are supersets). ANDing the answers over all fields gives the overlapping and the
+# covering rules without comparing rule pairs.
+# ---------------------------------------------------------------------------
+
+
+class _ExactIndex:
+    def __init__(self, wildcard: int, entries: Sequence[Tuple[Hashable, int]]):
+        self.wildcard, self.table = wildcard, {}
+        for value, bit in entries:
+            self.table[value] = self.table.get(value, 0) | bit
+
+    def query(self, values: Optional[List[Hashable]], everything: int) -> Tuple[int, int]:
+        if values is None:
+            return everything, self.wildcard
+        intersecting, covering = self.wildcard, everything
+        for value in values:
+            bits = self.table.get(value, 0)
+            intersecting |= bits
+            covering &= bits
+        return intersecting, self.wildcard | covering
+
+
+class _IntervalIndex:
+    """
+    Elementary segments of all range bounds, built by one sweep, with a segment tree for range-OR and range-AND.
+
+    The rules covering a whole range are the AND of its segments, the rules touching it their OR. Both cost
+    ``O(log segments)`` operations on rule bit sets.
+    """
+
+    def __init__(self, wildcard: int, entries: Sequence[Tuple[int, int, int]]):
+        self.wildcard = wildcard
+        self.starts = sorted({low for low, _, _ in entries} | {high + 1 for _, high, _ in entries})
+        toggles = [0] * (len(self.starts) + 1)
+        for low, high, bit in entries:  # ranges of one rule were merged, so a rule's bit toggles at each bound
+            toggles[bisect_left(self.starts, low)] ^= bit
+            toggles[bisect_left(self.starts, high + 1)] ^= bit
+        self.size, segments, current = len(self.starts), [], 0
+        for toggle in toggles[:-1]:
+            current ^= toggle
+            segments.append(current)
+        self.any = [0] * self.size + segments
+        self.all = [0] * self.size + segments
+        for node in range(self.size - 1, 0, -1):
+            self.any[node] = self.any[2 * node] | self.any[2 * node + 1]
+            self.all[node] = self.all[2 * node] & self.all[2 * node + 1]
+
+    def _fold(self, low: int, high: int, everything: int) -> Tuple[int, int]:
+        """``(OR, AND)`` of the segments of ``[low, high]``; both bounds are segment starts by construction."""
+        left, right = bisect_left(self.starts, low) + self.size, bisect_right(self.starts, high) + self.size
+        touching, covering = 0, everything
+        while left < right:
+            if left & 1:
+                touching, covering, left = touching | self.any[left], covering & self.all[left], left + 1
+            if right & 1:
+                right -= 1
+                touching, covering = touching | self.any[right], covering & self.all[right]
+            left, right = left // 2, right // 2
+        return touching, covering
+
+    def query(self, ranges: Optional[List[Tuple[int, int]]], everything: int) -> Tuple[int, int]:
+        if ranges is None:
+            return everything, self.wildcard
+        intersecting, covering = self.wildcard, everything
+        for low, high in ranges:
+            touching, covered = self._fold(low, high, everything)
+            intersecting, covering = intersecting | touching, covering & covered
+        return intersecting, self.wildcard | covering
+
+
+class _MaskedIndex:
+    """
+    One hash table per distinct mask, the bit-set form of a prefix trie that also covers non-contiguous masks.
+
+    A ``(value, mask)`` entry is covered by every entry whose mask is a subset of ``mask`` and that agrees on it, and it
+    intersects every entry that agrees on the bits both masks share.
+    """
+
+    def __init__(self, wildcard: int, entries: Sequence[Tuple[int, int, int]]):
+        self.wildcard, self.tables = wildcard, {}
+        for value, mask, bit in entries:
+            table = self.tables.setdefault(mask, {})
+            table[value & mask] = table.get(value & mask, 0) | bit
+        self._projections: Dict[Tuple[int, int], Dict[int, int]] = {}
+
+    def _projection(self, mask: int, shared: int) -> Dict[int, int]:
+        key = (mask, shared)
+        if key not in self._projections:
+            projection: Dict[int, int] = {}
+            for value, bits in self.tables[mask].items():
+                projection[value & shared] = projection.get(value & shared, 0) | bits
+            self._projections[key] = projection
+        return self._projections[key]
+
+    def query(self, entries: Optional[List[Tuple[int, int]]], everything: int) -> Tuple[int, int]:
+        if entries is None:
+            return everything, self.wildcard
+        intersecting, covering = self.wildcard, everything
+        for value, mask in entries:
+            covered = 0
+            for other in self.tables:
+                shared = other & mask
+                intersecting |= self._projection(other, shared).get(value & shared, 0)
+                if shared == other:
+                    covered |= self.tables[other].get(value & other, 0)
+            covering &= covered
+        return intersecting, self.wildcard | covering
+
+
+class RuleFinding(NamedTuple):
+    """
+    One finding of :func:`analyze_rules`; rules are given by their position in priority order.
+
+    Attributes:
+        kind (str): ``"shadowed"`` (an earlier rule with another action catches every frame of the rule),
+            ``"redundant"`` (the rule can be removed without changing any decision) or ``"conflict"`` (the rule
+            partially overlaps earlier rules with another action, so their order decides). Earlier rules the rule fully
+            covers are exceptions to it, and earlier rules that never match cannot conflict.
+        rule (int): The rule the finding is about.
+        others (Tuple[int, ...]): The rules that shadow it, make it redundant or conflict with it.
+    """
+
+    kind: str
+    rule: int
+    others: Tuple[int, ...]
+
+
+def _bits(bits: int) -> Tuple[int, ...]:
+    positions = []
+    while bits:
+        lowest = bits & -bits
+        positions.append(lowest.bit_length() - 1)
+        bits ^= lowest
+    return tuple(positions)
+
+
+def analyze_rules(
+    matches: Sequence[Optional[FrameFilter]],
+    actions: Sequence[Hashable],
+    ports: Optional[Sequence[Sequence[str]]] = None,
+    frame_masks: Optional[Sequence[Sequence[FrameMask]]] = None,
+    vehicle_states: Optional[Sequence[Optional[Bitmask]]] = None,
+) -> List[RuleFinding]:
+    """
+    Find shadowed, redundant and conflicting rules of a first-match rule list.
+
+    Every field gets an index over all rules (hash tables for exact values, a segment tree over elementary intervals
+    for ranges, per-mask hash tables for addresses and byte masks). Each rule then queries every index once, so the
+    analysis needs ``O(rules * fields * log rules)`` bit-set operations instead of comparing all rule pairs.
+
+    A rule is only reported as covered when a *single* other rule covers it. Rules matching on ``frame_mask`` and rules
+    matching on a ``match_filter`` never conflict, because their overlap depends on the frame layout.
+
+    Args:
+        matches (Sequence[Optional[FrameFilter]]): The frame filter of each rule, in priority order; ``None`` accepts
+            every frame.
+        actions (Sequence[Hashable]): A comparable action key per rule.
+        ports (Sequence[Sequence[str]], optional): Ingress ports of each rule; an empty list means all ports.
+        frame_masks (Sequence[Sequence[FrameMask]], optional): The byte patterns of each rule.
+        vehicle_states (Sequence[Optional[Bitmask]], optional): The vehicle-state gate of each rule.
+
+    Returns:
+        List[RuleFinding]: At most one finding per rule, in rule order.
+    """
+
+    count = len(matches)
+    everything = (1 << count) - 1
+    rules: List[Dict[str, Tuple[str, List[Any]]]] = [_implied_constraints(filter_constraints(m)) if m is not None else {} for m in matches]
+    for position, rule_ports in enumerate(ports or []):
+        if rule_ports:
+            rules[position]["match_ports"] = ("exact", list(rule_ports))
+    for position, state in enumerate(vehicle_states or []):
+        if state is not None:
+            rules[position]["vehicle_state"] = ("masked", [(state.data, state.mask)])
+    extent = max((fm.offset + fm.byte_length for masks in frame_masks or [] for fm in masks or []), default=0)
+    mask_rules = 0
+    for position, masks in enumerate(frame_masks or []):
+        if masks:
+            rules[position]["frame_mask"] = ("masked", [_frame_mask_entry(masks, extent)])
+            mask_rules |= 1 << position
+    filter_rules = sum(1 << position for position, match in enumerate(matches) if match is not None)
+    for constraints in rules:
+        for name, (kind, values) in constraints.items():
+            if kind == "interval":  # merge overlapping ranges so every rule covers disjoint ranges per field
+                merged: List[Tuple[int, int]] = []
+                for low, high in sorted(values):
+                    if merged and low <= merged[-1][1] + 1:
+                        merged[-1] = (merged[-1][0], max(high, merged[-1][1]))
+                    else:
+                        merged.append((low, high))
+                constraints[name] = (kind, merged)
+
+    indexes = {}
+    for name in sorted({field for constraints in rules for field in constraints}):
+        wildcard, entries, kind = 0, [], ""
+        for position, constraints in enumerate(rules):
+            if name not in constraints:
+                wildcard |= 1 << position
+                continue
+            kind, values = constraints[name]
+            entries.extend((*value, 1 << position) if kind != "exact" else (value, 1 << position) for value in values)
+        indexes[name] = {"exact": _ExactIndex, "interval": _IntervalIndex, "masked": _MaskedIndex}[kind](wildcard, entries)
+
+    by_action: Dict[Hashable, int] = {}
+    for position, action in enumerate(actions):
+        by_action[action] = by_action.get(action, 0) | 1 << position
+
+    intersections, coverings = [], []
+    for position, constraints in enumerate(rules):
+        intersecting, covering = everything, everything
+        for name, index in indexes.items():
+            touching, covered = index.query(constraints[name][1] if name in constraints else None, everything)
+            intersecting, covering = intersecting & touching, covering & covered
+        intersections.append(intersecting & ~(1 << position))
+        coverings.append(covering & ~(1 << position))
+
+    findings, dead = [], 0
+    for position, (intersecting, covering) in enumerate(zip(intersections, coverings)):
+        bit = 1 << position
+        earlier, same_action = bit - 1, by_action[actions[position]]
+        if covering & earlier:
+            first = covering & earlier & -(covering & earlier)
+            kind = "redundant" if first & same_action else "shadowed"
+            findings.append(RuleFinding(kind, position, _bits(first)))
+            dead |= bit
+            continue
+        later = covering & ~(2 * bit - 1) & same_action
+        if later:
+            first = later & -later
+            if not intersecting & ~same_action & (first - 1) & ~earlier:
+                findings.append(RuleFinding("redundant", position, _bits(first)))
+                continue
+        # an earlier, more specific rule with another action is the usual exception-before-default pattern, not a conflict
+        unrelated = mask_rules if bit & filter_rules else filter_rules if bit & mask_rules else 0
+        candidates = intersecting & earlier & ~same_action & ~unrelated & ~dead
+        conflicting = tuple(other for other in _bits(candidates) if not coverings[other] & bit)
+        if conflicting:
+            findings.append(RuleFinding("conflict", position, conflicting))
+    return findings
+
+
+def _tcam_action_key(rule: TCAMRule) -> str:
+    return json.dumps([action.model_dump(mode="json") for action in rule.action], sort_keys=True)
+
+
+def analyze_tcam_rules(rules: Sequence[TCAMRule]) -> List[RuleFinding]:
+    """
+    Analyse TCAM rules in priority order (lowest ``id`` first); see :func:`analyze_rules`.
+
+    Returns:
+        List[RuleFinding]: Findings whose positions refer to the rules sorted by ``id``.
+    """
+
+    ordered = sorted(rules, key=lambda rule: rule.id)
+    return analyze_rules(
+        [rule.match_filter for rule in ordered],
+        [_tcam_action_key(rule) for rule in ordered],
+        ports=[[] if rule._match_ports_autofilled else rule.match_ports for rule in ordered],
+        frame_masks=[rule.frame_mask for rule in ordered],
+        vehicle_states=[rule.vehicle_state for rule in ordered],
+    )
+
+
+def analyze_firewall_rules(rules: Sequence[FirewallRule]) -> List[RuleFinding]:
+    """Analyse one firewall chain in list order; see :func:`analyze_rules`."""
+    return analyze_rules([rule.pattern for rule in rules], [rule.action for rule in rules])
+
+
+def describe_rules(names: Sequence[str], positions: Sequence[int]) -> str:
+    """Quote the names of ``positions``, listing at most :data:`MAX_LISTED_RULES` of them."""
+    listed = ", ".join(f"'{names[position]}'" for position in positions[:MAX_LISTED_RULES])
+    hidden = len(positions) - MAX_LISTED_RULES
+    return f"{listed} and {hidden} more" if hidden > 0 else listed
@@ -14,11 +14,7 @@ ECU and controller-level memberships are pre-populated during
 from typing import TYPE_CHECKING, Dict, NamedTuple, Set
 
 from flync.core.utils.exceptions import Category, err_major, warn
-from flync.core.utils.forwarder_validators import (
-    _build_can_frame_catalog_by_bus_id,
-    _build_pdu_catalog,
-    _iter_sockets_on_controller,
-)
+from flync.core.utils.system_index import SystemIndex, iter_controller_sockets
 from flync.model.flync_4_nm.state_management import (
     _iter_buses,
     collect_effective_members,
@@ -49,16 +45,16 @@ class _ValidationContext(NamedTuple):
 def _build_context(model: "FLYNCModel", cfg) -> _ValidationContext:
     """Assemble the group-independent catalogs (PDUs, frames, bus topology, timing profiles)."""
 
-    channels = getattr(model.communication, "channels", None) if model.communication else None
-    sent_frame_ids_by_bus, attached_buses_by_ecu = _bus_topology_index(model)
+    index = SystemIndex.of(model)
+    sent_frame_ids_by_bus, attached_buses_by_ecu = _bus_topology_index(index)
     return _ValidationContext(
         model=model,
         timing_profiles={profile.name for profile in (cfg.timing_profiles if cfg else [])},
-        lin_bus_names={bus.name for bus in (channels.lin_buses or [])} if channels else set(),
-        pdu_catalog=_build_pdu_catalog(model),
-        frame_by_bus_id=_build_frame_catalog_by_bus_id(model),
+        lin_bus_names=set(index.lin_frames_by_bus),
+        pdu_catalog=index.pdus,
+        frame_by_bus_id=index.frames_by_bus_id,
         buses_by_name={bus.name: bus for bus in _iter_buses(model)},
-        ecus_by_name={ecu.name: ecu for ecu in model.ecus},
+        ecus_by_name=index.ecus_by_name,
         sent_frame_ids_by_bus=sent_frame_ids_by_bus,
         attached_buses_by_ecu=attached_buses_by_ecu,
         paths_cache={},
@@ -270,9 +266,9 @@ def _reachability_error(group_name, group, member, direction):
     )
 
 
-def _bus_topology_index(model: "FLYNCModel"):
+def _bus_topology_index(index: SystemIndex):
     """
-    One pass over every CAN / LIN interface.
+    One pass over every CAN / LIN interface of the indexed model.
 
     Returns ``(sent_frame_ids_by_bus, attached_buses_by_ecu)``: the frame ids any
     attached interface transmits per bus, and the set of buses each ECU attaches
@@ -281,10 +277,8 @@ def _bus_topology_index(model: "FLYNCModel"):
 
     sent_frame_ids_by_bus: Dict[str, Set[int]] = {}
     attached_buses_by_ecu: Dict[str, Set[str]] = {}
-    for ecu in model.ecus:
-        for controller in ecu.controllers:
-            for iface in (controller.can_interfaces or []) + (controller.lin_interfaces or []):
-                _index_bus_interface(iface, ecu.name, sent_frame_ids_by_bus, attached_buses_by_ecu)
+    for ecu, _, iface, _ in index.bus_interfaces:
+        _index_bus_interface(iface, ecu.name, sent_frame_ids_by_bus, attached_buses_by_ecu)
     return sent_frame_ids_by_bus, attached_buses_by_ecu
 
 
@@ -299,23 +293,6 @@ def _index_bus_interface(iface, ecu_name, sent_frame_ids_by_bus, attached_buses_
         sent_frame_ids_by_bus.setdefault(bus_ref, set()).add(ref.frame_ref)
 
 
-def _build_frame_catalog_by_bus_id(model: "FLYNCModel"):
-    """
-    Return a ``(bus_name, frame_id)``-keyed dict of every CAN and LIN frame.
-
-    Extends the CAN catalog from the forwarder validators with LIN frames
-    (keyed by ``lin_id``) so LIN masters resolve their sender/receiver frames
-    the same way CAN interfaces do.
-    """
-
-    catalog = dict(_build_can_frame_catalog_by_bus_id(model))
-    channels = getattr(model.communication, "channels", None) if model.communication else None
-    for bus in channels.lin_buses or [] if channels else []:
-        for frame in bus.frames or []:
-            catalog[(bus.name, frame.lin_id)] = frame
-    return catalog
-
-
 def _pdu_paths_by_ecu(ecu, pdu_catalog, frame_by_bus_id) -> "tuple[Set[str], Set[str]]":
     """
     Return ``(tx, rx)`` — the names of every PDU the ECU sends respectively
@@ -340,7 +317,7 @@ def _pdu_paths_by_ecu(ecu, pdu_catalog, frame_by_bus_id) -> "tuple[Set[str], Set
 def _collect_socket_pdus(controller, tx: Set[str], rx: Set[str], pdu_catalog) -> None:
     """Add the Ethernet socket-deployed PDUs of a controller to ``tx`` / ``rx``."""
 
-    for socket in _iter_sockets_on_controller(controller):
+    for socket in iter_controller_sockets(controller):
         for dep_root in socket.deployments or []:
             dep = dep_root.root
             if isinstance(dep, PDUSender):
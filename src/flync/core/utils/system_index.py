@@ -0,0 +1,267 @@
+"""
+System-wide lookup catalogs shared by the cross-document validators of a FLYNC model.
+
+:class:`SystemIndex` builds every catalog the model-level passes resolve references against (PDUs, CAN and LIN frames,
+sockets, deployments, forwarders, bus interfaces, SOME/IP services and the names and addresses that must be unique) on
+first use and memoizes it, so a validation walks each part of the model tree once no matter how many passes ask for it.
+The index reflects the model as it was when a catalog was first requested; it lives for the duration of one validation,
+scoped by :meth:`SystemIndex.validation_scope`.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from flync.core.utils.uniqueness_index import UniquenessIndex
+from flync.model.flync_4_signal.forwarder import CANFrameForwarder, PDUForwarder
+from flync.model.flync_4_signal.frame import CANFDFrame, CANFrame, LINFrame
+
+if TYPE_CHECKING:
+    from flync.model.flync_4_ecu.can_interface import CANInterface
+    from flync.model.flync_4_ecu.controller import Controller
+    from flync.model.flync_4_ecu.ecu import ECU
+    from flync.model.flync_4_ecu.sockets import Socket
+    from flync.model.flync_4_signal.pdu import PDU
+    from flync.model.flync_4_signal.pdu_deployment import PDUReceiver, PDUSender
+    from flync.model.flync_4_someip import SOMEIPServiceInterface
+    from flync.model.flync_model import FLYNCModel
+
+CANAnyFrame = Union[CANFrame, CANFDFrame]
+
+# the indexes of the running validation, by id() of their model; None outside of a validation
+_scoped_indexes: ContextVar[Optional[Dict[int, "SystemIndex"]]] = ContextVar("_scoped_indexes", default=None)
+
+
+def iter_controller_sockets(controller: "Controller") -> Iterator["Socket"]:
+    """Yield every :class:`Socket` owned by ``controller``, across all ethernet interfaces and VLAN containers."""
+
+    for eth_iface in controller.ethernet_interfaces or []:
+        for socket_container in eth_iface.sockets or []:
+            yield from socket_container.sockets or []
+
+
+class SystemIndex(object):
+    """
+    Memoized catalogs over one :class:`~flync.model.flync_model.FLYNCModel`.
+
+    Every catalog is a ``cached_property`` built on first access. Where a key occurs more than once, the last
+    occurrence wins, exactly as in the per-pass dicts the catalogs replace.
+
+    Attributes:
+        model (FLYNCModel): The indexed model, or any object exposing the same ``ecus`` / ``communication`` tree.
+    """
+
+    def __init__(self, model: "FLYNCModel"):
+        """Create an index over ``model``; nothing is walked until a catalog is requested."""
+        self.model = model
+
+    @classmethod
+    def of(cls, model: "FLYNCModel") -> "SystemIndex":
+        """
+        Return the index of ``model`` shared by the running validation, or a fresh one outside of a validation.
+
+        Args:
+            model (FLYNCModel): The model whose catalogs are needed.
+
+        Returns:
+            SystemIndex: The shared index of the running validation, else a new index owned by the caller.
+        """
+
+        scope = _scoped_indexes.get()
+        if scope is None:
+            return cls(model)
+        index = scope.get(id(model))
+        if index is None or index.model is not model:
+            index = scope[id(model)] = cls(model)
+        return index
+
+    @staticmethod
+    @contextmanager
+    def validation_scope() -> Iterator[None]:
+        """
+        Share one index per model among the calls of :meth:`of` inside the ``with`` block.
+
+        The indexes are dropped when the block is left, also when a validator raises, so no catalog outlives the
+        validation that built it.
+        """
+
+        token = _scoped_indexes.set({})
+        try:
+            yield
+        finally:
+            _scoped_indexes.reset(token)
+
+    # -----------------------------------------------------------------------
+    # communication.channels
+    # -----------------------------------------------------------------------
+
+    @cached_property
+    def _channels(self) -> Any:
+        communication = getattr(self.model, "communication", None)
+        return getattr(communication, "channels", None) if communication else None
+
+    @cached_property
+    def pdus(self) -> Dict[str, "PDU"]:
+        """Every Standard / Multiplexed / Container PDU declared under ``communication.channels``, by name."""
+        out: Dict[str, "PDU"] = {}
+        if self._channels is None:
+            return out
+        for pdu in self._channels.pdus or []:
+            out[pdu.name] = pdu
+        for container in self._channels.ethernet_pdu_containers or []:
+            out[container.name] = container
+        return out
+
+    @cached_property
+    def can_frames(self) -> Dict[str, CANAnyFrame]:
+        """Every CAN / CAN FD frame declared under ``communication.channels.can_buses``, by name."""
+        return {frame.name: frame for bus in self._can_buses for frame in bus.frames or []}
+
+    @cached_property
+    def can_frames_by_bus_id(self) -> Dict[Tuple[str, int], CANAnyFrame]:
+        """Every CAN / CAN FD frame keyed by ``(bus name, can_id)``."""
+        return {(bus.name, frame.can_id): frame for bus in self._can_buses for frame in bus.frames or []}
+
+    @cached_property
+    def can_frames_by_bus(self) -> Dict[str, Dict[int, CANAnyFrame]]:
+        """``{bus name: {can_id: frame}}`` for every CAN / CAN FD bus."""
+        return {bus.name: {frame.can_id: frame for frame in bus.frames or []} for bus in self._can_buses}
+
+    @cached_property
+    def lin_frames_by_bus(self) -> Dict[str, Dict[int, LINFrame]]:
+        """``{bus name: {lin_id: frame}}`` for every LIN bus."""
+        return {bus.name: {frame.lin_id: frame for frame in bus.frames or []} for bus in self._lin_buses}
+
+    @cached_property
+    def frames_by_bus_id(self) -> Dict[Tuple[str, int], Union[CANAnyFrame, LINFrame]]:
+        """Every CAN, CAN FD and LIN frame keyed by ``(bus name, can_id or lin_id)``, so LIN frame refs resolve like CAN ones."""
+        out: Dict[Tuple[str, int], Union[CANAnyFrame, LINFrame]] = dict(self.can_frames_by_bus_id)
+        for bus in self._lin_buses:
+            for frame in bus.frames or []:
+                out[(bus.name, frame.lin_id)] = frame
+        return out
+
+    @property
+    def _can_buses(self) -> List[Any]:
+        return (self._channels.can_buses or []) if self._channels is not None else []
+
+    @property
+    def _lin_buses(self) -> List[Any]:
+        return (self._channels.lin_buses or []) if self._channels is not None else []
+
+    # -----------------------------------------------------------------------
+    # ECU tree: sockets and their deployments
+    # -----------------------------------------------------------------------
+
+    @cached_property
+    def ecus_by_name(self) -> Dict[str, "ECU"]:
+        """Every ECU, by name."""
+        return {ecu.name: ecu for ecu in self.model.ecus or []}
+
+    @cached_property
+    def sockets(self) -> List[Tuple["ECU", "Controller", "Socket"]]:
+        """``(ecu, controller, socket)`` for every socket of the system, in model order."""
+        return [
+            (ecu, controller, socket)
+            for ecu in self.model.ecus or []
+            for controller in ecu.controllers or []
+            for socket in iter_controller_sockets(controller)
+        ]
+
+    @cached_property
+    def sockets_by_controller(self) -> Dict[Tuple[str, str], Tuple["Controller", "Socket"]]:
+        """``(controller, socket)`` keyed by ``(controller name, socket name)``; socket names may collide across controllers."""
+        return {(controller.name, socket.name): (controller, socket) for _, controller, socket in self.sockets}
+
+    @cached_property
+    def pdu_forwarders(self) -> List[Tuple["Controller", "Socket", PDUForwarder]]:
+        """``(controller, socket, forwarder)`` for every :class:`PDUForwarder` deployment."""
+        return [(controller, socket, dep) for controller, socket, dep in self._socket_deployments if isinstance(dep, PDUForwarder)]
+
+    @cached_property
+    def pdu_forwarders_by_key(self) -> Dict[Tuple[str, str, str], PDUForwarder]:
+        """Every :class:`PDUForwarder` keyed by ``(controller name, socket name, pdu_ref)``."""
+        return {(controller.name, socket.name, fwd.pdu_ref): fwd for controller, socket, fwd in self.pdu_forwarders}
+
+    @cached_property
+    def pdu_deployments(self) -> List[Tuple["Controller", "Socket", "Union[PDUSender, PDUReceiver]"]]:
+        """``(controller, socket, deployment)`` for every standalone or forwarder-adjacent PDUSender / PDUReceiver."""
+        from flync.model.flync_4_signal.pdu_deployment import PDUReceiver, PDUSender  # local import — avoid module cycle
+
+        return [(controller, socket, dep) for controller, socket, dep in self._socket_deployments if isinstance(dep, (PDUSender, PDUReceiver))]
+
+    @cached_property
+    def _socket_deployments(self) -> List[Tuple["Controller", "Socket", Any]]:
+        return [(controller, socket, dep_root.root) for _, controller, socket in self.sockets for dep_root in socket.deployments or []]
+
+    # -----------------------------------------------------------------------
+    # ECU tree: bus interfaces and CAN forwarders
+    # -----------------------------------------------------------------------
+
+    @cached_property
+    def bus_interfaces(self) -> List[Tuple["ECU", "Controller", Any, str]]:
+        """``(ecu, controller, interface, kind)`` for every CAN (``kind == "can"``) and LIN (``"lin"``) interface."""
+        out: List[Tuple["ECU", "Controller", Any, str]] = []
+        for ecu in self.model.ecus or []:
+            for controller in ecu.controllers or []:
+                out.extend((ecu, controller, iface, "can") for iface in controller.can_interfaces or [])
+                out.extend((ecu, controller, iface, "lin") for iface in controller.lin_interfaces or [])
+        return out
+
+    @cached_property
+    def can_interfaces(self) -> List[Tuple["Controller", "CANInterface"]]:
+        """``(controller, interface)`` for every CAN interface."""
+        return [(controller, iface) for _, controller, iface, kind in self.bus_interfaces if kind == "can"]
+
+    @cached_property
+    def can_interfaces_by_controller_bus(self) -> Dict[Tuple[str, str], "CANInterface"]:
+        """Every CAN interface keyed by ``(controller name, bus_ref)``."""
+        return {(controller.name, iface.bus_ref): iface for controller, iface in self.can_interfaces}
+
+    @cached_property
+    def can_frame_forwarders(self) -> List[Tuple["Controller", "CANInterface", CANFrameForwarder]]:
+        """``(controller, interface, forwarder)`` for every :class:`CANFrameForwarder`."""
+        return [(controller, iface, fwd) for controller, iface in self.can_interfaces for fwd in iface.forwarder_frames or []]
+
+    @cached_property
+    def can_forwarders_by_bus_id(self) -> Dict[Tuple[str, int], CANFrameForwarder]:
+        """Every :class:`CANFrameForwarder` whose ingress frame resolves, keyed by ``(bus_ref, can_id)`` of that frame."""
+        out: Dict[Tuple[str, int], CANFrameForwarder] = {}
+        for _, iface, fwd in self.can_frame_forwarders:
+            frame = self.can_frames.get(fwd.frame_ref)
+            if frame is not None:
+                out[(iface.bus_ref, frame.can_id)] = fwd
+        return out
+
+    # -----------------------------------------------------------------------
+    # SOME/IP services
+    # -----------------------------------------------------------------------
+
+    @cached_property
+    def someip_services(self) -> List["SOMEIPServiceInterface"]:
+        """Every SOME/IP service interface of the system-wide ``someip_config``."""
+        communication = getattr(self.model, "communication", None)
+        someip = getattr(communication, "someip_config", None) if communication else None
+        return list(someip.services or []) if someip else []
+
+    @cached_property
+    def someip_services_by_key(self) -> Dict[Tuple[int, int], "SOMEIPServiceInterface"]:
+        """Every SOME/IP service interface keyed by ``(service id, major version)``."""
+        return {(service.id, service.major_version): service for service in self.someip_services}
+
+    @cached_property
+    def someip_service_names(self) -> Set[Tuple[str, int]]:
+        """The ``(name, major version)`` of every SOME/IP service interface."""
+        return {(service.name, service.major_version) for service in self.someip_services}
+
+    # -----------------------------------------------------------------------
+    # unique names and addresses
+    # -----------------------------------------------------------------------
+
+    @cached_property
+    def uniqueness(self) -> UniquenessIndex:
+        """The ECU names, port names, IPs, MACs and transmitted multicast groups of the system, see :class:`UniquenessIndex`."""
+        return UniquenessIndex.from_ecus(self.model.ecus)
@@ -0,0 +1,174 @@
+"""
+System-wide index of the names and addresses that must be unique across a FLYNC model.
+
+:class:`UniquenessIndex` is filled in a single pass over the ECUs of a :class:`~flync.model.flync_model.FLYNCModel`
+and then answers every uniqueness and membership question of the model-level validators in constant time.
+Addresses are hashed by their packed integer value rather than their text, so two spellings of the same address
+(``02:AA:...`` and ``02:aa:...``, or an expanded and a compressed IPv6 address) are recognised as one.
+"""
+
+from __future__ import annotations
+
+from ipaddress import IPv4Address, IPv6Address, ip_address
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterable, List, NamedTuple, Optional, Tuple
+
+if TYPE_CHECKING:
+    from flync.model.flync_4_ecu.ecu import ECU
+    from flync.model.flync_4_ecu.sockets import Socket
+
+#: IPs standing for a dynamically assigned address; they may repeat freely.
+DYNAMIC_IPS = frozenset({("ip", 4, 0), ("ip", 6, 0)})
+
+
+def ip_key(address: Any) -> Tuple[str, int, int]:
+    """Return the hash key of an IP address given as text or as an ``ipaddress`` object."""
+    if not isinstance(address, (IPv4Address, IPv6Address)):
+        address = ip_address(str(address))
+    return ("ip", address.version, int(address))
+
+
+def mac_key(address: Any) -> Tuple[str, int]:
+    """Return the hash key of a MAC address, whatever its separators or letter case."""
+    digits = str(address).replace(":", "").replace("-", "").replace(".", "")
+    return ("mac", int(digits, 16))
+
+
+def address_key(address: Any) -> Tuple:
+    """Return the hash key of an IP or MAC address, e.g. the ``group`` of a multicast group membership."""
+    if isinstance(address, (IPv4Address, IPv6Address)):
+        return ip_key(address)
+    try:
+        return ip_key(address)
+    except ValueError:
+        return mac_key(address)
+
+
+class Duplicate(NamedTuple):
+    """
+    A value registered more than once in a namespace of a :class:`UniquenessIndex`.
+
+    Attributes:
+        value (Any): The repeated value, as it was registered the second time.
+        first_owner (str): Name of the ECU owning the first occurrence.
+        owner (str): Name of the ECU owning the repeated occurrence; equal to ``first_owner`` for a repeat within one ECU.
+    """
+
+    value: Any
+    first_owner: str
+    owner: str
+
+
+class UniquenessIndex(object):
+    """
+    Owners of the names and addresses of a system, one namespace per kind of value.
+
+    Every value is registered with the name of the ECU owning it. The first owner of a key is kept and every later
+    registration of the same key is recorded as a :class:`Duplicate`, so all conflicts of a namespace are known once the
+    index is built, together with both owning ECUs.
+    """
+
+    ECU_NAMES = "ecu_names"
+    PORT_NAMES = "port_names"
+    IPS = "ips"
+    MACS = "macs"
+    MULTICAST_TX = "multicast_tx"
+
+    def __init__(self):
+        """Create an empty index."""
+        self._owners: Dict[str, Dict[Hashable, str]] = {}
+        self._values: Dict[str, List[Any]] = {}
+        self._duplicates: Dict[str, List[Duplicate]] = {}
+        self._socket_tx: Dict[int, Tuple["Socket", frozenset]] = {}
+
+    @classmethod
+    def from_ecus(cls, ecus: Iterable["ECU"]) -> "UniquenessIndex":
+        """
+        Index the names, addresses and transmitted multicast groups of ``ecus`` in one pass.
+
+        Args:
+            ecus (Iterable[ECU]): The ECUs of the system.
+
+        Returns:
+            UniquenessIndex: The filled index.
+        """
+
+        index = cls()
+        for ecu in ecus:
+            index.add(cls.ECU_NAMES, ecu.name, ecu.name)
+            for port in ecu.get_all_ports():
+                index.add(cls.PORT_NAMES, port.name, ecu.name)
+            for ip in ecu.get_all_ips():
+                key = ip_key(ip)
+                if key not in DYNAMIC_IPS:
+                    index.add(cls.IPS, ip, ecu.name, key=key)
+            for mac in ecu.get_all_macs():
+                index.add(cls.MACS, mac, ecu.name, key=mac_key(mac))
+            for mcast in ecu.multicast_groups or []:
+                if mcast.mode == "tx":
+                    index.add(cls.MULTICAST_TX, mcast, ecu.name, key=cls.multicast_key(mcast.group, mcast.vlan))
+        return index
+
+    @staticmethod
+    def multicast_key(group: Any, vlan: Optional[int]) -> Tuple:
+        """Return the key of a multicast group within a VLAN in the :attr:`MULTICAST_TX` namespace."""
+        return (address_key(group), vlan)
+
+    def add(self, namespace: str, value: Any, owner: str, key: Optional[Hashable] = None) -> Optional[Duplicate]:
+        """
+        Register ``value`` as owned by the ECU ``owner``.
+
+        Args:
+            namespace (str): The kind of value, e.g. :attr:`IPS`.
+            value (Any): The value to register.
+            owner (str): Name of the ECU owning the value.
+            key (Hashable | None): Key identifying the value; defaults to the value itself.
+
+        Returns:
+            Duplicate | None: The conflict with an earlier registration of the same key, if any.
+        """
+
+        owners = self._owners.setdefault(namespace, {})
+        self._values.setdefault(namespace, []).append(value)
+        key = value if key is None else key
+        first_owner = owners.get(key)
+        if first_owner is None:
+            owners[key] = owner
+            return None
+        duplicate = Duplicate(value, first_owner, owner)
+        self._duplicates.setdefault(namespace, []).append(duplicate)
+        return duplicate
+
+    def contains(self, namespace: str, key: Hashable) -> bool:
+        """Return whether a value with ``key`` is registered in ``namespace``."""
+        return key in self._owners.get(namespace, {})
+
+    def owner(self, namespace: str, key: Hashable) -> Optional[str]:
+        """Return the ECU owning the first value registered with ``key`` in ``namespace``, or ``None``."""
+        return self._owners.get(namespace, {}).get(key)
+
+    def values(self, namespace: str) -> List[Any]:
+        """Return every value registered in ``namespace``, duplicates included, in registration order."""
+        return self._values.get(namespace, [])
+
+    def duplicates(self, namespace: str) -> List[Duplicate]:
+        """Return every repeated registration in ``namespace``, in registration order."""
+        return self._duplicates.get(namespace, [])
+
+    def socket_transmits(self, socket: "Socket", address: Any) -> bool:
+        """
+        Return whether ``address`` is one of the ``multicast_tx`` entries of ``socket``.
+
+        The entries of each socket are hashed on first use.
+        """
+
+        entry = self._socket_tx.get(id(socket))
+        if entry is None:
+            # the socket is kept alive with its entry, so its id cannot be reused while indexed
+            entry = self._socket_tx[id(socket)] = (socket, frozenset(ip_key(tx) for tx in socket.multicast_tx or []))
+        return ip_key(address) in entry[1]
+
+    def __getstate__(self):
+        """Drop the per-socket entries, which are keyed by object identity."""
+        state = self.__dict__.copy()
+        state["_socket_tx"] = {}
+        return state
@@ -0,0 +1,275 @@
+"""
+Opt-in profiling of a FLYNC validation.
+
+A :class:`ValidationProfile` records the wall time, the number of calls and, optionally, the ``tracemalloc`` peak of
+
+* the phases of a load (``kind="phase"``): parsing the documents, the whole load, every ``validate_with_policy``
+  round and the object mapping,
+* every document (``kind="document"``): the validation of its load node,
+* every model validator (``kind="validator"``), e.g. ``FLYNCModel.validate_multicast_paths``.
+
+The code paths mark phases and documents with :func:`profile_scope`, which costs a context-variable lookup while no
+profile is active. Model validators are not touched at all: an active profile times the code objects of the
+validators through :mod:`sys.monitoring`, so only their calls raise an event.
+
+Times are inclusive: a phase contains the documents and validators it ran, a document the validators run for it. The
+memory peak of a scope is the largest amount of memory allocated on top of what was allocated when it was entered.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import CodeType
+from typing import Any, Iterator, Optional
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+_active_profile: ContextVar[Optional["ValidationProfile"]] = ContextVar("_active_profile", default=None)
+
+
+@dataclass
+class ProfileEntry(object):
+    """
+    Accumulated measurements of one profiled scope.
+
+    Attributes:
+        kind (str): ``"phase"``, ``"document"`` or ``"validator"``.
+        name (str): Name of the phase, uri of the document or qualified name of the validator.
+        calls (int): How often the scope was entered.
+        seconds (float): Total wall time spent in it.
+        peak_bytes (int | None): Largest memory peak of one call, if memory was traced.
+    """
+
+    kind: str
+    name: str
+    calls: int = 0
+    seconds: float = 0.0
+    peak_bytes: Optional[int] = None
+
+
+class _Frame(object):
+    """An open scope: its entry, start time, the traced memory at its start and the largest peak seen inside it."""
+
+    __slots__ = ("entry", "code", "start", "memory", "peak")
+
+    def __init__(self, entry: ProfileEntry, code: Optional[CodeType], memory: int):
+        self.entry = entry
+        self.code = code
+        self.memory = memory
+        self.peak = memory
+        self.start = time.perf_counter()
+
+
+class ValidationProfile(object):
+    """
+    Measurements of the validations run while the profile was active.
+
+    Example::
+
+        profile = ValidationProfile(trace_memory=True)
+        with profile.activate():
+            validate_workspace(path)
+        profile.write_json("profile.json")
+
+    Attributes:
+        trace_memory (bool): Also record the ``tracemalloc`` peak of every scope. Tracing slows the validation
+            down considerably, so times measured with it are only comparable with each other.
+        entries (dict[tuple[str, str], ProfileEntry]): The measurements, by ``(kind, name)``.
+        seconds (float): Total wall time the profile was active.
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.entries: dict[tuple[str, str], ProfileEntry] = {}
+        self.seconds = 0.0
+        self._stack: list[_Frame] = []
+        self._validators: dict[CodeType, str] = {}
+
+    def entry(self, kind: str, name: str) -> ProfileEntry:
+        """Return the entry of a scope, creating it on first use."""
+        key = (kind, name)
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self.entries[key] = ProfileEntry(kind, name)
+        return entry
+
+    def sorted_entries(self, kind: Optional[str] = None) -> list[ProfileEntry]:
+        """Return the entries, or those of one ``kind``, slowest first."""
+        return sorted((e for e in self.entries.values() if kind is None or e.kind == kind), key=lambda e: (-e.seconds, e.kind, e.name))
+
+    def merge(self, other: "ValidationProfile") -> None:
+        """Add the measurements of ``other``, e.g. of a parallel-validation worker, to this profile."""
+        for entry in other.entries.values():
+            mine = self.entry(entry.kind, entry.name)
+            mine.calls += entry.calls
+            mine.seconds += entry.seconds
+            if entry.peak_bytes is not None:
+                mine.peak_bytes = max(mine.peak_bytes or 0, entry.peak_bytes)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the profile as JSON-compatible data, the entries slowest first."""
+        return {
+            "seconds": self.seconds,
+            "trace_memory": self.trace_memory,
+            "entries": [asdict(entry) for entry in self.sorted_entries()],
+        }
+
+    def write_json(self, path: str | Path) -> None:
+        """Write :meth:`to_dict` to ``path``."""
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+
+    @contextmanager
+    def activate(self) -> Iterator["ValidationProfile"]:
+        """
+        Record the validations run inside the ``with`` block into this profile.
+
+        Yields:
+            ValidationProfile: This profile.
+        """
+
+        if _active_profile.get() is self:
+            yield self
+            return
+        token = _active_profile.set(self)
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        monitoring = self._start_monitoring()
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.seconds += time.perf_counter() - start
+            if monitoring:
+                self._stop_monitoring()
+            if started_tracing:
+                tracemalloc.stop()
+            self._stack.clear()
+            _active_profile.reset(token)
+
+    def _enter(self, kind: str, name: str, code: Optional[CodeType] = None) -> None:
+        memory = 0
+        if self.trace_memory and tracemalloc.is_tracing():
+            memory, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                # the peak so far belongs to the enclosing scope, the reset below would lose it
+                self._stack[-1].peak = max(self._stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+        self._stack.append(_Frame(self.entry(kind, name), code, memory))
+
+    def _exit(self) -> None:
+        frame = self._stack.pop()
+        entry = frame.entry
+        entry.calls += 1
+        entry.seconds += time.perf_counter() - frame.start
+        if self.trace_memory and tracemalloc.is_tracing():
+            peak = max(tracemalloc.get_traced_memory()[1], frame.peak)
+            entry.peak_bytes = max(entry.peak_bytes or 0, peak - frame.memory)
+            if self._stack:
+                self._stack[-1].peak = max(self._stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+
+    # ---------------------------------------------------------------------
+    # model validators, through sys.monitoring
+    # ---------------------------------------------------------------------
+
+    def _start_monitoring(self) -> bool:
+        monitoring = sys.monitoring
+        tool = monitoring.PROFILER_ID
+        try:
+            monitoring.use_tool_id(tool, "flync validation profile")
+        except ValueError:
+            logger.warning("Another profiler is active; model validators are not profiled")
+            return False
+        self._validators = _model_validator_codes()
+        events = monitoring.events
+        monitoring.register_callback(tool, events.PY_START, self._on_start)
+        monitoring.register_callback(tool, events.PY_RETURN, self._on_return)
+        monitoring.register_callback(tool, events.PY_UNWIND, self._on_unwind)
+        for code in self._validators:
+            monitoring.set_local_events(tool, code, events.PY_START | events.PY_RETURN)
+        # a validator that raises leaves through PY_UNWIND, which cannot be enabled per code object
+        monitoring.set_events(tool, events.PY_UNWIND)
+        return True
+
+    def _stop_monitoring(self) -> None:
+        monitoring = sys.monitoring
+        tool = monitoring.PROFILER_ID
+        monitoring.set_events(tool, 0)
+        for code in self._validators:
+            monitoring.set_local_events(tool, code, 0)
+        for event in (monitoring.events.PY_START, monitoring.events.PY_RETURN, monitoring.events.PY_UNWIND):
+            monitoring.register_callback(tool, event, None)
+        monitoring.free_tool_id(tool)
+        # code objects cannot be pickled, and a profile of a worker process is pickled back to the loading one
+        self._validators = {}
+
+    def _on_start(self, code: CodeType, offset: int) -> None:
+        name = self._validators.get(code)
+        if name is not None:
+            self._enter("validator", name, code)
+
+    def _on_return(self, code: CodeType, offset: int, retval: object) -> None:
+        if self._stack and self._stack[-1].code is code:
+            self._exit()
+
+    def _on_unwind(self, code: CodeType, offset: int, exception: BaseException) -> None:
+        if self._stack and self._stack[-1].code is code:
+            self._exit()
+
+
+def _model_validator_codes() -> dict[CodeType, str]:
+    """Return the code objects of the model validators of every loaded pydantic model, with the validator names."""
+
+    codes: dict[CodeType, str] = {}
+    pending = list(BaseModel.__subclasses__())
+    seen: set[type] = set()
+    while pending:
+        cls = pending.pop()
+        if cls in seen:
+            continue
+        seen.add(cls)
+        pending.extend(cls.__subclasses__())
+        decorators = getattr(cls, "__pydantic_decorators__", None)
+        for decorator in decorators.model_validators.values() if decorators is not None else ():
+            func = getattr(decorator.func, "__func__", decorator.func)
+            code = getattr(func, "__code__", None)
+            if code is not None:
+                codes.setdefault(code, func.__qualname__)
+    return codes
+
+
+def active_profile() -> Optional[ValidationProfile]:
+    """Return the profile recording the current validation, if any."""
+    return _active_profile.get()
+
+
+@contextmanager
+def profile_scope(kind: str, name: str) -> Iterator[None]:
+    """
+    Record the ``with`` block as a call of the scope ``(kind, name)`` of the active profile; a no-op without one.
+
+    Args:
+        kind (str): ``"phase"`` or ``"document"``.
+        name (str): Name of the phase or uri of the document.
+    """
+
+    profile = _active_profile.get()
+    if profile is None:
+        yield
+        return
+    profile._enter(kind, name)
+    try:
+        yield
+    finally:
+        profile._exit()
@@ -23,6 +23,7 @@ from pydantic import (
 )
 
 import flync.core.utils.common_validators as common_validators
+import flync.core.utils.rule_analysis as rule_analysis
 from flync.core.annotations import (
     External,
     Implied,
@@ -179,12 +180,11 @@ class SwitchPort(FLYNCBaseModel):
         Returns the switch ports that are part of the same VLAN as that port.
         """
 
-        ports = []
-        for vlan_entry in self.get_switch().vlans:
-            if vlan_entry.id == vlan:
-                ports.extend(vlan_entry.ports)
-        ports_obj = [sp for sport in ports for sp in self.get_switch().ports if sp.name == sport]
-        return ports_obj
+        switch = self.get_switch()
+        ports_by_name: dict = {}
+        for sp in switch.ports:
+            ports_by_name.setdefault(sp.name, []).append(sp)
+        return [sp for vlan_entry in switch.vlans if vlan_entry.id == vlan for sport in vlan_entry.ports for sp in ports_by_name.get(sport, ())]
 
     def is_part_of_vlan(self, vlan):
         for vlan_entry in self.get_switch().vlans:
@@ -702,6 +702,41 @@ class Switch(FLYNCBaseModel):
 
         return self
 
+    @model_validator(mode="after")
+    def validate_tcam_rule_overlaps(self):
+        """
+        Warn about TCAM rules that never match, can be removed, or partially overlap earlier rules with another action.
+
+        Rules are analysed in priority order (lowest ``id`` first) by :func:`~flync.core.utils.rule_analysis.analyze_tcam_rules`,
+        which scales to thousands of rules.
+        """
+
+        if not self.tcam_rules:
+            return self
+        names = [rule.name for rule in sorted(self.tcam_rules, key=lambda rule: rule.id)]
+        for finding in rule_analysis.analyze_tcam_rules(self.tcam_rules):
+            name, others = names[finding.rule], rule_analysis.describe_rules(names, finding.others)
+            if finding.kind == "shadowed":
+                warn(
+                    f"TCAM rule '{name}' never matches: the earlier rule {others} matches all of its frames with a different action.",
+                    category=Category.CONSISTENCY,
+                    error_number="241",
+                )
+            elif finding.kind == "redundant":
+                warn(
+                    f"TCAM rule '{name}' is redundant: rule {others} applies the same actions to all of its frames.",
+                    category=Category.CONSISTENCY,
+                    error_number="242",
+                )
+            else:
+                warn(
+                    f"TCAM rule '{name}' partially overlaps the earlier rule(s) {others} with different actions; "
+                    "the rule ids decide which actions apply to the overlap.",
+                    category=Category.CONSISTENCY,
+                    error_number="243",
+                )
+        return self
+
     def get_mac(self):
         """Return MAC address from the host controller's first ethernet interface."""
         macs = self.host_controller.get_all_macs()
@@ -6,7 +6,8 @@ from pydantic import BeforeValidator, Field, field_validator, model_validator
 
 import flync.core.utils.common_validators as common_validators
 from flync.core.base_models.base_model import FLYNCBaseModel
-from flync.core.utils.exceptions import Category, err_minor
+from flync.core.utils.exceptions import Category, err_minor, warn
+from flync.core.utils.rule_analysis import analyze_firewall_rules, describe_rules
 from flync.model.flync_4_tsn.qos import FrameFilter
 
 
@@ -86,3 +87,33 @@ class Firewall(FLYNCBaseModel):
                 raise err_minor("Two or more rules cannot be the same", category=Category.UNIQUENESS, error_number="099")
             filter_list.append(rule.pattern)
         return rules
+
+    @model_validator(mode="after")
+    def check_rule_anomalies(self):
+        """Warn about rules of a chain that never match, can be removed, or partially overlap earlier rules with another action."""
+        for chain in ("input", "output", "forward"):
+            rules = getattr(self, f"{chain}_rules") or []
+            names = [rule.name for rule in rules]
+            for finding in analyze_firewall_rules(rules):
+                name, others = names[finding.rule], describe_rules(names, finding.others)
+                if finding.kind == "shadowed":
+                    warn(
+                        f"Firewall {chain} rule '{name}' never matches: "
+                        f"the earlier rule {others} matches all of its frames with a different action.",
+                        category=Category.CONSISTENCY,
+                        error_number="244",
+                    )
+                elif finding.kind == "redundant":
+                    warn(
+                        f"Firewall {chain} rule '{name}' is redundant: rule {others} gives all of its frames the same action.",
+                        category=Category.CONSISTENCY,
+                        error_number="245",
+                    )
+                else:
+                    warn(
+                        f"Firewall {chain} rule '{name}' partially overlaps the earlier rule(s) {others} with a different action; "
+                        "the rule order decides which action applies to the overlap.",
+                        category=Category.CONSISTENCY,
+                        error_number="246",
+                    )
+        return self
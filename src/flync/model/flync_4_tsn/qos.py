@@ -344,12 +344,11 @@ class FrameFilter(FLYNCBaseModel):
     @field_validator("src_mac", "dst_mac", mode="after")
     @classmethod
     def validate_port_mac(cls, value):
-        """MAC addresses must be valid."""
-        if isinstance(value, List):
-            for element in value:
-                value = MacAddress.validate_mac_address(element.encode())
-        else:
-            value = MacAddress.validate_mac_address(value.encode())
+        """MAC addresses must be valid; :class:`MACAddressEntry` values were already validated by their own model."""
+        if isinstance(value, list):
+            return [cls.validate_port_mac(element) for element in value]
+        if isinstance(value, str):
+            return MacAddress.validate_mac_address(value.encode())
         return value
 
     @field_validator("src_port", "dst_port", mode="after")
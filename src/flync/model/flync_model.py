@@ -10,10 +10,10 @@ from pydantic_core import PydanticCustomError
 
 from flync.core.annotations import External, NamingStrategy, OutputStrategy
 from flync.core.base_models.base_model import FLYNCBaseModel
-from flync.core.utils.base_utils import check_obj_in_list
 from flync.core.utils.common_validators import validate_list_items_unique
 from flync.core.utils.exceptions import Category, err_major, warn
 from flync.core.utils.forwarder_validators import (
+    ForwarderGraph,
     detect_forwarder_cycles,
     validate_forwarder_locality,
     validate_forwarder_refs,
@@ -23,6 +23,7 @@ from flync.core.utils.interface_validators import (
     validate_interface_frame_refs,
 )
 from flync.core.utils.multicast import (
+    MulticastPathIndex,
     collect_ipv6_solicited_node_rx,
     collect_ipv6_solicited_node_tx,
     compute_path,
@@ -31,6 +32,8 @@ from flync.core.utils.multicast import (
 from flync.core.utils.state_management_validators import (
     validate_state_management,
 )
+from flync.core.utils.system_index import SystemIndex
+from flync.core.utils.uniqueness_index import UniquenessIndex
 from flync.model.flync_4_app import App
 from flync.model.flync_4_communication import FLYNCCommunicationConfig
 from flync.model.flync_4_ecu import (
@@ -186,13 +189,12 @@ class FLYNCModel(FLYNCBaseModel):
 
     @model_validator(mode="after")
     def validate_unique_ecu_names(self):
-        validate_list_items_unique([ecu.name for ecu in self.ecus], "ECU names")
+        validate_list_items_unique(SystemIndex.of(self).uniqueness.values(UniquenessIndex.ECU_NAMES), "ECU names")
         return self
 
     @model_validator(mode="after")
     def validate_unique_port_names(self):
-        all_ports = [port.name for ecu in self.ecus for port in ecu.get_all_ports()]
-        validate_list_items_unique(all_ports, "ECU port names")
+        validate_list_items_unique(SystemIndex.of(self).uniqueness.values(UniquenessIndex.PORT_NAMES), "ECU port names")
         return self
 
     @model_validator(mode="after")
@@ -271,14 +273,12 @@ class FLYNCModel(FLYNCBaseModel):
         """
 
         try:
-            all_ips = []
-            for ecu in self.ecus:
-                new_ips = ecu.get_all_ips()
-                for ip in new_ips:
-                    if ip not in all_ips:
-                        all_ips.append(ip)
-                    elif str(ip) not in ("0.0.0.0", "::"):
-                        warn(f"The IP {ip} is repeated in ECU {ecu.name}", category=Category.UNIQUENESS, error_number="165")
+            for ip, first_owner, owner in SystemIndex.of(self).uniqueness.duplicates(UniquenessIndex.IPS):
+                warn(
+                    f"The IP {ip} is repeated in ECU {owner} (first used in ECU {first_owner})",
+                    category=Category.UNIQUENESS,
+                    error_number="165",
+                )
         except PydanticCustomError as e:
             warn(str(e), category=Category.UNIQUENESS, error_number="166")
         return self
@@ -286,24 +286,17 @@ class FLYNCModel(FLYNCBaseModel):
     @model_validator(mode="after")
     def check_tx_rx_multicast_group(self):
         try:
-            tx_list = []
-            rx_list = []
             separ = "/VLAN"
+            index = SystemIndex.of(self).uniqueness
             for ecu in self.ecus:
                 for mcast in ecu.multicast_groups:
-                    key = str(mcast.group) + separ + str(mcast.vlan)
-                    if mcast.mode == "tx":
-                        tx_list.append(key)
-                    if mcast.mode == "rx":
-                        rx_list.append(key)
-
-            for rx in rx_list:
-                if rx not in tx_list:
-                    warn(
-                        f"Invalid Multicast Configuration. There is a multicast rx configured for the address {rx} but no tx.",
-                        category=Category.CONSISTENCY,
-                        error_number="167",
-                    )
+                    if mcast.mode == "rx" and not index.contains(UniquenessIndex.MULTICAST_TX, index.multicast_key(mcast.group, mcast.vlan)):
+                        rx = str(mcast.group) + separ + str(mcast.vlan)
+                        warn(
+                            f"Invalid Multicast Configuration. There is a multicast rx configured for the address {rx} but no tx.",
+                            category=Category.CONSISTENCY,
+                            error_number="167",
+                        )
         except PydanticCustomError as e:
             warn(str(e), category=Category.CONSISTENCY, error_number="168")
         return self
@@ -314,21 +307,22 @@ class FLYNCModel(FLYNCBaseModel):
             paths = {}
             vlans_dict = {}
             separ = "/VLAN"
+            path_index = MulticastPathIndex()
             for ecu in self.ecus:
                 for mcast in ecu.multicast_groups:
                     key = str(mcast.group) + separ + str(mcast.vlan)
                     vlans_dict[key] = mcast.vlan
                     if (mcast.mode == "tx") and key not in paths:
 
-                        paths[key] = compute_path(mcast.vlan, mcast._interface)
-                    if (mcast.mode == "tx") and key in paths and not check_obj_in_list(mcast._interface, paths[key]):
+                        paths[key] = compute_path(mcast.vlan, mcast._interface, path_index)
+                    if (mcast.mode == "tx") and key in paths and not path_index.path_contains(paths[key], mcast._interface):
                         warn(
                             "Invalid Multicast Address Configuration. There are several RX that the TX Endpoint at "
                             f"{mcast._interface.name} cannot reach. {serialize_components(paths[key])}",
                             category=Category.CONSISTENCY,
                             error_number="169",
                         )
-            self.check_rx_are_reached(separ, paths, vlans_dict)
+            self.check_rx_are_reached(separ, paths, vlans_dict, path_index)
         except PydanticCustomError as e:
             warn(str(e), category=Category.CONSISTENCY, error_number="170")
         return self
@@ -371,14 +365,10 @@ class FLYNCModel(FLYNCBaseModel):
         Validate all MACs are unique system wide
         """
 
-        all_macs = []
-        for ecu in self.ecus:
-            new_macs = ecu.get_all_macs()
-            for mac in new_macs:
-                if mac not in all_macs:
-                    all_macs.append(mac)
-                else:
-                    raise err_major(f"The MAC {mac} is repeated in ECU {ecu.name}", category=Category.UNIQUENESS, error_number="172")
+        duplicates = SystemIndex.of(self).uniqueness.duplicates(UniquenessIndex.MACS)
+        if duplicates:
+            repeats = "; ".join(f"{mac} is repeated in ECU {owner} (first used in ECU {first_owner})" for mac, first_owner, owner in duplicates)
+            raise err_major(f"Repeated MAC addresses: {repeats}", category=Category.UNIQUENESS, error_number="172")
         return self
 
     @model_validator(mode="after")
@@ -403,7 +393,7 @@ class FLYNCModel(FLYNCBaseModel):
     @model_validator(mode="after")
     def validate_service_refs_in_apps(self):
         """Validate that applications are referencing existing services."""
-        known_services = {(svc.name, svc.major_version) for svc in self.get_all_someip_services()}
+        known_services = SystemIndex.of(self).someip_service_names
         for app in self.apps or []:
             for ref in (app.service_consumer_refs or []) + (app.service_provider_refs or []):
                 if (ref.service_name, ref.major_version) not in known_services:
@@ -448,7 +438,9 @@ class FLYNCModel(FLYNCBaseModel):
         """Return the derived LIN bus topology for ``bus_name``, or ``None`` if unknown."""
         return next((t for t in self.topology.lin_bus_topology if t.bus_name == bus_name), None)
 
-    def check_rx_are_reached(self, separ, paths, vlans_dict):
+    def check_rx_are_reached(self, separ, paths, vlans_dict, path_index=None):
+        if path_index is None:
+            path_index = MulticastPathIndex()
         for ecu in self.ecus:
             for mcast in ecu.multicast_groups:
                 key = str(mcast.group) + separ + str(mcast.vlan)
@@ -459,7 +451,7 @@ class FLYNCModel(FLYNCBaseModel):
                         category=Category.CONSISTENCY,
                         error_number="173",
                     )
-                if (mcast.mode == "rx") and key in paths and not check_obj_in_list(mcast._interface, paths[key]):
+                if (mcast.mode == "rx") and key in paths and not path_index.path_contains(paths[key], mcast._interface):
                     warn(
                         f"Invalid Multicast Address Configuration. The RX interface for address {key} "
                         f"- {mcast._interface.name} cannot be reached by the TX ports.",
@@ -593,9 +585,8 @@ class FLYNCModel(FLYNCBaseModel):
     def resolve_someip_deployments(self):
         if self.communication and self.communication.someip_config:
             someip = self.communication.someip_config
-            services_by_key = {(s.id, s.major_version): s for s in someip.services}
             sd_timings_by_id = {t.profile_id: t for t in someip.sd_config.sd_timings} if someip.sd_config else {}
-            self._bind_someip_sockets(services_by_key, sd_timings_by_id)
+            self._bind_someip_sockets(SystemIndex.of(self).someip_services_by_key, sd_timings_by_id)
         return self
 
     @model_validator(mode="after")
@@ -611,11 +602,7 @@ class FLYNCModel(FLYNCBaseModel):
 
         deployments = [
             (deployment.root, socket, ecu)
-            for ecu in self.ecus
-            for ctrl in ecu.controllers
-            for iface in ctrl.ethernet_interfaces
-            for sock_con in iface.sockets
-            for socket in sock_con.sockets
+            for ecu, socket in self._iter_ecu_sockets()
             for deployment in socket.deployments
             if deployment.root.deployment_type.startswith("someip_") and socket.endpoint_type == "multicast" and socket.protocol == "udp"
         ]
@@ -628,7 +615,7 @@ class FLYNCModel(FLYNCBaseModel):
             # An unbound deployment (no someip_config declared) still names its service by id / major_version.
             svc_label = f"{svc.name}, {svc.id:#06x}, {svc.major_version}" if svc else f"{provider.service:#06x}, {provider.major_version}"
             for mcast_config in provider.multicast_config or []:
-                if mcast_config.ip_address not in socket.multicast_tx:
+                if not SystemIndex.of(self).uniqueness.socket_transmits(socket, mcast_config.ip_address):
                     raise err_major(
                         f"Deployed provided service ({svc_label}) "
                         f"has multicast configuration for eventgroups ({mcast_config.eventgroups}/{mcast_config.ip_address}), "
@@ -639,16 +626,23 @@ class FLYNCModel(FLYNCBaseModel):
 
         return self
 
+    @model_validator(mode="wrap")
+    @classmethod
+    def scope_system_index(cls, data, handler):
+        """
+        Share one :class:`~flync.core.utils.system_index.SystemIndex` among the model validators of one validation.
+
+        Defined last, so it wraps every other model validator, including those run by validation on assignment. Its
+        catalogs are built lazily, the first time a validator asks for them, and dropped when the validation ends or
+        raises.
+        """
+
+        with SystemIndex.validation_scope():
+            return handler(data)
+
     def _iter_ecu_sockets(self):
         """Yield ``(ecu, socket)`` for every :class:`Socket` across every ECU / controller / ethernet interface / VLAN container."""
-        return (
-            (ecu, socket)
-            for ecu in self.ecus
-            for controller in ecu.controllers
-            for eth_iface in controller.ethernet_interfaces or []
-            for socket_container in eth_iface.sockets or []
-            for socket in socket_container.sockets or []
-        )
+        return ((ecu, socket) for ecu, _controller, socket in SystemIndex.of(self).sockets)
 
     def _iter_all_sockets(self):
         """Yield every :class:`Socket` across every controller / ethernet interface / VLAN container."""
@@ -677,3 +671,7 @@ class FLYNCModel(FLYNCBaseModel):
             for can_iface in controller.can_interfaces or []:
                 out.extend(can_iface.forwarder_frames or [])
         return out
+
+    def get_forwarder_graph(self) -> ForwarderGraph:
+        """Return the graph of every PDU and CAN-frame forwarder, with the forwarders each one feeds resolved."""
+        return ForwarderGraph.from_model(self)
@@ -0,0 +1,28 @@
+"""
+Packet classifier for the FLYNC SDK.
+
+Compiles the frame filters, TCAM rules and firewall rules of a FLYNC model into bit-vector classifiers and evaluates
+them with first-match semantics against frames parsed from raw bytes or from pcap / pcapng captures, e.g. to check
+recorded traffic against the configured rules offline.
+
+Example::
+
+    classifier = compile_tcam(switch)
+    for batch in iter_batches(read_pcap("capture.pcapng", port="z2_s1_p0")):
+        counts = classifier.hit_counts(batch, vehicle_state=0x02)
+"""
+
+from flync.sdk.classifier.engine import Classifier, FirewallClassifier, compile_filters, compile_firewall, compile_tcam
+from flync.sdk.classifier.packets import FrameHeader, iter_batches, parse_frame, read_pcap
+
+__all__ = [
+    "Classifier",
+    "FirewallClassifier",
+    "FrameHeader",
+    "compile_filters",
+    "compile_firewall",
+    "compile_tcam",
+    "iter_batches",
+    "parse_frame",
+    "read_pcap",
+]
@@ -0,0 +1,308 @@
+"""
+Compilation of :class:`~flync.model.flync_4_tsn.qos.FrameFilter`, :class:`~flync.model.flync_4_ecu.switch.TCAMRule`
+and :class:`~flync.model.flync_4_security.firewall.FirewallRule` lists into a bit-vector classifier.
+
+Every rule owns one bit of a Python ``int``, its position in priority order. Each header field a rule list matches on
+gets one index that maps a field value to the bits of all rules accepting it: a dictionary for exact fields, sorted
+elementary intervals for VLAN IDs and ports, and one hash table per distinct mask for MAC / IP addresses and the
+vehicle state. Classifying a frame ANDs one lookup per used field, so its cost grows with the number of fields and
+masks instead of the number of rules, and the lowest set bit of the result is the first matching rule.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from flync.core.utils.rule_analysis import filter_constraints
+from flync.model.flync_4_ecu.switch import Switch, TCAMRule
+from flync.model.flync_4_security.firewall import Firewall, FirewallRule
+from flync.model.flync_4_tsn.qos import FrameFilter
+from flync.sdk.classifier.packets import FrameHeader
+
+_FIELD_INDEX = {name: position for position, name in enumerate(FrameHeader._fields)}
+_DATA = _FIELD_INDEX["data"]
+
+#: Flow cache entries kept before the cache is cleared; captures repeat few distinct headers, so this rarely triggers.
+FLOW_CACHE_SIZE = 1 << 16
+
+
+class _ExactIndex:
+    """Exact values to rule bits; rules without a constraint on the field are in ``wildcard``."""
+
+    def __init__(self, wildcard: int, table: Dict[Any, int]):
+        self.wildcard, self.table = wildcard, table
+
+    def lookup(self, value: Any) -> int:
+        return self.wildcard | self.table.get(value, 0)
+
+
+class _IntervalIndex:
+    """Inclusive ranges cut into elementary intervals; ``bits[i]`` holds the rules covering ``[starts[i], starts[i + 1])``."""
+
+    def __init__(self, wildcard: int, ranges: Sequence[Tuple[int, int, int]]):
+        self.wildcard = wildcard
+        self.starts = sorted({low for low, _, _ in ranges} | {high + 1 for _, high, _ in ranges})
+        self.bits = [0] * len(self.starts)
+        for low, high, bit in ranges:
+            for position in range(bisect_left(self.starts, low), bisect_right(self.starts, high)):
+                self.bits[position] |= bit
+
+    def lookup(self, value: Optional[int]) -> int:
+        if value is None:
+            return self.wildcard
+        position = bisect_right(self.starts, value) - 1
+        return self.wildcard | (self.bits[position] if position >= 0 else 0)
+
+
+class _MaskedIndex:
+    """One hash table per distinct mask, so a lookup costs one probe per mask instead of one comparison per rule."""
+
+    def __init__(self, wildcard: int, entries: Sequence[Tuple[int, int, int]]):
+        self.wildcard = wildcard
+        tables: Dict[int, Dict[int, int]] = {}
+        for value, mask, bit in entries:
+            table = tables.setdefault(mask, {})
+            table[value & mask] = table.get(value & mask, 0) | bit
+        self.tables = sorted(tables.items(), key=lambda item: -item[0].bit_count())
+
+    def lookup(self, value: Optional[int]) -> int:
+        if value is None:
+            return self.wildcard
+        bits = self.wildcard
+        for mask, table in self.tables:
+            bits |= table.get(value & mask, 0)
+        return bits
+
+
+class _FrameMaskIndex:
+    """Byte patterns grouped by ``(offset, byte length, mask)``; a rule fails if any of its patterns does not match."""
+
+    def __init__(self, patterns: Sequence[Tuple[int, int, int, int, int]]):
+        groups: Dict[Tuple[int, int, int], Tuple[int, Dict[int, int]]] = {}
+        for offset, length, mask, data, bit in patterns:
+            needed, table = groups.get((offset, length, mask), (0, {}))
+            table[data] = table.get(data, 0) | bit
+            groups[(offset, length, mask)] = (needed | bit, table)
+        self.groups = [(offset, offset + length, mask, needed, table) for (offset, length, mask), (needed, table) in groups.items()]
+        self.extent = max((end for _, end, _, _, _ in self.groups), default=0)
+
+    def failing(self, data: bytes) -> int:
+        failed = 0
+        for start, end, mask, needed, table in self.groups:
+            if len(data) < end:
+                failed |= needed
+            else:
+                failed |= needed & ~table.get(int.from_bytes(data[start:end], "big") & mask, 0)
+        return failed
+
+
+class Classifier:
+    """
+    First-match classifier over a compiled rule list.
+
+    Use :func:`compile_filters`, :func:`compile_tcam` or :func:`compile_firewall` to build one. Frames are
+    :class:`~flync.sdk.classifier.packets.FrameHeader` tuples, e.g. from :func:`~flync.sdk.classifier.packets.read_pcap`.
+
+    Attributes:
+        rules (List[Any]): The rules in priority order; results refer to rules by their position in this list.
+    """
+
+    def __init__(self, rules: Sequence[Any], matches: Sequence[Optional[FrameFilter]], ports: Sequence[Sequence[str]] = (), **gates: Any):
+        """
+        Args:
+            rules (Sequence[Any]): The rules in priority order.
+            matches (Sequence[Optional[FrameFilter]]): The frame filter of each rule; ``None`` accepts every frame.
+            ports (Sequence[Sequence[str]]): Ingress ports of each rule; an empty list binds a rule to all ports.
+            **gates: ``frame_masks`` (the :class:`~flync.model.flync_4_ecu.switch.FrameMask` list of each rule) and
+                ``vehicle_states`` (the :class:`~flync.core.datatypes.Bitmask` or ``None`` of each rule).
+        """
+
+        self.rules = list(rules)
+        self.all_rules = (1 << len(self.rules)) - 1
+        self._cache: Dict[Tuple[Any, ...], int] = {}
+        self._indexes: List[Tuple[int, Callable[[Any], int]]] = []
+
+        constraints = [filter_constraints(match) if match is not None else {} for match in matches]
+        for name in sorted({field for constraint in constraints for field in constraint}):
+            wildcard, entries, kind = 0, [], None
+            for position, constraint in enumerate(constraints):
+                if name not in constraint:
+                    wildcard |= 1 << position
+                    continue
+                kind, values = constraint[name]
+                entries.extend((*value, 1 << position) if isinstance(value, tuple) else (value, 1 << position) for value in values)
+            self._indexes.append((_FIELD_INDEX[name], self._build(kind, wildcard, entries)))
+
+        self._port_wildcard, self._ports = 0, {}
+        for position, rule_ports in enumerate(ports):
+            if not rule_ports:
+                self._port_wildcard |= 1 << position
+            for port in rule_ports:
+                self._ports[port] = self._ports.get(port, 0) | 1 << position
+
+        vehicle_states = gates.get("vehicle_states") or [None] * len(self.rules)
+        gated = [(state.data, state.mask, 1 << position) for position, state in enumerate(vehicle_states) if state is not None]
+        self._vehicle_index = _MaskedIndex(self.all_rules & ~sum(bit for _, _, bit in gated), gated) if gated else None
+
+        patterns = [
+            (frame_mask.offset, frame_mask.byte_length, frame_mask.mask, frame_mask.data, 1 << position)
+            for position, frame_masks in enumerate(gates.get("frame_masks") or [])
+            for frame_mask in frame_masks or []
+        ]
+        self._frame_masks = _FrameMaskIndex(patterns) if patterns else None
+
+    @staticmethod
+    def _build(kind: str, wildcard: int, entries: List[Tuple[Any, ...]]) -> Callable[[Any], int]:
+        if kind == "exact":
+            table: Dict[Any, int] = {}
+            for value, bit in entries:
+                table[value] = table.get(value, 0) | bit
+            return _ExactIndex(wildcard, table).lookup
+        if kind == "interval":
+            return _IntervalIndex(wildcard, entries).lookup
+        return _MaskedIndex(wildcard, entries).lookup
+
+    def match_bits(self, header: FrameHeader, vehicle_state: Optional[int] = None) -> int:
+        """
+        Return the bit set of all rules matching ``header``; bit ``i`` stands for ``rules[i]``.
+
+        Args:
+            header (FrameHeader): The frame. Its ``port`` restricts the rules to those bound to that port; ``None``
+                ignores the rules' port bindings.
+            vehicle_state (int, optional): Current value of the vehicle-state register. ``None`` disables every rule
+                gated on a vehicle state.
+        """
+
+        key = header[:_DATA] + (header.data[: self._frame_masks.extent] if self._frame_masks else b"", vehicle_state)
+        bits = self._cache.get(key)
+        if bits is not None:
+            return bits
+        bits = self.all_rules
+        for field, lookup in self._indexes:
+            bits &= lookup(header[field])
+            if not bits:
+                break
+        if bits and header.port is not None and self._ports:
+            bits &= self._port_wildcard | self._ports.get(header.port, 0)
+        if bits and self._vehicle_index is not None:
+            bits &= self._vehicle_index.lookup(vehicle_state)
+        if bits and self._frame_masks is not None:
+            bits &= ~self._frame_masks.failing(header.data)
+        if len(self._cache) >= FLOW_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[key] = bits
+        return bits
+
+    def first_match(self, header: FrameHeader, vehicle_state: Optional[int] = None) -> Optional[Any]:
+        """Return the highest-priority rule matching ``header``, or ``None``; see :meth:`match_bits` for the arguments."""
+        bits = self.match_bits(header, vehicle_state)
+        return self.rules[(bits & -bits).bit_length() - 1] if bits else None
+
+    def all_matches(self, header: FrameHeader, vehicle_state: Optional[int] = None) -> List[Any]:
+        """Return all rules matching ``header`` in priority order; see :meth:`match_bits` for the arguments."""
+        bits = self.match_bits(header, vehicle_state)
+        return [rule for position, rule in enumerate(self.rules) if bits >> position & 1]
+
+    def classify(self, headers: Iterable[FrameHeader], vehicle_state: Optional[int] = None) -> List[Optional[int]]:
+        """
+        Classify a batch of frames.
+
+        Args:
+            headers (Iterable[FrameHeader]): The frames, e.g. a batch of :func:`~flync.sdk.classifier.packets.iter_batches`.
+            vehicle_state (int, optional): Vehicle-state register value for the whole batch; see :meth:`match_bits`.
+
+        Returns:
+            List[Optional[int]]: Per frame, the position in :attr:`rules` of the first matching rule, or ``None``.
+        """
+
+        match_bits = self.match_bits
+        return [(bits & -bits).bit_length() - 1 if bits else None for bits in (match_bits(header, vehicle_state) for header in headers)]
+
+    def hit_counts(self, headers: Iterable[FrameHeader], vehicle_state: Optional[int] = None) -> Counter:
+        """Count the first matches per rule position over ``headers``; frames no rule matches are counted under ``None``."""
+        return Counter(self.classify(headers, vehicle_state))
+
+
+class FirewallClassifier:
+    """
+    A compiled firewall chain: the action of the first matching rule, or the firewall's ``default_action``.
+
+    Attributes:
+        classifier (Classifier): The compiled rules of the chain, in list order.
+        default_action (str): Action for frames no rule matches.
+    """
+
+    def __init__(self, rules: Sequence[FirewallRule], default_action: str):
+        self.classifier = Classifier(rules, [rule.pattern for rule in rules])
+        self.default_action = default_action
+        self._actions = [rule.action for rule in rules]
+
+    def decide(self, header: FrameHeader) -> str:
+        """Return ``"accept"``, ``"drop"`` or ``"reject"`` for one frame."""
+        bits = self.classifier.match_bits(header)
+        return self._actions[(bits & -bits).bit_length() - 1] if bits else self.default_action
+
+    def decide_batch(self, headers: Iterable[FrameHeader]) -> List[str]:
+        """Return the action for every frame of ``headers``."""
+        actions, default = self._actions, self.default_action
+        return [actions[position] if position is not None else default for position in self.classifier.classify(headers)]
+
+
+def compile_filters(filters: Sequence[FrameFilter]) -> Classifier:
+    """
+    Compile frame filters, e.g. the ``stream_identification`` of a stream, into a classifier.
+
+    Args:
+        filters (Sequence[FrameFilter]): The filters in priority order.
+
+    Returns:
+        Classifier: A classifier whose :attr:`Classifier.rules` are the filters.
+    """
+
+    return Classifier(filters, filters)
+
+
+def compile_tcam(rules: Switch | Iterable[TCAMRule]) -> Classifier:
+    """
+    Compile TCAM rules into a classifier; a lower rule ``id`` means a higher priority.
+
+    ``match_filter``, ``frame_mask``, ``match_ports`` and ``vehicle_state`` are all honoured. Pass the frame's ingress
+    port in :attr:`FrameHeader.port` and the vehicle-state register to the classifier to evaluate the latter two.
+
+    Args:
+        rules (Switch | Iterable[TCAMRule]): A switch, whose ``tcam_rules`` are compiled, or the rules themselves.
+
+    Returns:
+        Classifier: A classifier whose :attr:`Classifier.rules` are the TCAM rules ordered by ``id``.
+    """
+
+    if isinstance(rules, Switch):
+        rules = rules.tcam_rules or []
+    ordered = sorted(rules, key=lambda rule: rule.id)
+    return Classifier(
+        ordered,
+        [rule.match_filter for rule in ordered],
+        [rule.match_ports for rule in ordered],
+        frame_masks=[rule.frame_mask for rule in ordered],
+        vehicle_states=[rule.vehicle_state for rule in ordered],
+    )
+
+
+def compile_firewall(firewall: Firewall, chain: str = "input") -> FirewallClassifier:
+    """
+    Compile one chain of a firewall; rules apply in list order.
+
+    Args:
+        firewall (Firewall): The firewall, e.g. of a controller or a controller interface.
+        chain (str): ``"input"``, ``"output"`` or ``"forward"``.
+
+    Returns:
+        FirewallClassifier: The compiled chain.
+
+    Raises:
+        ValueError: If ``chain`` names no chain of the firewall.
+    """
+
+    if chain not in ("input", "output", "forward"):
+        raise ValueError(f"unknown firewall chain '{chain}'; expected 'input', 'output' or 'forward'")
+    return FirewallClassifier(getattr(firewall, f"{chain}_rules") or [], firewall.default_action or "reject")
@@ -0,0 +1,201 @@
+"""
+Frame headers as the classifier sees them, and a reader for local pcap / pcapng captures.
+
+:func:`parse_frame` cuts the fields a :class:`~flync.model.flync_4_tsn.qos.FrameFilter` can match on out of a raw
+Ethernet frame. :func:`read_pcap` streams the frames of a capture file, and :func:`iter_batches` groups them for
+:meth:`~flync.sdk.classifier.engine.Classifier.classify`.
+"""
+
+import struct
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+_VLAN_TPIDS = (0x8100, 0x88A8)
+_IPV6_EXTENSION_HEADERS = (0, 43, 60)  # hop-by-hop, routing and destination options; fragments are handled apart
+_TRANSPORT_PROTOCOLS = {6: "tcp", 17: "udp"}
+
+_PCAP_MAGICS = {b"\xd4\xc3\xb2\xa1": "<", b"\xa1\xb2\xc3\xd4": ">", b"\x4d\x3c\xb2\xa1": "<", b"\xa1\xb2\x3c\x4d": ">"}
+_PCAPNG_SECTION_HEADER = 0x0A0D0D0A
+_LINKTYPE_ETHERNET = 1
+
+
+class FrameHeader(NamedTuple):
+    """
+    The matchable fields of one Ethernet frame. Fields a frame does not carry are ``None``.
+
+    Attributes:
+        dst_mac (int): Destination MAC address as a 48-bit integer.
+        src_mac (int): Source MAC address as a 48-bit integer.
+        ethertype (int): EtherType of the payload, behind any VLAN tags.
+        vlan_tagged (bool): Whether the frame carries an 802.1Q / 802.1ad tag.
+        vlanid (int, optional): VLAN ID of the outermost tag.
+        pcp (int, optional): Priority Code Point of the outermost tag.
+        src_ipv4 (int, optional): Source IPv4 address.
+        dst_ipv4 (int, optional): Destination IPv4 address.
+        src_ipv6 (int, optional): Source IPv6 address.
+        dst_ipv6 (int, optional): Destination IPv6 address.
+        protocol (str, optional): ``"tcp"`` or ``"udp"``.
+        src_port (int, optional): Source TCP / UDP port.
+        dst_port (int, optional): Destination TCP / UDP port.
+        port (str, optional): Name of the switch port the frame was received on, when known.
+        data (bytes): The raw frame, for byte-level ``frame_mask`` matching.
+    """
+
+    dst_mac: int
+    src_mac: int
+    ethertype: int
+    vlan_tagged: bool = False
+    vlanid: Optional[int] = None
+    pcp: Optional[int] = None
+    src_ipv4: Optional[int] = None
+    dst_ipv4: Optional[int] = None
+    src_ipv6: Optional[int] = None
+    dst_ipv6: Optional[int] = None
+    protocol: Optional[str] = None
+    src_port: Optional[int] = None
+    dst_port: Optional[int] = None
+    port: Optional[str] = None
+    data: bytes = b""
+
+
+def parse_frame(data: bytes, port: Optional[str] = None) -> FrameHeader:
+    """
+    Parse the Ethernet, VLAN, IPv4 / IPv6 and TCP / UDP headers of a raw frame.
+
+    Truncated headers are parsed as far as they go: the fields behind the cut stay ``None``. Ports are only read from the
+    first fragment of a fragmented IP packet.
+
+    Args:
+        data (bytes): The frame, starting at the destination MAC address.
+        port (str, optional): Switch port the frame was received on.
+
+    Returns:
+        FrameHeader: The parsed header, keeping ``data`` for byte-level matching.
+    """
+
+    if len(data) < 14:
+        return FrameHeader(int.from_bytes(data[:6], "big"), int.from_bytes(data[6:12], "big"), 0, port=port, data=data)
+    dst_mac, src_mac = int.from_bytes(data[:6], "big"), int.from_bytes(data[6:12], "big")
+    ethertype, offset = int.from_bytes(data[12:14], "big"), 14
+    vlan_tagged, vlanid, pcp = False, None, None
+    while ethertype in _VLAN_TPIDS and len(data) >= offset + 4:
+        if not vlan_tagged:
+            tci = int.from_bytes(data[offset : offset + 2], "big")
+            vlan_tagged, vlanid, pcp = True, tci & 0x0FFF, tci >> 13
+        ethertype, offset = int.from_bytes(data[offset + 2 : offset + 4], "big"), offset + 4
+    fields = dict(dst_mac=dst_mac, src_mac=src_mac, ethertype=ethertype, vlan_tagged=vlan_tagged, vlanid=vlanid, pcp=pcp, port=port, data=data)
+
+    transport = None
+    if ethertype == 0x0800 and len(data) >= offset + 20:
+        header_length = (data[offset] & 0x0F) * 4
+        fields["src_ipv4"] = int.from_bytes(data[offset + 12 : offset + 16], "big")
+        fields["dst_ipv4"] = int.from_bytes(data[offset + 16 : offset + 20], "big")
+        first_fragment = int.from_bytes(data[offset + 6 : offset + 8], "big") & 0x1FFF == 0
+        transport = (data[offset + 9], offset + header_length, first_fragment)
+    elif ethertype == 0x86DD and len(data) >= offset + 40:
+        fields["src_ipv6"] = int.from_bytes(data[offset + 8 : offset + 24], "big")
+        fields["dst_ipv6"] = int.from_bytes(data[offset + 24 : offset + 40], "big")
+        transport = _ipv6_transport(data, data[offset + 6], offset + 40)
+    if transport is not None and transport[0] in _TRANSPORT_PROTOCOLS:
+        number, start, first_fragment = transport
+        fields["protocol"] = _TRANSPORT_PROTOCOLS[number]
+        if first_fragment and len(data) >= start + 4:
+            fields["src_port"] = int.from_bytes(data[start : start + 2], "big")
+            fields["dst_port"] = int.from_bytes(data[start + 2 : start + 4], "big")
+    return FrameHeader(**fields)
+
+
+def _ipv6_transport(data: bytes, next_header: int, offset: int) -> Tuple[int, int, bool]:
+    """Skip the IPv6 extension headers; return ``(protocol number, transport offset, first fragment)``."""
+    first_fragment = True
+    while len(data) >= offset + 8:
+        if next_header in _IPV6_EXTENSION_HEADERS:
+            next_header, offset = data[offset], offset + 8 + data[offset + 1] * 8
+        elif next_header == 44:
+            first_fragment = int.from_bytes(data[offset + 2 : offset + 4], "big") >> 3 == 0
+            next_header, offset = data[offset], offset + 8
+        else:
+            break
+    return next_header, offset, first_fragment
+
+
+def read_pcap(path: str | Path, port: Optional[str] = None) -> Iterator[FrameHeader]:
+    """
+    Stream the parsed frames of a pcap or pcapng capture with Ethernet link type.
+
+    Args:
+        path (str | Path): The capture file.
+        port (str, optional): Switch port to attribute every frame to, e.g. for a capture taken at one port.
+
+    Yields:
+        FrameHeader: One parsed header per captured frame, in capture order.
+
+    Raises:
+        ValueError: If the file is no pcap / pcapng capture, or captures another link type than Ethernet.
+    """
+
+    with open(path, "rb") as stream:
+        magic = stream.read(4)
+        if magic in _PCAP_MAGICS:
+            frames = _pcap_frames(stream, _PCAP_MAGICS[magic])
+        elif len(magic) == 4 and struct.unpack("<I", magic)[0] == _PCAPNG_SECTION_HEADER:
+            frames = _pcapng_frames(stream, magic)
+        else:
+            raise ValueError(f"{path} is not a pcap or pcapng capture")
+        for frame in frames:
+            yield parse_frame(frame, port)
+
+
+def _pcap_frames(stream: BinaryIO, order: str) -> Iterator[bytes]:
+    header = stream.read(20)
+    if len(header) < 20 or struct.unpack(order + "I", header[16:20])[0] & 0x0FFFFFFF != _LINKTYPE_ETHERNET:
+        raise ValueError("only Ethernet captures (link type 1) can be classified")
+    record = struct.Struct(order + "IIII")
+    while True:
+        head = stream.read(record.size)
+        if len(head) < record.size:
+            return
+        captured = record.unpack(head)[2]
+        yield stream.read(captured)
+
+
+def _pcapng_frames(stream: BinaryIO, first: bytes) -> Iterator[bytes]:
+    order, link_types = "<", []
+    block_type = first
+    while len(block_type) == 4:
+        head = stream.read(4)
+        if len(head) < 4:
+            return
+        if struct.unpack("<I", block_type)[0] == _PCAPNG_SECTION_HEADER:
+            order = "<" if stream.read(4) == b"\x4d\x3c\x2b\x1a" else ">"
+            length, link_types = struct.unpack(order + "I", head)[0], []
+            body = stream.read(length - 12)
+        else:
+            length = struct.unpack(order + "I", head)[0]
+            body = stream.read(length - 8)
+            kind = struct.unpack(order + "I", block_type)[0]
+            if kind == 1:  # interface description
+                link_types.append(struct.unpack(order + "H", body[:2])[0])
+            elif kind == 6:  # enhanced packet
+                interface, _, _, captured = struct.unpack(order + "IIII", body[:16])
+                if link_types[interface] != _LINKTYPE_ETHERNET:
+                    raise ValueError("only Ethernet captures (link type 1) can be classified")
+                yield body[20 : 20 + captured]
+            elif kind == 3:  # simple packet
+                if link_types[0] != _LINKTYPE_ETHERNET:
+                    raise ValueError("only Ethernet captures (link type 1) can be classified")
+                captured = struct.unpack(order + "I", body[:4])[0]
+                yield body[4 : 4 + min(captured, len(body) - 8)]
+        block_type = stream.read(4)
+
+
+def iter_batches(headers: Iterable[FrameHeader], size: int = 65536) -> Iterator[List[FrameHeader]]:
+    """Group ``headers`` into lists of at most ``size`` frames, e.g. to classify a large capture batch by batch."""
+    batch: List[FrameHeader] = []
+    for header in headers:
+        batch.append(header)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
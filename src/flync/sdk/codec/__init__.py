@@ -0,0 +1,29 @@
+"""
+Signal codec for the FLYNC SDK.
+
+Compiles the frame and PDU layouts of a FLYNC model into flat plans of shifts, masks and scaling, and uses them to
+decode raw CAN, CAN FD and LIN payloads into physical signal values and to encode them back, one payload at a time or,
+with NumPy installed (``flync[codec]``), for whole arrays of payloads at once.
+
+Example::
+
+    codec = SignalCodec(workspace.flync_model)
+    plan = codec.frame("CAN1", 0x123)
+    plan.decode(payload)              # {"VehicleSpeed": 52.5, ...}
+    columns = plan.decode_batch(log)  # {"VehicleSpeed": array([...]), ...}
+"""
+
+from flync.sdk.codec.batch import as_payloads, decode_batch, encode_batch
+from flync.sdk.codec.plan import CodecPlan, ContainerPlan, FieldPlan, SignalCodec, compile_frame, compile_pdu
+
+__all__ = [
+    "CodecPlan",
+    "ContainerPlan",
+    "FieldPlan",
+    "SignalCodec",
+    "as_payloads",
+    "compile_frame",
+    "compile_pdu",
+    "decode_batch",
+    "encode_batch",
+]
@@ -0,0 +1,221 @@
+"""
+Vectorized encoding and decoding of many payloads of one :class:`~flync.sdk.codec.plan.CodecPlan`.
+
+Payloads are held as a ``(messages, bytes)`` ``uint8`` array and every field is cut out for all messages at once from
+the bytes listed in its byte plan, so the cost is a handful of NumPy operations per signal instead of a Python loop per
+message. Needs NumPy, which is not a core dependency of FLYNC: install the ``codec`` extra (``pip install "flync[codec]"``).
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional
+
+from flync.sdk.codec.plan import CodecPlan, FieldPlan
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without the codec extra
+    np = None
+
+if TYPE_CHECKING:
+    import numpy
+
+    Array = numpy.ndarray
+else:
+    Array = Any
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError('batch encoding and decoding need NumPy; install it with pip install "flync[codec]"')
+
+
+def as_payloads(payloads: Any, length: int) -> Array:
+    """
+    Bring payloads into the ``(messages, length)`` ``uint8`` layout the batch functions work on.
+
+    Args:
+        payloads (Any): A 2-D ``uint8`` array, or a sequence of ``bytes`` (which may differ in length).
+        length (int): Payload length of the plan in bytes; shorter payloads are zero-padded, longer ones truncated.
+
+    Returns:
+        numpy.ndarray: The payloads as a C-contiguous ``uint8`` array. A correctly shaped input is returned as is.
+    """
+
+    _require_numpy()
+    if isinstance(payloads, np.ndarray) and payloads.ndim == 2:
+        array = payloads.astype(np.uint8, copy=False)
+    else:
+        payloads = list(payloads)
+        width = max((len(payload) for payload in payloads), default=0)
+        if all(len(payload) == width for payload in payloads):
+            array = np.frombuffer(b"".join(bytes(payload) for payload in payloads), dtype=np.uint8).reshape(len(payloads), width)
+        else:
+            array = np.zeros((len(payloads), width), dtype=np.uint8)
+            for row, payload in enumerate(payloads):
+                array[row, : len(payload)] = np.frombuffer(bytes(payload), dtype=np.uint8)
+    if array.shape[1] < length:
+        array = np.pad(array, ((0, 0), (0, length - array.shape[1])))
+    return np.ascontiguousarray(array[:, :length])
+
+
+def _extract(payloads: Array, fp: FieldPlan) -> Array:
+    """Return the raw bits of ``fp`` for every payload as ``uint64``."""
+    raw = np.zeros(payloads.shape[0], dtype=np.uint64)
+    for byte, shift, _ in fp.byte_plan:
+        column = payloads[:, byte].astype(np.uint64)
+        raw |= column << np.uint64(shift) if shift >= 0 else column >> np.uint64(-shift)
+    return raw & np.uint64(fp.mask)
+
+
+def _to_values(payloads: Array, fp: FieldPlan, raw: Array, physical: bool) -> Array:
+    """Convert raw ``uint64`` bits into the column of ``fp``, the vectorized :meth:`FieldPlan.to_value`."""
+    if fp.kind in ("char", "bytes"):
+        first, count = fp.byte_range
+        data = np.ascontiguousarray(payloads[:, first : first + count])
+        return data.view(f"S{count}").ravel() if fp.kind == "char" else data
+    if fp.kind == "float":
+        values = raw.astype(np.uint32).view(np.float32).astype(np.float64) if fp.length == 32 else raw.view(np.float64)
+    elif fp.kind == "signed":
+        if fp.length == 64:
+            values = raw.view(np.int64)
+        else:
+            values = raw.astype(np.int64)
+            values = np.where(values >> (fp.length - 1) != 0, values - (1 << fp.length), values)
+    else:
+        values = raw
+    return values * fp.factor + fp.offset if physical and fp.is_scaled else values
+
+
+def _active(fp: FieldPlan, raws: Dict[int, Array], rows: int) -> Array:
+    active = np.ones(rows, dtype=bool)
+    for selector, value in fp.conditions:
+        active &= raws[selector] == np.uint64(value)
+    return active
+
+
+def decode_batch(plan: CodecPlan, payloads: Any, physical: bool = True) -> Dict[str, Array]:
+    """
+    Decode many payloads of one layout into one column per signal.
+
+    Args:
+        plan (CodecPlan): The compiled layout.
+        payloads (Any): A ``(messages, bytes)`` ``uint8`` array or a sequence of ``bytes``; see :func:`as_payloads`.
+        physical (bool): Whether to apply ``factor`` and ``offset``. Raw values are returned when ``False``.
+
+    Returns:
+        Dict[str, numpy.ndarray]: One column per field name, in layout order. Numeric columns are ``float64`` for
+        scaled and float signals and ``int64`` / ``uint64`` otherwise; ``char`` columns are fixed-width ``bytes``
+        and ``bytearray`` columns are ``(messages, bytes)`` ``uint8`` arrays. Fields of mux groups are masked arrays,
+        masked where their group is not selected.
+
+    Raises:
+        ValueError: If the layout contains a container PDU with slot headers, whose slots vary per message.
+    """
+
+    _require_numpy()
+    if plan.containers:
+        raise ValueError(f"{plan.name} contains container PDU(s); decode their payloads one by one with CodecPlan.decode")
+    payloads = as_payloads(payloads, plan.length)
+    rows = payloads.shape[0]
+    raws: Dict[int, Array] = {}
+    columns: Dict[str, Array] = {}
+    for index, fp in enumerate(plan.fields):
+        raw = raws[index] = _extract(payloads, fp) if fp.kind not in ("char", "bytes") else None
+        values = _to_values(payloads, fp, raw, physical)
+        if not fp.conditions:
+            columns[fp.name] = values
+            continue
+        active = _active(fp, raws, rows)
+        previous = columns.get(fp.name)
+        if previous is None:
+            columns[fp.name] = np.ma.masked_array(values, mask=~active)
+        else:  # the same signal in another mux group: fill in the rows that group selects
+            merged = np.where(active, values, previous.data)
+            columns[fp.name] = np.ma.masked_array(merged, mask=np.ma.getmaskarray(previous) & ~active)
+    return columns
+
+
+def encode_batch(plan: CodecPlan, columns: Mapping[str, Any], base: Optional[Any] = None, physical: bool = True) -> Array:
+    """
+    Encode columns of signal values into one payload per message.
+
+    Args:
+        plan (CodecPlan): The compiled layout.
+        columns (Mapping[str, Any]): One column per field name, all of the same length. Masked entries of a masked
+            array are left untouched, and so are the rows where a mux group field's group is not selected.
+        base (Any, optional): Payloads to start from (see :func:`as_payloads`); all zeros when omitted. Not modified.
+        physical (bool): Whether numeric values are physical (``factor`` and ``offset`` are undone) or already raw.
+
+    Returns:
+        numpy.ndarray: The ``(messages, plan.length)`` ``uint8`` payloads.
+
+    Raises:
+        KeyError: If a column names no field of the layout.
+        ValueError: If the columns differ in length, a value does not fit its field, or the layout contains a
+            container PDU with slot headers.
+    """
+
+    _require_numpy()
+    if plan.containers:
+        raise ValueError(f"{plan.name} contains container PDU(s); encode their payloads one by one with CodecPlan.encode")
+    unknown = set(columns).difference(fp.name for fp in plan.fields)
+    if unknown:
+        raise KeyError(f"{plan.name} has no signal(s) {sorted(unknown)}")
+    lengths = {len(column) for column in columns.values()}
+    if base is not None:
+        payloads = as_payloads(base, plan.length).copy()
+        lengths.add(payloads.shape[0])
+    else:
+        payloads = np.zeros((next(iter(lengths), 0), plan.length), dtype=np.uint8)
+    if len(lengths) > 1:
+        raise ValueError(f"columns and base payloads differ in length: {sorted(lengths)}")
+    rows = payloads.shape[0]
+    raws: Dict[int, Array] = {}
+    for index, fp in enumerate(plan.fields):
+        active = _active(fp, raws, rows)
+        if fp.name not in columns:
+            raws[index] = _extract(payloads, fp)
+            continue
+        column = columns[fp.name]
+        active &= ~np.ma.getmaskarray(column)
+        if fp.kind in ("char", "bytes"):
+            first, count = fp.byte_range
+            payloads[:, first : first + count] = np.where(
+                active[:, None], _as_bytes(np.ma.getdata(column), count), payloads[:, first : first + count]
+            )
+            continue
+        raw = _to_raw(fp, np.ma.getdata(column), active, physical)
+        for byte, shift, byte_mask in fp.byte_plan:
+            bits = raw >> np.uint64(shift) if shift >= 0 else raw << np.uint64(-shift)
+            updated = (payloads[:, byte] & np.uint8(~byte_mask & 0xFF)) | (bits & np.uint64(byte_mask)).astype(np.uint8)
+            payloads[:, byte] = np.where(active, updated, payloads[:, byte])
+        raws[index] = np.where(active, raw, _extract(payloads, fp))
+    return payloads
+
+
+def _as_bytes(values: Any, count: int) -> Array:
+    """Bring a ``char`` / ``bytearray`` column into ``(messages, count)`` ``uint8`` form."""
+    data = np.asarray(values)
+    if data.ndim == 1:  # fixed-width bytes (or str), e.g. the column decode_batch returns for char signals
+        if data.dtype.kind != "S":
+            data = np.array([value.encode("latin-1") if isinstance(value, str) else bytes(value) for value in data], dtype=f"S{count}")
+        if data.dtype.itemsize > count:
+            raise ValueError(f"values of {count} bytes at most expected, got up to {data.dtype.itemsize}")
+        data = np.frombuffer(data.astype(f"S{count}").tobytes(), dtype=np.uint8).reshape(-1, count)
+    return data.astype(np.uint8, copy=False)
+
+
+def _to_raw(fp: FieldPlan, values: Array, active: Array, physical: bool) -> Array:
+    """Convert a numeric column into raw ``uint64`` bits, the vectorized :meth:`FieldPlan.to_raw`; inactive rows are not checked."""
+    values = np.asarray(values, dtype=np.float64 if fp.kind == "float" or (physical and fp.is_scaled) else None)
+    if physical and fp.is_scaled:
+        values = (values - fp.offset) / fp.factor
+    if fp.kind == "float":
+        return values.astype(np.float32).view(np.uint32).astype(np.uint64) if fp.length == 32 else values.astype(np.float64).view(np.uint64)
+    rounded = np.rint(values) if values.dtype.kind == "f" else values
+    low, high = fp.raw_bounds
+    checked = rounded[active]
+    if checked.size and (checked.min() < low or checked.max() > high):
+        raise ValueError(f"values of signal '{fp.name}' fall outside the raw range [{low}, {high}]")
+    if fp.kind == "unsigned":
+        return rounded.astype(np.uint64) & np.uint64(fp.mask)
+    return rounded.astype(np.int64).astype(np.uint64) & np.uint64(fp.mask)
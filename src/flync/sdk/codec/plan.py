@@ -0,0 +1,561 @@
+"""
+Compiled payload layouts of FLYNC frames and PDUs.
+
+:func:`compile_pdu` and :func:`compile_frame` walk a layout once and flatten it into a :class:`CodecPlan`: one
+:class:`FieldPlan` per placed signal, carrying its absolute bit range, the shift and mask that cut it out of the payload,
+the bytes it touches and its scaling. Encoding and decoding then only run over that list, never over the model.
+Multiplexed PDUs become fields guarded by selector conditions; container PDUs, whose slots vary from payload to payload,
+are kept as :class:`ContainerPlan` sections parsed at run time.
+
+Bits are numbered the way the FLYNC overlap checks count them: a signal instance occupies
+``[bit_position, bit_position + bit_length)`` of its PDU, and a PDU placed in a frame or mux group is shifted by its own
+``bit_position``.
+
+- ``LE``: bit ``n`` is bit ``n % 8`` (least significant first) of byte ``n // 8``, and ``bit_position`` holds the least
+  significant bit of the value.
+- ``BE``: bits are counted most significant first, so bit ``n`` is bit ``7 - n % 8`` of byte ``n // 8``, and
+  ``bit_position`` holds the most significant bit of the value.
+
+Byte-aligned signals therefore cover the same bytes in either byte order. Signal instances without a ``bit_position``
+are unplaced and get no field.
+"""
+
+import struct
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from flync.core.utils.system_index import SystemIndex
+from flync.model.flync_4_signal.frame import Frame
+from flync.model.flync_4_signal.pdu import PDU, ContainerPDU, MultiplexedPDU, StandardPDU
+from flync.model.flync_4_signal.signal import Signal, SignalInstance
+
+if TYPE_CHECKING:
+    from flync.model.flync_model import FLYNCModel
+
+#: A mux condition: the index of the selector field in :attr:`CodecPlan.fields` and the raw value that activates the field.
+Condition = Tuple[int, int]
+
+#: ``(byte index, shift, byte mask)``: the byte contributes ``byte << shift`` (``byte >> -shift`` when negative) to the raw
+#: value, and ``byte mask`` selects the bits of the byte the field owns.
+BytePlan = Tuple[int, int, int]
+
+_FLOAT_FORMATS = {32: "<f", 64: "<d"}
+
+
+@dataclass(frozen=True)
+class FieldPlan(object):
+    """
+    One placed signal of a :class:`CodecPlan`, with everything needed to cut it out of a payload precomputed.
+
+    Attributes:
+        name (str): Key of the value in decoded results, the signal name qualified as ``"<pdu>.<signal>"`` when the plain
+            name is taken by another signal of the layout.
+        signal (Signal): The signal definition.
+        start (int): First bit of the field in the payload, in the numbering of its byte order.
+        length (int): Width of the field in bits.
+        big_endian (bool): Whether the instance is ``BE``.
+        kind (str): ``"unsigned"``, ``"signed"``, ``"float"``, ``"char"`` or ``"bytes"``.
+        shift (int): Right shift of the payload read as one little (``LE``) or big (``BE``) endian integer that brings
+            the field to bit 0.
+        mask (int): ``(1 << length) - 1``.
+        byte_plan (Tuple[BytePlan, ...]): The bytes the field spans, for byte-wise (and vectorized) access.
+        conditions (Tuple[Condition, ...]): Selector values that must all match for the field to be present.
+    """
+
+    name: str
+    signal: Signal
+    start: int
+    length: int
+    big_endian: bool
+    kind: str
+    shift: int
+    mask: int
+    byte_plan: Tuple[BytePlan, ...]
+    conditions: Tuple[Condition, ...] = ()
+
+    @property
+    def factor(self) -> float:
+        return self.signal.factor
+
+    @property
+    def offset(self) -> float:
+        return self.signal.offset
+
+    @property
+    def is_scaled(self) -> bool:
+        """Whether the physical value differs from the raw one (always ``False`` for text and byte fields)."""
+        return self.kind not in ("char", "bytes") and (self.signal.factor != 1.0 or self.signal.offset != 0.0)
+
+    @property
+    def raw_bounds(self) -> Tuple[int, int]:
+        """Inclusive range of the raw integer value of an ``unsigned`` or ``signed`` field."""
+        if self.kind == "signed":
+            return -(1 << (self.length - 1)), (1 << (self.length - 1)) - 1
+        return 0, self.mask
+
+    @property
+    def byte_range(self) -> Tuple[int, int]:
+        """``(first byte, byte count)`` of a byte-aligned ``char`` or ``bytes`` field."""
+        return self.start // 8, self.length // 8
+
+    def to_value(self, raw: int, physical: bool = True) -> Any:
+        """Convert a raw field value into the signal's value (physical unless ``physical`` is ``False``)."""
+        if self.kind == "signed" and raw >> (self.length - 1):
+            raw -= 1 << self.length
+        elif self.kind == "float":
+            value = struct.unpack(_FLOAT_FORMATS[self.length], raw.to_bytes(self.length // 8, "little"))[0]
+            return value * self.factor + self.offset if physical and self.is_scaled else value
+        elif self.kind in ("char", "bytes"):
+            data = raw.to_bytes(self.length // 8, "big" if self.big_endian else "little")
+            return data.decode("latin-1").rstrip("\x00") if self.kind == "char" else data
+        return raw * self.factor + self.offset if physical and self.is_scaled else raw
+
+    def to_raw(self, value: Any, physical: bool = True) -> int:
+        """
+        Convert a value of the signal into its raw field bits.
+
+        Args:
+            value (Any): A number, or ``str`` / ``bytes`` for ``char`` / ``bytearray`` signals.
+            physical (bool): Whether numeric values are physical (``factor`` and ``offset`` are undone) or already raw.
+
+        Returns:
+            int: The unsigned raw bits, at most :attr:`length` wide.
+
+        Raises:
+            ValueError: If the value does not fit the field.
+        """
+
+        if self.kind in ("char", "bytes"):
+            data = value.encode("latin-1") if isinstance(value, str) else bytes(value)
+            if len(data) > self.length // 8:
+                raise ValueError(f"signal '{self.name}' holds {self.length // 8} bytes, got {len(data)}")
+            return int.from_bytes(data.ljust(self.length // 8, b"\x00"), "big" if self.big_endian else "little")
+        if physical and self.is_scaled:
+            value = (value - self.offset) / self.factor
+        if self.kind == "float":
+            return int.from_bytes(struct.pack(_FLOAT_FORMATS[self.length], value), "little")
+        raw = round(value)
+        low, high = self.raw_bounds
+        if not low <= raw <= high:
+            raise ValueError(f"value {value} of signal '{self.name}' is outside the raw range [{low}, {high}]")
+        return raw & self.mask
+
+
+@dataclass(frozen=True)
+class ContainerPlan(object):
+    """
+    A :class:`ContainerPDU` section of a :class:`CodecPlan`, demultiplexed while decoding.
+
+    Slots are read one after another from the start of the section: a big-endian header ID of ``id_bytes`` and a
+    big-endian payload length of ``length_bytes``, then the contained PDU. A header ID of ``0`` or the end of the section
+    stops the walk. Slots with an unknown header ID are skipped.
+
+    Attributes:
+        name (str): Name of the container PDU.
+        start (int): First byte of the section in the payload.
+        length (int): Length of the section in bytes.
+        id_bytes (int): Width of the header ID field in bytes.
+        length_bytes (int): Width of the header length field in bytes.
+        slots (Dict[int, CodecPlan]): The contained PDUs by header ID.
+    """
+
+    name: str
+    start: int
+    length: int
+    id_bytes: int
+    length_bytes: int
+    slots: Dict[int, "CodecPlan"]
+
+    def iter_slots(self, payload: bytes) -> List[Tuple[int, bytes]]:
+        """Return ``(header id, slot payload)`` for every slot of the section in ``payload``."""
+        section = payload[self.start : self.start + self.length]
+        header = self.id_bytes + self.length_bytes
+        slots: List[Tuple[int, bytes]] = []
+        position = 0
+        while position + header <= len(section):
+            header_id = int.from_bytes(section[position : position + self.id_bytes], "big")
+            size = int.from_bytes(section[position + self.id_bytes : position + header], "big")
+            if header_id == 0:
+                break
+            slots.append((header_id, section[position + header : position + header + size]))
+            position += header + size
+        return slots
+
+
+@dataclass(frozen=True)
+class CodecPlan(object):
+    """
+    The compiled layout of a frame or PDU.
+
+    Attributes:
+        name (str): Name of the compiled frame or PDU.
+        length (int): Payload length in bytes; shorter payloads are zero-padded, longer ones truncated.
+        fields (Tuple[FieldPlan, ...]): Every statically placed signal, selectors before the fields they guard.
+        containers (Tuple[ContainerPlan, ...]): The container PDU sections, if any.
+    """
+
+    name: str
+    length: int
+    fields: Tuple[FieldPlan, ...]
+    containers: Tuple[ContainerPlan, ...] = ()
+    _uses: Tuple[bool, bool] = field(default=(False, False), repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_uses", (any(not f.big_endian for f in self.fields), any(f.big_endian for f in self.fields)))
+
+    @property
+    def names(self) -> List[str]:
+        """The distinct value keys of the static fields, in layout order."""
+        return list(dict.fromkeys(f.name for f in self.fields))
+
+    def decode(self, payload: bytes, physical: bool = True) -> Dict[str, Any]:
+        """
+        Decode one payload.
+
+        Args:
+            payload (bytes): The raw frame or PDU payload.
+            physical (bool): Whether to apply ``factor`` and ``offset``. Raw values are returned when ``False``.
+
+        Returns:
+            Dict[str, Any]: Value per field name. Fields of inactive mux groups and absent container slots are left out.
+        """
+
+        payload = self._fit(payload)
+        uses_le, uses_be = self._uses
+        little = int.from_bytes(payload, "little") if uses_le else 0
+        big = int.from_bytes(payload, "big") if uses_be else 0
+        raws: Dict[int, int] = {}
+        values: Dict[str, Any] = {}
+        for index, fp in enumerate(self.fields):
+            if fp.conditions and not all(raws.get(selector) == value for selector, value in fp.conditions):
+                continue
+            raws[index] = raw = ((big if fp.big_endian else little) >> fp.shift) & fp.mask
+            values[fp.name] = fp.to_value(raw, physical)
+        for container in self.containers:
+            for header_id, slot in container.iter_slots(payload):
+                plan = container.slots.get(header_id)
+                if plan is not None:
+                    values.update(plan.decode(slot, physical))
+        return values
+
+    def encode(self, values: Mapping[str, Any], payload: Optional[bytes] = None, physical: bool = True) -> bytes:
+        """
+        Encode the given signal values into a payload.
+
+        Args:
+            values (Mapping[str, Any]): Value per field name. Fields not listed keep their bits from ``payload``.
+            payload (bytes, optional): The payload to start from; all zeros when omitted.
+            physical (bool): Whether numeric values are physical (``factor`` and ``offset`` are undone) or already raw.
+
+        Returns:
+            bytes: The encoded payload of :attr:`length` bytes.
+
+        Raises:
+            KeyError: If a value names no field of the layout.
+            ValueError: If a value does not fit its field or belongs to a mux group its selector does not activate.
+        """
+
+        unknown = set(values).difference(f.name for f in self.fields).difference(self._container_names())
+        if unknown:
+            raise KeyError(f"{self.name} has no signal(s) {sorted(unknown)}")
+        data = bytearray(self._fit(payload or b""))
+        raws: Dict[int, int] = {}
+        written = set()
+        for index, fp in enumerate(self.fields):
+            if fp.conditions and not all(raws.get(selector) == value for selector, value in fp.conditions):
+                continue
+            if fp.name in values:
+                raws[index] = raw = fp.to_raw(values[fp.name], physical)
+                _write(data, fp, raw)
+                written.add(fp.name)
+            else:
+                raws[index] = _read(data, fp)
+        inactive = set(values).difference(written).intersection(f.name for f in self.fields)
+        if inactive:
+            raise ValueError(f"signal(s) {sorted(inactive)} of {self.name} are not active for the selected mux group")
+        for container in self.containers:
+            self._encode_container(data, container, values, physical)
+        return bytes(data)
+
+    def decode_batch(self, payloads: Any, physical: bool = True) -> Dict[str, Any]:
+        """Vectorized :meth:`decode` of many payloads; see :func:`flync.sdk.codec.batch.decode_batch`."""
+        from flync.sdk.codec.batch import decode_batch
+
+        return decode_batch(self, payloads, physical)
+
+    def encode_batch(self, columns: Mapping[str, Any], base: Any = None, physical: bool = True) -> Any:
+        """Vectorized :meth:`encode` of many payloads; see :func:`flync.sdk.codec.batch.encode_batch`."""
+        from flync.sdk.codec.batch import encode_batch
+
+        return encode_batch(self, columns, base, physical)
+
+    def _fit(self, payload: bytes) -> bytes:
+        return payload[: self.length].ljust(self.length, b"\x00")
+
+    def _container_names(self) -> set:
+        return {name for container in self.containers for plan in container.slots.values() for name in plan.names}
+
+    @staticmethod
+    def _encode_container(data: bytearray, container: ContainerPlan, values: Mapping[str, Any], physical: bool) -> None:
+        """Pack a slot for every contained PDU that has at least one value, in declaration order."""
+        section = bytearray()
+        for header_id, plan in container.slots.items():
+            own = {name: value for name, value in values.items() if name in plan.names}
+            if own:
+                section += header_id.to_bytes(container.id_bytes, "big") + plan.length.to_bytes(container.length_bytes, "big")
+                section += plan.encode(own, physical=physical)
+        if len(section) > container.length:
+            raise ValueError(f"the slots of container PDU '{container.name}' need {len(section)} bytes, it holds {container.length}")
+        data[container.start : container.start + container.length] = section.ljust(container.length, b"\x00")
+
+
+def _read(data: bytearray, fp: FieldPlan) -> int:
+    """Read the raw bits of ``fp`` from ``data`` through its byte plan."""
+    raw = 0
+    for byte, shift, _ in fp.byte_plan:
+        raw |= data[byte] << shift if shift >= 0 else data[byte] >> -shift
+    return raw & fp.mask
+
+
+def _write(data: bytearray, fp: FieldPlan, raw: int) -> None:
+    """Store the raw bits of ``fp`` into ``data`` through its byte plan, keeping the bits of other fields."""
+    for byte, shift, byte_mask in fp.byte_plan:
+        bits = raw >> shift if shift >= 0 else raw << -shift
+        data[byte] = (data[byte] & ~byte_mask) | (bits & byte_mask)
+
+
+# ---------------------------------------------------------------------------
+# Compilation
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _Placed(object):
+    """A signal instance collected while walking a layout, before names and shifts are fixed."""
+
+    instance: SignalInstance
+    start: int
+    owner: str
+    conditions: Tuple[Condition, ...]
+
+
+@dataclass
+class _Layout(object):
+    """The state of one compilation: the resolved PDUs and everything collected so far."""
+
+    pdus: Mapping[str, PDU]
+    placed: List[_Placed] = field(default_factory=list)
+    containers: List[ContainerPlan] = field(default_factory=list)
+
+    def resolve(self, pdu_ref: str, context: str) -> PDU:
+        pdu = self.pdus.get(pdu_ref)
+        if pdu is None:
+            raise ValueError(f"{context} references unknown PDU '{pdu_ref}'")
+        return pdu
+
+    def add_pdu(self, pdu: PDU, start: int, conditions: Tuple[Condition, ...]) -> None:
+        if isinstance(pdu, StandardPDU):
+            self._add_signals(pdu.signals, start, pdu.name, conditions)
+            for group in pdu.signal_groups:
+                if group.bit_position is not None:
+                    self._add_signals(group.signal_group.signals, start + group.bit_position, pdu.name, conditions)
+        elif isinstance(pdu, MultiplexedPDU):
+            self._add_multiplexed(pdu, start, conditions)
+        elif isinstance(pdu, ContainerPDU):
+            self._add_container(pdu, start, conditions)
+        else:
+            raise ValueError(f"PDU '{pdu.name}' of type {type(pdu).__name__} has no codec")
+
+    def _add_signals(self, instances: Sequence[SignalInstance], start: int, owner: str, conditions: Tuple[Condition, ...]) -> None:
+        for instance in instances:
+            if instance.bit_position is not None:
+                self.placed.append(_Placed(instance, start + instance.bit_position, owner, conditions))
+
+    def _add_multiplexed(self, pdu: MultiplexedPDU, start: int, conditions: Tuple[Condition, ...]) -> None:
+        selector = pdu.selector_signal
+        if selector.bit_position is None:
+            raise ValueError(f"MultiplexedPDU '{pdu.name}': the selector signal '{selector.signal.name}' is not placed")
+        selector_index = len(self.placed)
+        self.placed.append(_Placed(selector, start + selector.bit_position, pdu.name, conditions))
+        for static in pdu.static_group or []:
+            self.add_pdu(self.resolve(static.pdu_ref, f"MultiplexedPDU '{pdu.name}'"), start + (static.bit_position or 0), conditions)
+        for group in pdu.mux_groups:
+            member = self.resolve(group.pdu.pdu_ref, f"MultiplexedPDU '{pdu.name}'")
+            self.add_pdu(member, start + (group.pdu.bit_position or 0), conditions + ((selector_index, group.selector_value),))
+
+    def _add_container(self, pdu: ContainerPDU, start: int, conditions: Tuple[Condition, ...]) -> None:
+        if pdu.header.id_length_bits == 0:  # a header-less container holds exactly one PDU at a fixed offset
+            ref = pdu.contained_pdus[0]
+            self.add_pdu(self.resolve(ref.pdu_ref, f"ContainerPDU '{pdu.name}'"), start + (ref.offset or 0), conditions)
+            return
+        if start % 8 or conditions:
+            raise ValueError(f"ContainerPDU '{pdu.name}' must sit byte-aligned and outside mux groups to be decoded")
+        slots = {ref.header_id: compile_pdu(self.resolve(ref.pdu_ref, f"ContainerPDU '{pdu.name}'"), self.pdus) for ref in pdu.contained_pdus}
+        self.containers.append(
+            ContainerPlan(pdu.name, start // 8, pdu.length, pdu.header.id_length_bits // 8, pdu.header.length_field_bits // 8, slots)
+        )
+
+    def plan(self, name: str, length: int) -> CodecPlan:
+        names = _field_names(self.placed)
+        fields = tuple(_field_plan(name, placed, field_name, length) for placed, field_name in zip(self.placed, names))
+        return CodecPlan(name, length, fields, tuple(self.containers))
+
+
+def _field_names(placed: List[_Placed]) -> List[str]:
+    """Name every field after its signal, qualified by its PDU when a signal of another PDU has the same name."""
+    owners: Dict[str, set] = {}
+    for p in placed:
+        owners.setdefault(p.instance.signal.name, set()).add(p.owner)
+    names = [p.instance.signal.name if len(owners[p.instance.signal.name]) == 1 else f"{p.owner}.{p.instance.signal.name}" for p in placed]
+    seen: Dict[str, List[_Placed]] = {}
+    for p, name in zip(placed, names):
+        for other in seen.setdefault(name, []):
+            if not _exclusive(p.conditions, other.conditions):
+                raise ValueError(f"signal '{name}' is placed more than once in the same layout")
+        seen[name].append(p)
+    return names
+
+
+def _exclusive(left: Tuple[Condition, ...], right: Tuple[Condition, ...]) -> bool:
+    """Whether two sets of mux conditions can never hold at the same time."""
+    selected = dict(left)
+    return any(selector in selected and selected[selector] != value for selector, value in right)
+
+
+def _kind(signal: Signal) -> str:
+    data_type = signal.data_type
+    if data_type.is_float():
+        return "float"
+    if data_type.is_signed_integer():
+        return "signed"
+    if data_type.is_unsigned_integer():
+        return "unsigned"
+    return "char" if data_type.value == "char" else "bytes"
+
+
+def _field_plan(layout_name: str, placed: _Placed, name: str, length: int) -> FieldPlan:
+    """Fix the shift, mask and byte plan of one placed signal within a payload of ``length`` bytes."""
+    signal = placed.instance.signal
+    start, width, big_endian = placed.start, signal.bit_length, placed.instance.endianness == "BE"
+    end = start + width
+    if end > length * 8:
+        raise ValueError(f"signal '{name}' of {layout_name} ends at bit {end}, beyond the {length * 8} bits of the payload")
+    kind = _kind(signal)
+    if kind in ("char", "bytes") and start % 8:
+        raise ValueError(f"{signal.data_type.value} signal '{name}' of {layout_name} must start on a byte boundary")
+    mask = (1 << width) - 1
+    byte_plan = []
+    for byte in range(start // 8, (end - 1) // 8 + 1):
+        shift = end - 8 - 8 * byte if big_endian else 8 * byte - start
+        byte_plan.append((byte, shift, (mask >> shift if shift >= 0 else mask << -shift) & 0xFF))
+    shift = length * 8 - end if big_endian else start
+    return FieldPlan(name, signal, start, width, big_endian, kind, shift, mask, tuple(byte_plan), placed.conditions)
+
+
+def compile_pdu(pdu: PDU, pdus: Optional[Mapping[str, PDU]] = None) -> CodecPlan:
+    """
+    Compile the layout of a PDU.
+
+    Args:
+        pdu (PDU): A :class:`StandardPDU`, :class:`MultiplexedPDU` or :class:`ContainerPDU`.
+        pdus (Mapping[str, PDU], optional): PDUs by name, to resolve the static group and mux groups of a multiplexed PDU
+            and the contained PDUs of a container PDU.
+
+    Returns:
+        CodecPlan: The plan of a payload of ``pdu.length`` bytes.
+
+    Raises:
+        ValueError: If a referenced PDU is unknown or a signal cannot be placed in the payload.
+    """
+
+    layout = _Layout(pdus or {})
+    layout.add_pdu(pdu, 0, ())
+    return layout.plan(pdu.name, pdu.length)
+
+
+def compile_frame(frame: Frame, pdus: Mapping[str, PDU]) -> CodecPlan:
+    """
+    Compile the layout of a frame and the PDUs packed into it.
+
+    Args:
+        frame (Frame): A CAN, CAN FD or LIN frame.
+        pdus (Mapping[str, PDU]): PDUs by name, to resolve ``frame.packed_pdus``.
+
+    Returns:
+        CodecPlan: The plan of a payload of ``frame.length`` bytes.
+
+    Raises:
+        ValueError: If a referenced PDU is unknown or a signal cannot be placed in the payload.
+    """
+
+    layout = _Layout(pdus)
+    for instance in frame.packed_pdus:
+        layout.add_pdu(layout.resolve(instance.pdu_ref, f"Frame '{frame.name}'"), instance.bit_position or 0, ())
+    return layout.plan(frame.name, frame.length)
+
+
+class SignalCodec(object):
+    """
+    Compiles and caches the plans of the frames and PDUs of one :class:`~flync.model.flync_model.FLYNCModel`.
+
+    Plans reflect the model as it was when they were compiled; create a new codec after changing the model.
+
+    Attributes:
+        model (FLYNCModel): The model whose layouts are compiled.
+    """
+
+    def __init__(self, model: "FLYNCModel"):
+        """Create a codec over ``model``; nothing is compiled until a plan is requested."""
+        self.model = model
+        self._index = SystemIndex(model)
+        self._plans: Dict[Tuple[Any, ...], CodecPlan] = {}
+
+    def pdu(self, name: str) -> CodecPlan:
+        """
+        Return the plan of a PDU.
+
+        Args:
+            name (str): Name of a PDU declared under ``communication.channels``.
+
+        Returns:
+            CodecPlan: The compiled plan.
+
+        Raises:
+            KeyError: If no PDU has that name.
+        """
+
+        key = ("pdu", name)
+        if key not in self._plans:
+            if name not in self._index.pdus:
+                raise KeyError(f"no PDU named '{name}'")
+            self._plans[key] = compile_pdu(self._index.pdus[name], self._index.pdus)
+        return self._plans[key]
+
+    def frame(self, bus: str, frame_id: int) -> CodecPlan:
+        """
+        Return the plan of a frame, looked up the way a bus log identifies it.
+
+        Args:
+            bus (str): Name of the CAN or LIN bus.
+            frame_id (int): The ``can_id`` or ``lin_id`` of the frame.
+
+        Returns:
+            CodecPlan: The compiled plan.
+
+        Raises:
+            KeyError: If the bus carries no frame with that ID.
+        """
+
+        key = ("frame", bus, frame_id)
+        if key not in self._plans:
+            frame = self._index.frames_by_bus_id.get((bus, frame_id))
+            if frame is None:
+                raise KeyError(f"no frame with ID {frame_id:#x} on bus '{bus}'")
+            self._plans[key] = compile_frame(frame, self._index.pdus)
+        return self._plans[key]
+
+    def compile(self, layout: Union[Frame, PDU]) -> CodecPlan:
+        """Compile a frame or PDU of the model, resolving its PDU references against the model (not cached)."""
+        if isinstance(layout, Frame):
+            return compile_frame(layout, self._index.pdus)
+        return compile_pdu(layout, self._index.pdus)
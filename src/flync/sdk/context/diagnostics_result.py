@@ -8,7 +8,7 @@ from enum import Enum
 from os import getcwd
 from typing import Optional
 
-from pydantic import ConfigDict, field_serializer
+from pydantic import ConfigDict, Field, field_serializer
 from pydantic.dataclasses import dataclass
 from pydantic_core import ErrorDetails
 
@@ -49,12 +49,15 @@ class DiagnosticsResult:
         errors (dict[str, list[ErrorDetails]]): Mapping of document URIs to their associated Pydantic validation error details.
         model (Optional[FLYNCBaseModel]): The validated root model, or ``None`` if validation failed.
         workspace (Optional[FLYNCWorkspace]): The loaded workspace instance, or ``None`` if the workspace could not be created.
+        skipped_checks (list[str]): Checks of the root model that were not run because only part of the workspace was
+            validated, as ``"<model>.<validator>"``.
     """
 
     state: WorkspaceState
     errors: dict[str, list[ErrorDetails]]
     model: Optional[FLYNCBaseModel] = None
     workspace: Optional[FLYNCWorkspace] = None
+    skipped_checks: list[str] = Field(default_factory=list)
 
     @field_serializer("workspace")
     def serialize_workspace(self, value: FLYNCWorkspace) -> str:
@@ -9,7 +9,7 @@ import importlib.metadata
 import logging
 from enum import IntFlag
 from pathlib import Path
-from typing import Any, Type
+from typing import Any, Optional, Type
 
 import yaml
 from packaging.version import Version
@@ -126,6 +126,20 @@ class WorkspaceConfiguration(BaseModel):
         should stay free of FLYNC tooling files - generated or converted output, scratch directories, or a
         workspace whose configuration file is maintained by hand. Only the implicit write is suppressed;
         :meth:`to_yaml_file` still writes when called directly.
+        parse_cache (bool): When ``True``, parsed documents are kept in a content-addressed cache under the FLYNC user cache
+        directory, so reopening a workspace skips YAML parsing for every file whose text did not change. Defaults to ``False``.
+        parse_cache_max_mb (int): Size cap of the parse cache in MiB; least recently used entries are evicted beyond it.
+        Defaults to ``512``.
+        parse_cache_dir (str | None): Parent directory of the parse cache, e.g. to keep a benchmark or CI run away from the
+        user's cache. Defaults to ``None``, the FLYNC user cache directory.
+        parallel_validation (bool): When ``True``, the folder subtrees of the root model (every ECU, the communication
+        configuration, every application, the topology) are loaded and validated in a process pool, and only the root-level
+        validators run in the calling process. Pays off for large workspaces on many cores. Defaults to ``False``.
+        validation_workers (int | None): Number of processes used by ``parallel_validation``. Defaults to the number of CPUs.
+        fast_write (bool): When ``True``, :meth:`~flync.sdk.workspace.flync_workspace.FLYNCWorkspace.load_flync_model` only
+        builds the documents, and ``generate_configs`` writes them in one batch from a thread pool, leaving every file that
+        already holds its document's content untouched so its modification time stays stable. Defaults to ``False``.
+        write_workers (int | None): Number of threads used by ``fast_write``. Defaults to the executor's own choice.
         version (BaseVersion): FLYNC release that last wrote this configuration. Auto-detects the current version by default.
         Always serialized, and moved forward (never backwards) when a newer FLYNC rewrites the file.
         Tracking only: it is recorded to support future migrations and is not enforced on load.
@@ -140,6 +154,13 @@ class WorkspaceConfiguration(BaseModel):
     map_objects: bool = False
     list_objects_mode: ListObjectsMode = ListObjectsMode.INDEX | ListObjectsMode.NAME
     persist_config: bool = True
+    parse_cache: bool = False
+    parse_cache_max_mb: int = Field(default=512, gt=0)
+    parse_cache_dir: Optional[str] = None
+    parallel_validation: bool = False
+    validation_workers: Optional[int] = Field(default=None, gt=0)
+    fast_write: bool = False
+    write_workers: Optional[int] = Field(default=None, gt=0)
     version: BaseVersion = Field(default_factory=_get_current_flync_version)
 
     @field_validator("root_model", mode="before")
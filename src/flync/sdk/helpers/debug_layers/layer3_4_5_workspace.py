@@ -8,7 +8,8 @@ three buckets based on their Pydantic error type:
   Layer 5 - System-wide         : cross-model warnings (warn() calls)
 
 The workspace already runs all validators; this module just classifies the
-output so the runner can present it in layers.
+output so the runner can present it in layers.  Given a debug session, the
+workspace is loaded from the documents the session already parsed.
 """
 
 from __future__ import annotations
@@ -18,7 +19,10 @@ import re
 from dataclasses import dataclass
 from dataclasses import field as dc_field
 from pathlib import Path
-from typing import Any, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .session import DebugSession
 
 # Sub-error patterns that indicate a structural (schema) problem
 _EXTRA_RE = re.compile(r"^([^:\n]+):\s*Extra inputs are not permitted", re.MULTILINE)
@@ -68,16 +72,25 @@ class WorkspaceIssue(object):
 
 def run_workspace_validation(
     dir_path: Path,
+    session: Optional[DebugSession] = None,
 ) -> tuple[Any, list[WorkspaceIssue]]:
     """
     Load the full workspace and return (DiagnosticsResult, [WorkspaceIssue]).
 
     Issues are classified into layers 3 / 4 / 5 by error type.
     Layer 3 errors are enriched with typo hints where possible.
+
+    With a session, the workspace is built from the session's parsed
+    documents and the hints read keys from the same ASTs.  Every file with
+    a layer 3 or 4 error is marked as failed in the session.
     """
     from flync.sdk.helpers.validation_helpers import validate_workspace
 
-    result = validate_workspace(dir_path)
+    if session is None:
+        result = validate_workspace(dir_path)
+    else:
+        session.parse()
+        result = validate_workspace(dir_path, session.configuration, documents=session.documents)
     issues: list[WorkspaceIssue] = []
 
     for doc_uri, doc_errors in result.errors.items():
@@ -85,8 +98,13 @@ def run_workspace_validation(
         for err in doc_errors:
             issues.extend(_classify_error(err, rel_doc, dir_path))
 
+    if session is not None:
+        for issue in issues:
+            if issue.severity == "error" and issue.path:
+                session.mark_failed(issue.path, issue.layer)
+
     # Enrich layer-3 errors with "did you mean" hints
-    _enrich_typo_hints(issues, dir_path)
+    _enrich_typo_hints(issues, dir_path, session)
     return result, issues
 
 
@@ -390,6 +408,7 @@ def _extract_list_type_errors(
 def _enrich_typo_hints(
     issues: list[WorkspaceIssue],
     dir_path: Path,
+    session: Optional[DebugSession] = None,
 ) -> None:
     """
     Add "did you mean X?" hints to Layer 3 errors caused by renamed fields.
@@ -401,6 +420,9 @@ def _enrich_typo_hints(
     - extra_forbid : traverse the Pydantic model tree to find a real field
                      name similar to the rejected key (the correct name is
                      absent from the file but exists in the schema).
+
+    With a session the YAML data comes from its parsed documents instead of
+    the files.
     """
     yaml_cache: dict[str, Any] = {}
     model_cache: dict[str, list[type]] = {}
@@ -409,7 +431,7 @@ def _enrich_typo_hints(
         if issue.layer != 3 or not issue.loc_tuple:
             continue
         if issue.err_type == "missing":
-            _enrich_missing_field_hint(issue, dir_path, yaml_cache)
+            _enrich_missing_field_hint(issue, dir_path, yaml_cache, session)
         elif issue.err_type in ("extra_forbid", "extra_forbidden"):
             _enrich_extra_field_hint(issue, model_cache)
 
@@ -418,6 +440,7 @@ def _enrich_missing_field_hint(
     issue: WorkspaceIssue,
     dir_path: Path,
     yaml_cache: dict[str, Any],
+    session: Optional[DebugSession] = None,
 ) -> None:
     """Set issue.hint by looking for a similarly-named key in the actual YAML file."""
     if not issue.path:
@@ -426,7 +449,7 @@ def _enrich_missing_field_hint(
     if abs_path is None:
         return
 
-    data = _load_yaml_cached(abs_path, yaml_cache)
+    data = session.data(abs_path, issue.layer) if session is not None else _load_yaml_cached(abs_path, yaml_cache)
     if data is None:
         return
 
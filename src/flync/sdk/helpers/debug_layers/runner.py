@@ -2,6 +2,8 @@
 
 Runs five validation layers in order and stops at the first layer that
 produces hard errors, so the user always sees the most actionable message.
+All layers share one :class:`~.session.DebugSession`, so every file is
+parsed once per run.
 
   1  Folder & file structure
   2  YAML syntax
@@ -103,21 +105,26 @@ def _run_layers(dir_path: Path) -> None:
     from .layer1_structure import check_structure
     from .layer2_yaml import check_yaml_syntax
     from .layer3_4_5_workspace import run_workspace_validation
+    from .session import DebugSession
 
+    session = DebugSession(dir_path)
     l1_errors, l1_warnings = _report_layer1(check_structure, dir_path)
+    for issue in l1_errors:
+        if issue.path:
+            session.mark_failed(issue.path, 1)
     if l1_errors:
         _console.print("\n[bold red]Stopped at Layer 1.[/bold red]  Fix the structure issues above before proceeding.")
         _print_summary(l1_errors=len(l1_errors), l1_warnings=len(l1_warnings))
         return
 
-    yaml_issues = _report_layer2(check_yaml_syntax, dir_path)
+    yaml_issues = _report_layer2(check_yaml_syntax, dir_path, session)
     if yaml_issues:
         _console.print("\n[bold red]Stopped at Layer 2.[/bold red]  Fix YAML syntax errors before proceeding.")
         _print_summary(l1_warnings=len(l1_warnings), l2_errors=len(yaml_issues))
         return
 
     _console.print("\n[dim]Loading workspace...[/dim]")
-    ws_result, ws_issues = run_workspace_validation(dir_path)
+    ws_result, ws_issues = run_workspace_validation(dir_path, session)
     l3 = [i for i in ws_issues if i.layer == 3]
     l4 = [i for i in ws_issues if i.layer == 4]
     l5 = [i for i in ws_issues if i.layer == 5]
@@ -166,10 +173,10 @@ def _report_layer1(check_structure, dir_path: Path) -> tuple[list, list]:
     return l1_errors, l1_warnings
 
 
-def _report_layer2(check_yaml_syntax, dir_path: Path) -> list:
-    """Run Layer 2 (YAML syntax) and print its findings. Returns the issues found."""
+def _report_layer2(check_yaml_syntax, dir_path: Path, session) -> list:
+    """Run Layer 2 (YAML syntax) on the session's files and print its findings. Returns the issues found."""
     _section("Layer 2 - YAML Syntax")
-    yaml_issues = check_yaml_syntax(dir_path)
+    yaml_issues = check_yaml_syntax(dir_path, session)
 
     if not yaml_issues:
         _ok("All .flync.yaml files parse correctly")
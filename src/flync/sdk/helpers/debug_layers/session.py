@@ -0,0 +1,108 @@
+"""Shared state of one ``flync debug`` run.
+
+A :class:`DebugSession` reads and parses every FLYNC document of the debugged
+directory exactly once, with the parser the workspace itself uses.  Layer 2
+reports the files that failed to parse, the workspace load of layers 3-5
+takes the parsed documents as they are, and the layer 3 hints look keys up in
+the same ASTs, so no file is read or parsed a second time.
+
+The session also remembers the first layer every file failed in.  A file
+that already failed is not handed to a later layer.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Optional
+
+from ruamel.yaml.error import MarkedYAMLError
+
+from flync.sdk.context.workspace_config import WorkspaceConfiguration
+from flync.sdk.workspace.document import Document, read_file
+from flync.sdk.workspace.flync_workspace import _resolve_workspace_config
+
+from .layer2_yaml import YAMLIssue
+
+
+class DebugSession(object):
+    """
+    Parsed documents and per-file outcome of one debug run over ``dir_path``.
+
+    Attributes:
+        dir_path (Path): The debugged workspace directory.
+        configuration (WorkspaceConfiguration): Configuration of the workspace load of layers 3-5. Without an explicit
+            one it is resolved like ``flync validate`` does, from the workspace's ``.flync/config.yaml`` if present.
+        documents (dict[str, Document]): Every document that parsed, by workspace-relative uri.
+        failed (dict[str, int]): The first layer every failed file failed in, by workspace-relative path.
+    """
+
+    def __init__(self, dir_path: Path, configuration: Optional[WorkspaceConfiguration] = None):
+        self.dir_path = dir_path
+        self.configuration = configuration or _resolve_workspace_config(dir_path, None)
+        self.documents: dict[str, Document] = {}
+        self.failed: dict[str, int] = {}
+        self._yaml_issues: Optional[list[YAMLIssue]] = None
+
+    def mark_failed(self, path: str, layer: int) -> None:
+        """Record that the file at the workspace-relative ``path`` failed in ``layer``, unless it failed earlier."""
+        self.failed.setdefault(Path(path).as_posix(), layer)
+
+    def parse(self) -> list[YAMLIssue]:
+        """
+        Parse every FLYNC document under :attr:`dir_path` that no earlier layer rejected.
+
+        Runs once per session; later calls return the issues of the first one.
+
+        Returns:
+            list[YAMLIssue]: One issue for every file that could not be parsed, in path order.
+        """
+        if self._yaml_issues is not None:
+            return self._yaml_issues
+        self._yaml_issues = []
+        needs_compose = self.configuration.map_objects
+        # every extension the workspace loads, not only the one it writes
+        extensions = self.configuration.allowed_extensions
+        for path in sorted({path for extension in extensions for path in self.dir_path.rglob(f"*{extension}")}):
+            uri = Document.normalize_uri(path, self.dir_path)
+            if uri in self.failed or not path.is_file():
+                continue
+            try:
+                text = read_file(path)
+                ast, compose_ast = Document._parse_text(text, needs_compose)
+            except MarkedYAMLError as exc:
+                mark = exc.problem_mark
+                self._fail(
+                    YAMLIssue(message=exc.problem or str(exc), path=uri, line=mark.line + 1 if mark else None, col=mark.column + 1 if mark else None)
+                )
+                continue
+            except Exception as exc:
+                self._fail(YAMLIssue(message=str(exc), path=uri))
+                continue
+            document = Document(uri, text, needs_compose)
+            document.assign_ast(ast, compose_ast)
+            self.documents[uri] = document
+        return self._yaml_issues
+
+    def _fail(self, issue: YAMLIssue) -> None:
+        self._yaml_issues.append(issue)  # type: ignore[union-attr]
+        self.mark_failed(issue.path, 2)
+
+    def data(self, path: Path, layer: int) -> Any:
+        """
+        Return the parsed content of a document for ``layer``, without reading the file again.
+
+        Args:
+            path (Path): Absolute path of the document.
+            layer (int): The asking layer; a file that failed in an earlier one is not handed out.
+
+        Returns:
+            Any: The AST of the document, or ``None`` if it is outside the workspace, was not parsed or failed earlier.
+        """
+        try:
+            uri = Document.normalize_uri(path, self.dir_path)
+        except ValueError:
+            return None
+        document = self.documents.get(uri)
+        if document is None or self.failed.get(uri, layer) < layer:
+            return None
+        return document.ast
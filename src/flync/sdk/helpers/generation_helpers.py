@@ -28,6 +28,7 @@ from flync.model.flync_4_topology.ethernet_topology import ExternalConnection
 from flync.model.flync_model import FLYNCBaseModel, FLYNCModel
 from flync.sdk.context.workspace_config import WorkspaceConfiguration
 from flync.sdk.utils.field_utils import get_field_name_from_alias
+from flync.sdk.workspace.document_writer import WriteReport
 from flync.sdk.workspace.flync_workspace import FLYNCWorkspace
 from flync.sdk.workspace.ids import ObjectId
 from flync.sdk.workspace.objects import SemanticObject
@@ -597,7 +598,7 @@ def dump_flync_workspace(
     output_path: str | pathlib.Path,
     workspace_name: str | None,
     workspace_config: WorkspaceConfiguration | None = None,
-) -> None:
+) -> WriteReport:
     """
     Generate a FLYNC workspace from a FLYNCModel object.
 
@@ -606,9 +607,10 @@ def dump_flync_workspace(
         output_path (str | pathlib.Path): The path where the workspace will be created.
         workspace_name (str | None): Optional name for the workspace.
         workspace_config (WorkspaceConfiguration | None): Optional workspace configuration. Uses defaults if ``None``.
+            With ``fast_write`` set, files that already hold the generated content are left untouched.
 
     Returns:
-        None
+        WriteReport: The files and bytes written by the final save.
     """
 
     ws = FLYNCWorkspace.load_model(
@@ -617,7 +619,7 @@ def dump_flync_workspace(
         output_path,
         workspace_config=workspace_config,
     )
-    ws.generate_configs()
+    return ws.generate_configs()
 
 
 def generate_external_node(
@@ -7,6 +7,7 @@ Provides high-level functions to validate FLYNC workspaces and individual nodes,
 
 import faulthandler
 import logging
+from contextlib import nullcontext
 from pathlib import Path
 
 from pydantic_core import (
@@ -15,11 +16,14 @@ from pydantic_core import (
     ValidationError,
 )
 
+from flync.core.utils.validation_profile import ValidationProfile
 from flync.model import FLYNCBaseModel, FLYNCModel
 from flync.sdk.context.diagnostics_result import (
     DiagnosticsResult,
     WorkspaceState,
 )
+from flync.sdk.utils.field_utils import get_model_checks
+from flync.sdk.workspace.document import Document
 from flync.sdk.workspace.flync_workspace import (
     FLYNCWorkspace,
     WorkspaceConfiguration,
@@ -36,6 +40,9 @@ faulthandler.enable()
 def validate_workspace(
     workspace_path: str | Path,
     workspace_config: WorkspaceConfiguration | None = None,
+    use_snapshot: bool = False,
+    documents: dict[str, Document] | None = None,
+    profile: ValidationProfile | None = None,
 ) -> DiagnosticsResult:
     """
     Validate an entire FLYNC workspace rooted at the default ``FLYNCModel``.
@@ -43,18 +50,27 @@ def validate_workspace(
     Args:
         workspace_path (str | Path): Path to the workspace directory.
         workspace_config (WorkspaceConfiguration | None): Optional workspace configuration. Uses defaults if ``None``.
+        use_snapshot (bool): Reuse the workspace's snapshot when no document changed since it was written, and write
+            it otherwise. See :meth:`~flync.sdk.workspace.flync_workspace.FLYNCWorkspace.load_snapshot`.
+        documents (dict[str, Document] | None): Already parsed documents by workspace-relative uri, which are not
+            parsed again.
+        profile (ValidationProfile | None): Record the time (and memory) spent per phase, document and model
+            validator of the validation into this profile.
 
     Returns:
         DiagnosticsResult: The validation outcome including state, errors, and the loaded model.
     """
 
-    return validate_external_node(FLYNCModel, workspace_path, workspace_config)
+    return validate_external_node(FLYNCModel, workspace_path, workspace_config, use_snapshot=use_snapshot, documents=documents, profile=profile)
 
 
 def validate_external_node(
     node: str | type[FLYNCBaseModel],
     node_path: Path | str,
     workspace_config: WorkspaceConfiguration | None = None,
+    use_snapshot: bool = False,
+    documents: dict[str, Document] | None = None,
+    profile: ValidationProfile | None = None,
 ) -> DiagnosticsResult:
     """
     Validate a specific FLYNC node type at a given filesystem path.
@@ -67,6 +83,11 @@ def validate_external_node(
         node_path (Path | str): Path to the directory containing the node's FLYNC configuration files.
         workspace_config (WorkspaceConfiguration | None): Optional workspace configuration. \
             Uses defaults if ``None``. The ``root_model`` field is always overwritten with ``node``.
+        use_snapshot (bool): Restore the load from the snapshot of ``node_path`` when it is fresh, and write it otherwise.
+        documents (dict[str, Document] | None): Already parsed documents by workspace-relative uri, which are not
+            parsed again.
+        profile (ValidationProfile | None): Record the time (and memory) spent per phase, document and model
+            validator of the validation into this profile.
 
     Returns:
         DiagnosticsResult: Validation outcome with state, per-document errors, the loaded model, and the workspace instance.
@@ -82,53 +103,125 @@ def validate_external_node(
             workspace_config = WorkspaceConfiguration.create_from_config(workspace_config, root_model=node)
         else:
             workspace_config = WorkspaceConfiguration(root_model=node)
-        ws = FLYNCWorkspace.safe_load_workspace(
-            "validation_workspace",
-            node_path,
-            workspace_config=workspace_config,
-        )
+        with profile.activate() if profile is not None else nullcontext():
+            ws = FLYNCWorkspace.safe_load_workspace(
+                "validation_workspace",
+                node_path,
+                workspace_config=workspace_config,
+                use_snapshot=use_snapshot,
+                documents=documents,
+            )
         model = ws.flync_model
-        state = WorkspaceState.VALID
-        # only add documents that have problems
-        for doc_url, doc_errors in ws.documents_diags.items():
-            if doc_errors:
-                errors[doc_url] = doc_errors
-                state = WorkspaceState.WARNING
-        if ws.flync_model is None:
-            state = WorkspaceState.INVALID
+        state, errors = _state_and_errors(ws)
     except Exception as ex:
         state = WorkspaceState.BROKEN
         logger.error(
             "Encountered issue while validating node %s",
             ex.with_traceback(None),  # type: ignore[func-returns-value]
         )
-    return DiagnosticsResult(state=state, errors=errors, model=model, workspace=ws)
+    # the checks across the whole system live on the root model, which a standalone node never reaches
+    skipped_checks = get_model_checks(FLYNCModel) if node is not FLYNCModel else []
+    return DiagnosticsResult(state=state, errors=errors, model=model, workspace=ws, skipped_checks=skipped_checks)
+
+
+def _state_and_errors(ws: FLYNCWorkspace, model: FLYNCBaseModel | None = None) -> tuple[WorkspaceState, dict]:
+    """
+    Derive the validation state of a loaded workspace and collect the diagnostics of its documents that have any.
+
+    The state is ``INVALID`` when the loaded model is missing: ``model`` if given (e.g. the subtree of a subtree-only
+    load), the workspace's ``flync_model`` otherwise.
+    """
+    state = WorkspaceState.VALID
+    errors = {}
+    # only add documents that have problems
+    for doc_url, doc_errors in ws.documents_diags.items():
+        if doc_errors:
+            errors[doc_url] = doc_errors
+            state = WorkspaceState.WARNING
+    if (model if model is not None else ws.flync_model) is None:
+        state = WorkspaceState.INVALID
+    return state, errors
+
+
+def validate_subtree(
+    ws_path: Path | str,
+    node_path: str,
+    workspace_config: WorkspaceConfiguration | None = None,
+    profile: ValidationProfile | None = None,
+) -> DiagnosticsResult:
+    """
+    Validate only the part of a workspace that holds ``node_path``, see :meth:`FLYNCWorkspace.safe_load_subtree`.
+
+    The root model is not validated; its checks are listed in
+    :attr:`~flync.sdk.context.diagnostics_result.DiagnosticsResult.skipped_checks`.
+
+    Args:
+        ws_path (Path | str): Path to the workspace root directory.
+        node_path (str): Dot-separated object path of the subtree, e.g. ``ecus.zonal_platform2``.
+        workspace_config (WorkspaceConfiguration | None): Optional workspace configuration. Object mapping is always
+            enabled, so nodes below the loaded subtree can be looked up.
+        profile (ValidationProfile | None): Record the time (and memory) spent per phase, document and model
+            validator of the validation into this profile.
+
+    Returns:
+        DiagnosticsResult: Validation outcome of the loaded subtree, with the subtree as ``model``.
+    """
+
+    state = WorkspaceState.EMPTY
+    errors = {}
+    model = None
+    ws = None
+    try:
+        if workspace_config:
+            workspace_config = WorkspaceConfiguration.create_from_config(workspace_config, map_objects=True)
+        else:
+            workspace_config = WorkspaceConfiguration(map_objects=True)
+        with profile.activate() if profile is not None else nullcontext():
+            ws = FLYNCWorkspace.safe_load_subtree("validation_workspace", ws_path, node_path, workspace_config=workspace_config)
+        model = ws.subtree_model
+        state, errors = _state_and_errors(ws, model)
+    except Exception as ex:
+        state = WorkspaceState.BROKEN
+        logger.error(
+            "Encountered issue while validating subtree %s: %s",
+            node_path,
+            ex.with_traceback(None),  # type: ignore[func-returns-value]
+        )
+    skipped_checks = ws.skipped_checks if ws is not None else []
+    return DiagnosticsResult(state=state, errors=errors, model=model, workspace=ws, skipped_checks=skipped_checks)
 
 
 def validate_node(
     ws_path: Path | str,
     node_path: str = "",
     workspace_config: WorkspaceConfiguration | None = None,
+    full_workspace: bool = False,
 ) -> DiagnosticsResult:
     """
-    Validate a single node within an already-loaded workspace.
+    Validate a single node within a workspace.
 
-    First validates the full workspace, then checks that the node at ``node_path`` exists and extracts its model. If the node is missing, a
-    fatal validation error is recorded.
+    By default only the subtree holding the node is loaded and validated (see :func:`validate_subtree`), and the
+    root-level checks are reported as skipped; with ``full_workspace`` the entire workspace is validated first. Then
+    checks that the node at ``node_path`` exists and extracts its model. If the node is missing, a fatal validation
+    error is recorded.
 
     Args:
         ws_path (Path | str): Path to the workspace root directory.
         node_path (str): Dot-separated path to the target node within the workspace object graph.
-        workspace_config (WorkspaceConfiguration | None): Optional workspace configuration forwarded to :func:`validate_workspace`.
+        workspace_config (WorkspaceConfiguration | None): Optional workspace configuration forwarded to the load.
+        full_workspace (bool): Validate the entire workspace, including the root-level checks, instead of the subtree.
 
     Returns:
         DiagnosticsResult: Validation outcome for the specified node.
     """
 
-    # load entire workspace
-    workspace_results = validate_workspace(ws_path, workspace_config=workspace_config)
+    if full_workspace or not node_path:
+        # load entire workspace
+        workspace_results = validate_workspace(ws_path, workspace_config=workspace_config)
+    else:
+        workspace_results = validate_subtree(ws_path, node_path, workspace_config=workspace_config)
     # validate node in workspace
-    if not workspace_results.workspace or node_path not in workspace_results.workspace.objects:
+    if not workspace_results.workspace or not workspace_results.workspace.has_object(ObjectId(node_path)):
         workspace_results.state = WorkspaceState.INVALID
         fatal_ctx = {"node_path": node_path}
         error = InitErrorDetails(
@@ -145,5 +238,5 @@ def validate_node(
         except ValidationError as ex:
             workspace_results.errors[node_path] = ex.errors()
     else:
-        workspace_results.model = workspace_results.workspace.objects[ObjectId(node_path)].model  # type: ignore[assignment]
+        workspace_results.model = workspace_results.workspace.get_object(ObjectId(node_path)).model  # type: ignore[assignment]
     return workspace_results
@@ -65,3 +65,24 @@ def get_field_name_from_alias(model: type[BaseModel], alias: str):
         if field.alias == alias:
             return name
     return alias
+
+
+def get_model_checks(model: type[BaseModel]) -> list[str]:
+    """
+    List the whole-model checks of a Pydantic model, i.e. its ``after`` and ``wrap`` model validators.
+
+    These are the checks that need the complete model, as opposed to the ``before`` validators that only reshape its
+    input.
+
+    Args:
+        model (type[BaseModel]): The Pydantic model class to inspect.
+
+    Returns:
+        list[str]: The checks as ``"<model>.<validator>"``, in declaration order.
+    """
+
+    return [
+        f"{model.__name__}.{name}"
+        for name, decorator in model.__pydantic_decorators__.model_validators.items()
+        if decorator.info.mode in ("after", "wrap")
+    ]
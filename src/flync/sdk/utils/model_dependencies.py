@@ -2,30 +2,43 @@
 Model dependency graph utilities for the FLYNC SDK.
 
 Provides functions and classes to build, traverse, and query the dependency graph between Pydantic models that make up a FLYNC workspace.
+
+A wheel ships the graphs of :class:`~flync.model.flync_model.FLYNCModel` and of every node type in it, built when the
+package is built (see :func:`write_graph_artifact`), so an installed FLYNC neither builds nor locks anything to get
+them. Other roots, and every root of an editable install, are cached in a shelve in the FLYNC user cache directory.
 """
 
 import hashlib
 import importlib
+import importlib.metadata
 import json
+import logging
+import pickle
+import re
 import shelve
 import time
 import types
+import zlib
 from functools import lru_cache
 from os import listdir, makedirs, remove, stat, walk
-from os.path import abspath, dirname, join
+from os.path import abspath, dirname, isdir, join, realpath
 from types import NoneType
 from typing import Annotated, Literal, Union, get_args, get_origin
 from weakref import WeakKeyDictionary
 
 import platformdirs
 from filelock import FileLock
+from packaging.version import InvalidVersion, Version
 from pydantic import BaseModel
 
 from flync.core.annotations import External, Implied, OutputStrategy, Reference
+from flync.core.utils.exceptions_handling import clear_type_adapter_cache
 from flync.sdk.context.node_info import NodeInfo
 
 from .field_utils import get_metadata
 
+logger = logging.getLogger(__name__)
+
 
 def _collect_union_options(args):
     """Return container-model dicts for each non-None union member type."""
@@ -104,8 +117,11 @@ def unwrap_annotated(annotation):
 @lru_cache(maxsize=None)
 def model_force_rebuild(model: type[BaseModel]):
     """Force rebuild of a Pydantic model class, regenerating schema and validators.
-    Cached with lru_cache to avoid redundant rebuilds for the same model."""
-    return model.model_rebuild(force=True)
+    Cached with lru_cache to avoid redundant rebuilds for the same model.
+    Cached TypeAdapters may embed the old schema, so they are dropped."""
+    result = model.model_rebuild(force=True)
+    clear_type_adapter_cache()
+    return result
 
 
 @lru_cache(maxsize=None)
@@ -299,6 +315,17 @@ class ModelDependencyGraph:
         self.edges, self.tree = collect_edges(root)
         self.reverse_tree: dict[type[BaseModel], set[type[BaseModel]]] = self._invert()
         self.fields_info: dict[str, NodeInfo] = self._field_info()
+        self._effective_types: dict[tuple[type[BaseModel], str], type] = {}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # effective types may carry validator callables that cannot be pickled; they are cheap to recompute
+        state["_effective_types"] = {}
+        return state
+
+    def __setstate__(self, state):
+        state.setdefault("_effective_types", {})
+        self.__dict__.update(state)
 
     def _invert(self):
         """
@@ -459,6 +486,8 @@ class ModelDependencyGraph:
         Compute the effective validation type for a child field.
 
         Accounts for ``SINGLE_FILE`` and ``OMMIT_ROOT`` output strategies that change how the YAML is structured on disk.
+        The result is memoized per ``(field_type, parent_attribute_name)``: the same type object is returned on every call,
+        so the TypeAdapter built for it by ``validate_with_policy`` is reused instead of being compiled again.
 
         Args:
             field_type (type[BaseModel]): The child model class.
@@ -468,6 +497,14 @@ class ModelDependencyGraph:
             type: The adjusted type to use for validation.
         """
 
+        key = (field_type, parent_attribute_name)
+        real_type = self._effective_types.get(key)
+        if real_type is None:
+            real_type = self._effective_types[key] = self.__build_type_from_parent(field_type, parent_attribute_name)
+        return real_type
+
+    def __build_type_from_parent(self, field_type: type[BaseModel], parent_attribute_name: str):
+        """Compute the effective validation type for :meth:`rebuild_type_from_parent`, without memoization."""
         real_type = field_type
         attribute = self.field_info_from_child(field_type, parent_attribute_name)
         # in case of omit root, we need to include a dictionary
@@ -590,6 +627,9 @@ _graph_cache: dict[str, "ModelDependencyGraph"] = {}
 # lets the graph be collected once its root is no longer referenced.
 _dynamic_graph_cache: "WeakKeyDictionary[type, ModelDependencyGraph]" = WeakKeyDictionary()
 
+#: File next to this module holding the graphs built with the wheel, see :func:`write_graph_artifact`.
+GRAPH_ARTIFACT = "model_dependency_graphs.bin"
+
 
 def hash_directory_fast(directory: str, ext=".py") -> str:
     """
@@ -642,8 +682,48 @@ def delete_unwanted_cache_files(cache_location: str, cache_file_name: str, force
     """
 
     for f in listdir(cache_location):
+        path = join(cache_location, f)
+        if isdir(path):
+            # sub-directories hold other caches (e.g. the parse cache), which manage their own lifetime
+            continue
         if force or cache_file_name not in f:
-            remove(join(cache_location, f))
+            remove(path)
+
+
+def is_editable_install() -> bool:
+    """
+    Tell whether the running FLYNC code may change without its version changing.
+
+    That is the case for an editable install, and for sources that are imported without being the installed
+    distribution (e.g. a checkout on ``PYTHONPATH``).
+    """
+
+    try:
+        dist = importlib.metadata.distribution("flync")
+    except importlib.metadata.PackageNotFoundError:
+        return True
+    direct_url = dist.read_text("direct_url.json")
+    if direct_url and json.loads(direct_url).get("dir_info", {}).get("editable"):
+        return True
+    return realpath(str(dist.locate_file("flync/__init__.py"))) != realpath(join(get_package_root(), "__init__.py"))
+
+
+@lru_cache(maxsize=None)
+def flync_code_version() -> str:
+    """
+    Return a tag of the running FLYNC code, for keying the caches derived from it.
+
+    An installed release is identified by its version. The sources of an editable install are hashed on top of it,
+    so a cache written before an edit is not taken for one of the edited code.
+    """
+
+    try:
+        release = importlib.metadata.version("flync")
+    except importlib.metadata.PackageNotFoundError:
+        release = "unknown"
+    if is_editable_install():
+        return f"{release}-{hash_directory_fast(get_package_root())}"
+    return release
 
 
 def cleanup_old_caches(force: bool = False):
@@ -654,7 +734,7 @@ def cleanup_old_caches(force: bool = False):
         # only keep official version cache
         makedirs(shelv_location, exist_ok=True)
         shelv_file_name = "dependency_graph_cache"
-        shelv_file_name += "_" + hash_directory_fast(get_package_root())
+        shelv_file_name += "_" + re.sub(r"[^\w.-]", "_", flync_code_version())
         if not _cache_cleaned:
             delete_unwanted_cache_files(shelv_location, shelv_file_name, force=force)
             # Clean up stale lock files (older than 1 hour)
@@ -669,6 +749,10 @@ def cleanup_old_caches(force: bool = False):
     return shelv_location, _cache_name
 
 
+# memory addresses in the repr of validator functions differ between processes, the hash must not
+_ADDRESS = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
 def _hash_model_structure(model: type[BaseModel]) -> str:
     """
     Hash a model's structure to detect changes in field definitions.
@@ -685,8 +769,8 @@ def _hash_model_structure(model: type[BaseModel]) -> str:
     structure = {}
     for name, field in model.model_fields.items():
         structure[name] = {
-            "annotation": str(field.annotation),
-            "metadata": str(field.metadata),
+            "annotation": _ADDRESS.sub("", str(field.annotation)),
+            "metadata": _ADDRESS.sub("", str(field.metadata)),
         }
 
     h = hashlib.sha256()
@@ -721,6 +805,67 @@ def _is_pickleable_class(cls: type) -> bool:
     return obj is cls
 
 
+def _graph_key(root: type[BaseModel]) -> str:
+    return f"{str(root)}_{_hash_model_structure(root)}"
+
+
+@lru_cache(maxsize=None)
+def _shipped_graphs() -> dict[str, bytes]:
+    """
+    Return the compressed, pickled graphs shipped with the installed release, by cache key.
+
+    The artifact is only trusted when it was built for the running version; editable installs never use it.
+    """
+
+    if is_editable_install():
+        return {}
+    try:
+        with open(join(dirname(abspath(__file__)), GRAPH_ARTIFACT), "rb") as file:
+            artifact = pickle.load(file)
+    except FileNotFoundError:
+        return {}
+    except Exception:
+        logger.warning("Ignoring unreadable model dependency graph artifact", exc_info=True)
+        return {}
+    # the build hook sees the normalized version, the installed metadata may keep the spelling of the VCS tag
+    try:
+        if Version(artifact.get("version", "")) != Version(flync_code_version()):
+            return {}
+    except InvalidVersion:
+        return {}
+    return artifact["graphs"]
+
+
+def write_graph_artifact(path: str, version: str) -> int:
+    """
+    Build the dependency graphs of :class:`~flync.model.flync_model.FLYNCModel` and of every node type in it and write
+    them to ``path``.
+
+    Called by the build hook of the wheel, which ships the file as :data:`GRAPH_ARTIFACT`.
+
+    Args:
+        path (str): The file to write.
+        version (str): The version of the package being built; the graphs are only used by that version.
+
+    Returns:
+        int: The number of graphs written.
+    """
+
+    from flync.model import FLYNCModel
+
+    # built directly, so a package build neither hashes the sources nor writes to the user cache
+    root_graph = ModelDependencyGraph(FLYNCModel)
+    roots = [FLYNCModel] + [info.python_type for info in root_graph.fields_info.values()]
+    graphs = {}
+    for root in roots:
+        if _is_pickleable_class(root) and _graph_key(root) not in graphs:
+            graph = root_graph if root is FLYNCModel else ModelDependencyGraph(root)
+            graphs[_graph_key(root)] = zlib.compress(pickle.dumps(graph, protocol=pickle.HIGHEST_PROTOCOL))
+    with open(path, "wb") as file:
+        pickle.dump({"version": version, "graphs": graphs}, file, protocol=pickle.HIGHEST_PROTOCOL)
+    return len(graphs)
+
+
 def get_model_dependency_graph(root: type[BaseModel]) -> ModelDependencyGraph:
     """
     Return a cached :class:`ModelDependencyGraph` for the given root model.
@@ -753,11 +898,17 @@ def get_model_dependency_graph(root: type[BaseModel]) -> ModelDependencyGraph:
             _dynamic_graph_cache[root] = cached
         return cached
 
-    key = f"{str(root)}_{_hash_model_structure(root)}"
+    key = _graph_key(root)
     cached = _graph_cache.get(key)
     if cached is not None:
         return cached
 
+    shipped = _shipped_graphs().get(key)
+    if shipped is not None:
+        graph = pickle.loads(zlib.decompress(shipped))
+        _graph_cache[key] = graph
+        return graph
+
     shelv_location, shelv_file_name = cleanup_old_caches()
     lock_path = join(shelv_location, shelv_file_name + ".lock")
     with FileLock(lock_path):
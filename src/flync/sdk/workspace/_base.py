@@ -15,17 +15,18 @@ from pydantic_core import ErrorDetails
 
 from flync.core.base_models.base_model import FLYNCBaseModel
 from flync.model.flync_model import FLYNCModel
-from flync.sdk.context.workspace_config import (
-    ListObjectsMode,
-    WorkspaceConfiguration,
-)
+from flync.sdk.context.workspace_config import WorkspaceConfiguration
 from flync.sdk.utils.model_dependencies import ModelDependencyGraph, get_model_dependency_graph
 from flync.sdk.utils.sdk_types import PathType
 
 from .document import Document
 from .ids import ObjectId
+from .object_map import ObjectMap, ObjectPaths
 from .objects import SemanticObject
+from .parse_cache import ParseCache
+from .reference_index import ReferenceIndex
 from .source import SourceRef
+from .source_index import SourceIndex
 
 logger = logging.getLogger(__name__)
 
@@ -112,9 +113,13 @@ class _WorkspaceBase(object):
         # documents
         self.documents: Dict[str, Document] = {}
         self.documents_diags: Dict[str, list[ErrorDetails]] = {}
-        # semantic graph
-        self.objects: Dict[ObjectId, SemanticObject] = {}
-        self.sources: Dict[ObjectId, SourceRef] = {}
+        # semantic graph; both maps are keyed by the nodes of one trie of object paths, which also records the
+        # parent -> child edges and the name aliases of list items
+        self._object_paths = ObjectPaths()
+        self.objects: ObjectMap[SemanticObject] = ObjectMap(self._object_paths)
+        self.sources: ObjectMap[SourceRef] = ObjectMap(self._object_paths)
+        # per-document interval index over ``sources``, kept in step by ``_set_source`` / ``_drop_source``
+        self._source_index = SourceIndex()
         # root information (if any)
         self.flync_model: Optional[FLYNCModel | FLYNCBaseModel] = None
         self.workspace_root: Optional[Path] = None
@@ -124,20 +129,29 @@ class _WorkspaceBase(object):
                 workspace_path,
             )
         self.workspace_root = Path(workspace_path).absolute()
+        # id(model) -> canonical ids of the objects holding the model; aliases are resolved through ``_object_paths``
         self._model_to_object_ids: dict[int, list[ObjectId]] = {}
-        # Immediate-parent object-id -> ordered immediate child ids, recorded as
-        # child paths are built during load (parent + separator + segment) so
-        # child lookups never destructure the dot-separated id. ``_linked_child_ids``
-        # dedups so a child is registered under its parent at most once.
-        self._children_by_parent: dict[str, list[str]] = {}
-        self._linked_child_ids: set[str] = set()
-        # Mapping of canonical ObjectId → list of duplicate ObjectIds.
-        # Keys represent the chosen canonical identifier, while values hold all alternative IDs
-        # that refer to the same logical object.
-        self._duplicated_objects_ids: dict[ObjectId, list[ObjectId]] = {}
+        # referenced model -> referencing (model, field) pairs, refreshed from the mapped models holding Reference fields
+        self._reference_index = ReferenceIndex()
+        # id(model) -> model, for the mapped models of a type with Reference fields resolved through a private attr
+        self._reference_holders: dict[int, Any] = {}
+        # nesting depth of _tracking_references; the index is refreshed when the outermost block ends
+        self._reference_tracking_depth = 0
         # document id -> LoadNode, built during load so update_document can
         # partially reload a single document instead of the whole workspace.
         self._doc_index: dict[str, LoadNode] = {}
+        # set on the throwaway workspace of a parallel-validation worker: (list folder, entries of that folder to load)
+        self._subtree_shard: Optional[tuple[Path, frozenset[Path]]] = None
+        # checks of the root model that a subtree-only load could not run (see FLYNCWorkspace.safe_load_subtree)
+        self.skipped_checks: list[str] = []
+        # the model loaded by FLYNCWorkspace.safe_load_subtree; flync_model stays None for a subtree-only load
+        self.subtree_model: Optional[FLYNCBaseModel] = None
+        # content-addressed cache of parsed documents, shared by every workspace of this user
+        self._parse_cache: Optional[ParseCache] = (
+            ParseCache(self.configuration.parse_cache_max_mb * 1024 * 1024, self.configuration.parse_cache_dir)
+            if self.configuration.parse_cache
+            else None
+        )
 
     @property
     def load_errors(self):
@@ -309,34 +323,41 @@ class _WorkspaceBase(object):
             list[str]: New list of extended path strings.
         """
 
-        child_paths = [self.new_object_path(current_path, new_object_name) for current_path in current_paths]
         if self.configuration.map_objects:
-            # Each child path is its parent path with one appended segment, so the
-            # parent/child pair is known here without ever splitting the id. Index
-            # alignment holds because both lists are built from ``current_paths``.
-            for parent_path, child_path in zip(current_paths, child_paths):
-                self._link_child_path(parent_path, child_path)
-            if (
-                len(child_paths) > 1
-                and ListObjectsMode.INDEX in self.configuration.list_objects_mode
-                and ListObjectsMode.NAME in self.configuration.list_objects_mode
-            ):
-                self._duplicated_objects_ids.setdefault(child_paths[0], []).extend(child_paths[1:])  # type: ignore[arg-type]
-        return child_paths
-
-    def _link_child_path(self, parent_id: str, child_id: str) -> None:
+            # each child path is its parent path with one appended segment, so the edge is recorded in the trie
+            # here, without ever splitting the id
+            for current_path in current_paths:
+                self._link_child_path(current_path, str(new_object_name))
+        return [self.new_object_path(current_path, new_object_name) for current_path in current_paths]
+
+    def _link_child_path(self, parent_path: str, segment: str) -> int:
+        """
+        Record the object path ``parent_path`` + ``segment`` in the path trie.
+
+        Args:
+            parent_path (str): Dot-separated path of the parent; empty for a root-level id.
+            segment (str): The appended segment.
+
+        Returns:
+            int: The trie node of the child path.
         """
-        Record a parent -> child edge in the child index.
 
-        ``parent_path``/``child_path`` are raw (possibly leading-dot) traversal
-        paths; they are normalized with the same ``strip(".")`` used when objects
-        are registered, so the recorded ids match :attr:`objects` keys. Root-level
-        ids (which normalize to an empty parent) are skipped, preserving the
-        "root has no children" behaviour.
+        paths = self._object_paths
+        return paths.child(paths.intern(parent_path), segment)
+
+    def _alias_object_path(self, parent_path: str, segment: str, alias: str) -> None:
         """
+        Make the object path ``parent_path`` + ``segment`` reachable as ``parent_path`` + ``alias`` too.
+
+        The alias shares the trie node, and therefore the objects and sources, of the aliased path and of every path
+        below it.
 
-        if not parent_id or child_id in self._linked_child_ids:
-            return
+        Args:
+            parent_path (str): Dot-separated path of the parent.
+            segment (str): The segment of the aliased path, e.g. a list index.
+            alias (str): The alternative segment, e.g. the name of the list item.
+        """
 
-        self._linked_child_ids.add(child_id)
-        self._children_by_parent.setdefault(parent_id, []).append(child_id)
+        paths = self._object_paths
+        parent = paths.intern(parent_path)
+        paths.alias(parent, alias, paths.child(parent, segment))
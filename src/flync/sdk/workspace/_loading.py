@@ -3,16 +3,22 @@ Disk-to-model loading for the FLYNC workspace.
 
 Walks a workspace directory, routes externally annotated fields to their files or folders, and
 validates each load node. Depends on :mod:`._object_mapping` to register what it loads.
+
+With ``parallel_validation`` the folder subtrees of the root model are loaded by process-pool workers, each returning a
+:class:`SubtreeFragment` that is merged back before the root-level validators run.
 """
 
 import logging
 import multiprocessing
 import os
 import sys
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
 from itertools import islice
+from math import ceil
 from pathlib import Path
-from typing import Annotated, Optional, Union, get_args, get_origin
+from typing import Annotated, Iterator, Optional, Union, get_args, get_origin
 
 from pydantic_core import ValidationError
 
@@ -25,16 +31,111 @@ from flync.core.annotations import (
 )
 from flync.core.base_models.base_model import FLYNCBaseModel
 from flync.core.utils.exceptions_handling import is_semantic_validation_error, validate_with_policy
+from flync.core.utils.validation_profile import ValidationProfile, active_profile, profile_scope
 from flync.sdk.utils.field_utils import get_metadata
 from flync.sdk.utils.model_dependencies import model_force_rebuild
 from flync.sdk.utils.sdk_types import PathType
 
 from ._base import LoadNode, ParentLink
 from ._object_mapping import _WorkspaceObjectMapping
-from .document import Document, parse_documents, read_file
+from .document import Document, PositionIndex, parse_documents, read_file, source_stamp
+from .ids import ObjectId
+from .object_map import ObjectMap, ObjectPaths
+from .parse_cache import ParseCache
 
 logger = logging.getLogger(__name__)
 
+#: Smallest number of files handed to one process-pool worker. Fewer cache misses than this are parsed in process,
+#: where starting the pool would cost more than the parsing itself.
+_MIN_BATCH_SIZE = 32
+
+
+def _process_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Create the process pool used for parsing and for parallel validation.
+
+    A forking ProcessPoolExecutor is unsafe here: load_workspace is driven from
+    asyncio.to_thread(...), so the default POSIX "fork" start method forks from a
+    multi-threaded process and can deadlock the child. Use a non-fork context
+    (forkserver on POSIX, spawn elsewhere); everything submitted is module-level
+    and picklable, so this is behaviour-neutral.
+    """
+
+    mp_context = multiprocessing.get_context("forkserver" if sys.platform != "win32" else "spawn")
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context)
+
+
+@dataclass
+class SubtreeFragment(object):
+    """
+    Everything a parallel-validation worker loaded for one subtree of the root model.
+
+    The fragment is pickled back to the loading process as a whole, so the models held by ``load_info``, ``objects``,
+    ``doc_index`` and ``references`` keep their shared identities; state keyed by ``id(model)`` is therefore carried as
+    ``(model, ...)`` pairs and re-keyed when the fragment is merged.
+
+    Attributes:
+        load_info (dict): The root field value(s) the subtree produced, as ``module_load_info`` would hold them.
+        diagnostics (dict): ``documents_diags`` of every document of the subtree.
+        doc_index (dict): ``LoadNode`` of every document of the subtree.
+        documents (dict): Documents the worker had to open itself, i.e. not handed to it.
+        objects (ObjectMap): Object-map entries of the subtree.
+        sources (ObjectMap): Sources of those objects.
+        model_object_ids (list): ``(model, object ids)`` pairs of ``_model_to_object_ids``.
+        object_paths (ObjectPaths): The object paths recorded while loading, with the aliases of list items.
+        references (list): ``(referrer, field name, target)`` reference bindings of the subtree.
+        profile (ValidationProfile | None): What the worker measured, when the loading process is profiled.
+    """
+
+    load_info: dict
+    diagnostics: dict
+    doc_index: dict
+    documents: dict
+    objects: ObjectMap
+    sources: ObjectMap
+    model_object_ids: list
+    object_paths: ObjectPaths
+    references: list
+    profile: Optional[ValidationProfile] = None
+
+
+def _validate_subtree(
+    workspace_cls: type,
+    configuration,
+    workspace_root: Path,
+    documents: dict[str, Document],
+    field_name: str,
+    shard: Optional[tuple[Path, frozenset[Path]]],
+    trace_memory: Optional[bool] = None,
+) -> SubtreeFragment:
+    """
+    Load and validate one root field of a workspace in a worker process.
+
+    Args:
+        workspace_cls (type): The workspace class of the loading process.
+        configuration (WorkspaceConfiguration): Its configuration.
+        workspace_root (Path): Its root directory.
+        documents (dict[str, Document]): The already parsed documents of the subtree.
+        field_name (str): The root field to load.
+        shard (tuple[Path, frozenset[Path]] | None): For a folder list, the list folder and the entries of it to load;
+            ``None`` loads the whole field.
+        trace_memory (bool | None): Profile the load, tracing memory or not, when the loading process is profiled;
+            ``None`` does not profile it.
+
+    Returns:
+        SubtreeFragment: The loaded subtree.
+    """
+
+    workspace = workspace_cls("subtree", workspace_root, configuration)
+    workspace.documents.update(documents)
+    workspace._subtree_shard = shard
+    if trace_memory is None:
+        return workspace._load_subtree(field_name)
+    with ValidationProfile(trace_memory).activate() as profile:
+        fragment = workspace._load_subtree(field_name)
+    fragment.profile = profile
+    return fragment
+
 
 class _WorkspaceLoading(_WorkspaceObjectMapping):
     """Reads FLYNC documents from disk and validates them into model instances."""
@@ -42,18 +143,47 @@ class _WorkspaceLoading(_WorkspaceObjectMapping):
     def _open_documents(self):
         """
         Open all documents in the workspace matching the configured file extension.
-        File I/O and YAML parsing happen inside the ProcessPool workers; the raw text
-        is NOT returned through IPC to reduce pickle overhead — it is re-read from the
-        OS page cache in the main process for Document construction.
+        File I/O and YAML parsing happen inside the ProcessPool workers, which return
+        the AST and a compact :class:`PositionIndex` instead of the composed node tree.
+        The raw text is NOT returned through IPC either; each Document reads it lazily
+        from disk, so the main process only touches a file again when the text is needed.
+
+        With the parse cache enabled, files are read and hashed in the main process instead, and only
+        the cache misses are parsed (see :meth:`__open_cached_documents`).
+
+        Documents already in :attr:`documents` (handed over parsed, e.g. by a debug session) are kept as they are.
 
         Returns:
             None
         """
         if self.workspace_root is None:
             return
-        files = [p for p in self.workspace_root.rglob(f"*{self.configuration.flync_file_extension}") if p.is_file()]
+        files = [
+            p
+            for p in self.workspace_root.rglob(f"*{self.configuration.flync_file_extension}")
+            if p.is_file() and Document.normalize_uri(p, self.workspace_root) not in self.documents
+        ]
         if len(files) == 0:
             return
+        if self._parse_cache is not None:
+            self.__open_cached_documents(files, self._parse_cache)
+            return
+
+        # taken before parsing, so a file edited while it is parsed is never read back lazily as if it matched
+        stamps = {Document.normalize_uri(path, self.workspace_root): source_stamp(path) for path in files}
+        for uri, ast, positions in self.__parse_in_pool(files):
+            self.__add_parsed_document(uri, None, ast, positions, stamps[uri])
+
+    def __parse_in_pool(self, files: list[Path]):
+        """
+        Parse ``files`` in batches on a process pool.
+
+        Args:
+            files (list[Path]): Absolute paths of the documents to parse.
+
+        Yields:
+            tuple[str, Any, PositionIndex | None]: ``(uri, ast, positions)`` for every file, in completion order.
+        """
 
         def batched(iterable, size):
             """Yield successive batches of given size from an iterable."""
@@ -62,32 +192,75 @@ class _WorkspaceLoading(_WorkspaceObjectMapping):
                 yield batch
 
         workers = os.cpu_count() or 1
-        batch_size = max(32, len(files) // (workers * 4))
+        batch_size = max(_MIN_BATCH_SIZE, len(files) // (workers * 4))
         batches = list(batched(files, batch_size))
 
-        # A forking ProcessPoolExecutor is unsafe here: load_workspace is driven from
-        # asyncio.to_thread(...), so the default POSIX "fork" start method forks from a
-        # multi-threaded process and can deadlock the child. Use a non-fork context
-        # (forkserver on POSIX, spawn elsewhere); everything submitted (module-level
-        # parse_document, path/str/bool args) is picklable, so this is behaviour-neutral.
-        mp_context = multiprocessing.get_context("forkserver" if sys.platform != "win32" else "spawn")
-        with ProcessPoolExecutor(mp_context=mp_context) as pool:
+        with _process_pool() as pool:
             futures = [
                 pool.submit(
                     parse_documents,
                     batch,
                     self.workspace_root,
                     self.configuration.map_objects,
+                    True,
                 )
                 for batch in batches
             ]
 
             for future in as_completed(futures):
-                for uri, ast, compose_ast in future.result():
-                    text = read_file(self.workspace_root / uri)
-                    doc = Document(uri, text, self.configuration.map_objects)
-                    doc.assign_ast(ast, compose_ast)
-                    self.documents[doc.uri] = doc
+                yield from future.result()
+
+    def __open_cached_documents(self, files: list[Path], cache: ParseCache):
+        """
+        Open ``files`` through the parse cache.
+
+        Every file is read and hashed here; hits are taken straight from the cache and the text read for hashing becomes
+        the document text, so no file is read twice. Misses are parsed in process when they fit a single batch (the usual
+        case for a warm workspace with a few edited files) and on the process pool otherwise, then stored in the cache.
+
+        Args:
+            files (list[Path]): Absolute paths of the documents to open.
+            cache (ParseCache): The cache to read from and fill.
+        """
+
+        needs_compose = self.configuration.map_objects
+        pending: dict[str, tuple[str, str]] = {}
+        misses: list[Path] = []
+        for path in files:
+            text = read_file(path)
+            uri = Document.normalize_uri(path, self.workspace_root)
+            key = cache.content_key(text, needs_compose)
+            cached = cache.get(key)
+            if cached is None:
+                pending[uri] = (text, key)
+                misses.append(path)
+                continue
+            ast, positions = cached
+            self.__add_parsed_document(uri, text, ast, positions)
+        if not misses:
+            return
+
+        if len(misses) <= _MIN_BATCH_SIZE:
+            parsed = ((uri, *self.__parse_compact(text, needs_compose)) for uri, (text, _) in pending.items())
+        else:
+            parsed = self.__parse_in_pool(misses)
+        for uri, ast, positions in parsed:
+            text, key = pending[uri]
+            cache.put(key, ast, positions)
+            self.__add_parsed_document(uri, text, ast, positions)
+        cache.evict()
+
+    @staticmethod
+    def __parse_compact(text: str, needs_compose: bool):
+        """Parse ``text`` in process, returning the AST and the position index of its composed tree."""
+        ast, compose_ast = Document._parse_text(text, needs_compose)
+        return ast, PositionIndex.from_node(compose_ast)
+
+    def __add_parsed_document(self, uri: str, text: Optional[str], ast, positions: Optional[PositionIndex], stamp: Optional[tuple[int, int]] = None):
+        """Register an already parsed document in the workspace; without ``text`` it is read lazily, if still ``stamp``."""
+        doc = Document(uri, text, self.configuration.map_objects, source_path=self.workspace_root / uri, source_stamp=stamp)
+        doc.assign_ast(ast, positions)
+        self.documents[doc.uri] = doc
 
     def _open_document(self, uri: PathType):
         """
@@ -100,12 +273,27 @@ class _WorkspaceLoading(_WorkspaceObjectMapping):
 
         Returns: None
         """
-        text = read_file(uri)
-        uri = Document.normalize_uri(uri, self.workspace_root)
-        doc = Document(uri, text, self.configuration.map_objects)
-        doc.parse()
+        with profile_scope("phase", "parse documents"):
+            text = read_file(uri)
+            uri = Document.normalize_uri(uri, self.workspace_root)
+            doc = Document(uri, text, self.configuration.map_objects)
+            if self._parse_cache is None:
+                doc.parse()
+            else:
+                self.__parse_cached(doc, self._parse_cache)
         self.documents[uri] = doc
 
+    @staticmethod
+    def __parse_cached(doc: Document, cache: ParseCache):
+        """Parse ``doc`` through the parse cache, storing the result on a miss."""
+        key = cache.content_key(doc.text, doc.needs_compose)
+        cached = cache.get(key)
+        if cached is not None:
+            doc.assign_ast(*cached)
+            return
+        doc.parse()
+        cache.put(key, doc.ast, PositionIndex.from_node(doc.compose_ast))
+
     def __load_list_item(
         self,
         sub_item_path: Path,
@@ -216,6 +404,9 @@ class _WorkspaceLoading(_WorkspaceObjectMapping):
             # Sort so list indices (and therefore object ids and list order) are
             # deterministic across loads and filesystems; iterdir() order is not.
             for idx, sub_item_path in enumerate(sorted(item_dir.iterdir())):
+                if self._subtree_shard is not None and item_dir == self._subtree_shard[0] and sub_item_path not in self._subtree_shard[1]:
+                    # loaded by another parallel-validation worker
+                    continue
                 if not self.is_path_supported(sub_item_path):
                     logger.warning(
                         "Unrecognized file found in FLYNC workspace: %s",
@@ -592,33 +783,317 @@ class _WorkspaceLoading(_WorkspaceObjectMapping):
             link=link,
         )
         module_load_info: dict = {}
-        # start by loading each field
+        with self.__subtree_loads(path, current_type, link) as subtree_loads:
+            # start by loading each field
+            for field_name, field_info in current_type.model_fields.items():
+                external: External | None = get_metadata(field_info.metadata, External)
+                if field_name in subtree_loads:
+                    self.__merge_subtree_loads(path, module_load_info, field_name, subtree_loads[field_name])
+                    continue
+                self.__handle_external_field_load(
+                    path,
+                    current_object_paths,
+                    module_load_info,
+                    field_name,
+                    field_info,
+                    external,
+                )
+                if implied := get_metadata(field_info.metadata, Implied):
+                    self._handle_implied_field_load(path, module_load_info, field_name, implied)
+                    # Implied fields carry no YAML node and no model value of their
+                    # own, so the AST walk never registers them. Register a marker
+                    # object (model=None) under the linked path; without it
+                    # get_child_ids would drop the field, since it filters children
+                    # by has_object().
+                    paths = self.update_objects_path(current_object_paths, field_name)
+                    self._add_object_to_path("", None, paths, 0, 0, 0, 0)
+
+        # then group all the fields into the same object and return it
+        self._append_to_info_dict(path, module_load_info)
+
+        if doc_id in self.documents_diags:
+            logger.error("File %s was already loaded.", doc_id)
+        return self._validate_node(self._doc_index[doc_id], module_load_info, map_paths=current_object_paths)
+
+    @contextmanager
+    def __subtree_loads(self, path: Path, current_type: type, link: Optional[ParentLink]) -> Iterator[dict[str, list[tuple]]]:
+        """
+        Submit the folder subtrees of the root node to a process pool when ``parallel_validation`` is enabled.
+
+        Args:
+            path (Path): Absolute path of the node being loaded.
+            current_type (type): Its model type.
+            link (ParentLink | None): Its parent link; only the root node (no link) is split.
+
+        Yields:
+            dict[str, list[tuple]]: Per root field, the ``(shard, future)`` pairs loading it, in load order. Empty when the
+            node is loaded sequentially.
+        """
+
+        plan: dict[str, list[tuple]] = {}
+        if self.configuration.parallel_validation and link is None and self._subtree_shard is None and current_type is self.configuration.root_model:
+            plan = self.__plan_subtree_shards(path, current_type)
+        if sum(len(shards) for shards in plan.values()) < 2:
+            yield {}
+            return
+
+        profile = active_profile()
+        trace_memory = profile.trace_memory if profile is not None else None
+        with _process_pool(self.configuration.validation_workers) as pool:
+            yield {
+                field_name: [
+                    (
+                        shard,
+                        pool.submit(
+                            _validate_subtree,
+                            type(self),
+                            self.configuration,
+                            self.workspace_root,
+                            self.__subtree_documents(doc_ids),
+                            field_name,
+                            shard,
+                            trace_memory,
+                        ),
+                    )
+                    for shard, doc_ids in shards
+                ]
+                for field_name, shards in plan.items()
+            }
+
+    def __plan_subtree_shards(self, path: Path, current_type: type) -> dict[str, list[tuple]]:
+        """
+        Split the folder fields of the root model into independently loadable shards.
+
+        A folder list (``ecus/``, ``apps/``) is split by its entries into up to one shard per worker; any other folder
+        field (``communication/``, ``topology/``) is a single shard. Fields without a folder on disk are left to the
+        sequential load.
+
+        Args:
+            path (Path): Absolute path of the root node.
+            current_type (type): The root model type.
+
+        Returns:
+            dict[str, list[tuple]]: Per field, ``(shard, document ids)`` pairs, where ``shard`` is the list folder and the
+            entries of it to load, or ``None`` for the whole field.
+        """
+
+        workers = self.configuration.validation_workers or os.cpu_count() or 1
+        plan: dict[str, list[tuple]] = {}
         for field_name, field_info in current_type.model_fields.items():
             external: External | None = get_metadata(field_info.metadata, External)
+            if external is None or OutputStrategy.FOLDER not in external.output_structure:
+                continue
+            folder = self.__get_external_path(path, external, field_name)
+            if not folder.exists() and field_info.alias is not None:
+                folder = self.__get_external_path(path, external, field_info.alias)
+            if not folder.is_dir():
+                continue
+            if not self.__is_list_annotation(field_info.annotation):
+                plan[field_name] = [(None, [self.document_id_from_path(folder)])]
+                continue
+            entries = sorted(folder.iterdir())
+            supported = [entry for entry in entries if self.is_path_supported(entry)]
+            if not supported:
+                continue
+            for entry in entries:
+                if not self.is_path_supported(entry):
+                    logger.warning("Unrecognized file found in FLYNC workspace: %s", str(entry))
+            size = ceil(len(supported) / workers)
+            plan[field_name] = [
+                ((folder, frozenset(chunk)), [self.document_id_from_path(entry) for entry in chunk])
+                for chunk in (supported[start : start + size] for start in range(0, len(supported), size))
+            ]
+        return plan
+
+    @staticmethod
+    def __is_list_annotation(annotation) -> bool:
+        """Return whether ``annotation`` is a ``list``, optional or not."""
+        if get_origin(annotation) is Union:
+            members = [member for member in get_args(annotation) if member is not type(None)]
+            if len(members) != 1:
+                return False
+            annotation = members[0]
+        return get_origin(annotation) is list
+
+    def __subtree_documents(self, doc_ids: list[str]) -> dict[str, Document]:
+        """Return the parsed documents at or below the given document ids."""
+        prefixes = tuple(f"{doc_id}/" for doc_id in doc_ids)
+        wanted = set(doc_ids)
+        return {uri: document for uri, document in self.documents.items() if uri in wanted or uri.startswith(prefixes)}
+
+    def __merge_subtree_loads(self, path: Path, module_load_info: dict, field_name: str, shards: list[tuple[Optional[tuple], Future]]):
+        """
+        Merge the fragments of a root field loaded in parallel, in the order a sequential load produces them.
+
+        The items of a split folder list are concatenated and their parent links renumbered, then the field itself is
+        registered in the object map with the complete list, as :meth:`__handle_generic_types` does for a sequential load.
+
+        Args:
+            path (Path): Absolute path of the root node.
+            module_load_info (dict): Accumulator for the root's field values; updated in place.
+            field_name (str): The root field.
+            shards (list[tuple]): The ``(shard, future)`` pairs loading the field.
+        """
+
+        items: list = []
+        folder: Optional[Path] = None
+        profile = active_profile()
+        for shard, future in shards:
+            fragment: SubtreeFragment = future.result()
+            if profile is not None and fragment.profile is not None:
+                profile.merge(fragment.profile)
+            if shard is None:
+                self._absorb_fragment(fragment)
+                module_load_info.update(fragment.load_info)
+                continue
+            folder = shard[0]
+            for node in fragment.doc_index.values():
+                link = node.link
+                if link is not None and link.parent_path == path and link.field_name == field_name and link.container == "list":
+                    link.key += len(items)
+            self._absorb_fragment(fragment)
+            items.extend(fragment.load_info.get(field_name, []))
+        if folder is None:
+            return
+        module_load_info[field_name] = items
+        self._add_object_to_path(
+            doc_id=self.document_id_from_path(folder),
+            model=items,
+            current_object_paths=self.update_objects_path([""], field_name),
+            start_line=0,
+            end_line=0,
+            end_column=0,
+            start_column=0,
+        )
+
+    def _absorb_fragment(self, fragment: SubtreeFragment) -> None:
+        """Add the documents, diagnostics, load nodes, objects and references of ``fragment`` to the workspace."""
+        self.documents_diags.update(fragment.diagnostics)
+        self._doc_index.update(fragment.doc_index)
+        for uri, document in fragment.documents.items():
+            self.documents.setdefault(uri, document)
+        self._object_paths.merge(fragment.object_paths)
+        for object_id, semantic_object in fragment.objects.items():
+            self.objects.setdefault(object_id, semantic_object)
+        for object_id, source in fragment.sources.items():
+            if object_id not in self.sources:
+                self._set_source(object_id, source)
+        for model, object_ids in fragment.model_object_ids:
+            self._model_to_object_ids.setdefault(id(model), []).extend(object_ids)
+            self._add_reference_holder(model)
+        for referrer, field_name, target in fragment.references:
+            self._reference_index.bind(referrer, field_name, target)
+
+    def _load_subtree(self, field_name: str) -> SubtreeFragment:
+        """
+        Load one root field on its own and package everything it produced.
+
+        Runs on the throwaway workspace of a parallel-validation worker (see :func:`_validate_subtree`), walking the field
+        exactly as :meth:`_load_from_path` does for the root node.
+
+        Args:
+            field_name (str): The root field to load.
+
+        Returns:
+            SubtreeFragment: The loaded subtree.
+        """
+
+        root_type = self.configuration.root_model
+        model_force_rebuild(root_type)
+        field_info = root_type.model_fields[field_name]
+        received = set(self.documents)
+        load_info: dict = {}
+        with self._tracking_references():
             self.__handle_external_field_load(
-                path,
-                current_object_paths,
-                module_load_info,
+                self.workspace_root,
+                [""],
+                load_info,
                 field_name,
                 field_info,
-                external,
+                get_metadata(field_info.metadata, External),
             )
-            if implied := get_metadata(field_info.metadata, Implied):
-                self._handle_implied_field_load(path, module_load_info, field_name, implied)
-                # Implied fields carry no YAML node and no model value of their
-                # own, so the AST walk never registers them. Register a marker
-                # object (model=None) under the linked path; without it
-                # get_child_ids would drop the field, since it filters children
-                # by has_object().
-                paths = self.update_objects_path(current_object_paths, field_name)
-                self._add_object_to_path("", None, paths, 0, 0, 0, 0)
+        if self._subtree_shard is not None:
+            # the field object only holds this shard's items; the loading process registers the merged list
+            field_id = ObjectId(self.new_object_path("", field_name))
+            partial = self.objects.pop(field_id, None)
+            self._drop_source(field_id)
+            if partial is not None and partial.model is not None:
+                self._model_to_object_ids.pop(id(partial.model), None)
 
-        # then group all the fields into the same object and return it
-        self._append_to_info_dict(path, module_load_info)
+        return self._export_fragment(load_info, {uri: document for uri, document in self.documents.items() if uri not in received})
 
-        if doc_id in self.documents_diags:
-            logger.error("File %s was already loaded.", doc_id)
-        return self._validate_node(self._doc_index[doc_id], module_load_info, map_paths=current_object_paths)
+    def _export_fragment(self, load_info: dict, documents: dict[str, Document]) -> SubtreeFragment:
+        """
+        Package the state of this workspace so another workspace can take it over with :meth:`_absorb_fragment`.
+
+        Maps keyed by ``id(model)`` are turned into ``(model, ...)`` pairs, since the ids do not survive pickling.
+
+        Args:
+            load_info (dict): The loaded field values to hand over.
+            documents (dict[str, Document]): The documents to hand over.
+
+        Returns:
+            SubtreeFragment: The packaged state.
+        """
+
+        models = {id(semantic_object.model): semantic_object.model for semantic_object in self.objects.values() if semantic_object.model is not None}
+        return SubtreeFragment(
+            load_info=load_info,
+            diagnostics=self.documents_diags,
+            doc_index=self._doc_index,
+            documents=documents,
+            objects=self.objects,
+            sources=self.sources,
+            model_object_ids=[(models[key], object_ids) for key, object_ids in self._model_to_object_ids.items() if key in models],
+            object_paths=self._object_paths,
+            references=list(self._reference_index.bindings()),
+        )
+
+    def _resolve_subtree(self, object_path: str) -> tuple[str, Optional[tuple[Path, frozenset[Path]]]]:
+        """
+        Find the root field and the on-disk entry holding ``object_path``, following the ``External`` annotations.
+
+        The first segment names a root field (or its alias). For a folder list (``ecus``, ``apps``) the second segment
+        picks one entry of that folder, by name or by list index, so only that entry needs to be loaded; any deeper
+        segment lies within the entry.
+
+        Args:
+            object_path (str): Dot-separated object path, e.g. ``ecus.zonal_platform2.controllers.0``.
+
+        Returns:
+            tuple[str, tuple[Path, frozenset[Path]] | None]: The root field to load and, for a folder list, the shard
+            restricting it to one entry (see :func:`_validate_subtree`); ``None`` loads the whole field.
+
+        Raises:
+            ValueError: If the path does not lead to a root field stored in its own file or folder, or names no entry.
+        """
+
+        segments = object_path.strip(".").split(".")
+        root_type = self.configuration.root_model
+        field_name = next((name for name, info in root_type.model_fields.items() if segments[0] in (name, info.alias)), None)
+        if field_name is None:
+            raise ValueError(f"{root_type.__name__} has no field {segments[0]!r}")
+        field_info = root_type.model_fields[field_name]
+        external: External | None = get_metadata(field_info.metadata, External)
+        if external is None:
+            raise ValueError(f"{root_type.__name__}.{field_name} is not stored in a file of its own")
+        folder = self.__get_external_path(self.workspace_root, external, field_name)  # type: ignore[arg-type]
+        if not folder.exists() and field_info.alias is not None:
+            folder = self.__get_external_path(self.workspace_root, external, field_info.alias)  # type: ignore[arg-type]
+        if not folder.exists():
+            raise ValueError(f"{object_path!r} resolves to {folder}, which does not exist")
+        if len(segments) == 1 or OutputStrategy.FOLDER not in external.output_structure or not self.__is_list_annotation(field_info.annotation):
+            return field_name, None
+        # list indices count every folder entry, as the folder walk of __handle_generic_types_list does
+        entries = sorted(folder.iterdir())
+        key = segments[1]
+        if key.isdigit():
+            entry = entries[int(key)] if int(key) < len(entries) else None
+        else:
+            entry = next((item for item in entries if self.is_path_supported(item) and self.name_form_file(item) == key), None)
+        if entry is None or not self.is_path_supported(entry):
+            raise ValueError(f"{folder} has no entry {key!r}")
+        return field_name, (folder, frozenset([entry]))
 
     def _handle_implied_field_load(
         self,
@@ -768,15 +1243,17 @@ class _WorkspaceLoading(_WorkspaceObjectMapping):
         original_type = node.current_type
         current_type = node.current_type
         try:
-            if node.current_type_name:
-                current_type = self.model_graph.rebuild_type_from_parent(current_type, node.current_type_name)
-            relative_path = node.path.relative_to(self.workspace_root.absolute())  # type: ignore[union-attr]
-            model, errors = validate_with_policy(current_type, module_load_info, relative_path.as_posix())
-            self.documents_diags[node.doc_id].extend(errors)
-            if map_paths is not None and self.configuration.map_objects:
-                self._update_objects(node.doc_id, model, map_paths, parent_name=node.current_type_name)
-            if node.current_type_name:
-                model = self.model_graph.normalize_child_to_parent(original_type, node.current_type_name, model)
+            with profile_scope("document", node.doc_id):
+                if node.current_type_name:
+                    current_type = self.model_graph.rebuild_type_from_parent(current_type, node.current_type_name)
+                relative_path = node.path.relative_to(self.workspace_root.absolute())  # type: ignore[union-attr]
+                model, errors = validate_with_policy(current_type, module_load_info, relative_path.as_posix())
+                self.documents_diags[node.doc_id].extend(errors)
+                if map_paths is not None and self.configuration.map_objects:
+                    with profile_scope("phase", "object mapping"):
+                        self._update_objects(node.doc_id, model, map_paths, parent_name=node.current_type_name)
+                if node.current_type_name:
+                    model = self.model_graph.normalize_child_to_parent(original_type, node.current_type_name, model)
             node.model = model
             return model
         except ValidationError as e:
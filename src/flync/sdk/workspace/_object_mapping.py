@@ -6,16 +6,18 @@ used by the SDK and the language server. Depends only on :mod:`._base`.
 """
 
 import logging
+from collections import deque
+from contextlib import contextmanager
 from itertools import chain
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, cast
+from typing import TYPE_CHECKING, Iterator, Optional, cast
 
 from pydantic import RootModel, ValidationError
 from pydantic.fields import FieldInfo
 from ruamel.yaml.nodes import MappingNode, Node, SequenceNode
 from typing_extensions import deprecated
 
-from flync.core.annotations.reference import Reference, resolve_reference
+from flync.core.annotations.reference import Reference, reference_sources, resolve_reference
 from flync.core.base_models.base_model import FLYNCBaseModel
 from flync.core.utils.exceptions_handling import get_name_by_alias, get_unique_errors, has_validators, validate_with_policy
 from flync.sdk.context.workspace_config import ListObjectsMode
@@ -24,8 +26,8 @@ from flync.sdk.utils.model_dumper import dump_model_with_discriminators
 
 from ._base import _WorkspaceBase
 from .ids import ObjectId
-from .objects import ObjectMetadata, SemanticObject
-from .source import SourceRef, get_range
+from .objects import ObjectMetadata, SemanticObject, parent_object_id
+from .source import Position, SourceRef, get_range
 
 if TYPE_CHECKING:
     from .flync_workspace import FLYNCWorkspace
@@ -143,7 +145,8 @@ class _WorkspaceObjectMapping(_WorkspaceBase):
           ``name`` attribute.
 
         Both flags are active by default, so a list item is accessible under two IDs simultaneously (e.g. ``controllers.0`` and
-        ``controllers.my_ctrl``).
+        ``controllers.my_ctrl``). The index path is then the canonical one and the name an alias of it in the path trie,
+        so the item, and everything below it, is registered once and found under both.
 
         Args:
             item_name (str | None): Name of the list item, or ``None`` empty string when the item has no name.
@@ -151,25 +154,18 @@ class _WorkspaceObjectMapping(_WorkspaceBase):
             idx (int): Zero-based position of the item in the list.
 
         Returns:
-            list[str]: New list of object paths for this item.
+            list[str]: New list of canonical object paths for this item.
         """
-        idx_paths = []
-        name_paths = []
         index_mode = ListObjectsMode.INDEX in self.configuration.list_objects_mode
         name_mode = ListObjectsMode.NAME in self.configuration.list_objects_mode
-        if index_mode or not item_name:
-            idx_paths += self.update_objects_path(current_object_paths, idx)
-        if name_mode and item_name:
-            name_paths += self.update_objects_path(current_object_paths, item_name)
+        if name_mode and item_name and not index_mode:
+            return self.update_objects_path(current_object_paths, item_name)
 
-        if name_mode and index_mode:
-            if len(idx_paths) > 1:
-                self._duplicated_objects_ids.setdefault(idx_paths[0], []).extend(idx_paths[1:] + name_paths)
-
-            elif len(idx_paths) == 1 and name_paths:
-                self._duplicated_objects_ids.setdefault(idx_paths[0], []).extend(name_paths)
-
-        return idx_paths + name_paths
+        idx_paths = self.update_objects_path(current_object_paths, idx)
+        if name_mode and item_name and self.configuration.map_objects:
+            for current_path in current_object_paths:
+                self._alias_object_path(current_path, str(idx), item_name)
+        return idx_paths
 
     def _add_object_to_path(
         self,
@@ -184,7 +180,8 @@ class _WorkspaceObjectMapping(_WorkspaceBase):
         """
         Register a model value and its source location for each given document id.
 
-        Creates entries in :attr:`objects` and :attr:`sources` for every path in ``current_object_paths``. Skips paths that are already registered.
+        Creates entries in :attr:`objects` and :attr:`sources` for every path in ``current_object_paths``. Stops at the first path
+        that is already registered, e.g. under an alias.
 
         Args:
             doc_id (str): document id of the document containing the object.
@@ -200,48 +197,64 @@ class _WorkspaceObjectMapping(_WorkspaceBase):
 
         model_key = None if model is None else id(model)
         src_ref = SourceRef(doc_id, get_range(start_line, start_column, end_line, end_column))
-        if self._duplicated_objects_ids and current_object_paths:
-            common = [p for p in current_object_paths if p in self._duplicated_objects_ids]
-            if common:
-                current_object_paths = common
-
+        if model_key is not None:
+            self._add_reference_holder(model)
         for object_path in current_object_paths:
             object_id = ObjectId(object_path)
             if object_id in self.objects:
                 return
             self.objects[object_id] = SemanticObject(object_id, model)
-            self.sources[object_id] = src_ref
+            self._set_source(object_id, src_ref)
             if model_key is not None:
                 self._model_to_object_ids.setdefault(model_key, []).append(object_id)
-                if oids := self._duplicated_objects_ids.get(object_id):
-                    self._model_to_object_ids[model_key].extend(oids)
 
-    def _resolve_duplicate_object_id(self, oid: ObjectId):
-        """
-        Resolve a duplicate object ID into a fully registered object.
+    def _add_reference_holder(self, model) -> None:
+        """Index the references currently bound on a newly mapped model and keep it for later refreshes."""
+        if reference_sources(type(model)):
+            self._reference_holders[id(model)] = model
+            # references bound before the object was mapped (e.g. while its own document was validated)
+            self._reference_index.bind_current(model)
 
-        This method checks whether the given `oid` exists in the duplicates mapping
-        (`self._duplicated_objects_ids`). If found, it promotes the duplicate ID into
-        `self.objects` and `self.sources` by copying the canonical object's model and source.
+    @contextmanager
+    def _tracking_references(self) -> Iterator[None]:
+        """
+        Bring the reverse reference index up to date with the ``Reference`` bindings made within the ``with`` block.
 
-        Args
-        ----------
-        oid : ObjectId
-            The object identifier to resolve from duplicates.
+        Validators bind the private attrs of models other than the one they validate, e.g. a parent's validator those
+        of its children mapped earlier. When the outermost block ends, the current bindings of every mapped model with
+        ``Reference`` fields are indexed again, and the entries of models that left the object map are dropped. Nested
+        blocks only refresh once.
         """
-        if oid in self.objects or not self._duplicated_objects_ids:
-            return
-        parent = oid.split(".")[0]
-        for name_id, idx_ids in self._duplicated_objects_ids.items():
-            if parent != name_id.split(".")[0] or oid not in idx_ids:
-                continue
 
-            model = self.objects[name_id].model
-            source = self.sources[name_id]
-            self.objects.update({dup: SemanticObject(oid, model) for dup in idx_ids})
-            self.sources.update(dict.fromkeys(idx_ids, source))
-            del self._duplicated_objects_ids[name_id]
+        if not self.configuration.map_objects:
+            yield
             return
+        self._reference_tracking_depth += 1
+        try:
+            yield
+        finally:
+            self._reference_tracking_depth -= 1
+            if self._reference_tracking_depth == 0:
+                self.__refresh_reference_index()
+
+    def __refresh_reference_index(self) -> None:
+        mapped = self._model_to_object_ids
+        for key in [key for key in self._reference_holders if key not in mapped]:
+            del self._reference_holders[key]
+        for model in self._reference_holders.values():
+            self._reference_index.bind_current(model)
+        self._reference_index.prune(lambda model: id(model) in mapped)
+
+    def _set_source(self, oid: ObjectId, source: SourceRef) -> None:
+        """Record the source of an object in :attr:`sources` and the per-document interval index."""
+        self._source_index.add(oid, source, self.sources.get(oid))
+        self.sources[oid] = source
+
+    def _drop_source(self, oid: ObjectId) -> None:
+        """Remove the source of an object from :attr:`sources` and the per-document interval index."""
+        source = self.sources.pop(oid, None)
+        if source is not None:
+            self._source_index.discard(oid, source)
 
     def get_object(self, id: ObjectId) -> SemanticObject:
         """
@@ -255,7 +268,6 @@ class _WorkspaceObjectMapping(_WorkspaceBase):
             SemanticObject:
                 The requested semantic object.
         """
-        self._resolve_duplicate_object_id(id)
         return self.objects[id]
 
     def has_object(self, id: ObjectId) -> bool:
@@ -270,7 +282,6 @@ class _WorkspaceObjectMapping(_WorkspaceBase):
             bool:
                 True if the key is found, False otherwise.
         """
-        self._resolve_duplicate_object_id(id)
         return id in self.objects
 
     def get_metadata(self, id: ObjectId) -> ObjectMetadata:
@@ -294,6 +305,9 @@ class _WorkspaceObjectMapping(_WorkspaceBase):
         """
 
         semantic_obj = self.get_object(id)
+        if semantic_obj.id != id:
+            # an alias of a list item: describe the object under the id it was asked for
+            semantic_obj = SemanticObject(ObjectId(id), semantic_obj.model)
         # ``FLYNCWorkspace`` is the only concrete subclass of this layer, and ObjectMetadata only
         # calls back into methods defined here, so the cast is safe.
         return ObjectMetadata(semantic_obj, cast("FLYNCWorkspace", self))
@@ -302,23 +316,24 @@ class _WorkspaceObjectMapping(_WorkspaceBase):
         """
         Return a list of all ObjectIds present in the workspace.
 
+        The canonical ids come first, followed by the aliases of list items (see
+        :attr:`~flync.sdk.context.workspace_config.ListObjectsMode.NAME`) and of everything below them.
+
         Returns:
             list[ObjectId]:
                 List of object identifiers.
         """
-        if not self._duplicated_objects_ids:
-            return list(self.objects.keys())
-
-        duplicated_ids = chain.from_iterable(self._duplicated_objects_ids.values())
-        return list(chain(self.objects.keys(), duplicated_ids))
+        aliases = chain.from_iterable(self.objects.spellings(oid)[1:] for oid in self.objects)
+        return list(chain(self.objects, aliases))
 
     def get_child_ids(self, id: ObjectId) -> list[str]:
         """
         Return the immediate child ObjectId strings of a given object.
 
-        Backed by the ``_children_by_parent`` index built during object
-        mapping, so this is an O(1) lookup rather than a full scan of the
-        workspace.
+        Backed by the path trie built during object mapping, so this is a
+        walk down the id's segments rather than a full scan of the workspace.
+        Children are spelled below ``id`` as given, aliases of list items
+        included.
 
         Args:
             id (ObjectId): Identifier of the parent object.
@@ -327,7 +342,11 @@ class _WorkspaceObjectMapping(_WorkspaceBase):
             list[str]: Immediate child id strings (empty if none / not mapped).
         """
 
-        return [child for child in self._children_by_parent.get(str(id), []) if self.has_object(ObjectId(child))]
+        node = self._object_paths.find(id) if id else None
+        if node is None:
+            return []
+        children = (f"{id}.{segment}" for segment in self._object_paths.child_segments(node))
+        return [child for child in children if self.has_object(ObjectId(child))]
 
     def get_definition(self, object_id: ObjectId, field_name: str) -> Optional[ObjectId]:
         """
@@ -356,8 +375,9 @@ class _WorkspaceObjectMapping(_WorkspaceBase):
         """
         Return all ObjectIds that reference the given object.
 
-        Iterates over every semantic object in the workspace and checks whether any of its fields are defined by the same model as the target object.
-        For each matching field, the concrete path to that field is collected via `find_path_from_field`.
+        Served by the reverse reference index, which is brought up to date with the ``Reference`` private attrs after
+        every load or update, so the cost is proportional to the number of references rather than to the size of the
+        workspace. For each referencing field, the concrete path to that field is collected via `find_path_from_field`.
 
         Args:
             object_id (ObjectId):
@@ -370,17 +390,14 @@ class _WorkspaceObjectMapping(_WorkspaceBase):
 
         refs: list[ObjectId] = []
         current_obj = self.get_object(object_id)
-
-        for semantic_obj in self.objects.values():
-            fields: dict | None = getattr(type(semantic_obj.model), "model_fields", None)
-            if fields is None:
-                continue
-
-            for field, info in fields.items():
-                if obj_id_def := self.get_definition(semantic_obj.id, field):
-                    model_def = self.get_object(obj_id_def)
-                    if model_def.model is current_obj.model:
-                        self.find_path_from_field(object_id, refs, semantic_obj, field, info)
+        if not isinstance(current_obj.model, FLYNCBaseModel):
+            return refs
+
+        for referrer, field in self._reference_index.referrers_of(current_obj.model):
+            info = type(referrer).model_fields[field]
+            for oid in self._model_to_object_ids.get(id(referrer), ()):
+                if (semantic_obj := self.objects.get(oid)) is not None:
+                    self.find_path_from_field(object_id, refs, semantic_obj, field, info)
         return refs
 
     def find_path_from_field(
@@ -440,7 +457,7 @@ class _WorkspaceObjectMapping(_WorkspaceBase):
                 List of ObjectIds that correspond to the Flync object. Empty if none found.
         """
 
-        return self._model_to_object_ids.get(id(model), []).copy()
+        return [alias for oid in self._model_to_object_ids.get(id(model), ()) for alias in self.objects.spellings(oid)]
 
     def get_semantic_objects_from_model(self, model: FLYNCBaseModel) -> list[SemanticObject]:
         """
@@ -458,7 +475,7 @@ class _WorkspaceObjectMapping(_WorkspaceBase):
                 List of semantic objects that correspond to the Flync object. Empty if none found.
         """
 
-        return [self.get_object(oid) for oid in self._model_to_object_ids.get(id(model), [])]
+        return [self.get_object(oid) for oid in self.get_semantic_objects_ids_from_model(model)]
 
     @deprecated("Use get_semantic_objects_from_model() instead, which returns all matches")
     def get_semantic_object_from_model(self, model: FLYNCBaseModel) -> SemanticObject | None:
@@ -491,13 +508,15 @@ class _WorkspaceObjectMapping(_WorkspaceBase):
             SourceRef:
                 The source reference associated with the object.
         """
-        self._resolve_duplicate_object_id(id)
         return self.sources[id]
 
     def objects_at(self, uri: str, line: int, character: int) -> list[ObjectId]:
         """
         Return the list of ObjectIds located at the specified position in a document.
 
+        Backed by a per-document interval index, so a lookup costs ``O(log n + k)`` for ``k`` hits instead of a scan of
+        every object in the workspace.
+
         Args:
             uri (str):
                 Document URI.
@@ -508,19 +527,33 @@ class _WorkspaceObjectMapping(_WorkspaceBase):
 
         Returns:
             list[ObjectId]:
-                List of object identifiers at the given position.
+                List of object identifiers at the given position, innermost first.
         """
 
-        result = []
-        for oid, src in self.sources.items():
-            if src.uri != uri:
-                continue
-            r = src.range
-            if (line > r.start.line or (line == r.start.line and character >= r.start.character)) and (
-                line < r.end.line or (line == r.end.line and character <= r.end.character)
-            ):
-                result.append(oid)
-        return result
+        return self._source_index.at(uri, Position(line, character))
+
+    def objects_in_range(self, uri: str, start_line: int, start_character: int, end_line: int, end_character: int) -> list[ObjectId]:
+        """
+        Return the list of ObjectIds whose source range overlaps the specified range of a document.
+
+        Args:
+            uri (str):
+                Document URI.
+            start_line (int):
+                1-based line of the first position of the range.
+            start_character (int):
+                1-based character offset of the first position of the range.
+            end_line (int):
+                1-based line of the last position of the range.
+            end_character (int):
+                1-based character offset of the last position of the range, inclusive.
+
+        Returns:
+            list[ObjectId]:
+                List of object identifiers sharing at least one position with the range, innermost first.
+        """
+
+        return self._source_index.overlapping(uri, Position(start_line, start_character), Position(end_line, end_character))
 
     def revalidate_references_of(self, id: ObjectId) -> None:
         """
@@ -552,50 +585,54 @@ class _WorkspaceObjectMapping(_WorkspaceBase):
         affected_files: set[str] = set()
         affected_files.add(self.get_source(id).uri)
         revalidated_objects: set[ObjectId] = set()
-        objects_to_revalidate: list[ObjectId] = list(need_revalidate)
-
-        while objects_to_revalidate:
-            nr = objects_to_revalidate.pop(0)
-            if nr in revalidated_objects:
-                continue
-
-            field_obj_ref: SemanticObject = self.get_object(nr)
-            meta = self.get_metadata(nr)
-            parent_id = meta.parent_id
-            child_field_name = meta.name
-            if parent_id is None or child_field_name is None or not self.has_object(ObjectId(parent_id)):
-                continue
-
-            parent_id = ObjectId(parent_id)
-            parent_obj_ref: SemanticObject = self.get_object(parent_id)
-            if not isinstance(parent_obj_ref.model, FLYNCBaseModel):
-                continue
-
-            field_name = get_field_name_from_alias(type(parent_obj_ref.model), child_field_name)
-            field_info = type(parent_obj_ref.model).model_fields[field_name]
-
-            if ref := get_metadata(field_info.metadata, Reference):
-                parent_source = self.get_source(parent_id)
-                try:
-                    # Read source_key (default "name") from the changed model
-                    # to obtain the new scalar value for the parent's reference
-                    # field (e.g. the new name of the referenced object).
-                    new_value = getattr(model_changed.model, ref.source_key)
-                    field_obj_ref.model = new_value
-                    setattr(parent_obj_ref.model, field_name, new_value)
+        objects_to_revalidate: deque[ObjectId] = deque(need_revalidate)
+        queued: set[ObjectId] = set(need_revalidate)
+
+        # validators re-run by the assignments below may re-bind references; the index is refreshed once at the end
+        with self._tracking_references():
+            while objects_to_revalidate:
+                nr = objects_to_revalidate.popleft()
+                queued.discard(nr)
+                if nr in revalidated_objects:
+                    continue
+
+                field_obj_ref: SemanticObject = self.get_object(nr)
+                meta = self.get_metadata(nr)
+                parent_id = meta.parent_id
+                child_field_name = meta.name
+                if parent_id is None or child_field_name is None or not self.has_object(ObjectId(parent_id)):
+                    continue
+
+                parent_id = ObjectId(parent_id)
+                parent_obj_ref: SemanticObject = self.get_object(parent_id)
+                if not isinstance(parent_obj_ref.model, FLYNCBaseModel):
+                    continue
+
+                field_name = get_field_name_from_alias(type(parent_obj_ref.model), child_field_name)
+                field_info = type(parent_obj_ref.model).model_fields[field_name]
+
+                if ref := get_metadata(field_info.metadata, Reference):
+                    parent_source = self.get_source(parent_id)
+                    try:
+                        # Read source_key (default "name") from the changed model
+                        # to obtain the new scalar value for the parent's reference
+                        # field (e.g. the new name of the referenced object).
+                        new_value = getattr(model_changed.model, ref.source_key)
+                        field_obj_ref.model = new_value
+                        setattr(parent_obj_ref.model, field_name, new_value)
 
-                except ValidationError as e:
-                    merged_errors = self.documents_diags[parent_source.uri] + e.errors()
-                    self.documents_diags[parent_source.uri] = get_unique_errors(merged_errors)
+                    except ValidationError as e:
+                        merged_errors = self.documents_diags[parent_source.uri] + e.errors()
+                        self.documents_diags[parent_source.uri] = get_unique_errors(merged_errors)
 
-                affected_files.add(parent_source.uri)
+                    affected_files.add(parent_source.uri)
 
-                self.__revalidate_model(parent_id, parent_obj_ref)
-                revalidated_objects.add(nr)
+                    self.__revalidate_model(parent_id, parent_obj_ref)
+                    revalidated_objects.add(nr)
 
-                # Always walk up to parent, even if parent has no direct references
-                # Parent might have @model_validator or @field_validator
-                self.__enqueue_parent_for_revalidation(parent_id, objects_to_revalidate, revalidated_objects)
+                    # Always walk up to parent, even if parent has no direct references
+                    # Parent might have @model_validator or @field_validator
+                    self.__enqueue_parent_for_revalidation(parent_id, objects_to_revalidate, queued, revalidated_objects)
 
         for affected_file in affected_files:
             self.__persist_document_changes(affected_file)
@@ -603,7 +640,8 @@ class _WorkspaceObjectMapping(_WorkspaceBase):
     def __enqueue_parent_for_revalidation(
         self,
         object_id: ObjectId,
-        queue: list[ObjectId],
+        queue: deque[ObjectId],
+        queued: set[ObjectId],
         revalidated: set[ObjectId],
     ) -> None:
         """
@@ -614,26 +652,24 @@ class _WorkspaceObjectMapping(_WorkspaceBase):
 
         Args:
             object_id (ObjectId): The object whose parent to check.
-            queue (list[ObjectId]): The revalidation queue (updated in place).
+            queue (deque[ObjectId]): The revalidation queue (updated in place).
+            queued (set[ObjectId]): The ids currently in ``queue`` (updated in place).
             revalidated (set[ObjectId]): Already-revalidated objects (to avoid cycles).
         """
-        parent_id: ObjectId
-        while True:
-            meta_parent_id = self.get_metadata(object_id).parent_id
-            if meta_parent_id is None or ObjectId(meta_parent_id) in revalidated:
-                break
+        while (meta_parent_id := parent_object_id(object_id)) is not None:
             parent_id = ObjectId(meta_parent_id)
+            if parent_id in revalidated:
+                break
+            object_id = parent_id
             if not self.has_object(parent_id):
                 continue
 
             parent_obj = self.get_object(parent_id)
             if isinstance(parent_obj.model, FLYNCBaseModel) and has_validators(type(parent_obj.model)):
-                if parent_id not in queue and parent_id not in revalidated:
+                if parent_id not in queued:
                     queue.append(parent_id)
+                    queued.add(parent_id)
                     break
-            object_id = parent_id
-            if object_id == "":
-                break
 
     def __revalidate_model(self, object_id: ObjectId, semantic_obj: SemanticObject) -> None:
         """
@@ -670,7 +706,7 @@ class _WorkspaceObjectMapping(_WorkspaceBase):
         Args:
             uri (str): The document URI (workspace-relative path).
         """
-        root_id = min([obj_id for obj_id, src in self.sources.items() if src.uri == uri], key=lambda x: x.count("."))
+        root_id = min(self._source_index.objects_in(uri), key=lambda x: x.count("."))
         while True:
             root_object: SemanticObject | None
             if self.has_object(root_id):
@@ -8,8 +8,6 @@ routing externally annotated fields to their own files or folders.
 import logging
 from pathlib import Path
 
-import yaml
-
 from flync.core.annotations import (
     External,
     Implied,
@@ -28,6 +26,7 @@ from flync.sdk.utils.sdk_types import PathType
 
 from ._incremental import _WorkspaceIncremental
 from .document import Document
+from .document_writer import WriteReport, write_documents
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +39,8 @@ class _WorkspaceSaving(_WorkspaceIncremental):
         Load a FLYNCModel into the workspace.
 
         This is a placeholder implementation that stores the model for later
-        use.
+        use. Every document is written as soon as it is built, unless
+        ``fast_write`` is configured: then :meth:`generate_configs` writes them all.
         """
 
         if isinstance(file_path, str):
@@ -75,7 +75,8 @@ class _WorkspaceSaving(_WorkspaceIncremental):
         Persist serialized model content as a Document in the workspace.
 
         Resolves the full URI under the workspace root, creates a :class:`~flync.sdk.workspace.document.Document` for it, and calls
-        :meth:`generate_configs` to write it to disk. Does nothing when ``content`` is empty (e.g. all fields were external).
+        :meth:`generate_configs` to write it to disk, unless ``fast_write`` leaves that to one batch written later.
+        Does nothing when ``content`` is empty (e.g. all fields were external).
 
         Args:
             file_path (Path): Relative path (without extension) for the file.
@@ -91,7 +92,8 @@ class _WorkspaceSaving(_WorkspaceIncremental):
         uri = self.workspace_root / file_path.with_suffix(self.configuration.flync_file_extension)
         doc = Document(uri, content, self.configuration.map_objects)
         self.documents[str(uri)] = doc
-        self.generate_configs(uri)
+        if not self.configuration.fast_write:
+            self.generate_configs(uri)
 
     def __get_model_content(self, flync_model: FLYNCBaseModel, file_path):
         """
@@ -249,7 +251,7 @@ class _WorkspaceSaving(_WorkspaceIncremental):
 
         return None
 
-    def generate_configs(self, uri: PathType | None = None, *, persist_config: bool | None = None):
+    def generate_configs(self, uri: PathType | None = None, *, persist_config: bool | None = None) -> WriteReport:
         """
         Save the workspace to the given path.
 
@@ -257,6 +259,9 @@ class _WorkspaceSaving(_WorkspaceIncremental):
         If a FLYNCModel has been loaded via ``load_flync_model``, it attempts to serialize the model to JSON.
         Also persists the workspace configuration to .flync/config.yaml (only when saving the entire workspace).
 
+        Every file is replaced atomically. With ``fast_write`` configured, the documents are serialized and written by
+        ``write_workers`` threads and files that already hold their document's content are not touched.
+
         Args:
             uri (str | Path | None): Optional argument to save specific file instead of the entire workspace.
             persist_config (bool | None): One-off override for ``WorkspaceConfiguration.persist_config``.
@@ -264,7 +269,8 @@ class _WorkspaceSaving(_WorkspaceIncremental):
             the generated FLYNC files. ``None`` (the default) follows the workspace configuration. Ignored when ``uri`` is given, since a
             single-document save never writes the configuration.
 
-        Returns: None
+        Returns:
+            WriteReport: The number of written and unchanged documents and the bytes written, configuration excluded.
         """
 
         if uri is not None:
@@ -272,23 +278,15 @@ class _WorkspaceSaving(_WorkspaceIncremental):
             if uri not in self.documents:
                 raise ValueError(f"Document with URI {uri} not found in workspace.")
         docs = [self.documents[uri]] if uri else self.documents.values()
-        for doc in docs:
-            # create file
-            path_from_uri: Path = Path(doc.uri)
-            path_from_uri.parent.mkdir(parents=True, exist_ok=True)
-            if isinstance(doc.text, str):
-                path_from_uri.write_text(doc.text, encoding="utf-8")
-            elif isinstance(doc.text, dict) or isinstance(doc.text, list):
-                with open(path_from_uri, "w", encoding="utf-8") as f:
-                    yaml.dump(
-                        doc.text,
-                        f,
-                        sort_keys=False,
-                        default_flow_style=False,
-                        allow_unicode=True,
-                    )
+        fast = self.configuration.fast_write
+        report = write_documents(
+            ((Path(doc.uri), doc.text) for doc in docs if isinstance(doc.text, (str, dict, list))),
+            skip_unchanged=fast,
+            max_workers=self.configuration.write_workers if fast else 1,
+        )
 
         # Persist workspace configuration when saving entire workspace, unless suppressed.
         should_persist = self.configuration.persist_config if persist_config is None else persist_config
         if uri is None and should_persist:
             self.save_workspace_config()
+        return report
@@ -1,12 +1,20 @@
 """Helper for working with YAML documents."""
 
+import logging
+import os
+from array import array
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from ruamel.yaml import YAML
+from ruamel.yaml.error import StreamMark
+from ruamel.yaml.nodes import MappingNode, Node, ScalarNode, SequenceNode
+from ruamel.yaml.tag import Tag
 
 from flync.sdk.utils.sdk_types import PathType
 
+logger = logging.getLogger(__name__)
+
 _yaml_cache: dict[str, YAML] = {}
 
 
@@ -28,6 +36,116 @@ def _get_yaml(typ: str):
     return yaml
 
 
+class PositionIndex(object):
+    """
+    Compact, picklable snapshot of the source marks of a composed YAML node tree.
+
+    A ruamel ``compose`` tree is a large object graph (every node carries tags, comments and marks that reference the whole
+    text buffer). The object map only needs the node kinds, the mapping keys and the start/end line and column of every node,
+    so this class keeps exactly that, flattened in pre-order into a handful of arrays.
+
+    Attributes:
+        kinds (bytes): One :attr:`MAPPING` / :attr:`SEQUENCE` / :attr:`SCALAR` code per node.
+        marks (array): Four 0-based values per node: start line, start column, end line, end column.
+        sizes (array): Number of children of every mapping and sequence node, in visiting order.
+        keys (list): The key of every mapping entry, in visiting order.
+    """
+
+    __slots__ = ("kinds", "marks", "sizes", "keys")
+
+    MAPPING = 0
+    SEQUENCE = 1
+    SCALAR = 2
+
+    _TAGS = {
+        MAPPING: Tag(suffix="tag:yaml.org,2002:map"),
+        SEQUENCE: Tag(suffix="tag:yaml.org,2002:seq"),
+        SCALAR: Tag(suffix="tag:yaml.org,2002:str"),
+    }
+
+    def __init__(self, kinds: bytes, marks: array, sizes: array, keys: list):
+        """
+        Initialize a PositionIndex from already flattened arrays.
+
+        Use :meth:`from_node` to build one from a composed tree.
+        """
+
+        self.kinds = kinds
+        self.marks = marks
+        self.sizes = sizes
+        self.keys = keys
+
+    @classmethod
+    def from_node(cls, node: Optional[Node]) -> Optional["PositionIndex"]:
+        """
+        Flatten a composed node tree.
+
+        Args:
+            node (Node | None): Root node as returned by ``YAML(typ="rt").compose``.
+
+        Returns:
+            PositionIndex | None: The flattened index, or ``None`` for an empty document.
+        """
+
+        if node is None:
+            return None
+        kinds = bytearray()
+        marks = array("I")
+        sizes = array("I")
+        keys: list = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            marks.extend((current.start_mark.line, current.start_mark.column, current.end_mark.line, current.end_mark.column))
+            if isinstance(current, MappingNode):
+                kinds.append(cls.MAPPING)
+                sizes.append(len(current.value))
+                keys.extend(key_node.value for key_node, _ in current.value)
+                stack.extend(val_node for _, val_node in reversed(current.value))
+            elif isinstance(current, SequenceNode):
+                kinds.append(cls.SEQUENCE)
+                sizes.append(len(current.value))
+                stack.extend(reversed(current.value))
+            else:
+                kinds.append(cls.SCALAR)
+        return cls(bytes(kinds), marks, sizes, keys)
+
+    def to_node(self) -> Node:
+        """
+        Rebuild a lightweight ruamel node tree carrying the recorded kinds, keys and marks.
+
+        Scalar values are not kept (the safe-loaded AST holds the data), and key nodes share the start mark of their value.
+
+        Returns:
+            Node: The root node.
+        """
+
+        cursor = {"node": 0, "size": 0, "key": 0}
+        return self.__build(cursor)
+
+    def __build(self, cursor: dict) -> Node:
+        """Rebuild the node at ``cursor`` (and its subtree), advancing the cursor past it."""
+        position = cursor["node"]
+        cursor["node"] += 1
+        kind = self.kinds[position]
+        start_line, start_column, end_line, end_column = self.marks[position * 4 : position * 4 + 4]
+        start_mark = StreamMark(None, 0, start_line, start_column)
+        end_mark = StreamMark(None, 0, end_line, end_column)
+        if kind == self.SCALAR:
+            return ScalarNode(self._TAGS[kind], "", start_mark, end_mark)
+        size = self.sizes[cursor["size"]]
+        cursor["size"] += 1
+        if kind == self.SEQUENCE:
+            return SequenceNode(self._TAGS[kind], [self.__build(cursor) for _ in range(size)], start_mark, end_mark)
+        keys = self.keys[cursor["key"] : cursor["key"] + size]
+        cursor["key"] += size
+        entries = []
+        for key in keys:
+            value_node = self.__build(cursor)
+            entries.append((ScalarNode(self._TAGS[self.SCALAR], key, value_node.start_mark, value_node.start_mark), value_node))
+        return MappingNode(self._TAGS[kind], entries, start_mark, end_mark)
+
+
 class Document(object):
     """
     Represents a YAML document with parsing capabilities.
@@ -40,26 +158,81 @@ class Document(object):
         ast (Any | None): The parsed abstract syntax tree, or None if not parsed.
 
         compose_ast (Any | None): The composed ruamel.yaml AST used for source-position tracking, or None if not parsed.
+            When the document only holds a :class:`PositionIndex`, a lightweight tree is rebuilt from it on first access.
+        positions (PositionIndex | None): Compact position index standing in for the composed AST, if any.
         needs_compose (bool): Whether to produce a composed AST.
+        source_path (Path | None): File the text is read from on first access when it was not given up front.
+        source_stamp (tuple[int, int] | None): Modification time (ns) and size of :attr:`source_path` when the document
+            was parsed. The text is only read lazily while the file still matches them.
     """
 
     _yaml_safe = _get_yaml("safe")
 
-    def __init__(self, uri: PathType, text: str, needs_compose: bool):
+    def __init__(
+        self,
+        uri: PathType,
+        text: Optional[str],
+        needs_compose: bool,
+        source_path: Optional[Path] = None,
+        source_stamp: Optional[tuple[int, int]] = None,
+    ):
         """
         Initialize a Document instance.
 
         Args:
             uri (str): The document's URI.
-            text (str): The raw YAML text.
+            text (str | None): The raw YAML text, or ``None`` to read it lazily from ``source_path``.
             needs_compose (bool): Whether to produce a composed AST for source tracking.
+            source_path (Path | None): File backing the document, read on first access to :attr:`text`.
+            source_stamp (tuple[int, int] | None): :func:`source_stamp` of ``source_path`` taken before it was parsed.
         """
 
         self.uri: PathType = uri
         self.needs_compose = needs_compose
+        self.source_path = source_path
+        self.source_stamp = source_stamp
         self.ast: Any | None = None
-        self.compose_ast = None
-        self.text: str = text
+        self.positions: Optional[PositionIndex] = None
+        self._compose_ast: Optional[Node] = None
+        self._text = text
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        if state["positions"] is not None:
+            # the tree memoized from the position index is rebuilt on demand instead of being pickled
+            state["_compose_ast"] = None
+        return state
+
+    @property
+    def text(self):
+        """
+        The raw YAML text, read from :attr:`source_path` the first time it is needed.
+
+        ``None`` if the file changed on disk since the document was parsed: its content would no longer match the AST
+        and the source positions of the document.
+        """
+        if self._text is None and self.source_path is not None:
+            if self.source_stamp is not None and source_stamp(self.source_path) != self.source_stamp:
+                logger.warning("%s changed on disk since it was loaded; reload the document to access its text", self.uri)
+                return None
+            self._text = read_file(self.source_path)
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        self._text = value
+
+    @property
+    def compose_ast(self) -> Optional[Node]:
+        """The composed AST, rebuilt from :attr:`positions` on first access when only the index is held."""
+        if self._compose_ast is None and self.positions is not None:
+            self._compose_ast = self.positions.to_node()
+        return self._compose_ast
+
+    @compose_ast.setter
+    def compose_ast(self, value: Optional[Node]):
+        self._compose_ast = value
+        self.positions = None
 
     def parse(self):
         """
@@ -90,10 +263,14 @@ class Document(object):
 
         Args:
             ast: Parsed YAML object tree.
-            compose_ast: Composed YAML node tree (optional, used for object maps).
+            compose_ast: Composed YAML node tree, or its :class:`PositionIndex` (optional, used for object maps).
         """
         self.ast = ast
-        self.compose_ast = compose_ast
+        if isinstance(compose_ast, PositionIndex):
+            self.compose_ast = None
+            self.positions = compose_ast
+        else:
+            self.compose_ast = compose_ast
 
     @classmethod
     def _get_safe_yaml(cls):
@@ -144,6 +321,23 @@ class Document(object):
         return uri.as_posix()
 
 
+def source_stamp(path: PathType) -> Optional[tuple[int, int]]:
+    """
+    Return the modification time (ns) and size of a file, or ``None`` if it cannot be read.
+
+    Args:
+        path (PathType): Path to the file.
+
+    Returns:
+        tuple[int, int] | None: ``(st_mtime_ns, st_size)`` of the file.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 def read_file(path: PathType) -> str:
     """
     Read a file as UTF-8 text.
@@ -161,22 +355,26 @@ def read_file(path: PathType) -> str:
         return ""
 
 
-def parse_documents(paths, ws_root, needs_compose):
+def parse_documents(paths, ws_root, needs_compose, compact=False):
     """
     Parse multiple YAML documents from given paths.
 
     The raw text is read inside each worker and NOT returned through IPC
-    to avoid pickle overhead. The main process re-reads the file from the
-    OS page cache for Document construction.
+    to avoid pickle overhead; :class:`Document` reads it lazily from disk
+    if it is ever needed, provided the file still has the :func:`source_stamp`
+    taken before it was parsed.
 
     Args:
         paths (list[PathType]): List of file paths to parse.
         ws_root (Path): Workspace root for URI normalization.
         needs_compose (bool): Whether to produce composed ASTs.
+        compact (bool): Return a :class:`PositionIndex` in place of every composed AST. Pickling the index
+            is much cheaper than pickling the node tree, which references the whole text buffer.
 
     Returns:
         list[tuple[str, Any, Any | None]]: Each tuple contains
-            (normalized_uri, ast, compose_ast).
+            (normalized_uri, ast, compose_ast), where compose_ast is a
+            :class:`PositionIndex` when ``compact`` is set.
     """
 
     results = []
@@ -188,7 +386,7 @@ def parse_documents(paths, ws_root, needs_compose):
             (
                 Document.normalize_uri(path, ws_root),
                 ast,
-                compose_ast,
+                PositionIndex.from_node(compose_ast) if compact else compose_ast,
             )
         )
     return results
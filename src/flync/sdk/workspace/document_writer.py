@@ -0,0 +1,138 @@
+"""
+Writing workspace documents to disk.
+
+Documents are serialized with the libyaml emitter when PyYAML was built with it; its output is the same as the one of
+the pure-Python emitter, only faster. Files are replaced atomically (temporary file plus rename), so a reader never
+sees a half-written document, and :func:`write_documents` can leave files whose content did not change untouched, so
+their modification times stay stable for the build systems that consume the generated workspace.
+"""
+
+import os
+import secrets
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+import yaml
+
+try:
+    from yaml import CDumper as _Dumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import Dumper as _Dumper  # type: ignore[assignment]
+
+
+@dataclass
+class WriteReport(object):
+    """
+    What a call of :meth:`~flync.sdk.workspace.flync_workspace.FLYNCWorkspace.generate_configs` wrote.
+
+    Attributes:
+        files_written (int): Documents written to disk.
+        files_unchanged (int): Documents skipped because the file on disk already had their content.
+        bytes_written (int): Total size of the written documents.
+    """
+
+    files_written: int = 0
+    files_unchanged: int = 0
+    bytes_written: int = 0
+
+    def add(self, written: Optional[int]) -> None:
+        """Count one document, given the number of bytes written for it or ``None`` if it was left untouched."""
+        if written is None:
+            self.files_unchanged += 1
+        else:
+            self.files_written += 1
+            self.bytes_written += written
+
+
+def serialize_document(text: str | dict | list) -> bytes:
+    """
+    Turn the content of a :class:`~flync.sdk.workspace.document.Document` into the bytes of its file.
+
+    Args:
+        text (str | dict | list): Raw text, or the mapping or sequence to dump as YAML.
+
+    Returns:
+        bytes: The UTF-8 encoded file content, with the platform's line separators.
+    """
+
+    if not isinstance(text, str):
+        text = yaml.dump(text, Dumper=_Dumper, sort_keys=False, default_flow_style=False, allow_unicode=True)
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    return text.encode("utf-8")
+
+
+def write_file(path: Path, content: bytes, skip_unchanged: bool = False) -> Optional[int]:
+    """
+    Atomically replace a file with ``content``.
+
+    The content goes to a temporary file next to ``path`` first, which is then renamed over it. The permissions of a
+    replaced file are kept.
+
+    Args:
+        path (Path): The file to write; missing parent directories are created.
+        content (bytes): The new content.
+        skip_unchanged (bool): Leave the file untouched, modification time included, if it already holds ``content``.
+
+    Returns:
+        int | None: The number of bytes written, or ``None`` if the file was left untouched.
+    """
+
+    try:
+        current = os.stat(path)
+    except FileNotFoundError:
+        current = None
+        path.parent.mkdir(parents=True, exist_ok=True)
+    if skip_unchanged and current is not None and current.st_size == len(content) and path.read_bytes() == content:
+        return None
+    tmp = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+    # 0o666 lets the umask decide the permissions of a new file, as with open(path, "w")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as file:
+            if current is not None and hasattr(os, "fchmod"):
+                # set explicitly, the mode passed to os.open is masked by the umask (e.g. group write under 022)
+                os.fchmod(file.fileno(), stat.S_IMODE(current.st_mode))
+            file.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return len(content)
+
+
+def _write_document(path: Path, text: str | dict | list, skip_unchanged: bool) -> Optional[int]:
+    return write_file(path, serialize_document(text), skip_unchanged)
+
+
+def write_documents(
+    documents: Iterable[tuple[Path, str | dict | list]],
+    skip_unchanged: bool = False,
+    max_workers: Optional[int] = 1,
+) -> WriteReport:
+    """
+    Serialize and write a batch of documents.
+
+    Args:
+        documents (Iterable[tuple[Path, str | dict | list]]): File path and content of every document.
+        skip_unchanged (bool): Leave the files that already hold their document's content untouched.
+        max_workers (int | None): Threads serializing and writing the documents; ``1`` writes them in the calling
+            thread, ``None`` lets :class:`~concurrent.futures.ThreadPoolExecutor` pick the number.
+
+    Returns:
+        WriteReport: The number of written and skipped documents and the bytes written.
+    """
+
+    report = WriteReport()
+    documents = list(documents)
+    if max_workers == 1 or len(documents) < 2:
+        for path, text in documents:
+            report.add(_write_document(path, text, skip_unchanged))
+        return report
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="flync_writer") as pool:
+        for written in pool.map(lambda document: _write_document(*document, skip_unchanged), documents):
+            report.add(written)
+    return report
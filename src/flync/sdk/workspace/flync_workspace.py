@@ -5,18 +5,23 @@ Provides classes and functions to manage workspace operations.
 """
 
 import logging
+import pickle
 from pathlib import Path
 
-from pydantic_core import ValidationError
+from pydantic_core import InitErrorDetails, PydanticCustomError, ValidationError
 
 from flync.core.base_models.base_model import FLYNCBaseModel
 from flync.core.utils.exceptions_handling import errors_to_init_errors
+from flync.core.utils.validation_profile import profile_scope
 from flync.model.flync_model import FLYNCModel
 from flync.sdk.context.workspace_config import WorkspaceConfiguration
+from flync.sdk.utils.field_utils import get_model_checks
 from flync.sdk.utils.sdk_types import PathType
 
 from ._base import LoadNode, ParentLink
 from ._saving import _WorkspaceSaving
+from .document import Document
+from .snapshot import SnapshotHeader, default_snapshot_path, prune_snapshots, read_snapshot, write_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -79,9 +84,10 @@ class FLYNCWorkspace(_WorkspaceSaving):
 
         documents_diags (Dict[str, list[ErrorDetails]]): Validation errors indexed by document URI.
 
-        objects (Dict[ObjectId, SemanticObject]): Semantic objects indexed by ObjectId.
+        objects (ObjectMap[SemanticObject]): Semantic objects indexed by ObjectId. Dict-like; a lookup also accepts
+            the name alias of a list item (or of anything below one), iteration yields the canonical ids.
 
-        sources (Dict[ObjectId, SourceRef]): Source references indexed by ObjectId.
+        sources (ObjectMap[SourceRef]): Source references indexed by ObjectId, keyed like ``objects``.
 
         flync_model (FLYNCModel | FLYNCBaseModel | None): The root FLYNC model instance, if loaded.
 
@@ -134,12 +140,17 @@ class FLYNCWorkspace(_WorkspaceSaving):
         workspace_name: str,
         workspace_path: PathType,
         workspace_config: PathType | WorkspaceConfiguration | None = None,
+        use_snapshot: bool = False,
+        documents: dict[str, Document] | None = None,
     ) -> "FLYNCWorkspace":
         """
         loads a workspace object from a location of the Yaml Configuration.
 
         In case this fails, the workspace will still be created, but with an empty model.
 
+        With ``use_snapshot`` the workspace is restored from its snapshot in the FLYNC user cache directory when the
+        snapshot is fresh (see :meth:`load_snapshot`); otherwise it is loaded and the snapshot is rewritten.
+
         Args:
             workspace_name (str): The name of the workspace.
 
@@ -150,21 +161,106 @@ class FLYNCWorkspace(_WorkspaceSaving):
                 - str | Path: Path to config file (e.g., ".flync/config.yaml")
                 - None: Auto-discover .flync/config.yaml in workspace_path or use defaults
 
+            use_snapshot (bool): Restore from, and keep up to date, the snapshot of the workspace.
+
+            documents (dict[str, Document] | None): Documents of the workspace that were already parsed, by
+                workspace-relative uri; only the other files are read and parsed.
+
         Returns: FLYNCWorkspace
         """
 
         resolved_config = _resolve_workspace_config(workspace_path, workspace_config)
+        if use_snapshot:
+            snapshot_path = default_snapshot_path(Path(workspace_path))
+            # describe the files before loading them, so an edit made during the load leaves the snapshot stale
+            header = SnapshotHeader.of(Path(workspace_path), resolved_config)
+            with profile_scope("phase", "restore snapshot"):
+                restored = cls._restore_snapshot(snapshot_path, header, resolved_config, workspace_name)
+            if restored is not None:
+                return restored
         output = FLYNCWorkspace(
             name=workspace_name,
             workspace_path=workspace_path,
             configuration=resolved_config,
         )
-        output._open_documents()
-        model = output._load_from_path(output.workspace_root)  # type: ignore[arg-type]
+        output.documents.update(documents or {})
+        with profile_scope("phase", "parse documents"):
+            output._open_documents()
+        with profile_scope("phase", "load"), output._tracking_references():
+            model = output._load_from_path(output.workspace_root)  # type: ignore[arg-type]
 
         if not isinstance(model, FLYNCBaseModel):
             logger.error("Unable to load the workspace %s", workspace_path)
         output.flync_model = model
+        if use_snapshot:
+            with profile_scope("phase", "write snapshot"):
+                output._write_snapshot(snapshot_path, header)
+        return output
+
+    @classmethod
+    def safe_load_subtree(
+        cls,
+        workspace_name: str,
+        workspace_path: PathType,
+        object_path: str,
+        workspace_config: PathType | WorkspaceConfiguration | None = None,
+    ) -> "FLYNCWorkspace":
+        """
+        loads only the part of a workspace that holds ``object_path``, e.g. a single ECU for ``ecus.zonal_platform2``.
+
+        The path is resolved on disk through the ``External`` annotations of the root model. For a folder list
+        (``ecus``, ``apps``) just the named entry is loaded, so a path deeper in that entry (``ecus.zonal_platform2.
+        controllers.0``) is loaded together with its ECU, the scope in which its references resolve. Any other root
+        field is loaded whole. Only the documents of that subtree are parsed.
+
+        The root model is not validated: its checks are listed in :attr:`skipped_checks`, ``flync_model`` stays ``None``
+        and :attr:`subtree_model` holds the loaded subtree instead. Objects keep the ids of a full load, so ``objects``
+        can be queried as usual.
+
+        As with :meth:`safe_load_workspace`, problems are reported as diagnostics rather than raised: a path that does
+        not resolve to a file or folder of the workspace leaves ``subtree_model`` empty and records a fatal error under
+        ``object_path`` in ``documents_diags``.
+
+        Args:
+            workspace_name (str): The name of the workspace.
+
+            workspace_path (str | Path): The path of the workspace files.
+
+            object_path (str): Dot-separated object path of the subtree to load.
+
+            workspace_config: Can be:
+                - WorkspaceConfiguration: Config object directly
+                - str | Path: Path to config file (e.g., ".flync/config.yaml")
+                - None: Auto-discover .flync/config.yaml in workspace_path or use defaults
+
+        Returns: FLYNCWorkspace
+        """
+
+        resolved_config = _resolve_workspace_config(workspace_path, workspace_config)
+        output = FLYNCWorkspace(
+            name=workspace_name,
+            workspace_path=workspace_path,
+            configuration=resolved_config,
+        )
+        output.skipped_checks = get_model_checks(output.configuration.root_model)
+        try:
+            field_name, shard = output._resolve_subtree(object_path)
+        except ValueError as e:
+            ctx = {"object_path": object_path, "reason": str(e)}
+            error = InitErrorDetails(type=PydanticCustomError("fatal", "unable to load subtree {object_path}: {reason}", ctx), input=object_path)
+            output.documents_diags[object_path] = ValidationError.from_exception_data(title="subtree load", line_errors=[error]).errors()
+            return output
+        # documents are opened lazily as the subtree walk reaches them, so nothing outside of it is parsed
+        output._subtree_shard = shard
+        try:
+            with profile_scope("phase", "load"):
+                fragment = output._load_subtree(field_name)
+        finally:
+            output._subtree_shard = None
+        value = next(iter(fragment.load_info.values()), None)
+        if shard is not None:
+            value = value[0] if value else None
+        output.subtree_model = value if isinstance(value, FLYNCBaseModel) else None
         return output
 
     @classmethod
@@ -198,4 +294,101 @@ class FLYNCWorkspace(_WorkspaceSaving):
             )
         return output
 
+    @classmethod
+    def load_snapshot(
+        cls,
+        workspace_path: PathType,
+        workspace_config: PathType | WorkspaceConfiguration | None = None,
+        snapshot_path: PathType | None = None,
+        workspace_name: str | None = None,
+    ) -> "FLYNCWorkspace | None":
+        """
+        restores a workspace from a snapshot written by :meth:`save_snapshot`, without parsing or validating.
+
+        The snapshot is only used when it is fresh: written by the same FLYNC code, for the same workspace path and
+        configuration, and with the same content of every FLYNC document (compared by hash).
+
+        Args:
+            workspace_path (str | Path): The path of the workspace files.
+
+            workspace_config: Can be:
+                - WorkspaceConfiguration: Config object directly
+                - str | Path: Path to config file (e.g., ".flync/config.yaml")
+                - None: Auto-discover .flync/config.yaml in workspace_path or use defaults
+
+            snapshot_path (str | Path | None): The snapshot file. Defaults to the workspace's file in the FLYNC user
+                cache directory.
+
+            workspace_name (str | None): The name of the workspace. Defaults to the name it was saved with.
+
+        Returns: FLYNCWorkspace, or ``None`` when the snapshot is missing, stale or unreadable.
+        """
+
+        resolved_config = _resolve_workspace_config(workspace_path, workspace_config)
+        path = Path(snapshot_path) if snapshot_path else default_snapshot_path(Path(workspace_path))
+        return cls._restore_snapshot(path, SnapshotHeader.of(Path(workspace_path), resolved_config), resolved_config, workspace_name)
+
+    @classmethod
+    def _restore_snapshot(
+        cls,
+        snapshot_path: Path,
+        header: SnapshotHeader,
+        configuration: WorkspaceConfiguration,
+        workspace_name: str | None,
+    ) -> "FLYNCWorkspace | None":
+        """Rebuild a workspace from the snapshot at ``snapshot_path`` if it matches ``header``."""
+        payload = read_snapshot(snapshot_path, header)
+        if payload is None:
+            return None
+        name, model, fragment = payload
+        output = FLYNCWorkspace(
+            name=workspace_name or name,
+            workspace_path=header.workspace_root,
+            configuration=configuration,
+        )
+        output._absorb_fragment(fragment)
+        output.flync_model = model
+        return output
+
+    # endregion
+
+    # region snapshot
+    def save_snapshot(self, snapshot_path: PathType | None = None) -> Path:
+        """
+        Persist the loaded workspace as a compressed binary snapshot that :meth:`load_snapshot` restores.
+
+        The snapshot holds the model, the diagnostics, the documents, the object map, the sources and the load nodes,
+        so a restored workspace answers queries and incremental updates like a loaded one. It is keyed by the FLYNC
+        code, the configuration and the hashes of the documents as they are on disk now.
+
+        Args:
+            snapshot_path (str | Path | None): The snapshot file. Defaults to the workspace's file in the FLYNC user
+                cache directory, where the least recently used snapshots are pruned beyond a size cap.
+
+        Returns:
+            Path: The written snapshot.
+        """
+
+        path = Path(snapshot_path) if snapshot_path else default_snapshot_path(self.workspace_root)  # type: ignore[arg-type]
+        write_snapshot(path, SnapshotHeader.of(self.workspace_root, self.configuration), self.__snapshot_payload())  # type: ignore[arg-type]
+        if not snapshot_path:
+            prune_snapshots(path.parent, keep=path)
+        return path
+
+    def _write_snapshot(self, snapshot_path: Path, header: SnapshotHeader) -> None:
+        """
+        Write the snapshot described by ``header`` to its default location and prune the snapshots next to it.
+
+        A failure is logged, since a snapshot only ever saves time.
+        """
+        try:
+            size = write_snapshot(snapshot_path, header, self.__snapshot_payload())
+            logger.debug("Wrote snapshot %s (%d bytes)", snapshot_path, size)
+            prune_snapshots(snapshot_path.parent, keep=snapshot_path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError, RecursionError) as e:
+            logger.warning("Unable to write the snapshot of %s: %s", self.workspace_root, e)
+
+    def __snapshot_payload(self) -> tuple:
+        return self.name, self.flync_model, self._export_fragment({}, self.documents)
+
     # endregion
@@ -0,0 +1,276 @@
+"""
+Compact storage for the object map of a workspace.
+
+Object ids are dot-separated paths, and the ids of a workspace share long prefixes (``ecus.0.controllers.0.…``).
+:class:`ObjectPaths` interns them as the nodes of a trie, so an object is addressed by a small integer and no id string
+is kept per map entry. A list item that is reachable under its index and under its name (see
+:class:`~flync.sdk.context.workspace_config.ListObjectsMode`) is one node with an alias edge: everything below the item is
+stored once and found under both spellings, instead of once per combination of index and name segments along the path.
+
+:class:`ObjectMap` is the dict-like view the workspace exposes as ``objects`` and ``sources``. It is keyed by object id
+strings, resolves aliases on lookup and iterates the canonical ids in registration order.
+"""
+
+import sys
+from array import array
+from collections.abc import ItemsView, MutableMapping, ValuesView
+from typing import Dict, Generic, Iterator, List, Optional, TypeVar
+
+from .ids import ObjectId
+
+_V = TypeVar("_V")
+
+#: Node of the empty path, the parent of every root-level id.
+ROOT = 0
+
+
+class ObjectPaths(object):
+    """
+    Trie of the object paths of a workspace.
+
+    Every node has one canonical parent and segment, which spell its canonical id. :meth:`alias` adds further segments
+    under the same parent that lead to the same node. Removed nodes are recycled by later insertions.
+    """
+
+    def __init__(self):
+        """Create a trie holding only the root."""
+        self._segments: List[str] = [""]
+        self._parents = array("q", [-1])
+        # segment -> node, canonical and alias edges in insertion order; None for a node without children
+        self._children: List[Optional[Dict[str, int]]] = [None]
+        # node -> its alias segments, for the nodes that have any
+        self._aliases: Dict[int, List[str]] = {}
+        self._free: List[int] = []
+        # the last path resolved by find(); registering an object looks the same id up several times in a row
+        self._last: tuple[Optional[str], int] = (None, ROOT)
+
+    def __len__(self) -> int:
+        """Return the number of nodes, the root included."""
+        return len(self._segments) - len(self._free)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_last"] = (None, ROOT)
+        return state
+
+    def child(self, node: int, segment: str) -> int:
+        """Return the node of ``segment`` below ``node``, creating it if needed."""
+        children = self._children[node]
+        if children is None:
+            children = self._children[node] = {}
+        else:
+            found = children.get(segment)
+            if found is not None:
+                return found
+        segment = sys.intern(segment)
+        if self._free:
+            new = self._free.pop()
+            self._segments[new] = segment
+            self._parents[new] = node
+        else:
+            new = len(self._segments)
+            self._segments.append(segment)
+            self._parents.append(node)
+            self._children.append(None)
+        children[segment] = new
+        return new
+
+    def alias(self, node: int, segment: str, target: int) -> None:
+        """Make ``target``, a child of ``node``, reachable under ``segment`` too; a segment already in use is kept."""
+        children = self._children[node]
+        if children is None:
+            children = self._children[node] = {}
+        if segment in children:
+            return
+        segment = sys.intern(segment)
+        children[segment] = target
+        self._aliases.setdefault(target, []).append(segment)
+
+    def intern(self, path: str) -> int:
+        """Return the node of ``path``, creating the missing nodes of its segments below the deepest existing one."""
+        node = self.find(path)
+        if node is not None:
+            return node
+        node = ROOT
+        pending: List[str] = []
+        for segment in path.split("."):
+            pending.append(segment)
+            children = self._children[node]
+            found = None if children is None else children.get(".".join(pending))
+            if found is not None:
+                node, pending = found, []
+        for segment in pending:
+            node = self.child(node, segment)
+        return node
+
+    def find(self, path: str) -> Optional[int]:
+        """
+        Return the node of ``path`` (a canonical id or any alias of it), or ``None`` if it is not in the trie.
+
+        A segment that itself contains dots, e.g. an address used as a dict key, is matched by joining the segments
+        that do not resolve on their own.
+        """
+
+        last_path, last_node = self._last
+        if path is last_path:
+            return last_node
+        node = ROOT
+        if path:
+            pending = None
+            for segment in path.split("."):
+                if pending is not None:
+                    segment = f"{pending}.{segment}"
+                children = self._children[node]
+                found = None if children is None else children.get(segment)
+                if found is None:
+                    pending = segment
+                    continue
+                node, pending = found, None
+            if pending is not None:
+                return None
+        self._last = (path, node)
+        return node
+
+    def path(self, node: int) -> ObjectId:
+        """Return the canonical id of ``node``."""
+        segments = []
+        while node > ROOT:
+            segments.append(self._segments[node])
+            node = self._parents[node]
+        return ObjectId(".".join(reversed(segments)))
+
+    def spellings(self, node: int) -> List[ObjectId]:
+        """Return every id ``node`` is reachable under, the canonical id first."""
+        if node == ROOT:
+            return [ObjectId("")]
+        parents = self.spellings(self._parents[node])
+        names = [self._segments[node], *self._aliases.get(node, ())]
+        return [ObjectId(f"{parent}.{name}" if parent else name) for name in names for parent in parents]
+
+    def child_segments(self, node: int) -> List[str]:
+        """Return the segments below ``node``, aliases included, in insertion order."""
+        children = self._children[node]
+        return list(children) if children else []
+
+    def subtree(self, node: int) -> List[int]:
+        """Return ``node`` and its canonical descendants, parents before their children."""
+        nodes = [node]
+        for current in nodes:
+            children = self._children[current]
+            if children:
+                nodes.extend(child for segment, child in children.items() if self._parents[child] == current and self._segments[child] == segment)
+        return nodes
+
+    def prune(self, node: int) -> None:
+        """Remove every node below ``node``, together with the aliases leading to them; ``node`` itself is kept."""
+        for removed in self.subtree(node)[1:]:
+            self._children[removed] = None
+            self._segments[removed] = ""
+            self._parents[removed] = -1
+            self._aliases.pop(removed, None)
+            self._free.append(removed)
+        self._children[node] = None
+        self._last = (None, ROOT)
+
+    def clear(self) -> None:
+        """Remove every node but the root."""
+        self.__init__()
+
+    def merge(self, other: "ObjectPaths") -> None:
+        """Add the paths and aliases of ``other``, keeping their order below every node."""
+        mapping = {ROOT: ROOT}
+        for node in other.subtree(ROOT):
+            children = other._children[node]
+            if not children:
+                continue
+            mine = mapping[node]
+            for segment, child in children.items():
+                if child not in mapping:
+                    mapping[child] = self.child(mine, other._segments[child])
+                if segment != other._segments[child] or other._parents[child] != node:
+                    self.alias(mine, segment, mapping[child])
+
+
+class ObjectMap(MutableMapping, Generic[_V]):
+    """
+    Dict-like map from object ids to values, stored per node of an :class:`ObjectPaths` trie.
+
+    A lookup accepts the canonical id or any alias of it and finds the same entry. Iteration, ``len`` and the views
+    cover the canonical ids only, in the order they were registered.
+
+    Attributes:
+        paths (ObjectPaths): The trie the ids are interned in, shared by every map of a workspace.
+    """
+
+    def __init__(self, paths: ObjectPaths):
+        """Create an empty map over ``paths``."""
+        self.paths = paths
+        self._values: Dict[int, _V] = {}
+
+    def __getitem__(self, key: str) -> _V:
+        node = self.paths.find(key)
+        if node is None or node not in self._values:
+            raise KeyError(key)
+        return self._values[node]
+
+    def get(self, key: str, default=None):
+        node = self.paths.find(key)
+        return default if node is None else self._values.get(node, default)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        node = self.paths.find(key)
+        return node is not None and node in self._values
+
+    def __setitem__(self, key: str, value: _V) -> None:
+        self._values[self.paths.intern(key)] = value
+
+    def __delitem__(self, key: str) -> None:
+        node = self.paths.find(key)
+        if node is None or node not in self._values:
+            raise KeyError(key)
+        del self._values[node]
+
+    def __iter__(self) -> Iterator[ObjectId]:
+        path = self.paths.path
+        return (path(node) for node in self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    def items(self) -> "_ObjectMapItems":
+        return _ObjectMapItems(self)
+
+    def values(self) -> "_ObjectMapValues":
+        return _ObjectMapValues(self)
+
+    def clear(self) -> None:
+        self._values.clear()
+
+    def spellings(self, key: str) -> List[ObjectId]:
+        """Return every id the entry of ``key`` is reachable under, its canonical id first; empty for a missing key."""
+        node = self.paths.find(key)
+        return self.paths.spellings(node) if node is not None and node in self._values else []
+
+    def ids_under(self, key: str) -> List[ObjectId]:
+        """Return the canonical ids of the entries at ``key`` and below it, parents before their children."""
+        node = self.paths.find(key)
+        if node is None:
+            return []
+        return [self.paths.path(member) for member in self.paths.subtree(node) if member in self._values]
+
+
+class _ObjectMapItems(ItemsView):
+    def __iter__(self):
+        path = self._mapping.paths.path
+        for node, value in self._mapping._values.items():
+            yield path(node), value
+
+
+class _ObjectMapValues(ValuesView):
+    def __iter__(self):
+        return iter(self._mapping._values.values())
@@ -22,6 +22,25 @@ if TYPE_CHECKING:
     from .flync_workspace import FLYNCWorkspace
 
 
+def parent_object_id(object_id: str) -> Optional[str]:
+    """
+    Return the id of the immediate container of ``object_id``, or ``None`` for a root object.
+
+    A list item registered by name under a same-named wrapper level (``ports.ports.p1``) belongs to the outer level.
+    """
+
+    parts = str(object_id).rsplit(".", 1)
+    if len(parts) > 1 and parts[0]:
+        parent_id = parts[0]
+        parent_parts = parent_id.rsplit(".", 1)
+        if len(parent_parts) > 1:
+            grandparent_last = parent_parts[0].rsplit(".", 1)[-1]
+            if parent_parts[1] == grandparent_last:
+                return parent_parts[0]
+        return parent_id
+    return None
+
+
 class FieldMetadata(ABC):
     """Base class for field reference metadata."""
 
@@ -125,17 +144,7 @@ class ObjectMetadata(object):
     @property
     def parent_id(self) -> Optional[str]:
         """Parent ObjectId (immediate container), or None if root."""
-        id_str = str(self.id)
-        parts = id_str.rsplit(".", 1)
-        if len(parts) > 1 and parts[0]:
-            parent_id = parts[0]
-            parent_parts = parent_id.rsplit(".", 1)
-            if len(parent_parts) > 1:
-                grandparent_last = parent_parts[0].rsplit(".", 1)[-1]
-                if parent_parts[1] == grandparent_last:
-                    return parent_parts[0]
-            return parent_id
-        return None
+        return parent_object_id(self.id)
 
     @property
     def child_ids(self) -> list[str]:
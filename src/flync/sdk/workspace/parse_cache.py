@@ -0,0 +1,211 @@
+"""
+Content-addressed on-disk cache of parsed workspace documents.
+
+Every entry holds the safe-loaded AST of one document and, when object mapping is enabled, the
+:class:`~flync.sdk.workspace.document.PositionIndex` of its composed tree. Entries are keyed by a hash
+of the document text, so an unchanged file is never parsed twice, no matter where it lives or how
+often the workspace is opened.
+"""
+
+import hashlib
+import importlib.metadata
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+import platformdirs
+import ruamel.yaml
+
+from .document import PositionIndex
+
+logger = logging.getLogger(__name__)
+
+#: Sub-directory of ``platformdirs.user_cache_dir("FLYNC")`` holding the parse cache.
+PARSE_CACHE_DIRNAME = "parse_cache"
+
+#: Bumped whenever the layout of a cache entry changes, so older entries are never unpickled.
+_FORMAT_VERSION = 1
+
+_ENTRY_SUFFIX = ".pickle"
+
+
+def _cache_version_tag() -> str:
+    """
+    Return the tag naming the cache generation of the running FLYNC and ruamel.yaml releases.
+
+    Parse results depend on both, so a different release of either starts a fresh generation.
+    """
+
+    try:
+        flync_version = importlib.metadata.version("flync")
+    except importlib.metadata.PackageNotFoundError:
+        flync_version = "unknown"
+    tag = f"{_FORMAT_VERSION}-{flync_version}-{ruamel.yaml.__version__}"
+    return hashlib.sha256(tag.encode()).hexdigest()[:16]
+
+
+class ParseCache(object):
+    """
+    On-disk cache of parsed documents, bounded in size with least-recently-used eviction.
+
+    One file per entry is written atomically (temporary file plus rename), so concurrent processes
+    sharing the cache never observe a partially written entry and need no lock. The modification
+    time of an entry doubles as its LRU clock: it is refreshed on every hit.
+
+    Every FLYNC and ruamel.yaml release reads and writes its own generation directory. The size cap
+    covers all generations together, so several environments can share the cache without wiping each
+    other's entries; those of a release that is no longer used simply age out.
+
+    Attributes:
+        directory (Path): Directory holding the entries of the current cache generation.
+        max_bytes (int): Size cap; :meth:`evict` removes the oldest entries beyond it.
+        hits (int): Number of successful lookups since creation.
+        misses (int): Number of failed lookups since creation.
+    """
+
+    def __init__(self, max_bytes: int, location: Optional[os.PathLike | str] = None):
+        """
+        Open (and create if needed) the cache for the running FLYNC release.
+
+        Args:
+            max_bytes (int): Size cap of the cache in bytes.
+            location (PathLike | str | None): Parent directory of the cache. Defaults to the FLYNC user cache directory.
+        """
+
+        self.__root = Path(location or platformdirs.user_cache_dir("FLYNC")) / PARSE_CACHE_DIRNAME
+        self.directory = self.__root / _cache_version_tag()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def content_key(text: str, needs_compose: bool) -> str:
+        """
+        Return the cache key of a document's text.
+
+        Args:
+            text (str): The raw YAML text.
+            needs_compose (bool): Whether the entry carries a position index.
+
+        Returns:
+            str: Hex digest identifying the entry.
+        """
+
+        h = hashlib.sha256(text.encode("utf-8"))
+        h.update(b"\x01" if needs_compose else b"\x00")
+        return h.hexdigest()
+
+    def __entry_path(self, key: str) -> Path:
+        return self.directory / (key + _ENTRY_SUFFIX)
+
+    def get(self, key: str) -> Optional[tuple[Any, Optional[PositionIndex]]]:
+        """
+        Look up a parsed document.
+
+        Args:
+            key (str): Key returned by :meth:`content_key`.
+
+        Returns:
+            tuple[Any, PositionIndex | None] | None: The AST and position index, or ``None`` on a miss. An unreadable
+            entry counts as a miss.
+        """
+
+        path = self.__entry_path(key)
+        try:
+            with open(path, "rb") as entry:
+                # entries are only ever written by this class, into the user's own cache directory
+                ast, positions = pickle.load(entry)
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError):
+            logger.debug("Discarding unreadable parse cache entry %s", path)
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return ast, positions
+
+    def put(self, key: str, ast: Any, positions: Optional[PositionIndex]) -> None:
+        """
+        Store a parsed document.
+
+        Failures to write (full disk, read-only cache directory) are logged and otherwise ignored: the cache only ever
+        speeds a load up and must never make it fail.
+
+        Args:
+            key (str): Key returned by :meth:`content_key`.
+            ast (Any): The safe-loaded AST.
+            positions (PositionIndex | None): The position index of the composed tree, if any.
+        """
+
+        tmp_name = None
+        try:
+            payload = pickle.dumps((ast, positions), protocol=pickle.HIGHEST_PROTOCOL)
+            with tempfile.NamedTemporaryFile(dir=self.directory, suffix=".tmp", delete=False) as tmp:
+                tmp_name = tmp.name
+                tmp.write(payload)
+            os.replace(tmp_name, self.__entry_path(key))
+            tmp_name = None
+        except (OSError, pickle.PicklingError, TypeError) as e:
+            logger.debug("Unable to store parse cache entry %s: %s", key, e)
+        finally:
+            if tmp_name is not None:
+                Path(tmp_name).unlink(missing_ok=True)
+
+    def evict(self) -> int:
+        """
+        Remove the least recently used entries, of any generation, until the cache fits in :attr:`max_bytes`.
+
+        Generation directories of other releases left empty are removed as well.
+
+        Returns:
+            int: Number of entries removed.
+        """
+
+        entries = []
+        total = 0
+        generations = [self.directory]
+        for generation in os.scandir(self.__root):
+            if generation.is_dir() and generation.path != str(self.directory):
+                generations.append(Path(generation.path))
+        for generation in generations:
+            try:
+                scanned = list(os.scandir(generation))
+            except OSError:
+                continue
+            for entry in scanned:
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, entry.path))
+                total += st.st_size
+        removed = 0
+        if total > self.max_bytes:
+            for _, size, path in sorted(entries):
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                removed += 1
+                total -= size
+                if total <= self.max_bytes:
+                    break
+        for generation in generations[1:]:
+            try:
+                generation.rmdir()
+            except OSError:
+                pass  # still holds entries, or another process uses it
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry of the current generation."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self.directory.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,103 @@
+"""
+Reverse index of the ``Reference`` bindings between the models of a workspace.
+
+:class:`ReferenceIndex` maps every referenced model to the ``(model, field)`` pairs whose
+:class:`~flync.core.annotations.reference.Reference` private attr points at it, so "find all references" costs
+``O(k)`` for ``k`` references instead of a scan of every field of every object.
+"""
+
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from pydantic import BaseModel
+
+from flync.core.annotations.reference import reference_sources, resolve_reference
+
+_BindingKey = Tuple[int, str]  # (id of the referencing model, field name)
+
+
+class ReferenceIndex(object):
+    """
+    Referencing ``(model, field)`` pairs per referenced model.
+
+    Entries are recorded with :meth:`bind`, or read off a model's private attrs with :meth:`bind_current`; the workspace
+    does the latter when a model is mapped and after every load or update. The index keeps the models of its entries
+    alive, so the object ids it is keyed by stay unique while indexed; entries of models that left the workspace are
+    dropped with :meth:`prune`.
+    """
+
+    def __init__(self):
+        """Create an empty index."""
+        # id(target) -> (id(referrer), field) -> referrer
+        self._referrers: Dict[int, Dict[_BindingKey, BaseModel]] = {}
+        # (id(referrer), field) -> target
+        self._targets: Dict[_BindingKey, BaseModel] = {}
+
+    def bind(self, referrer: BaseModel, field_name: str, target) -> None:
+        """
+        Record that field ``field_name`` of ``referrer`` references ``target``, replacing its previous target.
+
+        Only references to models are indexed; binding to ``None`` or to a collection just drops the previous entry.
+        """
+
+        key = (id(referrer), field_name)
+        previous = self._targets.pop(key, None)
+        if previous is not None:
+            self.__drop(id(previous), key)
+        if isinstance(target, BaseModel):
+            self._targets[key] = target
+            self._referrers.setdefault(id(target), {})[key] = referrer
+
+    def bind_current(self, referrer) -> None:
+        """Record the references currently bound on ``referrer``, e.g. when it was bound before being indexed."""
+        for attr, field_names in reference_sources(type(referrer)).items():
+            target = getattr(referrer, attr, None)
+            for field_name in field_names:
+                self.bind(referrer, field_name, target)
+
+    def __drop(self, target_key: int, key: _BindingKey) -> None:
+        referrers = self._referrers.get(target_key)
+        if referrers is not None:
+            referrers.pop(key, None)
+            if not referrers:
+                del self._referrers[target_key]
+
+    def referrers_of(self, target) -> List[Tuple[BaseModel, str]]:
+        """
+        Return the ``(model, field name)`` pairs referencing ``target``, in binding order.
+
+        Every entry is checked against the live private attr, so a reference re-bound behind the index's back is never
+        reported for its old target.
+        """
+
+        return [
+            (referrer, field_name)
+            for (_, field_name), referrer in self._referrers.get(id(target), {}).items()
+            if resolve_reference(referrer, field_name) is target
+        ]
+
+    def bindings(self) -> Iterator[Tuple[BaseModel, str, BaseModel]]:
+        """Yield every indexed ``(referrer, field name, target)`` triple, in binding order."""
+        for key, target in self._targets.items():
+            yield self._referrers[id(target)][key], key[1], target
+
+    def prune(self, is_live: Callable[[BaseModel], bool]) -> int:
+        """
+        Drop the entries of referencing models for which ``is_live`` is false.
+
+        Returns:
+            int: Number of entries removed.
+        """
+
+        stale = [(key, target) for key, target in self._targets.items() if not is_live(self._referrers[id(target)][key])]
+        for key, target in stale:
+            del self._targets[key]
+            self.__drop(id(target), key)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._referrers.clear()
+        self._targets.clear()
+
+    def __len__(self) -> int:
+        return len(self._targets)
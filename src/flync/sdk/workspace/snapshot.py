@@ -0,0 +1,243 @@
+"""
+Binary snapshots of a loaded workspace.
+
+A snapshot stores everything a load produced (the validated model, the diagnostics, the object map, the sources and
+the load nodes) so the same workspace can be reopened without parsing a document or running a validator. Unpickling
+restores the models as they were, private ``Reference`` attributes included.
+
+Every snapshot starts with a small header: the FLYNC release that wrote it, the workspace configuration and a
+manifest of the hashes of the workspace files. A reader checks the header against the workspace on disk first and
+only unpickles the payload when nothing changed.
+
+The snapshots kept in the FLYNC user cache directory are capped in size like the parse cache: every snapshot written
+there prunes the least recently used ones beyond :data:`SNAPSHOT_CACHE_MAX_BYTES` (see :func:`prune_snapshots`).
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import struct
+import tempfile
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import platformdirs
+
+from flync.sdk.utils.model_dependencies import flync_code_version
+
+logger = logging.getLogger(__name__)
+
+#: Sub-directory of ``platformdirs.user_cache_dir("FLYNC")`` holding the snapshots of the workspaces.
+SNAPSHOT_DIRNAME = "snapshots"
+
+#: Size cap of the snapshot directory in bytes; the least recently used snapshots are removed beyond it.
+SNAPSHOT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+#: Bumped whenever the layout of a snapshot changes, so older snapshots are never unpickled.
+_FORMAT_VERSION = 2
+
+_MAGIC = b"FLYNCSNP"
+_LENGTH = struct.Struct("<Q")
+
+
+def _flync_version() -> str:
+    """Return the tag of the running FLYNC code; the sources of an editable install are hashed on top of the release."""
+
+    return flync_code_version()
+
+
+def default_snapshot_path(workspace_root: Path) -> Path:
+    """
+    Return where the snapshot of a workspace is kept by default, in the FLYNC user cache directory.
+
+    Args:
+        workspace_root (Path): Root directory of the workspace.
+
+    Returns:
+        Path: The snapshot file, named after the hash of the absolute workspace path.
+    """
+
+    key = hashlib.sha256(str(Path(workspace_root).absolute()).encode()).hexdigest()[:16]
+    return Path(platformdirs.user_cache_dir("FLYNC")) / SNAPSHOT_DIRNAME / f"{key}.snapshot"
+
+
+def file_manifest(workspace_root: Path, extensions: tuple[str, ...]) -> dict[str, str]:
+    """
+    Hash every FLYNC document under a workspace root.
+
+    Args:
+        workspace_root (Path): Root directory of the workspace.
+        extensions (tuple[str, ...]): File name endings of FLYNC documents.
+
+    Returns:
+        dict[str, str]: SHA-256 of the content by workspace-relative path.
+    """
+
+    manifest: dict[str, str] = {}
+    for directory, _, files in os.walk(workspace_root):
+        for file_name in files:
+            if not file_name.endswith(extensions):
+                continue
+            path = Path(directory, file_name)
+            with open(path, "rb") as document:
+                manifest[path.relative_to(workspace_root).as_posix()] = hashlib.file_digest(document, "sha256").hexdigest()
+    return dict(sorted(manifest.items()))
+
+
+@dataclass
+class SnapshotHeader(object):
+    """
+    What a snapshot was written from, compared against the workspace before the snapshot is used.
+
+    Attributes:
+        format_version (int): Layout version of the snapshot file.
+        flync_version (str): FLYNC release and source hash of the writer.
+        workspace_root (str): Absolute path of the workspace.
+        configuration (dict): ``model_dump()`` of the workspace configuration.
+        manifest (dict[str, str]): Hashes of the workspace documents, see :func:`file_manifest`.
+    """
+
+    format_version: int
+    flync_version: str
+    workspace_root: str
+    configuration: dict
+    manifest: dict[str, str]
+
+    @classmethod
+    def of(cls, workspace_root: Path, configuration) -> "SnapshotHeader":
+        """
+        Describe the workspace as it is on disk now.
+
+        Args:
+            workspace_root (Path): Root directory of the workspace.
+            configuration (WorkspaceConfiguration): Configuration the workspace is loaded with.
+
+        Returns:
+            SnapshotHeader: The header a fresh snapshot of this workspace carries.
+        """
+
+        root = Path(workspace_root).absolute()
+        return cls(
+            format_version=_FORMAT_VERSION,
+            flync_version=_flync_version(),
+            workspace_root=str(root),
+            configuration=configuration.model_dump(),
+            manifest=file_manifest(root, tuple(configuration.allowed_extensions)),
+        )
+
+
+def write_snapshot(path: Path, header: SnapshotHeader, payload: Any) -> int:
+    """
+    Write a snapshot atomically (temporary file plus rename), so a reader never sees a partial one.
+
+    Args:
+        path (Path): The snapshot file.
+        header (SnapshotHeader): Description of the snapshotted workspace.
+        payload (Any): The workspace state; pickled in one go, so models shared across it stay shared.
+
+    Returns:
+        int: Size of the written snapshot in bytes.
+    """
+
+    head = pickle.dumps(header, protocol=pickle.HIGHEST_PROTOCOL)
+    body = zlib.compress(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL), 1)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_name = None
+    try:
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as tmp:
+            tmp_name = tmp.name
+            tmp.write(_MAGIC + _LENGTH.pack(len(head)) + head + body)
+        os.replace(tmp_name, path)
+        tmp_name = None
+    finally:
+        if tmp_name is not None:
+            Path(tmp_name).unlink(missing_ok=True)
+    return len(_MAGIC) + _LENGTH.size + len(head) + len(body)
+
+
+def prune_snapshots(directory: Path, keep: Optional[Path] = None, max_bytes: Optional[int] = None) -> int:
+    """
+    Remove the least recently used snapshots of a directory until they fit in ``max_bytes``.
+
+    A snapshot counts as used when it is written or restored (:func:`read_snapshot` refreshes its modification time).
+    Only ``*.snapshot`` files are considered.
+
+    Args:
+        directory (Path): The directory holding the snapshots.
+        keep (Path | None): A snapshot never removed, e.g. the one just written, even if it alone exceeds the cap.
+        max_bytes (int | None): Size cap of the snapshots in bytes. Defaults to :data:`SNAPSHOT_CACHE_MAX_BYTES`.
+
+    Returns:
+        int: Number of snapshots removed.
+    """
+
+    if max_bytes is None:
+        max_bytes = SNAPSHOT_CACHE_MAX_BYTES
+    kept = os.path.abspath(keep) if keep is not None else None
+    entries = []
+    total = 0
+    try:
+        scanned = list(os.scandir(directory))
+    except OSError:
+        return 0
+    for entry in scanned:
+        if not entry.name.endswith(".snapshot"):
+            continue
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        total += st.st_size
+        if os.path.abspath(entry.path) != kept:
+            entries.append((st.st_mtime, st.st_size, entry.path))
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        removed += 1
+        total -= size
+    return removed
+
+
+def read_snapshot(path: Path, expected: SnapshotHeader) -> Optional[Any]:
+    """
+    Read the payload of a snapshot, if it was written from the workspace described by ``expected``.
+
+    Args:
+        path (Path): The snapshot file.
+        expected (SnapshotHeader): The workspace as it is now, see :meth:`SnapshotHeader.of`.
+
+    Returns:
+        Any | None: The payload, or ``None`` when the snapshot is missing, stale or unreadable.
+    """
+
+    try:
+        with open(path, "rb") as snapshot:
+            if snapshot.read(len(_MAGIC)) != _MAGIC:
+                logger.debug("Ignoring %s: not a FLYNC snapshot", path)
+                return None
+            (length,) = _LENGTH.unpack(snapshot.read(_LENGTH.size))
+            # snapshots are only ever written by write_snapshot, into the user's own cache directory
+            header = pickle.loads(snapshot.read(length))
+            if header != expected:
+                logger.debug("Ignoring stale snapshot %s", path)
+                return None
+            payload = pickle.loads(zlib.decompress(snapshot.read()))
+        try:
+            # the modification time orders the snapshots for prune_snapshots
+            os.utime(path)
+        except OSError:
+            pass
+        return payload
+    except FileNotFoundError:
+        return None
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError, struct.error, zlib.error) as e:
+        logger.debug("Ignoring unreadable snapshot %s: %s", path, e)
+        return None
@@ -0,0 +1,156 @@
+"""
+Per-document interval index over the source ranges of the semantic objects of a workspace.
+
+:class:`SourceIndex` answers "which objects are at this position" and "which objects overlap this range" for one
+document in ``O(log n + k)`` (plus sorting the ``k`` hits innermost-first), instead of scanning every source of the
+workspace. The interval tree of a document is built on the first query after its objects changed.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Tuple
+
+from .ids import ObjectId
+from .source import Position, SourceRef
+
+#: Characters are packed below lines into one integer key; no YAML line gets anywhere near this long.
+_CHARACTER_BITS = 32
+
+_Interval = Tuple[int, int, int, ObjectId]  # (start key, end key, registration order, object id)
+
+
+def _key(line: int, character: int) -> int:
+    """Pack a position into an integer that sorts like ``(line, character)``."""
+    return (line << _CHARACTER_BITS) | character
+
+
+def _innermost_first(interval: _Interval) -> Tuple[int, int, int]:
+    """Sort key ordering nested ranges from the innermost outwards, ties in registration order."""
+    return (-interval[0], interval[1], interval[2])
+
+
+class _IntervalTree(object):
+    """
+    Static centered interval tree over the closed source ranges of one document.
+
+    Every node keeps the intervals containing its center twice, sorted by start and by end, so a query only ever
+    scans intervals it reports, plus one stop per visited node.
+    """
+
+    __slots__ = ("center", "by_start", "starts", "by_end", "ends", "left", "right")
+
+    def __init__(self, intervals: List[_Interval]):
+        """Build the tree over a non-empty list of intervals."""
+        endpoints = sorted(key for interval in intervals for key in interval[:2])
+        self.center = center = endpoints[len(endpoints) // 2]
+        here, left, right = [], [], []
+        for interval in intervals:
+            if interval[1] < center:
+                left.append(interval)
+            elif interval[0] > center:
+                right.append(interval)
+            else:
+                here.append(interval)
+        self.by_start = sorted(here, key=lambda i: i[0])
+        self.starts = [i[0] for i in self.by_start]
+        self.by_end = sorted(here, key=lambda i: i[1])
+        self.ends = [i[1] for i in self.by_end]
+        self.left = _IntervalTree(left) if left else None
+        self.right = _IntervalTree(right) if right else None
+
+    def overlapping(self, low: int, high: int) -> List[_Interval]:
+        """Return the intervals sharing at least one position with ``[low, high]``."""
+        found: List[_Interval] = []
+        pending: List[_IntervalTree] = [self]
+        while pending:
+            node = pending.pop()
+            if high < node.center:
+                found.extend(node.by_start[: bisect_right(node.starts, high)])
+                if node.left is not None:
+                    pending.append(node.left)
+            elif low > node.center:
+                found.extend(node.by_end[bisect_left(node.ends, low) :])
+                if node.right is not None:
+                    pending.append(node.right)
+            else:
+                found.extend(node.by_start)
+                pending.extend(child for child in (node.left, node.right) if child is not None)
+        return found
+
+
+class SourceIndex(object):
+    """
+    Objects of every document, with a lazily built :class:`_IntervalTree` per document.
+
+    The workspace reports every change of :attr:`~flync.sdk.workspace.flync_workspace.FLYNCWorkspace.sources` through
+    :meth:`add` and :meth:`discard`; a change only drops the tree of the affected document, which is rebuilt from that
+    document's own objects on its next query.
+    """
+
+    def __init__(self):
+        """Create an empty index."""
+        # uri -> object id -> source, in registration order
+        self._members: Dict[str, Dict[ObjectId, SourceRef]] = {}
+        self._trees: Dict[str, Optional[_IntervalTree]] = {}
+
+    def add(self, oid: ObjectId, source: SourceRef, previous: Optional[SourceRef] = None) -> None:
+        """
+        Record that ``oid`` is located at ``source``.
+
+        Args:
+            oid (ObjectId): The object id.
+            source (SourceRef): The new location of the object.
+            previous (SourceRef | None): The location the object was registered at before, if any.
+        """
+
+        if previous is not None:
+            self.discard(oid, previous)
+        self._members.setdefault(source.uri, {})[oid] = source
+        self._trees.pop(source.uri, None)
+
+    def discard(self, oid: ObjectId, source: SourceRef) -> None:
+        """Forget the location of ``oid``, registered at ``source``."""
+        members = self._members.get(source.uri)
+        if members is not None and members.pop(oid, None) is not None:
+            self._trees.pop(source.uri, None)
+
+    def clear(self) -> None:
+        """Forget every object."""
+        self._members.clear()
+        self._trees.clear()
+
+    def __tree(self, uri: str) -> Optional[_IntervalTree]:
+        if uri in self._trees:
+            return self._trees[uri]
+        intervals = [
+            (_key(src.range.start.line, src.range.start.character), _key(src.range.end.line, src.range.end.character), order, oid)
+            for order, (oid, src) in enumerate(self._members.get(uri, {}).items())
+        ]
+        tree = self._trees[uri] = _IntervalTree(intervals) if intervals else None
+        return tree
+
+    def overlapping(self, uri: str, start: Position, end: Position) -> List[ObjectId]:
+        """
+        Return the objects of document ``uri`` whose source range shares a position with ``[start, end]``.
+
+        Args:
+            uri (str): Document URI.
+            start (Position): First position of the queried range.
+            end (Position): Last position of the queried range, inclusive.
+
+        Returns:
+            list[ObjectId]: The matching objects, innermost first.
+        """
+
+        tree = self.__tree(uri)
+        if tree is None:
+            return []
+        found = tree.overlapping(_key(start.line, start.character), _key(end.line, end.character))
+        return [interval[3] for interval in sorted(found, key=_innermost_first)]
+
+    def at(self, uri: str, position: Position) -> List[ObjectId]:
+        """Return the objects of document ``uri`` whose source range contains ``position``, innermost first."""
+        return self.overlapping(uri, position, position)
+
+    def objects_in(self, uri: str) -> List[ObjectId]:
+        """Return every object of document ``uri``, in registration order."""
+        return list(self._members.get(uri, ()))
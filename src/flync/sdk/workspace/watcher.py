@@ -0,0 +1,267 @@
+"""
+Watch mode for the FLYNC workspace.
+
+:class:`WorkspaceWatcher` loads a workspace once and then polls its tree for changed, added and removed FLYNC
+documents. A burst of saves (a ``git checkout``, a code generator) is debounced into a single batch that is fed
+to the incremental reload path of :meth:`~flync.sdk.workspace.flync_workspace.FLYNCWorkspace.update_documents`,
+and every batch reports only how the diagnostics changed as a :class:`DiagnosticsDelta`.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Hashable, Optional
+
+from pydantic_core import ErrorDetails
+
+from flync.sdk.context.workspace_config import WorkspaceConfiguration
+from flync.sdk.utils.sdk_types import PathType
+
+from .flync_workspace import FLYNCWorkspace, _resolve_workspace_config
+
+logger = logging.getLogger(__name__)
+
+# upper bound on the debounce rounds of one batch, so a file that is rewritten non-stop cannot stall the watcher
+MAX_SETTLE_ROUNDS = 20
+
+FileStamp = tuple[int, int, int]
+
+
+@dataclass
+class DiagnosticsDelta(object):
+    """
+    How the diagnostics of a watched workspace changed with one batch of file changes.
+
+    Attributes:
+        changed_files (list[str]): Workspace-relative ids of the changed, added and removed documents.
+        updated_documents (list[str]): Ids of every document whose model or diagnostics were recomputed.
+        added (dict[str, list[ErrorDetails]]): Diagnostics that appeared, by document id.
+        resolved (dict[str, list[ErrorDetails]]): Diagnostics that went away, by document id.
+        elapsed (float): Wall time of the incremental update in seconds.
+    """
+
+    changed_files: list[str]
+    updated_documents: list[str] = field(default_factory=list)
+    added: dict[str, list[ErrorDetails]] = field(default_factory=dict)
+    resolved: dict[str, list[ErrorDetails]] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def unchanged(self) -> bool:
+        """Whether the batch neither added nor resolved any diagnostic."""
+        return not self.added and not self.resolved
+
+
+def diagnostic_key(error: ErrorDetails) -> Hashable:
+    """
+    Return the identity of a diagnostic when comparing two validation runs.
+
+    The line number is deliberately left out: an edit above a diagnostic moves it, but does not make it new.
+
+    Args:
+        error (ErrorDetails): A diagnostic from :attr:`FLYNCWorkspace.documents_diags`.
+
+    Returns:
+        Hashable: Type, message, location and error id of the diagnostic.
+    """
+
+    ctx = error.get("ctx") or {}
+    return error.get("type"), error.get("msg"), tuple(error.get("loc", ())), ctx.get("error_id"), str(ctx.get("yaml_path", ""))
+
+
+def diff_diagnostics(
+    before: Dict[str, list[ErrorDetails]], after: Dict[str, list[ErrorDetails]]
+) -> tuple[dict[str, list[ErrorDetails]], dict[str, list[ErrorDetails]]]:
+    """
+    Compare two ``documents_diags`` snapshots document by document.
+
+    Diagnostics are compared as multisets of :func:`diagnostic_key`, so a diagnostic reported twice and fixed once
+    shows up as resolved once.
+
+    Args:
+        before (dict[str, list[ErrorDetails]]): The diagnostics before the change.
+        after (dict[str, list[ErrorDetails]]): The diagnostics after the change.
+
+    Returns:
+        tuple[dict, dict]: The added and the resolved diagnostics, by document id.
+    """
+
+    added: dict[str, list[ErrorDetails]] = {}
+    resolved: dict[str, list[ErrorDetails]] = {}
+    for doc_id in dict.fromkeys([*before, *after]):
+        old, new = before.get(doc_id) or [], after.get(doc_id) or []
+        if not old and not new:
+            continue
+        for errors, others, delta in ((new, old, added), (old, new, resolved)):
+            remaining = Counter(diagnostic_key(error) for error in others)
+            for error in errors:
+                key = diagnostic_key(error)
+                if remaining[key]:
+                    remaining[key] -= 1
+                else:
+                    delta.setdefault(doc_id, []).append(error)
+    return added, resolved
+
+
+class WorkspaceWatcher(object):
+    """
+    Keep a FLYNC workspace loaded and revalidate it incrementally as its files change.
+
+    The watcher polls file stamps (modification time, size and inode) instead of relying on platform file-system
+    events, so it behaves the same on every OS and on network or container mounts.
+
+    Example:
+        >>> watcher = WorkspaceWatcher("examples/flync_example")
+        >>> workspace = watcher.load()
+        >>> watcher.run(lambda delta: print(delta.added, delta.resolved))  # doctest: +SKIP
+
+    Attributes:
+        workspace_path (Path): Absolute path of the watched workspace root.
+        workspace_config (PathType | WorkspaceConfiguration | None): Configuration passed to the initial load.
+        interval (float): Seconds between two polls of the tree.
+        debounce (float): Quiet period in seconds that ends a burst of changes.
+        workspace (FLYNCWorkspace | None): The loaded workspace, once :meth:`load` ran.
+    """
+
+    def __init__(
+        self,
+        workspace_path: PathType,
+        workspace_config: PathType | WorkspaceConfiguration | None = None,
+        interval: float = 0.5,
+        debounce: float = 0.2,
+        name: str = "watched_workspace",
+    ):
+        """
+        Create a watcher; nothing is loaded before :meth:`load` or :meth:`run`.
+
+        Args:
+            workspace_path (PathType): Root directory of the workspace to watch.
+            workspace_config (PathType | WorkspaceConfiguration | None): Configuration object or file for the load.
+                ``None`` auto-discovers the workspace configuration.
+            interval (float): Seconds between two polls of the tree.
+            debounce (float): Quiet period in seconds that ends a burst of changes.
+            name (str): Name of the loaded workspace.
+        """
+
+        self.workspace_path = Path(workspace_path).absolute()
+        self.workspace_config = workspace_config
+        self.interval = interval
+        self.debounce = debounce
+        self.name = name
+        self.workspace: Optional[FLYNCWorkspace] = None
+        self._extensions: tuple[str, ...] = ()
+        self._stamps: dict[str, FileStamp] = {}
+
+    def load(self) -> FLYNCWorkspace:
+        """
+        Load the workspace and record the current state of its files.
+
+        Returns:
+            FLYNCWorkspace: The loaded workspace; a failed load leaves an empty model, as with
+            :meth:`FLYNCWorkspace.safe_load_workspace`.
+        """
+
+        configuration = _resolve_workspace_config(self.workspace_path, self.workspace_config)
+        self._extensions = tuple(configuration.allowed_extensions)
+        # stamp before loading, so an edit made while the workspace loads is picked up by the first poll
+        self._stamps = self.scan()
+        self.workspace = FLYNCWorkspace.safe_load_workspace(self.name, self.workspace_path, workspace_config=configuration)
+        return self.workspace
+
+    def scan(self) -> dict[str, FileStamp]:
+        """
+        Stamp every FLYNC document under the workspace root.
+
+        Returns:
+            dict[str, FileStamp]: ``(mtime_ns, size, inode)`` by workspace-relative document id.
+        """
+
+        stamps: dict[str, FileStamp] = {}
+        for directory, _, files in os.walk(self.workspace_path):
+            for file_name in files:
+                if not file_name.endswith(self._extensions):
+                    continue
+                path = os.path.join(directory, file_name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue  # deleted while walking; the next poll reports it
+                stamps[Path(path).relative_to(self.workspace_path).as_posix()] = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        return stamps
+
+    def poll(self) -> Optional[DiagnosticsDelta]:
+        """
+        Check the tree once and, if files changed, wait for the burst to settle and apply it.
+
+        Returns:
+            DiagnosticsDelta | None: The delta of the applied batch, or ``None`` if nothing changed.
+        """
+
+        if self.workspace is None:
+            self.load()
+        current = self.scan()
+        if current == self._stamps:
+            return None
+        for _ in range(MAX_SETTLE_ROUNDS):
+            time.sleep(self.debounce)
+            settled = self.scan()
+            if settled == current:
+                break
+            current = settled
+        changed = sorted(uri for uri in current.keys() | self._stamps.keys() if current.get(uri) != self._stamps.get(uri))
+        # recorded once applied, so a batch that fails to apply is retried by the next poll
+        delta = self.apply(changed)
+        self._stamps = current
+        return delta
+
+    def apply(self, uris: list[str]) -> DiagnosticsDelta:
+        """
+        Feed a batch of changed, added and removed documents to the incremental reload.
+
+        The whole batch goes to :meth:`~flync.sdk.workspace.flync_workspace.FLYNCWorkspace.update_documents`, so
+        every ancestor shared by the changed documents is re-validated once per batch, not once per file.
+
+        Args:
+            uris (list[str]): Workspace-relative ids of the changed documents.
+
+        Returns:
+            DiagnosticsDelta: The recomputed documents and how their diagnostics changed.
+        """
+
+        workspace = self.workspace if self.workspace is not None else self.load()
+        before = {doc_id: list(errors) for doc_id, errors in workspace.documents_diags.items()}
+        started = time.perf_counter()
+        updated = workspace.update_documents(uris)
+        elapsed = time.perf_counter() - started
+        added, resolved = diff_diagnostics(before, workspace.documents_diags)
+        return DiagnosticsDelta(list(uris), updated, added, resolved, elapsed)
+
+    def run(
+        self,
+        on_delta: Callable[[DiagnosticsDelta], None],
+        stop: Optional[threading.Event] = None,
+    ) -> None:
+        """
+        Poll the tree until ``stop`` is set, reporting every applied batch to ``on_delta``.
+
+        Args:
+            on_delta (Callable[[DiagnosticsDelta], None]): Called with the delta of every batch of changes.
+            stop (threading.Event | None): Ends the loop once set; without one, the loop runs until interrupted.
+        """
+
+        stop = stop or threading.Event()
+        if self.workspace is None:
+            self.load()
+        while not stop.is_set():
+            try:
+                delta = self.poll()
+            except Exception:
+                logger.exception("watch: applying the changes under %s failed", self.workspace_path)
+                delta = None
+            if delta is not None:
+                on_delta(delta)
+            stop.wait(self.interval)
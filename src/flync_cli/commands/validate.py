@@ -3,14 +3,17 @@
 import sys
 import time
 from pathlib import Path
+from typing import Optional
 
 import typer
 from rich.console import Console
 from typing_extensions import Annotated
 
+from flync.core.utils.validation_profile import ValidationProfile
 from flync.sdk.context.diagnostics_result import WorkspaceState
-from flync.sdk.helpers.validation_helpers import validate_external_node, validate_workspace
+from flync.sdk.helpers.validation_helpers import validate_external_node, validate_subtree, validate_workspace
 from flync_cli.utils.error_table import print_validation_result
+from flync_cli.utils.profile_table import print_profile
 
 console = Console(force_terminal=True, legacy_windows=False)
 app = typer.Typer()
@@ -27,8 +30,32 @@ def validate(
     node: Annotated[
         str, typer.Option("--node", "-n", help="Node type name to validate via validate_external_node. Omit to validate the full workspace.")
     ] = "",
+    subtree: Annotated[
+        str,
+        typer.Option(
+            "--subtree",
+            "-s",
+            help="Object path of a subtree to validate on its own, e.g. ecus.my_ecu. Root-level checks are skipped.",
+        ),
+    ] = "",
     config_name: Annotated[str, typer.Option("--config", "-c", help="Name of configuration.")] = "flync_config",
+    no_snapshot: Annotated[
+        bool, typer.Option("--no-snapshot", help="Always load and validate the workspace, ignoring and not writing its snapshot.")
+    ] = False,
     quiet: Annotated[bool, typer.Option("--quiet", "-q", help="Only show final result of the validation.")] = False,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            "--profile",
+            help="Time the phases, documents and model validators of the validation and print the slowest. Implies --no-snapshot.",
+        ),
+    ] = False,
+    profile_memory: Annotated[
+        bool, typer.Option("--profile-memory", help="Also record the peak memory of every profiled entry (slower). Implies --profile.")
+    ] = False,
+    profile_json: Annotated[
+        Optional[Path], typer.Option("--profile-json", help="Write the full profile as JSON to this file. Implies --profile.")
+    ] = None,
 ):
     """Validate a FLYNC model at the given path, optionally suppressing output."""
 
@@ -38,15 +65,32 @@ def validate(
         print(f"Error: Path does not exist: {path}", file=sys.stderr)
         sys.exit(1)
 
+    validation_profile = ValidationProfile(trace_memory=profile_memory) if profile or profile_memory or profile_json else None
+
     console.print(f"-- Validating {config_name} ... --")
     start = time.monotonic()
 
-    result = validate_external_node(node, resolved_path) if node else validate_workspace(resolved_path)
+    if subtree:
+        result = validate_subtree(resolved_path, subtree, profile=validation_profile)
+    elif node:
+        result = validate_external_node(node, resolved_path, profile=validation_profile)
+    else:
+        # a workspace restored from its snapshot is not validated, so its profile would be empty
+        use_snapshot = not no_snapshot and validation_profile is None
+        result = validate_workspace(resolved_path, use_snapshot=use_snapshot, profile=validation_profile)
 
     console.print(f">>> Elapsed time to load: {time.monotonic() - start:.2f}s")
 
+    if validation_profile is not None:
+        print_profile(validation_profile, console)
+        if profile_json is not None:
+            validation_profile.write_json(profile_json)
+            console.print(f"Profile written to {profile_json}", highlight=False)
+
     if not quiet:
         print_validation_result(result)
+        if result.skipped_checks:
+            console.print(f"[dim]Skipped {len(result.skipped_checks)} root-level checks: {', '.join(result.skipped_checks)}[/dim]", highlight=False)
 
     has_errors = any(err.get("type") != "warning" for errs in result.errors.values() for err in errs)
 
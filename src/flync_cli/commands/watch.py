@@ -0,0 +1,95 @@
+"""``flync watch`` command: keeps a FLYNC workspace loaded and revalidates it as its files change."""
+
+import sys
+import time
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from typing_extensions import Annotated
+
+from flync.sdk.context.diagnostics_result import DiagnosticsResult, WorkspaceState
+from flync.sdk.helpers.validation_helpers import _state_and_errors
+from flync.sdk.workspace.flync_workspace import FLYNCWorkspace
+from flync.sdk.workspace.watcher import DiagnosticsDelta, WorkspaceWatcher
+from flync_cli.utils.error_table import _format_source, print_validation_result, sanitize_error_message
+
+console = Console(force_terminal=True, legacy_windows=False)
+app = typer.Typer()
+
+
+def print_diagnostics_delta(delta: DiagnosticsDelta) -> None:
+    """Print the diagnostics that a batch of file changes added (``+``) and resolved (``-``)."""
+    files = ", ".join(delta.changed_files[:3]) + (f" and {len(delta.changed_files) - 3} more" if len(delta.changed_files) > 3 else "")
+    console.print(
+        f"\n[bold]{files}[/bold] [dim]changed, {len(delta.updated_documents)} document(s) revalidated in {delta.elapsed:.2f}s[/dim]",
+        highlight=False,
+    )
+    if delta.unchanged:
+        console.print("  [dim]no change in diagnostics[/dim]")
+        return
+    for sign, color, errors_by_doc in (("+", "red", delta.added), ("-", "green", delta.resolved)):
+        for doc_uri, errors in errors_by_doc.items():
+            for err in errors:
+                raw_ctx = err.get("ctx") or {}
+                line_color = "yellow" if sign == "+" and err.get("type") == "warning" else color
+                console.print(
+                    f"  [{line_color}]{sign} {raw_ctx.get('error_id') or err.get('type', '')}[/{line_color}] "
+                    f"{sanitize_error_message(err.get('msg', ''))} [cyan]({_format_source(doc_uri, raw_ctx)})[/cyan]",
+                    highlight=False,
+                )
+
+
+def _verdict(workspace: FLYNCWorkspace) -> str:
+    """Summarize the watched workspace as ``flync validate`` reports the same workspace."""
+    state, errors = _state_and_errors(workspace)
+    if state is not WorkspaceState.VALID and any(err.get("type") != "warning" for errs in errors.values() for err in errs):
+        color = "bold red"
+    elif state is WorkspaceState.WARNING:
+        color = "bold yellow"
+    else:
+        color = "bold green"
+    return f"[{color}] {state.upper()} [/{color}]"
+
+
+@app.command(help="Validate a FLYNC workspace, then revalidate it incrementally whenever its files change.")
+def watch(
+    path: Annotated[
+        str,
+        typer.Argument(
+            help="Path to FLYNC config directory",
+        ),
+    ],
+    interval: Annotated[float, typer.Option("--interval", "-i", help="Seconds between two checks of the files.")] = 0.5,
+    debounce: Annotated[float, typer.Option("--debounce", "-d", help="Quiet period in seconds that ends a burst of saves.")] = 0.2,
+    quiet: Annotated[bool, typer.Option("--quiet", "-q", help="Do not list the diagnostics of the initial load.")] = False,
+):
+    """Load the workspace at ``path`` once and print the diagnostics delta of every later change until interrupted."""
+
+    resolved_path = Path(path).resolve()
+
+    if not resolved_path.exists():
+        print(f"Error: Path does not exist: {path}", file=sys.stderr)
+        sys.exit(1)
+
+    console.print(f"-- Watching {resolved_path} ... --")
+    start = time.monotonic()
+    watcher = WorkspaceWatcher(resolved_path, interval=interval, debounce=debounce)
+    workspace = watcher.load()
+    console.print(f">>> Elapsed time to load: {time.monotonic() - start:.2f}s")
+
+    if not quiet:
+        state, errors = _state_and_errors(workspace)
+        print_validation_result(DiagnosticsResult(state=state, errors=errors))
+    console.print(f">>> Validation Result: {_verdict(workspace)}")
+
+    def report(delta: DiagnosticsDelta) -> None:
+        """Print one batch and the resulting workspace state."""
+        print_diagnostics_delta(delta)
+        console.print(f">>> Validation Result: {_verdict(workspace)}")
+
+    console.print("[dim]Waiting for changes, press Ctrl+C to stop.[/dim]")
+    try:
+        watcher.run(report)
+    except KeyboardInterrupt:
+        console.print("\n-- Stopped watching --")
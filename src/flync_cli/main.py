@@ -1,20 +1,84 @@
 """Assembles the FLYNC Typer application and its sub-commands."""
 
+import importlib
 import logging
+import os
 from importlib import metadata
+from typing import Any
 
 import typer
+import typer.main
 from rich import print as rprint
+from typer.core import TyperCommand, TyperGroup
+
+# Sub-commands by name: the module defining them and their help. The modules are only imported when their command
+# runs, so ``flync --help``, ``flync errors`` and shell completion do not build the FLYNC model.
+COMMANDS: dict[str, tuple[str, str]] = {
+    "validate": ("flync_cli.commands.validate", "Validate a FLYNC Model or parts of a Model."),
+    "watch": ("flync_cli.commands.watch", "Validate a FLYNC workspace, then revalidate it incrementally whenever its files change."),
+    "info": ("flync_cli.commands.info", "Display model information in a structured and user-friendly format."),
+    "display-vlan-info": (
+        "flync_cli.commands.vlan_info",
+        "Display the controllers, switch ports and IPs that are part of one VLAN for the system or an ECU.",
+    ),
+    "generate-system-uml": (
+        "flync_cli.commands.generate_system_uml",
+        "Generate a UML representation of a given system configuration. Java (JRE 11+) must be on your PATH for PlantUML rendering to work.",
+    ),
+    "display-service-info": ("flync_cli.commands.service_info", "Display all details related to a SOME/IP service deployment"),
+    "debug": ("flync_cli.commands.debug_flync", "Run layered validation to debug a FLYNC model step by step"),
+    "display-repo-structure": ("flync_cli.commands.debug_flync", "Display the repo structure of the current FLYNC model"),
+    "errors": ("flync_cli.commands.errors", "Inspect and maintain the FLYNC error catalog."),
+}
+
+
+class LazyCommand(TyperCommand):
+    """Stand-in for a sub-command of :data:`COMMANDS` whose module was not imported yet; it only knows its help."""
+
+    def __init__(self, name: str, module: str, help: str):
+        super().__init__(name, help=help)
+        self.module = module
+
+    def load(self) -> Any:
+        """
+        Import the module of the command and build the real command.
+
+        A module either defines commands of the top-level application (its Typer app is merged into it) or is a
+        command group of its own, like ``flync errors``.
+
+        Returns:
+            click.Command: The command, or the command group, named like this stand-in.
+        """
+        group = typer.main.get_group(importlib.import_module(self.module).app)
+        if self.name in group.commands:
+            return group.commands[self.name]
+        group.name = self.name
+        return group
+
+
+class LazyCommandGroup(TyperGroup):
+    """The top-level ``flync`` group, holding a :class:`LazyCommand` per sub-command until it is resolved.
+
+    Tools that walk the whole command tree without running a command, like ``typer ... utils docs``, set the
+    ``FLYNC_CLI_EAGER_COMMANDS`` environment variable to get the real commands right away.
+    """
+
+    def __init__(self, **attrs: Any):
+        super().__init__(**attrs)
+        eager = bool(os.environ.get("FLYNC_CLI_EAGER_COMMANDS"))
+        for name, (module, help) in COMMANDS.items():
+            command = LazyCommand(name, module, help)
+            self.add_command(command.load() if eager else command, name)
+
+    def resolve_command(self, ctx: typer.Context, args: list[str]) -> tuple[Any, Any, list[str]]:
+        name, command, args = super().resolve_command(ctx, args)
+        if isinstance(command, LazyCommand):
+            command = self.commands[name] = command.load()
+        return name, command, args
 
-from flync_cli.commands.debug_flync import app as debug
-from flync_cli.commands.errors import app as errors_app
-from flync_cli.commands.generate_system_uml import app as generate_uml
-from flync_cli.commands.info import app as display_info
-from flync_cli.commands.service_info import app as service_info
-from flync_cli.commands.validate import app as validate_app
-from flync_cli.commands.vlan_info import app as display_vlan_info
 
 app = typer.Typer(
+    cls=LazyCommandGroup,
     help="FLYNC CLI tool for validating the model, visually displaying the relevant information and generating system UML diagrams",
     context_settings={"allow_extra_args": True},
     add_completion=True,
@@ -22,14 +86,6 @@ app = typer.Typer(
 )
 logger = logging.getLogger(__name__)
 
-app.add_typer(validate_app)
-app.add_typer(display_info)
-app.add_typer(display_vlan_info)
-app.add_typer(generate_uml)
-app.add_typer(service_info)
-app.add_typer(debug)
-app.add_typer(errors_app, name="errors")
-
 
 @app.callback(invoke_without_command=True)
 def main(
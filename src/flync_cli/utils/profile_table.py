@@ -0,0 +1,42 @@
+"""
+Renders a :class:`~flync.core.utils.validation_profile.ValidationProfile` as a rich table on the console.
+
+:func:`print_profile` is used by ``flync validate --profile``; it lists the slowest phases, documents and model
+validators first. The full profile is available through ``--profile-json``.
+"""
+
+from rich.console import Console
+from rich.table import Table
+
+from flync.core.utils.validation_profile import ValidationProfile
+
+KIND_STYLES = {"phase": "bold cyan", "document": "green", "validator": "magenta"}
+
+
+def build_profile_table(profile: ValidationProfile, limit: int = 30) -> Table:
+    """Build the table of the ``limit`` slowest entries of ``profile``."""
+    table = Table(title=f"Validation profile ({profile.seconds:.2f}s)", show_lines=False)
+    table.add_column("Kind", no_wrap=True)
+    table.add_column("Name", overflow="fold")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total s", justify="right")
+    table.add_column("Mean ms", justify="right")
+    table.add_column("% of total", justify="right")
+    if profile.trace_memory:
+        table.add_column("Peak KiB", justify="right")
+    for entry in profile.sorted_entries()[:limit]:
+        share = 100 * entry.seconds / profile.seconds if profile.seconds else 0.0
+        mean = 1000 * entry.seconds / entry.calls if entry.calls else 0.0
+        row = [entry.kind, entry.name, str(entry.calls), f"{entry.seconds:.3f}", f"{mean:.2f}", f"{share:.1f}"]
+        if profile.trace_memory:
+            row.append("" if entry.peak_bytes is None else f"{entry.peak_bytes / 1024:.1f}")
+        table.add_row(*row, style=KIND_STYLES.get(entry.kind))
+    return table
+
+
+def print_profile(profile: ValidationProfile, console: Console, limit: int = 30) -> None:
+    """Print the ``limit`` slowest entries of ``profile``, and how many were left out."""
+    console.print(build_profile_table(profile, limit))
+    hidden = len(profile.entries) - limit
+    if hidden > 0:
+        console.print(f"[dim]{hidden} faster entries not shown; write them all with --profile-json.[/dim]", highlight=False)
@@ -8,7 +8,6 @@ import logging
 from pathlib import Path
 
 from .base import BaseConverter, ConverterConfig
-from .converters import FLYNCConverter, JsonConverter, YamlConverter
 from .registry import registry
 
 logger = logging.getLogger(__name__)
@@ -122,3 +121,12 @@ __all__ = [
     "Converter",
     "convert",
 ]
+
+
+def __getattr__(name):
+    # the built-in converter classes are imported on first access, see flync_converter.converters
+    if name in ("YamlConverter", "JsonConverter", "FLYNCConverter"):
+        from . import converters
+
+        return getattr(converters, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,13 +7,16 @@ The BaseConverter methods are documented in Google docstring style so that
 IDE help and generated docs show parameter and return contracts clearly.
 """
 
-from abc import ABC, abstractmethod
-from typing import Optional
+from __future__ import annotations
 
-from flync.model import FLYNCModel  # type: ignore[import-untyped]
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Optional
 
 from .converter_config import ConverterConfig
 
+if TYPE_CHECKING:
+    from flync.model import FLYNCModel  # type: ignore[import-untyped]
+
 """Base classes for converters between :class:`FLYNCModel` and other
 representations.
 
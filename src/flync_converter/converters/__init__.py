@@ -1,8 +1,22 @@
-"""Built-in FLYNC converters for YAML, JSON, DBC and native FLYNC files."""
+"""Built-in FLYNC converters for YAML, JSON, DBC and native FLYNC files.
 
-from .dbc_converter import DbcConverter
-from .flync_converter import FLYNCConverter
-from .json_converter import JsonConverter
-from .yaml_converter import YamlConverter
+The converter classes are imported on first access, so using one converter does not import the dependencies of the
+others (e.g. cantools for :class:`DbcConverter`).
+"""
+
+import importlib
+
+_MODULES = {
+    "JsonConverter": ".json_converter",
+    "YamlConverter": ".yaml_converter",
+    "FLYNCConverter": ".flync_converter",
+    "DbcConverter": ".dbc_converter",
+}
 
 __all__ = ["JsonConverter", "YamlConverter", "FLYNCConverter", "DbcConverter"]
+
+
+def __getattr__(name):
+    if name in _MODULES:
+        return getattr(importlib.import_module(_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
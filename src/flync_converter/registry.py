@@ -1,5 +1,6 @@
 """Plugin registry that discovers and instantiates FLYNC converter factories."""
 
+import importlib
 import logging
 
 import pluggy
@@ -14,23 +15,53 @@ hookimpl = pluggy.HookimplMarker("flync_converter")
 pm = pluggy.PluginManager("flync_converter")
 pm.add_hookspecs(__import__("flync_converter.hookspec").hookspec)
 
+BUILTIN_CONVERTERS = {
+    "json": "flync_converter.converters.json_converter",
+    "yaml": "flync_converter.converters.yaml_converter",
+    "flync": "flync_converter.converters.flync_converter",
+    "dbc": "flync_converter.converters.dbc_converter",
+}
+"""Modules of the built-in converters, by converter name."""
+
 
 class ConverterFactoryRegistry(dict[str, BaseConverter]):
-    """Registry mapping converter names to their BaseConverter instances."""
+    """Registry mapping converter names to their BaseConverter instances.
+
+    The built-in converters are registered by name only; the module of one is imported, registered with pluggy and
+    instantiated the first time the converter is looked up, so listing the converter names or running one converter
+    does not import the others (and their dependencies, e.g. cantools for ``dbc``).
+    """
+
+    def __getitem__(self, name: str) -> BaseConverter:
+        conv = super().__getitem__(name)
+        return conv if conv is not None else self._load_builtin(name)
+
+    def get(self, name: str, default=None):
+        """Return the converter registered as ``name``, loading a built-in one, or ``default``."""
+        return self[name] if name in self else default
+
+    def values(self):
+        """Return all registered converters, loading the built-in ones not used yet."""
+        return [self[name] for name in self]
+
+    def items(self):
+        """Return (name, converter) pairs of all registered converters, loading the built-in ones not used yet."""
+        return [(name, self[name]) for name in self]
 
     def load_builtin(self):
-        """Register the built-in json, yaml, flync, and dbc converters via pluggy."""
-        from .converters import dbc_converter, flync_converter, json_converter, yaml_converter
-
-        for mod in (json_converter, yaml_converter, flync_converter, dbc_converter):
-            if not pm.is_registered(mod):
-                logger.debug("Registering built-in plugin: %s", mod.__name__)
-                pm.register(mod)
-            else:
-                logger.debug(
-                    "Built-in plugin already registered, skipping: %s",
-                    mod.__name__,
-                )
+        """Register the names of the built-in json, yaml, flync, and dbc converters; they are loaded on first use."""
+        for name in BUILTIN_CONVERTERS:
+            self.setdefault(name, None)  # type: ignore[arg-type]
+
+    def _load_builtin(self, name: str) -> BaseConverter:
+        mod = importlib.import_module(BUILTIN_CONVERTERS[name])
+        if not pm.is_registered(mod):
+            logger.debug("Registering built-in plugin: %s", mod.__name__)
+            pm.register(mod)
+        for conv in mod.register_converters():
+            logger.debug("Registering converter: %s (from %s)", conv.name, mod.__name__)
+            super().__setitem__(conv.name, conv)
+        return super().__getitem__(name)
 
     def load_plugins(self):
         """Load built-in converters and discover entry-point plugins, populating the registry."""
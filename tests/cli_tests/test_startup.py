@@ -0,0 +1,62 @@
+"""
+Startup regression tests: ``flync`` must start without importing its commands, so that ``flync --help``,
+``flync errors`` and shell completion do not pay for building the FLYNC model.
+"""
+
+import subprocess
+import sys
+
+import pytest
+import typer.main
+from typer.testing import CliRunner
+
+from flync_cli.main import COMMANDS, LazyCommand, app
+
+HEAVY_MODULES = ("flync.model", "flync.sdk.workspace.flync_workspace", "cantools")
+# building the FLYNC model alone takes longer than this
+STARTUP_BUDGET = 0.75
+
+
+def _fresh_import(module: str) -> tuple[float, list[str]]:
+    """Import ``module`` in a new interpreter; return the import time and the heavy modules it pulled in."""
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"print(elapsed, *[name for name in {HEAVY_MODULES!r} if name in sys.modules])\n"
+    )
+    elapsed, *loaded = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.split()
+    return float(elapsed), loaded
+
+
+@pytest.mark.parametrize("module", ["flync_cli.main", "flync_cli.commands.errors"])
+def test_startup_does_not_import_the_model(module):
+    assert _fresh_import(module)[1] == []
+
+
+def test_startup_time():
+    # best of three, to be robust against a busy machine
+    assert min(_fresh_import("flync_cli.main")[0] for _ in range(3)) < STARTUP_BUDGET
+
+
+def test_help_lists_every_command_with_its_real_help():
+    result = CliRunner().invoke(app, ["--help"], terminal_width=200)
+    assert result.exit_code == 0
+    for name, (module, help) in COMMANDS.items():
+        assert name in result.output
+        assert LazyCommand(name, module, help).load().help == help, f"update the help of {name!r} in flync_cli.main.COMMANDS"
+
+
+def test_invoked_command_is_loaded():
+    result = CliRunner().invoke(app, ["errors", "validate-catalog", "--help"])
+    assert result.exit_code == 0
+    assert "Usage: root errors validate-catalog" in result.output
+
+
+def test_eager_commands_for_the_docs(monkeypatch):
+    monkeypatch.setenv("FLYNC_CLI_EAGER_COMMANDS", "1")
+    commands = typer.main.get_group(app).commands
+    assert list(commands) == list(COMMANDS)
+    assert not any(isinstance(command, LazyCommand) for command in commands.values())
+    assert "generate-catalog" in commands["errors"].commands
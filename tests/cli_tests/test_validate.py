@@ -1,5 +1,6 @@
 """Tests for the validate CLI command and validate helper."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -82,3 +83,37 @@ class TestValidateCommand:
     def test_invalid_level_is_rejected(self, tmp_path):
         result = runner.invoke(app, ["NotALevel", str(tmp_path)])
         assert result.exit_code != 0
+
+
+class TestValidateProfile:
+    @staticmethod
+    def _validate_workspace(path, use_snapshot, profile):
+        from flync.core.utils.validation_profile import profile_scope
+        from flync.sdk.context.diagnostics_result import DiagnosticsResult, WorkspaceState
+
+        with profile.activate(), profile_scope("phase", "load"), profile_scope("document", "ecus/ecu.flync.yaml"):
+            pass
+        return DiagnosticsResult(state=WorkspaceState.VALID, errors={}, model=None, workspace=None)
+
+    def test_profile_prints_table_and_skips_snapshot(self, tmp_path):
+        with patch("flync_cli.commands.validate.validate_workspace", side_effect=self._validate_workspace) as mocked:
+            result = runner.invoke(app, [str(tmp_path), "--profile", "--quiet"])
+        assert mocked.call_args.kwargs["use_snapshot"] is False
+        assert "Validation profile" in result.output
+        assert "ecus/ecu.flync.yaml" in result.output
+        assert "Peak KiB" not in result.output
+
+    def test_profile_json_writes_every_entry(self, tmp_path):
+        report = tmp_path / "profile.json"
+        with patch("flync_cli.commands.validate.validate_workspace", side_effect=self._validate_workspace):
+            result = runner.invoke(app, [str(tmp_path), "--profile-memory", "--profile-json", str(report), "--quiet"])
+        assert "Peak KiB" in result.output
+        data = json.loads(report.read_text())
+        assert data["trace_memory"] is True
+        assert [(e["kind"], e["name"]) for e in data["entries"]][:1] == [("phase", "load")]
+
+    def test_without_profile_no_profile_is_passed(self, tmp_path):
+        with patch("flync_cli.commands.validate.validate_workspace", return_value=MagicMock(errors={})) as mocked:
+            runner.invoke(app, [str(tmp_path), "--quiet"])
+        assert mocked.call_args.kwargs["profile"] is None
+        assert mocked.call_args.kwargs["use_snapshot"] is True
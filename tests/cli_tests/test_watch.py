@@ -0,0 +1,78 @@
+"""Tests for the watch CLI command."""
+
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from flync.sdk.workspace.watcher import DiagnosticsDelta
+from flync_cli.commands.watch import app, print_diagnostics_delta
+
+runner = CliRunner()
+
+BROKEN_REFERENCE = {"type": "major", "msg": "ECU port 'z1_p1' was not found.", "loc": (), "ctx": {"error_id": "FLYNC-TOP-ERR-REF-164"}}
+SPEED_WARNING = {"type": "warning", "msg": "Port speeds differ.", "loc": (), "ctx": {"error_id": "FLYNC-ECU-WARN-CONS-211"}}
+
+
+def _delta():
+    return DiagnosticsDelta(
+        changed_files=["ecus/zonal_platform1/ports.flync.yaml"],
+        updated_documents=["ecus/zonal_platform1/ports.flync.yaml", "ecus/zonal_platform1", "."],
+        added={"ecus/zonal_platform1": [BROKEN_REFERENCE]},
+        resolved={".": [SPEED_WARNING]},
+        elapsed=0.25,
+    )
+
+
+class TestPrintDiagnosticsDelta:
+    def test_prints_added_and_resolved(self, capsys):
+        print_diagnostics_delta(_delta())
+        out = capsys.readouterr().out
+        assert "+ FLYNC-TOP-ERR-REF-164" in out
+        assert "- FLYNC-ECU-WARN-CONS-211" in out
+        assert "3 document(s) revalidated" in out
+
+    def test_prints_unchanged_batches(self, capsys):
+        print_diagnostics_delta(DiagnosticsDelta(changed_files=[f"ecus/ecu_{index}.flync.yaml" for index in range(5)]))
+        out = capsys.readouterr().out
+        assert "and 2 more" in out
+        assert "no change in diagnostics" in out
+
+
+class TestWatchCommand:
+    def test_missing_path_exits_with_error(self, tmp_path):
+        result = runner.invoke(app, [str(tmp_path / "missing")])
+        assert result.exit_code == 1
+
+    def test_reports_deltas_until_interrupted(self, tmp_path):
+        workspace = MagicMock()
+        workspace.documents_diags = {"ecus/zonal_platform1": []}
+
+        def run(on_delta):
+            workspace.documents_diags["ecus/zonal_platform1"] = [BROKEN_REFERENCE]
+            on_delta(_delta())
+            raise KeyboardInterrupt
+
+        with patch("flync_cli.commands.watch.WorkspaceWatcher") as watcher_cls:
+            watcher_cls.return_value.load.return_value = workspace
+            watcher_cls.return_value.run.side_effect = run
+            result = runner.invoke(app, [str(tmp_path), "--debounce", "0.5"])
+
+        assert result.exit_code == 0
+        assert watcher_cls.call_args.kwargs["debounce"] == 0.5
+        assert "VALID" in result.output
+        assert "+ FLYNC-TOP-ERR-REF-164" in result.output
+        # the model still loaded, so ``flync validate`` reports the same workspace as WARNING
+        assert "WARNING" in result.output
+        assert "INVALID" not in result.output
+        assert "Stopped watching" in result.output
+
+    def test_reports_invalid_without_a_model(self, tmp_path):
+        workspace = MagicMock(flync_model=None)
+        workspace.documents_diags = {".": [BROKEN_REFERENCE]}
+
+        with patch("flync_cli.commands.watch.WorkspaceWatcher") as watcher_cls:
+            watcher_cls.return_value.load.return_value = workspace
+            watcher_cls.return_value.run.side_effect = KeyboardInterrupt
+            result = runner.invoke(app, [str(tmp_path), "--quiet"])
+
+        assert "INVALID" in result.output
@@ -0,0 +1,27 @@
+import subprocess
+import sys
+
+from flync_converter.converters.dbc_converter import DbcConverter
+from flync_converter.registry import BUILTIN_CONVERTERS, ConverterFactoryRegistry
+
+
+def test_builtin_converters_are_loaded_on_first_use():
+    registry = ConverterFactoryRegistry()
+    registry.load_builtin()
+    assert list(registry) == list(BUILTIN_CONVERTERS)
+    assert isinstance(registry["dbc"], DbcConverter)
+    assert registry["dbc"] is registry.get("dbc")
+    assert [conv.name for conv in registry.values()] == list(BUILTIN_CONVERTERS)
+    assert registry.get("missing") is None
+
+
+def test_registering_the_converters_does_not_import_them():
+    code = (
+        "import sys\n"
+        "from flync_converter.cli import main\n"
+        "from flync_converter.registry import registry\n"
+        "registry.load_plugins()\n"
+        "assert registry['json'].name == 'json'\n"
+        "print(*[name for name in ('cantools', 'flync_converter.converters.dbc_converter') if name in sys.modules])\n"
+    )
+    assert subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.strip() == ""
@@ -63,6 +63,17 @@ def test_canonical_workspace_exposes_pdu_forwarder(loaded_canonical_workspace):
     assert len(fwd.egresses) == 2
 
 
+def test_canonical_forwarder_graph(loaded_canonical_workspace):
+    """Both canonical forwarders end in plain senders, so the exported graph has two isolated, acyclic nodes."""
+
+    model = loaded_canonical_workspace.flync_model
+    graph = model.get_forwarder_graph()
+    assert [node.forwarder for node in graph.nodes] == model.get_all_pdu_forwarders() + model.get_all_can_frame_forwarders()
+    assert graph.nodes[1].locator == "controllers/hpc_controller1/can_interfaces/PowertrainCAN/forwarder_frames/Frame_EngineStatus"
+    assert [(graph.fan_in(i), graph.fan_out(i)) for i in range(len(graph.nodes))] == [(0, 0), (0, 0)]
+    assert graph.cycles() == []
+
+
 def test_canonical_scenario_3_eth_to_can_with_extraction(loaded_canonical_workspace):
     """The PDU forwarder extracts PDU_EngineStatus from EthPowertrainContainer and re-emits on DiagCAN."""
 
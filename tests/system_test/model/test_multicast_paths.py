@@ -1,7 +1,8 @@
 import shutil
 from pathlib import Path
 
-from flync.core.utils.base_utils import read_yaml
+from flync.core.utils.base_utils import check_obj_in_list, read_yaml
+from flync.core.utils.multicast import MulticastPathIndex, compute_path
 from flync.model.flync_4_ecu import SocketContainer, Switch
 from flync.sdk.workspace.flync_workspace import FLYNCWorkspace
 from tests.system_test.sdk.helper import update_yaml_content
@@ -87,3 +88,17 @@ def test_switch_flooded(tmpdir):
         if v.id == 40:
             mcast_addresses = [str(m.address) for m in v.multicast]
             assert "224.0.0.1" in mcast_addresses
+
+
+def test_multicast_path_index_matches_list_based_membership(example_workspace_path):
+    model = FLYNCWorkspace.load_workspace("flync_example", example_workspace_path).flync_model
+    index = MulticastPathIndex()
+    groups = [(ecu, mcast) for ecu in model.ecus for mcast in ecu.multicast_groups]
+    assert groups
+    for _, mcast in groups:
+        path = compute_path(mcast.vlan, mcast._interface, index)
+        # memoized per (VLAN, start component) and identical to a fresh walk
+        assert compute_path(mcast.vlan, mcast._interface, index) is path
+        assert [c.name for c in compute_path(mcast.vlan, mcast._interface)] == [c.name for c in path]
+        for _, other in groups:
+            assert index.path_contains(path, other._interface) == check_obj_in_list(other._interface, path)
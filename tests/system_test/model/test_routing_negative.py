@@ -3,6 +3,7 @@ from ipaddress import IPv4Address
 import pytest
 from pydantic import ValidationError
 
+from flync.core.utils.exceptions_handling import validate_with_policy
 from flync.model.flync_4_bus.can_bus import CANBus
 from flync.model.flync_4_communication.flync_channels import FLYNCChannelConfig
 from flync.model.flync_4_communication.flync_communication import FLYNCCommunicationConfig
@@ -508,3 +509,50 @@ def test_forwarding_can_to_ethernet_with_extract_pdu_ref_not_containerPDU():
     with pytest.raises(ValidationError) as exc_info:
         FLYNCModel(ecus=[ecu], topology=topology, metadata=metadata, communication=communication)
     assert_single_error(exc_info, "FLYNC-CMN-MIN-CONS-035", "is only valid when ingress is a ContainerPDU")
+
+
+def test_every_forwarder_cycle_is_reported():
+    """
+    Reports one error per forwarding loop of the workspace, each with the single Source path of its loop.
+    """
+    interfaces = []
+    can_buses = []
+    for bus in ("CAN1", "CAN2"):
+        frame = CANFrame(name=f"Status_{bus}", length=8, can_id=0x100, id_format="standard_11bit", is_remote_frame=False)
+        can_buses.append(CANBus(name=bus, baud_rate=10000, frames=[frame]))
+        forwarder = CANFrameForwarder(
+            frame_ref=frame.name, egresses=[ForwarderEgress(root=CANFrameEgress(egress_type="can_frame", bus_ref=bus, frame_ref=0x100))]
+        )
+        interfaces.append(
+            CANInterface(
+                name=f"IF_{bus}",
+                bus_ref=bus,
+                receiver_frames=[],
+                forwarder_frames=[forwarder],
+                sender_frames=[CANFrameRef(bus_ref=bus, frame_ref=0x100)],
+            )
+        )
+    controller = Controller(
+        name="CTRL1",
+        controller_metadata=_make_controller_metadata(),
+        can_interfaces=interfaces,
+        ethernet_interfaces=[],
+    )
+    ecu = ECU(name="ECU1", controllers=[controller], topology=InternalTopology(), ecu_metadata=_make_ecu_metadata())
+    communication = FLYNCCommunicationConfig(channels=FLYNCChannelConfig(can_buses=can_buses))
+    data = {"ecus": [ecu], "topology": _make_empty_topology(), "metadata": _make_system_metadata(), "communication": communication}
+
+    # the workspace loader validates through validate_with_policy, which must keep every error of the root validator
+    _, policy_errors = validate_with_policy(FLYNCModel, dict(data), "")
+    with pytest.raises(ValidationError) as exc_info:
+        FLYNCModel(**data)
+    errors = exc_info.value.errors()
+    assert [error["msg"] for error in policy_errors] == [error["msg"] for error in errors]
+    assert [error["ctx"]["error_id"] for error in errors] == ["FLYNC-CMN-MAJ-STRUCT-047"] * 2
+    assert [error["msg"] for error in errors] == [
+        f"Forwarder cycle detected: CANFrameForwarder(frame_ref=Status_{bus}) -> CANFrameForwarder(frame_ref=Status_{bus})"
+        for bus in ("CAN1", "CAN2")
+    ]
+    assert [error["ctx"]["yaml_path"] for error in errors] == [
+        f"controllers/CTRL1/can_interfaces/{bus}/forwarder_frames/Status_{bus}" for bus in ("CAN1", "CAN2")
+    ]
@@ -63,8 +63,9 @@ def test_unique_ips_duplicate_ipv4_across_ecus(tmpdir):
     warnings = _ip_repeat_warnings(loaded_ws.load_errors)
     assert len(warnings) == 1
     assert "10.0.50.1" in warnings[0]["msg"]
-    # Warning is reported for the second ECU that contains the duplicate.
-    assert "repeated in" in warnings[0]["msg"]
+    # Warning is reported for the second ECU that contains the duplicate and names the first one.
+    assert "repeated in ECU zonal_platform1" in warnings[0]["msg"]
+    assert "first used in ECU eth_ecu" in warnings[0]["msg"]
     if destination_folder.exists():
         shutil.rmtree(destination_folder)
 
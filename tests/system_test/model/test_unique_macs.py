@@ -0,0 +1,57 @@
+"""Tests for the FLYNCModel.validate_unique_macs validator.
+
+A MAC address configured more than once in the system is a major error. All
+repeated MACs are reported together, each with the ECU of the repeat and the
+ECU of the first occurrence.
+"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from flync.sdk.workspace.flync_workspace import FLYNCWorkspace
+from tests.system_test.sdk.helper import update_yaml_content
+
+absolute_path = Path(__file__).parents[3] / "examples" / "flync_example"
+
+
+def _mac_repeat_errors(errors):
+    return [e for e in errors if "Repeated MAC addresses" in e.get("msg", "")]
+
+
+def test_unique_macs_no_error_on_clean_workspace(tmpdir):
+    destination_folder = Path(tmpdir) / "copy"
+    shutil.copytree(absolute_path, destination_folder)
+    loaded_ws = FLYNCWorkspace.load_workspace("flync_example", destination_folder)
+    assert _mac_repeat_errors(loaded_ws.load_errors) == []
+
+
+def test_unique_macs_reports_every_duplicate_with_both_ecus(tmpdir):
+    destination_folder = Path(tmpdir) / "copy"
+    shutil.copytree(absolute_path, destination_folder)
+    iface = (
+        destination_folder
+        / "ecus"
+        / "eth_ecu"
+        / "controllers"
+        / "eth_ecu_controller1"
+        / "ethernet_interfaces"
+        / "eth_ecu_c1_iface1"
+        / "interface_config.flync.yaml"
+    )
+    # Reuse a MAC of zonal_platform2 and one of high_performance_compute.
+    update_yaml_content(iface, "00:11:01:01:01:02", "00:11:04:01:02:01")
+    update_yaml_content(iface, "00:11:01:01:01:03", "00:11:02:02:01:01")
+
+    with pytest.raises(ValidationError) as exc_info:
+        FLYNCWorkspace.load_workspace("flync_example", destination_folder)
+    errors = _mac_repeat_errors(exc_info.value.errors())
+    assert len(errors) == 1
+    msg = errors[0]["msg"]
+    assert "00:11:04:01:02:01 is repeated in ECU" in msg
+    assert "00:11:02:02:01:01 is repeated in ECU" in msg
+    assert "zonal_platform2" in msg
+    assert "high_performance_compute" in msg
+    assert "eth_ecu" in msg
@@ -3,6 +3,7 @@ Test the validation API of an external node using its file
 to ensure it reports node problems and states accurately.
 """
 
+import shutil
 from pathlib import Path
 
 import pytest
@@ -20,7 +21,9 @@ from flync.model.flync_4_someip import SDConfig
 from flync.model.flync_4_someip.service_interface import SDTimings, SOMEIPServiceInterface
 from flync.model.flync_4_topology.ethernet_topology import EthernetTopology
 from flync.sdk.context.diagnostics_result import WorkspaceState
-from flync.sdk.helpers.validation_helpers import validate_external_node
+from flync.sdk.context.workspace_config import WorkspaceConfiguration
+from flync.sdk.helpers.validation_helpers import validate_external_node, validate_node
+from flync.sdk.workspace.flync_workspace import FLYNCWorkspace
 
 from .helper import (
     absolute_path,
@@ -28,6 +31,7 @@ from .helper import (
     assert_not_broken_result,
     assert_valid_or_warning_result,
     assert_valid_result,
+    update_yaml_content,
 )
 
 
@@ -37,6 +41,7 @@ def test_validate_valid_external_ecu_switch():
     for switch_path in switch_paths:
         result = validate_external_node(Switch, switch_path)
         assert_valid_result(result)
+        assert "FLYNCModel.validate_unique_ips" in result.skipped_checks
 
 
 def test_validate_valid_external_controller_metadata():
@@ -196,3 +201,59 @@ def test_validate_external_node_by_string(node_type_str, rel_path):
     full_path = absolute_path / rel_path
     result = validate_external_node(node_type_str, full_path)
     assert_valid_result(result)
+
+
+def test_validate_node_loads_only_the_ecu_subtree():
+    """Validating an ECU by object path loads that ECU alone and reports the root-level checks as skipped."""
+    result = validate_node(absolute_path, "ecus.zonal_platform2")
+    assert_valid_result(result)
+    assert isinstance(result.model, ECU) and result.model.name == "zonal_platform2"
+    assert result.workspace.documents
+    assert all(doc_id.startswith("ecus/zonal_platform2/") for doc_id in result.workspace.documents)
+    assert "FLYNCModel.resolve_external_connections" in result.skipped_checks
+
+
+def test_validate_node_below_an_ecu_matches_the_full_load():
+    """A node inside an ECU is loaded with its ECU and ends up as the same model as in a full validation."""
+    partial = validate_node(absolute_path, "ecus.zonal_platform2.controllers.0")
+    full = validate_node(absolute_path, "ecus.zonal_platform2.controllers.0", WorkspaceConfiguration(map_objects=True), full_workspace=True)
+    assert partial.state == WorkspaceState.VALID
+    assert not full.skipped_checks
+    assert partial.model.model_dump() == full.model.model_dump()
+    assert validate_node(absolute_path, "ecus.7.controllers.0").model.model_dump() == partial.model.model_dump()
+
+
+def test_validate_node_reports_ecu_scoped_reference_errors(tmp_path):
+    """The ECU context is enough to resolve, and thus check, the references of its internal topology."""
+    workspace = tmp_path / "ws"
+    shutil.copytree(absolute_path, workspace)
+    update_yaml_content(workspace / "ecus" / "zonal_platform2" / "topology.flync.yaml", "ecu_port: z2_p1", "ecu_port: z2_missing")
+    result = validate_node(workspace, "ecus.zonal_platform2")
+    assert result.state == WorkspaceState.INVALID
+    assert any("z2_missing" in err["msg"] for errors in result.errors.values() for err in errors)
+
+
+@pytest.mark.parametrize("node_path", ["ecus.nonexistent_ecu", "ecus.99", "unknown_field"])
+def test_validate_node_missing_subtree(node_path):
+    """A path that resolves to no file or folder is reported as a missing node."""
+    result = validate_node(absolute_path, node_path)
+    assert result.state == WorkspaceState.INVALID
+    assert node_path in result.errors
+
+
+def test_safe_load_subtree_keeps_the_subtree_out_of_flync_model():
+    """The subtree is exposed as ``subtree_model``; ``flync_model`` only ever holds a root model."""
+    ws = FLYNCWorkspace.safe_load_subtree("subtree", absolute_path, "ecus.zonal_platform2")
+    assert ws.flync_model is None
+    assert isinstance(ws.subtree_model, ECU) and ws.subtree_model.name == "zonal_platform2"
+
+
+@pytest.mark.parametrize("node_path", ["ecus.nonexistent_ecu", "unknown_field"])
+def test_safe_load_subtree_reports_an_unresolvable_path(node_path):
+    """A path that resolves to no file or folder is a diagnostic, as for the other safe loaders, not an exception."""
+    ws = FLYNCWorkspace.safe_load_subtree("subtree", absolute_path, node_path)
+    assert ws.flync_model is None and ws.subtree_model is None
+    assert not ws.documents
+    (error,) = ws.documents_diags[node_path]
+    assert error["type"] == "fatal" and node_path in error["msg"]
+    assert ws.skipped_checks
@@ -0,0 +1,59 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+from flync.sdk.context.workspace_config import WorkspaceConfiguration
+from flync.sdk.workspace.flync_workspace import FLYNCWorkspace
+
+absolute_path = Path(__file__).parents[3] / "examples" / "flync_example"
+
+
+def _load(path, parallel):
+    config = WorkspaceConfiguration(map_objects=True, parallel_validation=parallel, validation_workers=3)
+    return FLYNCWorkspace.safe_load_workspace("parallel" if parallel else "sequential", path, config)
+
+
+def _assert_same_workspace(sequential, parallel):
+    assert parallel.flync_model.model_dump() == sequential.flync_model.model_dump()
+    assert list(parallel.objects) == list(sequential.objects)
+    assert list(parallel.sources.items()) == list(sequential.sources.items())
+    assert list(parallel.documents_diags.items()) == list(sequential.documents_diags.items())
+    assert parallel.list_objects() == sequential.list_objects()
+    assert [parallel.get_child_ids(oid) for oid in parallel.list_objects()] == [sequential.get_child_ids(oid) for oid in sequential.list_objects()]
+    assert {doc_id: node.link for doc_id, node in parallel._doc_index.items()} == {
+        doc_id: node.link for doc_id, node in sequential._doc_index.items()
+    }
+
+
+@pytest.fixture(scope="module")
+def example_loads():
+    return _load(absolute_path, False), _load(absolute_path, True)
+
+
+def test_parallel_load_matches_sequential_load(example_loads):
+    sequential, parallel = example_loads
+    _assert_same_workspace(sequential, parallel)
+
+
+def test_parallel_load_keeps_models_and_objects_linked(example_loads):
+    sequential, parallel = example_loads
+    ecu = parallel.flync_model.ecus[0]
+    assert parallel.get_semantic_objects_ids_from_model(ecu) == sequential.get_semantic_objects_ids_from_model(sequential.flync_model.ecus[0])
+    assert parallel.objects["ecus"].model[0] is ecu
+    port_id = "ecus.eth_ecu.ports.ports.eth_ecu_p1"
+    assert sorted(parallel.get_references_of(port_id)) == sorted(sequential.get_references_of(port_id))
+
+
+def test_parallel_load_renumbers_items_after_a_failed_ecu(tmp_path):
+    workspace = tmp_path / "workspace"
+    shutil.copytree(absolute_path, workspace)
+    # eth_ecu fails to load, so every later ECU moves up one position in the list
+    (workspace / "ecus" / "eth_ecu" / "ecu_metadata.flync.yaml").unlink()
+    sequential, parallel = _load(workspace, False), _load(workspace, True)
+    _assert_same_workspace(sequential, parallel)
+
+    ports = workspace / "ecus" / "zonal_platform1" / "ports.flync.yaml"
+    ports.write_text(ports.read_text().replace("speed: 100", "speed: 1000", 1))
+    assert parallel.update_document(ports) == sequential.update_document(ports)
+    _assert_same_workspace(sequential, parallel)
@@ -0,0 +1,42 @@
+import json
+
+from benchmarks.run import append_history
+from benchmarks.synthetic import SyntheticScale, generate_workspace
+from flync.sdk.context.workspace_config import WorkspaceConfiguration
+from flync.sdk.workspace.flync_workspace import FLYNCWorkspace
+
+SMALL_SCALE = SyntheticScale(ecus=3, controllers=2, sockets=2, services=2, pdus=3, can_frames=4)
+
+
+def _files(root):
+    return {path.relative_to(root): path.read_bytes() for path in sorted(root.rglob("*")) if path.is_file()}
+
+
+def test_generation_is_deterministic(tmp_path):
+    first = generate_workspace(tmp_path / "first", SMALL_SCALE)
+    second = generate_workspace(tmp_path / "second", SMALL_SCALE)
+    assert _files(first) == _files(second)
+
+
+def test_synthetic_workspace_loads_with_the_requested_objects(tmp_path):
+    path = generate_workspace(tmp_path / "workspace", SMALL_SCALE)
+    ws = FLYNCWorkspace.safe_load_workspace("synthetic", path, WorkspaceConfiguration(map_objects=True))
+    model = ws.flync_model
+    assert model is not None
+    errors = [diag for diags in ws.documents_diags.values() for diag in diags if diag.get("type") != "warning"]
+    assert not [error for error in errors if "experimental" not in error["msg"] and "not connected" not in error["msg"]]
+
+    synthetic_ecus = [ecu for ecu in model.ecus if ecu.name.startswith("syn_ecu_")]
+    assert len(synthetic_ecus) == SMALL_SCALE.ecus
+    assert all(len(ecu.controllers) == SMALL_SCALE.controllers for ecu in synthetic_ecus)
+    services = [service for service in model.communication.someip_config.services if service.name.startswith("Synthetic Service")]
+    assert len(services) == SMALL_SCALE.services
+    can_bus = next(bus for bus in model.communication.channels.can_buses if bus.name == "SyntheticCAN")
+    assert len(can_bus.frames) == SMALL_SCALE.can_frames
+
+
+def test_history_is_appended(tmp_path):
+    history = tmp_path / "results" / "history.json"
+    append_history(history, {"revision": "a"})
+    append_history(history, {"revision": "b"})
+    assert [run["revision"] for run in json.loads(history.read_text())] == ["a", "b"]
@@ -27,7 +27,7 @@ def _snapshot(ws: FLYNCWorkspace) -> dict:
         "diags": {k: len(v) for k, v in ws.documents_diags.items() if v},
         "objects": {str(oid): type(so.model).__name__ for oid, so in ws.objects.items()},
         "sources": {str(oid): (s.uri, s.range.start.line) for oid, s in ws.sources.items()},
-        "children": {k: sorted(v) for k, v in ws._children_by_parent.items()},
+        "children": {str(oid): sorted(ws.get_child_ids(oid)) for oid in ws.list_objects()},
         "docs": sorted(ws.documents.keys()),
     }
 
@@ -50,7 +50,20 @@ def _edit(root: Path, rel: str, old: str, new: str):
     path.write_text(path.read_text().replace(old, new))
 
 
+def _assert_source_index_in_sync(ws: FLYNCWorkspace):
+    """The per-document interval index behind ``objects_at`` covers exactly the current sources."""
+    by_uri: dict[str, set] = {}
+    for oid, src in ws.sources.items():
+        by_uri.setdefault(src.uri, set()).add(oid)
+    for uri, oids in by_uri.items():
+        assert set(ws._source_index.objects_in(uri)) == oids
+        for oid in oids:
+            start = ws.sources[oid].range.start
+            assert oid in ws.objects_at(uri, start.line, start.character)
+
+
 def _assert_matches_full_reload(ws, root, config, rel):
+    _assert_source_index_in_sync(ws)
     partial = _snapshot(ws)
     full = _snapshot(FLYNCWorkspace.safe_load_workspace("full", root, workspace_config=config))
     assert partial == full, f"partial update of {rel} diverged from a full reload"
@@ -129,13 +142,12 @@ def test_unknown_document_falls_back_to_full_reload(workspace):
     _assert_matches_full_reload(ws, root, config, "ecu_metadata")
 
 
-def test_update_document_cleans_duplicated_object_ids(workspace):
+def test_update_document_drops_aliases_of_removed_objects(workspace):
     """
-    After a partial document update, ``_duplicated_objects_ids`` keys must
-    all exist in ``self.objects`` and none of the removed object ids
-    may linger as keys or values.  This guards against a gap where
-    ``_purge_object_subtree`` purges ``self.objects`` but leaves stale
-    entries in ``_duplicated_objects_ids``.
+    After a partial document update, the removed objects must be gone under their
+    index ids and their name aliases alike, and the ``model -> ids`` index must not
+    keep any of them. This guards against ``_purge_object_subtree`` purging
+    ``self.objects`` but leaving stale alias ids behind.
     """
     import yaml
 
@@ -156,19 +168,18 @@ def test_update_document_cleans_duplicated_object_ids(workspace):
     for id in ids:
         assert ws.has_object(id), f"{id} not found"
 
-    # Collect the state of _duplicated_objects_ids before the update
-    pre_dup = {k: list(v) for k, v in ws._duplicated_objects_ids.items()}
-
     ws.update_document(rel)
 
     for id in ids:
         assert not ws.has_object(id), f"{id} should be removed since the vlans were removed from the document"
 
-    # After update, the purged ids must not appear as keys or values
-    all_dup_values = {v for vals in ws._duplicated_objects_ids.values() for v in vals}
+    # After update, the purged ids must not be listed or mapped to any model
+    all_ids = set(ws.list_objects())
+    mapped_ids = {oid for oids in ws._model_to_object_ids.values() for oid in oids}
     for removed_id in ids:
-        assert removed_id not in ws._duplicated_objects_ids, f"stale key {removed_id} in _duplicated_objects_ids"
-        assert removed_id not in all_dup_values, f"stale value {removed_id} in _duplicated_objects_ids"
+        assert removed_id not in all_ids, f"stale id {removed_id} in list_objects()"
+    assert not {oid for oid in mapped_ids if oid.startswith(f"{vlans_obj_id}.")}, "stale ids in _model_to_object_ids"
+    assert mapped_ids <= set(ws.objects), "_model_to_object_ids holds ids without an object"
 
 
 def _make_switch(root: Path, name: str) -> str:
@@ -228,3 +239,83 @@ def test_removing_a_referenced_document_matches_full_reload(workspace):
     ws.update_document(rel)
 
     _assert_matches_full_reload(ws, root, config, rel)
+
+
+def _count_rebuilds(ws: FLYNCWorkspace) -> list[str]:
+    """Record the id of every ancestor the next update re-validates."""
+    rebuilt: list[str] = []
+    rebuild = ws._rebuild_ancestor
+
+    def counting(parent_node, children):
+        rebuilt.append(parent_node.doc_id)
+        return rebuild(parent_node, children)
+
+    ws._rebuild_ancestor = counting
+    return rebuilt
+
+
+def test_batched_update_revalidates_each_ancestor_once(workspace):
+    ws, root, config = workspace
+    rels = [
+        PORTS,
+        "ecus/zonal_platform1/ecu_metadata.flync.yaml",
+        "ecus/eth_ecu/controllers/eth_ecu_controller1/controller_metadata.flync.yaml",
+        "communication/channels/pdus/PDU_CabinLight2.flync.yaml",
+        "communication/channels/pdus/PDU_MirrorLeft.flync.yaml",
+    ]
+    _edit(root, PORTS, "speed: 100", "speed: 1000")
+    pdus = root / "communication/channels/pdus"
+    (pdus / "PDU_CabinLight2.flync.yaml").write_text(
+        (pdus / "PDU_CabinLight.flync.yaml").read_text().replace("name: PDU_CabinLight", "name: PDU_CabinLight2")
+    )
+    (pdus / "PDU_MirrorLeft.flync.yaml").unlink()
+    rebuilt = _count_rebuilds(ws)
+
+    affected = ws.update_documents(rels)
+
+    assert sorted(rebuilt) == sorted(set(rebuilt)), "an ancestor shared by several changes was re-validated twice"
+    assert rebuilt[-1] == "."
+    assert {PORTS, "ecus/zonal_platform1", "ecus/eth_ecu", "communication/channels/pdus/PDU_CabinLight2.flync.yaml", "."} <= set(affected)
+    assert "communication/channels/pdus/PDU_MirrorLeft.flync.yaml" not in ws.documents
+    _assert_matches_full_reload(ws, root, config, ", ".join(rels))
+
+
+def test_batched_update_reloads_nested_changes_once(workspace):
+    ws, root, config = workspace
+    switch = f"{SWITCHES}/z1_switch1/switch.flync.yaml"
+    _edit(root, switch, "default_priority: 0", "default_priority: 2")
+    added = _make_switch(root, "z1_switch2")
+    reloaded: list[str] = []
+    reload_subtree = ws._reload_subtree
+    ws._reload_subtree = lambda node, **kwargs: reloaded.append(node.doc_id) or reload_subtree(node, **kwargs)
+
+    affected = ws.update_documents([switch, added])
+
+    # the new switch reloads its ancestor, whose subtree already contains the changed switch
+    assert len(reloaded) == 1
+    assert {switch, added} <= set(affected)
+    zonal = next(e for e in ws.flync_model.ecus if e.name == "zonal_platform1")
+    assert [s.name for s in zonal.switches] == ["z1_switch1", "z1_switch2"]
+    assert zonal.switches[0].switch_config.vlans[0].default_priority == 2
+    _assert_matches_full_reload(ws, root, config, f"{switch}, {added}")
+
+
+def test_batched_update_takes_the_fallback_of_any_document(workspace):
+    ws, root, config = workspace
+    top_level = "apps/application3.flync.yaml"
+    (root / top_level).write_text((root / "apps/application1.flync.yaml").read_text().replace("application1", "application3"))
+    _edit(root, PORTS, "speed: 100", "speed: 1000")
+    rebuilt = _count_rebuilds(ws)
+
+    ws.update_documents([PORTS, top_level])
+
+    # a new item directly under the root re-validates everything from the cached documents, once
+    assert rebuilt == []
+    _assert_matches_full_reload(ws, root, config, f"{PORTS}, {top_level}")
+
+
+def test_empty_batch_is_a_no_op(workspace):
+    ws, _, _ = workspace
+    model = ws.flync_model
+    assert ws.update_documents([]) == []
+    assert ws.flync_model is model
@@ -0,0 +1,130 @@
+"""
+Tests for the binary workspace snapshot: a restored workspace must be indistinguishable from a loaded one, and a
+snapshot must never be used once the workspace, its configuration or the FLYNC code changed.
+"""
+
+import os
+import shutil
+
+import pytest
+
+from flync.sdk.context.workspace_config import WorkspaceConfiguration
+from flync.sdk.helpers.validation_helpers import validate_workspace
+from flync.sdk.workspace import flync_workspace, snapshot
+from flync.sdk.workspace.flync_workspace import FLYNCWorkspace
+from flync.sdk.workspace.watcher import diff_diagnostics
+
+from .helper import absolute_path
+
+PORTS = "ecus/zonal_platform1/ports.flync.yaml"
+
+
+@pytest.fixture
+def workspace_path(tmp_path):
+    """A fresh, writable copy of the example workspace."""
+    root = tmp_path / "ws"
+    shutil.copytree(absolute_path, root)
+    return root
+
+
+@pytest.fixture
+def loaded(workspace_path):
+    """The example workspace loaded with object mapping, and its snapshot."""
+    workspace = FLYNCWorkspace.safe_load_workspace("loaded", workspace_path, workspace_config=WorkspaceConfiguration(map_objects=True))
+    return workspace, workspace.save_snapshot(workspace_path.parent / "ws.snapshot")
+
+
+def test_restored_workspace_matches_the_loaded_one(loaded, workspace_path):
+    workspace, snapshot = loaded
+    restored = FLYNCWorkspace.load_snapshot(workspace_path, WorkspaceConfiguration(map_objects=True), snapshot)
+
+    assert restored is not None and restored.name == "loaded"
+    assert restored.flync_model.model_dump() == workspace.flync_model.model_dump()
+    assert restored.documents_diags == workspace.documents_diags
+    assert restored.objects.keys() == workspace.objects.keys()
+    assert restored.sources == workspace.sources
+    assert restored._doc_index.keys() == workspace._doc_index.keys()
+    # the private attrs set by the validators point into the restored tree, not at copies
+    connection = restored.flync_model.topology.ethernet_topology.connections[0]
+    ecu_ports = [port for ecu in restored.flync_model.ecus for port in ecu.ports]
+    assert any(port is connection._ecu1_port for port in ecu_ports)
+    port_id = next(oid for oid, obj in restored.objects.items() if obj.model is connection._ecu1_port)
+    assert restored.get_references_of(port_id) == workspace.get_references_of(port_id)
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda root: (root / PORTS).write_text((root / PORTS).read_text() + "\n# edited\n"),
+        lambda root: shutil.copy(root / "system_metadata.flync.yaml", root / "communication" / "copy.flync.yaml"),
+        lambda root: (root / "communication" / "tcp_profiles.flync.yaml").unlink(),
+    ],
+    ids=["edited", "added", "removed"],
+)
+def test_snapshot_is_stale_after_a_document_changes(loaded, workspace_path, change):
+    change(workspace_path)
+    assert FLYNCWorkspace.load_snapshot(workspace_path, WorkspaceConfiguration(map_objects=True), loaded[1]) is None
+
+
+def test_snapshot_is_stale_for_another_configuration_or_release(loaded, workspace_path, monkeypatch):
+    assert FLYNCWorkspace.load_snapshot(workspace_path, WorkspaceConfiguration(map_objects=False), loaded[1]) is None
+    monkeypatch.setattr("flync.sdk.workspace.snapshot._flync_version", lambda: "another release")
+    assert FLYNCWorkspace.load_snapshot(workspace_path, WorkspaceConfiguration(map_objects=True), loaded[1]) is None
+
+
+def test_unreadable_snapshot_is_ignored(workspace_path, tmp_path):
+    snapshot = tmp_path / "broken.snapshot"
+    snapshot.write_bytes(b"FLYNCSNP\xff\xff")
+    assert FLYNCWorkspace.load_snapshot(workspace_path, snapshot_path=snapshot) is None
+    assert FLYNCWorkspace.load_snapshot(workspace_path, snapshot_path=tmp_path / "missing.snapshot") is None
+
+
+def test_restored_workspace_updates_incrementally(loaded, workspace_path):
+    restored = FLYNCWorkspace.load_snapshot(workspace_path, WorkspaceConfiguration(map_objects=True), loaded[1])
+    ports = workspace_path / PORTS
+    ports.write_text(ports.read_text().replace("name: z1_p1", "name: z1_renamed"))
+
+    assert "ecus/zonal_platform1" in restored.update_document(PORTS)
+    full = FLYNCWorkspace.safe_load_workspace("full", workspace_path, workspace_config=WorkspaceConfiguration(map_objects=True))
+    assert diff_diagnostics(full.documents_diags, restored.documents_diags) == ({}, {})
+
+
+def test_validate_workspace_reuses_a_fresh_snapshot(workspace_path, tmp_path, monkeypatch):
+    monkeypatch.setattr(flync_workspace, "default_snapshot_path", lambda root: tmp_path / "default.snapshot")
+    first = validate_workspace(workspace_path, use_snapshot=True)
+    assert (tmp_path / "default.snapshot").is_file()
+
+    def no_load(*args, **kwargs):
+        raise AssertionError("the workspace was loaded although its snapshot is fresh")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(FLYNCWorkspace, "_open_documents", no_load)
+        second = validate_workspace(workspace_path, use_snapshot=True)
+    assert (second.state, second.errors) == (first.state, first.errors)
+
+    (workspace_path / PORTS).write_text((workspace_path / PORTS).read_text() + "\n# edited\n")
+    assert validate_workspace(workspace_path, use_snapshot=True).state == first.state
+
+
+def test_prune_snapshots_removes_the_least_recently_used(tmp_path):
+    for age, name in enumerate(["c", "b", "a"]):
+        (tmp_path / f"{name}.snapshot").write_bytes(b"x" * 100)
+        os.utime(tmp_path / f"{name}.snapshot", (1000 - age, 1000 - age))
+    (tmp_path / "notes.txt").write_bytes(b"x" * 1000)
+
+    # "a" is the oldest but kept; "b" is the least recently used of the others
+    assert snapshot.prune_snapshots(tmp_path, keep=tmp_path / "a.snapshot", max_bytes=200) == 1
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["a.snapshot", "c.snapshot", "notes.txt"]
+    assert snapshot.prune_snapshots(tmp_path, max_bytes=200) == 0
+
+
+def test_writing_the_default_snapshot_prunes_the_others(workspace_path, tmp_path, monkeypatch):
+    directory = tmp_path / "snapshots"
+    directory.mkdir()
+    (directory / "other_workspace.snapshot").write_bytes(b"x" * 100)
+    os.utime(directory / "other_workspace.snapshot", (0, 0))
+    monkeypatch.setattr(flync_workspace, "default_snapshot_path", lambda root: directory / "default.snapshot")
+    monkeypatch.setattr(snapshot, "SNAPSHOT_CACHE_MAX_BYTES", 1)
+
+    validate_workspace(workspace_path, use_snapshot=True)
+    assert [path.name for path in directory.iterdir()] == ["default.snapshot"]
@@ -0,0 +1,129 @@
+"""
+Tests for :class:`WorkspaceWatcher`, the watch mode on top of the incremental reload. Every scenario checks that
+the kept-hot workspace ends up with the diagnostics of a full reload, and that only the change is reported.
+"""
+
+import shutil
+import threading
+import time
+
+import pytest
+
+from flync.sdk.context.workspace_config import WorkspaceConfiguration
+from flync.sdk.workspace.flync_workspace import FLYNCWorkspace
+from flync.sdk.workspace.watcher import WorkspaceWatcher, diff_diagnostics
+
+from .helper import absolute_path
+
+PORTS = "ecus/zonal_platform1/ports.flync.yaml"
+PDUS = "communication/channels/pdus"
+
+
+@pytest.fixture
+def watcher(tmp_path):
+    """A loaded watcher over a fresh, writable copy of the example workspace."""
+    root = tmp_path / "ws"
+    shutil.copytree(absolute_path, root)
+    watcher = WorkspaceWatcher(root, WorkspaceConfiguration(map_objects=True), interval=0.05, debounce=0.3)
+    watcher.load()
+    return watcher
+
+
+def _edit(watcher, rel, old, new):
+    path = watcher.workspace_path / rel
+    path.write_text(path.read_text().replace(old, new))
+
+
+def _assert_matches_full_reload(watcher):
+    full = FLYNCWorkspace.safe_load_workspace("full", watcher.workspace_path, workspace_config=WorkspaceConfiguration(map_objects=True))
+    assert diff_diagnostics(full.documents_diags, watcher.workspace.documents_diags) == ({}, {})
+
+
+def test_watcher_reports_only_the_diagnostics_delta(watcher):
+    assert watcher.poll() is None
+
+    # a topology connection references port "z1_p1"; renaming it dangles that reference
+    _edit(watcher, PORTS, "name: z1_p1", "name: z1_renamed")
+    delta = watcher.poll()
+    assert delta.changed_files == [PORTS]
+    assert "ecus/zonal_platform1" in delta.updated_documents
+    assert any(err["type"] == "major" and "z1_p1" in err["msg"] for err in delta.added["ecus/zonal_platform1"])
+    _assert_matches_full_reload(watcher)
+
+    _edit(watcher, PORTS, "name: z1_renamed", "name: z1_p1")
+    fixed = watcher.poll()
+    assert (fixed.added, fixed.resolved) == (delta.resolved, delta.added)
+    assert watcher.poll() is None
+
+
+def test_watcher_debounces_a_burst_of_changed_added_and_removed_files(watcher):
+    pdus = watcher.workspace_path / PDUS
+    copy = (pdus / "PDU_CabinLight.flync.yaml").read_text().replace("name: PDU_CabinLight", "name: PDU_CabinLight2")
+
+    def rest_of_the_burst():
+        time.sleep(0.05)
+        (pdus / "PDU_MirrorRight.flync.yaml").unlink()
+        time.sleep(0.05)
+        (pdus / "PDU_CabinLight2.flync.yaml").write_text(copy)
+
+    (watcher.workspace_path / PORTS).write_text((watcher.workspace_path / PORTS).read_text() + "\n# regenerated\n")
+    writer = threading.Thread(target=rest_of_the_burst)
+    writer.start()
+    delta = watcher.poll()
+    writer.join()
+
+    assert delta.changed_files == [f"{PDUS}/PDU_CabinLight2.flync.yaml", f"{PDUS}/PDU_MirrorRight.flync.yaml", PORTS]
+    # the container and channels still reference the removed PDU
+    assert any("PDU_MirrorRight" in err["msg"] for errors in delta.added.values() for err in errors)
+    assert f"{PDUS}/PDU_CabinLight2.flync.yaml" in watcher.workspace.documents
+    assert f"{PDUS}/PDU_MirrorRight.flync.yaml" not in watcher.workspace.documents
+    _assert_matches_full_reload(watcher)
+
+
+def test_batch_that_fails_to_apply_is_retried_by_the_next_poll(watcher, monkeypatch):
+    update_documents = watcher.workspace.update_documents
+    calls = []
+
+    def fail_once(uris):
+        calls.append(list(uris))
+        if len(calls) == 1:
+            raise RuntimeError("interrupted reload")
+        return update_documents(uris)
+
+    monkeypatch.setattr(watcher.workspace, "update_documents", fail_once)
+    _edit(watcher, PORTS, "name: z1_p1", "name: z1_renamed")
+    with pytest.raises(RuntimeError):
+        watcher.poll()
+
+    delta = watcher.poll()
+    assert calls == [[PORTS], [PORTS]]
+    assert any("z1_p1" in err["msg"] for err in delta.added["ecus/zonal_platform1"])
+    _assert_matches_full_reload(watcher)
+    assert watcher.poll() is None
+
+
+def test_run_reports_each_batch_until_stopped(watcher):
+    stop, deltas = threading.Event(), []
+
+    def on_delta(delta):
+        deltas.append(delta)
+        stop.set()
+
+    runner = threading.Thread(target=watcher.run, args=(on_delta, stop))
+    runner.start()
+    (watcher.workspace_path / PORTS).write_text((watcher.workspace_path / PORTS).read_text() + "\n# regenerated\n")
+    runner.join(timeout=60)
+    assert not runner.is_alive()
+    assert [delta.changed_files for delta in deltas] == [[PORTS]]
+    assert deltas[0].unchanged
+
+
+def test_diff_diagnostics_ignores_moved_lines_and_counts_repeats():
+    def diag(msg, line):
+        return {"type": "major", "msg": msg, "loc": ("ports",), "ctx": {"error_id": "FLYNC-ECU-ERR-001", "line": line}}
+
+    before = {"a.flync.yaml": [diag("twice", 3), diag("twice", 9), diag("fixed", 5)]}
+    after = {"a.flync.yaml": [diag("twice", 4), diag("new", 6)], "b.flync.yaml": []}
+    added, resolved = diff_diagnostics(before, after)
+    assert added == {"a.flync.yaml": [diag("new", 6)]}
+    assert resolved == {"a.flync.yaml": [diag("twice", 9), diag("fixed", 5)]}
@@ -0,0 +1,50 @@
+from types import SimpleNamespace
+
+from flync.core.utils.forwarder_validators import ForwarderGraph, ForwarderNode
+from flync.model.flync_4_signal.forwarder import PDUForwarder
+
+
+def _graph(edges, size):
+    nodes = [
+        ForwarderNode(PDUForwarder.model_construct(pdu_ref=f"PDU_{i}", egresses=[]), SimpleNamespace(name="ctrl"), f"controllers/ctrl/sockets/s{i}")
+        for i in range(size)
+    ]
+    successors = [[] for _ in range(size)]
+    for source, target in edges:
+        successors[source].append(target)
+    return ForwarderGraph(nodes, successors)
+
+
+def test_fan_in_and_fan_out():
+    graph = _graph([(0, 1), (0, 2), (1, 2)], 3)
+    assert [graph.fan_out(i) for i in range(3)] == [2, 1, 0]
+    assert [graph.fan_in(i) for i in range(3)] == [0, 1, 2]
+    assert graph.predecessors(2) == [0, 1]
+    assert graph.index_of(graph.nodes[1].forwarder) == 1
+
+
+def test_every_cycle_is_reported_once_per_component():
+    # 0 -> 1 -> 2 -> 0 and 3 -> 4 -> 3 are loops, 5 feeds itself, 6 is only downstream of the first loop
+    graph = _graph([(0, 1), (1, 2), (2, 0), (2, 6), (3, 4), (4, 3), (5, 5)], 7)
+    assert sorted(graph.strongly_connected_components()) == [[0, 1, 2], [3, 4], [5], [6]]
+
+    cycles = graph.cycles()
+    assert [cycle.path for cycle in cycles] == [
+        "PDUForwarder(pdu_ref=PDU_0) -> PDUForwarder(pdu_ref=PDU_1) -> PDUForwarder(pdu_ref=PDU_2) -> PDUForwarder(pdu_ref=PDU_0)",
+        "PDUForwarder(pdu_ref=PDU_3) -> PDUForwarder(pdu_ref=PDU_4) -> PDUForwarder(pdu_ref=PDU_3)",
+        "PDUForwarder(pdu_ref=PDU_5) -> PDUForwarder(pdu_ref=PDU_5)",
+    ]
+    assert [cycle.source for cycle in cycles] == ["controllers/ctrl/sockets/s0", "controllers/ctrl/sockets/s3", "controllers/ctrl/sockets/s5"]
+
+
+def test_acyclic_graph_has_no_cycles():
+    assert _graph([(0, 1), (1, 2), (0, 2)], 3).cycles() == []
+
+
+def test_long_chains_do_not_hit_the_recursion_limit():
+    size = 20000
+    chain = _graph([(i, i + 1) for i in range(size - 1)], size)
+    assert chain.cycles() == []
+    loop = _graph([(i, (i + 1) % size) for i in range(size)], size)
+    (cycle,) = loop.cycles()
+    assert len(cycle.nodes) == size + 1
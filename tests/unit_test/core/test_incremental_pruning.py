@@ -0,0 +1,114 @@
+from typing import List, Optional
+
+import pytest
+from pydantic import field_validator, model_validator
+
+from flync.core.base_models.base_model import FLYNCBaseModel
+from flync.core.utils.exceptions import err_minor
+from flync.core.utils.exceptions_handling import validate_with_policy
+
+_sibling_validations = []
+
+
+class _Leaf(FLYNCBaseModel):
+    name: str
+    speed: Optional[int] = None
+    duplex: Optional[str] = None
+
+    @model_validator(mode="after")
+    def duplex_needs_speed(self):
+        if self.duplex is not None and self.speed is None:
+            raise err_minor("duplex {duplex} set without a speed", duplex=self.duplex)
+        return self
+
+
+class _Branch(FLYNCBaseModel):
+    name: str
+    leaves: List[_Leaf] = []
+    mode: Optional[str] = None
+
+    @model_validator(mode="after")
+    def mode_needs_leaves(self):
+        if self.mode is not None and not self.leaves:
+            raise err_minor("mode set on a branch without leaves")
+        return self
+
+
+class _Sibling(FLYNCBaseModel):
+    value: int = 0
+
+    @field_validator("value")
+    @classmethod
+    def count(cls, value):
+        _sibling_validations.append(value)
+        return value
+
+
+class _Tree(FLYNCBaseModel):
+    branches: List[_Branch] = []
+    sibling: _Sibling = _Sibling()
+
+
+class _RawTree(_Tree):
+    @model_validator(mode="before")
+    @classmethod
+    def passthrough(cls, data):
+        return data
+
+
+def _data():
+    return {
+        "branches": [
+            {"name": "b0", "leaves": [{"name": "l0", "speed": "fast", "duplex": "full"}, {"name": "l1", "speed": 100}]},
+            {"name": "b1", "mode": "x", "leaves": [{"name": "l2", "speed": "slow", "duplex": "half"}]},
+        ],
+        "sibling": {"value": 1},
+    }
+
+
+def _summary(errors):
+    return sorted((tuple(e["loc"]), e["type"], e["msg"]) for e in errors)
+
+
+@pytest.mark.parametrize("model", [_Tree, _RawTree])
+def test_incremental_pruning_matches_full_loop(model):
+    full_result, full_errors = validate_with_policy(model, _data(), "doc.yaml", incremental=False)
+    result, errors = validate_with_policy(model, _data(), "doc.yaml", incremental=True)
+    assert result.model_dump() == full_result.model_dump()
+    assert _summary(errors) == _summary(full_errors)
+    assert [leaf.name for leaf in result.branches[0].leaves] == ["l1"]
+    assert [branch.name for branch in result.branches] == ["b0"]
+
+
+def test_incremental_pruning_saves_full_passes():
+    _sibling_validations.clear()
+    validate_with_policy(_Tree, _data(), "doc.yaml", incremental=False)
+    full_passes = len(_sibling_validations)
+    _sibling_validations.clear()
+    validate_with_policy(_Tree, _data(), "doc.yaml", incremental=True)
+    assert len(_sibling_validations) < full_passes
+
+
+def test_raw_input_validator_disables_splicing():
+    _sibling_validations.clear()
+    validate_with_policy(_RawTree, _data(), "doc.yaml", incremental=False)
+    full_passes = len(_sibling_validations)
+    _sibling_validations.clear()
+    validate_with_policy(_RawTree, _data(), "doc.yaml", incremental=True)
+    assert len(_sibling_validations) == full_passes
+
+
+def test_incremental_pruning_never_puts_instances_into_caller_data():
+    data = _data()
+    validate_with_policy(_Tree, data, "doc.yaml")
+
+    def walk(value):
+        assert not isinstance(value, FLYNCBaseModel)
+        if isinstance(value, dict):
+            for item in value.values():
+                walk(item)
+        elif isinstance(value, list):
+            for item in value:
+                walk(item)
+
+    walk(data)
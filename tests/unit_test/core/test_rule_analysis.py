@@ -0,0 +1,137 @@
+import itertools
+import random
+import time
+
+from flync.core.datatypes.ipaddress import IPv4AddressEntry
+from flync.core.datatypes.macaddress import MACAddressEntry
+from flync.core.datatypes.value_range import ValueRange
+from flync.core.utils.rule_analysis import RuleFinding, analyze_rules, analyze_tcam_rules, describe_rules
+from flync.model.flync_4_ecu.switch import TCAMRule
+from flync.model.flync_4_tsn.qos import FrameFilter
+from flync.sdk.classifier import Classifier, FrameHeader
+
+PORTS = ["p0", "p1", "p2"]
+
+
+def _random_rule(rng):
+    fields = {}
+    for name in rng.sample(["ethertype", "vlanid", "pcp", "protocol", "src_port", "dst_port"], rng.randint(0, 3)):
+        if name == "ethertype":
+            fields["ethertype"] = rng.choice([0x0800, 0x86DD, [0x0800, 0x86DD]])
+        elif name == "vlanid":
+            fields["vlanid"] = rng.choice([rng.randint(1, 6), ValueRange(from_value=2, to_value=5), [1, ValueRange(from_value=3, to_value=6)]])
+        elif name == "pcp":
+            fields["pcp"] = rng.choice([rng.randint(0, 3), [1, 2], [0, 1, 2]])
+        elif name == "protocol":
+            fields["protocol"] = rng.choice(["tcp", "udp"])
+        else:
+            fields[name] = rng.choice([rng.randint(1, 4), ValueRange(from_value=1, to_value=3), [ValueRange(from_value=1, to_value=2), 4]])
+    if rng.random() < 0.2 and not fields.keys() & {"vlanid", "pcp"}:
+        fields["vlan_tagged"] = rng.choice([True, False])
+    return FrameFilter(**fields) if fields else None, rng.choice(["drop", "mirror"]), rng.choice([[], ["p0"], ["p1", "p2"]])
+
+
+def _universe():
+    """Every combination of field values the random rules use, plus one value no rule names per field."""
+    tags = [(False, None, None)] + [(True, vlan, pcp) for vlan in [*range(8), 100] for pcp in [0, 1, 2, 3, 7]]
+    transports = [(None, None, None)] + [(protocol, src, dst) for protocol in ["tcp", "udp"] for src in range(1, 6) for dst in range(1, 6)]
+    for port, ethertype, (tagged, vlan, pcp) in itertools.product(PORTS, [0x0800, 0x86DD, 0x22F0], tags):
+        for protocol, src, dst in transports if ethertype != 0x22F0 else transports[:1]:
+            yield FrameHeader(0, 0, ethertype, tagged, vlan, pcp, protocol=protocol, src_port=src, dst_port=dst, port=port)
+
+
+def _expected_findings(matched, actions):
+    """Brute-force findings from the frame sets each rule matches, compared pair by pair."""
+    findings, dead = [], set()
+    for rule, frames in enumerate(matched):
+        covering = [other for other in range(len(matched)) if other != rule and frames <= matched[other]]
+        earlier = [other for other in covering if other < rule]
+        if earlier:
+            findings.append(RuleFinding("redundant" if actions[earlier[0]] == actions[rule] else "shadowed", rule, (earlier[0],)))
+            dead.add(rule)
+            continue
+        later = [other for other in covering if other > rule and actions[other] == actions[rule]]
+        if later and not any(matched[other] & frames and actions[other] != actions[rule] for other in range(rule + 1, later[0])):
+            findings.append(RuleFinding("redundant", rule, (later[0],)))
+            continue
+        conflicts = tuple(
+            other
+            for other in range(rule)
+            if other not in dead and actions[other] != actions[rule] and matched[other] & frames and not matched[other] <= frames
+        )
+        if conflicts:
+            findings.append(RuleFinding("conflict", rule, conflicts))
+    return findings
+
+
+def test_findings_agree_with_pairwise_comparison():
+    universe = list(_universe())
+    rng = random.Random(15)
+    for _ in range(15):
+        rules = [_random_rule(rng) for _ in range(25)]
+        matches, actions, ports = zip(*rules)
+        classifier = Classifier(matches, matches, ports)
+        matched = [set() for _ in rules]
+        for frame, header in enumerate(universe):
+            bits = classifier.match_bits(header)
+            for rule in range(len(rules)):
+                if bits >> rule & 1:
+                    matched[rule].add(frame)
+        assert all(matched), "every random rule matches some frame of the universe"
+        assert analyze_rules(matches, actions, ports) == _expected_findings(matched, actions)
+
+
+def test_addresses_frame_masks_and_vehicle_states():
+    subnet = FrameFilter(src_ipv4=IPv4AddressEntry(address="10.0.0.0", ipv4netmask="255.255.0.0"))
+    host = FrameFilter(src_ipv4=["10.0.1.1", "10.0.2.1"], protocol="udp")
+    oui = FrameFilter(dst_mac=MACAddressEntry(address="02:00:00:00:00:00", macmask="ff:ff:ff:00:00:00"))
+    station = FrameFilter(dst_mac="02:00:00:12:34:56")
+    other_oui = FrameFilter(dst_mac="04:00:00:12:34:56")
+    findings = analyze_rules([subnet, host, oui, station, other_oui], ["drop", "accept", "drop", "drop", "accept"])
+    assert findings == [RuleFinding("shadowed", 1, (0,)), RuleFinding("redundant", 3, (2,)), RuleFinding("conflict", 4, (0,))]
+
+    def rule(rule_id, action, frame_mask=None, vehicle_state=None, **match):
+        return TCAMRule(
+            name=f"r{rule_id}",
+            id=rule_id,
+            match_filter=FrameFilter(**match) if match else None,
+            frame_mask=frame_mask,
+            vehicle_state=vehicle_state,
+            action=[{"type": action, "ports": ["p1"]}],
+        )
+
+    ipv4 = {"offset": 12, "data": "0x0800"}
+    rules = [
+        rule(7, "drop", frame_mask=[ipv4, {"offset": 23, "data": "0x11"}]),
+        rule(3, "drop", frame_mask=[ipv4]),
+        rule(5, "force_egress", frame_mask=[{"offset": 23, "data": "0x11"}]),
+        rule(1, "drop", vehicle_state={"data": "0x02", "mask": "0x0F"}, pcp=3),
+        rule(2, "force_egress", vehicle_state={"data": "0x12", "mask": "0xFF"}, pcp=3, vlanid=5),
+        rule(4, "force_egress", vehicle_state={"data": "0x22", "mask": "0xFF"}, pcp=[3, 4]),
+    ]
+    findings = [(kind, f"r{sorted(r.id for r in rules)[position]}") for kind, position, _ in analyze_tcam_rules(rules)]
+    # the frame_mask rule r5 overlaps r3 in bytes, but not the match_filter rules r1 and r4 it cannot be compared with
+    assert findings == [("shadowed", "r2"), ("conflict", "r4"), ("conflict", "r5"), ("redundant", "r7")]
+
+
+def test_describe_rules_lists_a_few_names():
+    names = [f"rule_{index}" for index in range(8)]
+    assert describe_rules(names, (1, 2)) == "'rule_1', 'rule_2'"
+    assert describe_rules(names, tuple(range(8))).endswith("'rule_4' and 3 more")
+
+
+def test_thousands_of_generated_rules():
+    # generated TCAM tables: one rule per VLAN and port range, a few catch-all rules in between
+    matches, actions = [], []
+    for index in range(3000):
+        if index % 500 == 0:
+            matches.append(FrameFilter(vlan_tagged=True))
+        else:
+            low = (index * 7) % 60000 + 1
+            matches.append(FrameFilter(vlanid=index % 4000 + 1, dst_port=ValueRange(from_value=low, to_value=low + 10), protocol="udp"))
+        actions.append("drop" if index % 3 else "mirror")
+    started = time.perf_counter()
+    findings = analyze_rules(matches, actions)
+    assert time.perf_counter() - started < 60
+    assert {finding.kind for finding in findings} == {"shadowed", "redundant"}
+    assert all(finding.others[0] % 500 == 0 for finding in findings)
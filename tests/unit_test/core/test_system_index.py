@@ -0,0 +1,90 @@
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
+import flync.core.utils.system_index as system_index
+from flync.core.utils.system_index import SystemIndex
+from flync.core.utils.uniqueness_index import UniquenessIndex
+from flync.sdk.workspace.flync_workspace import FLYNCWorkspace
+
+
+def _bus(name, *frames):
+    return SimpleNamespace(name=name, frames=[SimpleNamespace(name=f"{name}_{can_id}", can_id=can_id) for can_id in frames])
+
+
+def _stub_model(can_buses):
+    channels = SimpleNamespace(pdus=[], ethernet_pdu_containers=None, can_buses=can_buses, lin_buses=None)
+    return SimpleNamespace(ecus=[], communication=SimpleNamespace(channels=channels))
+
+
+def test_catalogs_are_built_once_and_keep_the_last_duplicate():
+    model = _stub_model([_bus("CAN1", 0x100, 0x200), _bus("CAN2", 0x100), _bus("CAN1", 0x300)])
+    index = SystemIndex.of(model)
+
+    assert index.can_frames_by_bus is index.can_frames_by_bus
+    assert {bus: sorted(frames) for bus, frames in index.can_frames_by_bus.items()} == {"CAN1": [0x300], "CAN2": [0x100]}
+    assert sorted(index.can_frames_by_bus_id) == [("CAN1", 0x100), ("CAN1", 0x200), ("CAN1", 0x300), ("CAN2", 0x100)]
+    assert index.frames_by_bus_id == index.can_frames_by_bus_id
+    assert index.pdus == {} and index.sockets == [] and index.someip_services == []
+
+
+def test_of_shares_the_index_inside_a_validation_scope():
+    model, other = _stub_model([]), _stub_model([])
+    assert SystemIndex.of(model) is not SystemIndex.of(model)
+    with SystemIndex.validation_scope():
+        index = SystemIndex.of(model)
+        assert SystemIndex.of(model) is index
+        assert SystemIndex.of(other) is not index
+    assert SystemIndex.of(model) is not index
+
+
+@pytest.fixture(scope="module")
+def example_model(example_workspace_path):
+    return FLYNCWorkspace.load_workspace("system_index_ws", example_workspace_path).flync_model
+
+
+def test_validation_walks_the_sockets_once(example_model, monkeypatch):
+    walked = []
+    iter_controller_sockets = system_index.iter_controller_sockets
+
+    def counting(controller):
+        walked.append(controller.name)
+        return iter_controller_sockets(controller)
+
+    monkeypatch.setattr(system_index, "iter_controller_sockets", counting)
+    model = example_model
+    model.ecus = list(model.ecus)  # validate_assignment re-runs every model validator
+
+    controllers = [controller.name for ecu in model.ecus for controller in ecu.controllers]
+    assert walked == controllers
+    assert system_index._scoped_indexes.get() is None
+    # the uniqueness catalog lives in the index too, so nothing of the validation stays on the model
+    assert not any(isinstance(value, UniquenessIndex) for value in (model.__pydantic_private__ or {}).values())
+
+
+def test_failed_validation_drops_the_index(example_model):
+    ecus = list(example_model.ecus)
+    try:
+        with pytest.raises(ValidationError):
+            example_model.ecus = ecus + [ecus[0]]  # repeats an ECU name
+        assert system_index._scoped_indexes.get() is None
+    finally:
+        example_model.ecus = ecus
+
+
+def test_uniqueness_catalog_covers_the_ecus(example_model):
+    index = SystemIndex.of(example_model)
+    assert index.uniqueness is index.uniqueness
+    assert sorted(index.uniqueness.values(UniquenessIndex.ECU_NAMES)) == sorted(ecu.name for ecu in example_model.ecus)
+
+
+def test_example_catalogs(example_model):
+    index = SystemIndex.of(example_model)
+    channels = example_model.communication.channels
+    assert set(index.pdus) == {pdu.name for pdu in channels.pdus} | {c.name for c in channels.ethernet_pdu_containers or []}
+    assert len(index.sockets) == sum(1 for _ in example_model._iter_ecu_sockets())
+    assert [fwd for _, _, fwd in index.pdu_forwarders] == example_model.get_all_pdu_forwarders()
+    assert [fwd for _, _, fwd in index.can_frame_forwarders] == example_model.get_all_can_frame_forwarders()
+    for (controller_name, socket_name), (controller, socket) in index.sockets_by_controller.items():
+        assert (controller.name, socket.name) == (controller_name, socket_name)
@@ -0,0 +1,57 @@
+import pytest
+from pydantic import BaseModel
+
+from flync.core.utils import exceptions_handling
+from flync.core.utils.exceptions_handling import clear_type_adapter_cache, get_type_adapter, type_adapter_cache_info, validate_with_policy
+
+
+class _Item(BaseModel):
+    name: str
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_type_adapter_cache()
+    yield
+    clear_type_adapter_cache()
+
+
+def test_same_type_object_hits_the_cache():
+    wrapper = dict[str, _Item]
+    first = get_type_adapter(wrapper)
+    assert get_type_adapter(wrapper) is first
+    info = type_adapter_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_equal_but_distinct_generic_aliases_are_separate_entries():
+    get_type_adapter(dict[str, _Item])
+    get_type_adapter(dict[str, _Item])
+    assert type_adapter_cache_info().misses == 2
+
+
+def test_forced_model_rebuild_invalidates_the_model_entry():
+    stale = get_type_adapter(_Item)
+    _Item.model_rebuild(force=True)
+    assert get_type_adapter(_Item) is not stale
+    assert type_adapter_cache_info().misses == 2
+
+
+def test_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(exceptions_handling._type_adapter_cache, "maxsize", 2)
+    types = [list[int], list[str], list[float]]
+    for tp in types:
+        get_type_adapter(tp)
+    assert type_adapter_cache_info().currsize == 2
+    get_type_adapter(types[0])
+    assert type_adapter_cache_info().misses == 4
+
+
+def test_validate_with_policy_reuses_adapter_across_calls():
+    wrapper = dict[str, _Item]
+    for _ in range(3):
+        result, errors = validate_with_policy(wrapper, {"a": {"name": "x"}}, "doc.yaml")
+        assert result["a"].name == "x"
+        assert errors == []
+    info = type_adapter_cache_info()
+    assert (info.hits, info.misses) == (2, 1)
@@ -0,0 +1,74 @@
+import pickle
+from ipaddress import IPv6Address
+from types import SimpleNamespace
+
+from flync.core.utils.uniqueness_index import Duplicate, UniquenessIndex, address_key, ip_key, mac_key
+
+
+def _ecu(name, ips=(), macs=(), ports=(), multicast_groups=()):
+    return SimpleNamespace(
+        name=name,
+        get_all_ips=lambda: list(ips),
+        get_all_macs=lambda: list(macs),
+        get_all_ports=lambda: [SimpleNamespace(name=p) for p in ports],
+        multicast_groups=list(multicast_groups),
+    )
+
+
+def _mcast(group, mode, vlan=10):
+    return SimpleNamespace(group=group, mode=mode, vlan=vlan)
+
+
+def test_addresses_are_keyed_by_value_not_spelling():
+    assert ip_key("2001:db8::1") == ip_key("2001:0db8:0000:0000:0000:0000:0000:0001") == ip_key(IPv6Address("2001:db8::1"))
+    assert mac_key("02:AA:bb:00:00:01") == mac_key("02-aa-BB-00-00-01")
+    assert address_key("01:00:5e:00:00:01") == mac_key("01:00:5e:00:00:01")
+    assert address_key("0.0.0.1") != address_key("00:00:00:00:00:01")
+
+
+def test_every_duplicate_is_reported_with_both_owners():
+    index = UniquenessIndex.from_ecus(
+        [
+            _ecu("ecu_a", ips=["10.0.0.1", "10.0.0.2"], macs=["02:00:00:00:00:01"]),
+            _ecu("ecu_b", ips=["10.0.0.1"], macs=["02:00:00:00:00:01"]),
+            _ecu("ecu_c", ips=["10.0.0.2", "10.0.0.2"]),
+        ]
+    )
+
+    assert index.duplicates(UniquenessIndex.IPS) == [
+        Duplicate("10.0.0.1", "ecu_a", "ecu_b"),
+        Duplicate("10.0.0.2", "ecu_a", "ecu_c"),
+        Duplicate("10.0.0.2", "ecu_a", "ecu_c"),
+    ]
+    assert index.duplicates(UniquenessIndex.MACS) == [Duplicate("02:00:00:00:00:01", "ecu_a", "ecu_b")]
+    assert index.owner(UniquenessIndex.IPS, ip_key("10.0.0.2")) == "ecu_a"
+
+
+def test_dynamic_ips_may_repeat():
+    index = UniquenessIndex.from_ecus([_ecu("ecu_a", ips=["0.0.0.0", "::"]), _ecu("ecu_b", ips=["0.0.0.0", "::"])])
+    assert index.duplicates(UniquenessIndex.IPS) == []
+
+
+def test_names_keep_registration_order():
+    index = UniquenessIndex.from_ecus([_ecu("ecu_a", ports=["p1", "p2"]), _ecu("ecu_b", ports=["p1"])])
+    assert index.values(UniquenessIndex.ECU_NAMES) == ["ecu_a", "ecu_b"]
+    assert index.values(UniquenessIndex.PORT_NAMES) == ["p1", "p2", "p1"]
+    assert index.duplicates(UniquenessIndex.PORT_NAMES) == [Duplicate("p1", "ecu_a", "ecu_b")]
+
+
+def test_multicast_tx_lookup_is_per_vlan():
+    index = UniquenessIndex.from_ecus([_ecu("ecu_a", multicast_groups=[_mcast("239.0.0.1", "tx"), _mcast("239.0.0.2", "rx")])])
+    assert index.contains(UniquenessIndex.MULTICAST_TX, index.multicast_key("239.0.0.1", 10))
+    assert not index.contains(UniquenessIndex.MULTICAST_TX, index.multicast_key("239.0.0.1", 20))
+    assert not index.contains(UniquenessIndex.MULTICAST_TX, index.multicast_key("239.0.0.2", 10))
+
+
+def test_socket_transmits_survives_pickle():
+    socket = SimpleNamespace(multicast_tx=[IPv6Address("ff14::1")])
+    index = UniquenessIndex()
+    assert index.socket_transmits(socket, "ff14:0::1")
+    assert not index.socket_transmits(socket, "ff14::2")
+
+    restored = pickle.loads(pickle.dumps(index))
+    assert restored._socket_tx == {}
+    assert restored.socket_transmits(socket, "ff14::1")
@@ -1,6 +1,7 @@
 import pytest
 from pydantic import ValidationError
 
+from flync.core.utils.exceptions import _validation_warnings
 from flync.model.flync_4_ecu.switch import FrameMask, Switch, TCAMRule
 
 
@@ -412,3 +413,36 @@ class Test_FrameMask_TCAM:
         with pytest.raises(ValidationError) as e:
             TCAMRule.model_validate(rule)
         assert "must be a list of items" in str(e.value)
+
+
+@pytest.fixture
+def captured_warnings():
+    token = _validation_warnings.set([])
+    try:
+        yield _validation_warnings.get()
+    finally:
+        _validation_warnings.reset(token)
+
+
+def test_overlapping_tcam_rules_warn(embedded_metadata_entry, vlan_entry, switch_port, two_good_tcam_rules, captured_warnings):
+    catch_all = {"name": "tcam_rule_3", "id": 3, "match_filter": {"vlanid": 10}, "action": [{"type": "drop", "ports": [switch_port.name]}]}
+    udp = {"name": "tcam_rule_4", "id": 4, "match_filter": {"protocol": "udp"}, "action": [{"type": "mirror", "ports": [switch_port.name]}]}
+    _make_switch(embedded_metadata_entry, "switch_example", [vlan_entry], [switch_port], tcam_rules=[udp, catch_all, *two_good_tcam_rules])
+
+    assert [(warning["ctx"]["error_id"], warning["msg"]) for warning in captured_warnings] == [
+        (
+            "FLYNC-ECU-WARN-CONS-241",
+            "TCAM rule 'tcam_rule_2' never matches: the earlier rule 'tcam_rule_1' matches all of its frames with a different action.",
+        ),
+        (
+            "FLYNC-ECU-WARN-CONS-243",
+            "TCAM rule 'tcam_rule_4' partially overlaps the earlier rule(s) 'tcam_rule_1', 'tcam_rule_3' with different actions; "
+            "the rule ids decide which actions apply to the overlap.",
+        ),
+    ]
+
+
+def test_disjoint_tcam_rules_do_not_warn(embedded_metadata_entry, vlan_entry, switch_port, two_good_tcam_rules, captured_warnings):
+    other_vlan = two_good_tcam_rules[1].model_copy(update={"match_filter": two_good_tcam_rules[1].match_filter.model_copy(update={"vlanid": 11})})
+    _make_switch(embedded_metadata_entry, "switch_example", [vlan_entry], [switch_port], tcam_rules=[two_good_tcam_rules[0], other_vlan])
+    assert captured_warnings == []
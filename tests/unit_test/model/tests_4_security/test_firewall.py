@@ -1,6 +1,7 @@
 import pytest
 from pydantic import ValidationError
 
+from flync.core.utils.exceptions import _validation_warnings
 from flync.model.flync_4_ecu.controller import Controller, EthernetInterface, EthernetInterfaceConfig
 from flync.model.flync_4_security.firewall import Firewall
 from tests.error_assertions import assert_single_error
@@ -209,3 +210,35 @@ def test_negative_both_dst_ipv4_and_dst_ipv6_in_frame_filter(
     with pytest.raises(ValidationError) as exc_info:
         EthernetInterfaceConfig.model_validate(interface_config)
     assert_single_error(exc_info, "FLYNC-CMN-MIN-UNC-000", "while validating firewall")
+
+
+def test_firewall_rule_anomalies_warn():
+    firewall_example = {
+        "default_action": "drop",
+        "input_rules": [
+            {"name": "allow_lan", "action": "accept", "pattern": {"src_ipv4": {"address": "10.0.0.0", "ipv4netmask": "255.255.255.0"}}},
+            {"name": "block_ssh", "action": "drop", "pattern": {"protocol": "tcp", "dst_port": 22}},
+            {"name": "allow_host", "action": "accept", "pattern": {"src_ipv4": "10.0.0.7"}},
+        ],
+        "output_rules": [
+            {"name": "allow_web", "action": "accept", "pattern": {"protocol": "tcp", "dst_port": {"from_value": 80, "to_value": 443}}},
+            {"name": "allow_tcp", "action": "accept", "pattern": {"protocol": "tcp"}},
+        ],
+    }
+
+    token = _validation_warnings.set([])
+    try:
+        Firewall.model_validate(firewall_example)
+        warnings = [(warning["ctx"]["error_id"], warning["msg"]) for warning in _validation_warnings.get()]
+    finally:
+        _validation_warnings.reset(token)
+
+    assert warnings == [
+        (
+            "FLYNC-SEC-WARN-CONS-246",
+            "Firewall input rule 'block_ssh' partially overlaps the earlier rule(s) 'allow_lan' with a different action; "
+            "the rule order decides which action applies to the overlap.",
+        ),
+        ("FLYNC-SEC-WARN-CONS-245", "Firewall input rule 'allow_host' is redundant: rule 'allow_lan' gives all of its frames the same action."),
+        ("FLYNC-SEC-WARN-CONS-245", "Firewall output rule 'allow_web' is redundant: rule 'allow_tcp' gives all of its frames the same action."),
+    ]
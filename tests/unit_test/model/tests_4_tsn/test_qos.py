@@ -904,3 +904,23 @@ class Test_FrameFilter_Ethertype:
         """Test FrameFilter defaults ethertype to None when not specified."""
         frame_filter = FrameFilter()
         assert frame_filter.ethertype is None
+
+
+@pytest.mark.parametrize(
+    "mac, expected",
+    [
+        pytest.param(["02:00:00:00:00:01", "02-00-00-00-00-02"], ["02:00:00:00:00:01", "02:00:00:00:00:02"], id="list keeps every element"),
+        pytest.param({"address": "02:00:00:00:00:01", "macmask": "ff:ff:ff:00:00:00"}, "02:00:00:00:00:01", id="MAC address entry"),
+        pytest.param(["02:00:00:00:00:01", {"address": "02:00:00:00:00:02"}], ["02:00:00:00:00:01", "02:00:00:00:00:02"], id="mixed list"),
+    ],
+)
+def test_positive_frame_filter_mac_addresses(mac, expected):
+    frame_filter = FrameFilter(src_mac=mac, dst_mac=mac)
+    for value in (frame_filter.src_mac, frame_filter.dst_mac):
+        addresses = [getattr(element, "address", element) for element in value] if isinstance(value, list) else getattr(value, "address", value)
+        assert addresses == expected
+
+
+def test_negative_frame_filter_mac_address_in_list():
+    with pytest.raises(ValidationError):
+        FrameFilter(src_mac=["02:00:00:00:00:01", "not-a-mac"])
@@ -1,5 +1,6 @@
 import shutil
 import tracemalloc
+from typing import Optional
 
 import pytest
 from approvaltests import Path
@@ -16,9 +17,16 @@ __PERFORMANCE_THRESHOLDS = {
 current_dir = Path(__file__).resolve().parent
 
 
-def __performance_assertion(api: str, duration_ms: float, memory_mb: float):
+def __mean_ms(benchmark) -> Optional[float]:
+    # pytest-benchmark disables itself under xdist and leaves no stats; the wall time of a run competing with the other
+    # workers would not mean much anyway
+    return benchmark.stats["mean"] * 1000 if benchmark.stats else None
+
+
+def __performance_assertion(api: str, duration_ms: Optional[float], memory_mb: float):
     expected = __PERFORMANCE_THRESHOLDS[api]
-    assert duration_ms < expected["max_duration_ms"], f"{api} took {duration_ms}ms, exceeded {expected['max_duration_ms']}ms"
+    if duration_ms is not None:
+        assert duration_ms < expected["max_duration_ms"], f"{api} took {duration_ms}ms, exceeded {expected['max_duration_ms']}ms"
     assert memory_mb < expected["max_memory_mb"], f"{api} used {memory_mb}MB, exceeded {expected['max_memory_mb']}MB"
 
 
@@ -37,7 +45,7 @@ def test_validate_workspace_benchmark(benchmark, get_relative_flync_example_path
         return memory_mb
 
     memory_mb = benchmark(run_validate)
-    mean_ms = benchmark.stats["mean"] * 1000
+    mean_ms = __mean_ms(benchmark)
     __performance_assertion(validate_workspace.__name__, mean_ms, memory_mb)
 
 
@@ -59,6 +67,6 @@ def test_dump_flync_workspace_benchmark(benchmark, loaded_workspace_with_object_
         return peak / 1024 / 1024
 
     memory_mb = benchmark(run_dump)
-    mean_ms = benchmark.stats["mean"] * 1000
+    mean_ms = __mean_ms(benchmark)
 
     __performance_assertion(dump_flync_workspace.__name__, mean_ms, memory_mb)
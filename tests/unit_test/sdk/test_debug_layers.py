@@ -30,11 +30,14 @@ import flync.sdk.helpers.debug_layers.layer1_structure as layer1_mod
 import flync.sdk.helpers.debug_layers.layer2_yaml as layer2_mod
 import flync.sdk.helpers.debug_layers.layer3_4_5_workspace as layer345_mod
 from flync.core.annotations.external import External, NamingStrategy, OutputStrategy
+from flync.sdk.context.workspace_config import WorkspaceConfiguration
 from flync.sdk.helpers import debug as debug_mod
 from flync.sdk.helpers.debug_layers.layer1_structure import StructureIssue, check_structure
 from flync.sdk.helpers.debug_layers.layer2_yaml import YAMLIssue, check_yaml_syntax
 from flync.sdk.helpers.debug_layers.layer3_4_5_workspace import run_workspace_validation
 from flync.sdk.helpers.debug_layers.runner import run_debug
+from flync.sdk.helpers.debug_layers.session import DebugSession
+from flync.sdk.workspace.document import Document
 
 EXAMPLES = Path(__file__).parents[3] / "examples" / "flync_example"
 
@@ -573,7 +576,7 @@ def test_run_debug_scenarios(tmp_path, capsys, monkeypatch):
         m.setattr(
             layer2_mod,
             "check_yaml_syntax",
-            lambda dir_path: [YAMLIssue(message="bad syntax", path="ecus/x.flync.yaml", line=3)],
+            lambda dir_path, session=None: [YAMLIssue(message="bad syntax", path="ecus/x.flync.yaml", line=3)],
         )
         run_debug(tmp_path)
         assert "Stopped at Layer 2." in _plain(capsys.readouterr().out)
@@ -581,11 +584,11 @@ def test_run_debug_scenarios(tmp_path, capsys, monkeypatch):
     # Reports "Model is valid" when no issues are found at any layer.
     with monkeypatch.context() as m:
         m.setattr(layer1_mod, "check_structure", lambda model_cls, dir_path, root_path: [])
-        m.setattr(layer2_mod, "check_yaml_syntax", lambda dir_path: [])
+        m.setattr(layer2_mod, "check_yaml_syntax", lambda dir_path, session=None: [])
         m.setattr(
             layer345_mod,
             "run_workspace_validation",
-            lambda dir_path: (SimpleNamespace(model=object()), []),
+            lambda dir_path, session=None: (SimpleNamespace(model=object()), []),
         )
         run_debug(tmp_path)
         assert "Model is valid" in capsys.readouterr().out
@@ -595,11 +598,11 @@ def test_run_debug_scenarios(tmp_path, capsys, monkeypatch):
 
     with monkeypatch.context() as m:
         m.setattr(layer1_mod, "check_structure", lambda model_cls, dir_path, root_path: [])
-        m.setattr(layer2_mod, "check_yaml_syntax", lambda dir_path: [])
+        m.setattr(layer2_mod, "check_yaml_syntax", lambda dir_path, session=None: [])
         m.setattr(
             layer345_mod,
             "run_workspace_validation",
-            lambda dir_path: (
+            lambda dir_path, session=None: (
                 SimpleNamespace(model=object()),
                 [
                     WorkspaceIssue(layer=4, severity="error", message="bad value", field="x"),
@@ -614,3 +617,50 @@ def test_run_debug_scenarios(tmp_path, capsys, monkeypatch):
         assert "Layer 5 - System-Wide Validation" in out
         assert "system warning" in out
         assert "Stopped at Layer 3." not in out
+
+
+def test_debug_session_parses_every_file_once(workspace, monkeypatch):
+    parsed: list[str] = []
+    parse_text = Document._parse_text.__func__
+    monkeypatch.setattr(Document, "_parse_text", classmethod(lambda cls, text, compose: parsed.append(text) or parse_text(cls, text, compose)))
+
+    session = DebugSession(workspace)
+    assert check_yaml_syntax(workspace, session) == []
+    _, issues = run_workspace_validation(workspace, session)
+
+    assert len(parsed) == len(list(workspace.rglob("*.flync.yaml"))) == len(session.documents)
+    assert not [i for i in issues if i.layer in (3, 4)]
+
+
+def test_debug_session_reads_the_workspace_configuration(workspace):
+    WorkspaceConfiguration(map_objects=True, persist_config=False).to_yaml_file(workspace / ".flync" / "config.yaml")
+    assert DebugSession(workspace).configuration.map_objects is True
+    explicit = WorkspaceConfiguration()
+    assert DebugSession(workspace, explicit).configuration is explicit
+
+
+def test_debug_session_keeps_failed_files_from_later_layers(workspace):
+    (workspace / _LIN_BUS).write_text(_INVALID_YAML, encoding="utf-8")
+    session = DebugSession(workspace)
+    session.mark_failed(_TOPOLOGY, 1)
+
+    issues = check_yaml_syntax(workspace, session)
+    assert [(i.path, i.line) for i in issues] == [(_LIN_BUS, 2)]
+    assert session.failed == {_TOPOLOGY: 1, _LIN_BUS: 2}
+    assert _TOPOLOGY not in session.documents and _LIN_BUS not in session.documents
+    assert session.data(workspace / _DIAG_CAN, 3) == _load(workspace / _DIAG_CAN)
+    session.mark_failed(_DIAG_CAN, 3)
+    assert session.data(workspace / _DIAG_CAN, 3) is not None and session.data(workspace / _DIAG_CAN, 4) is None
+
+
+def test_debug_session_parses_every_allowed_extension(workspace):
+    # the workspace loads .flync.yml documents too, so the debug session must not skip them
+    lin_bus = workspace / _LIN_BUS
+    renamed = _LIN_BUS.removesuffix(".flync.yaml") + ".flync.yml"
+    lin_bus.rename(workspace / renamed)
+    session = DebugSession(workspace)
+    assert check_yaml_syntax(workspace, session) == []
+    assert renamed in session.documents
+
+    (workspace / renamed).write_text(_INVALID_YAML, encoding="utf-8")
+    assert [(i.path, i.line) for i in check_yaml_syntax(workspace, DebugSession(workspace))] == [(renamed, 2)]
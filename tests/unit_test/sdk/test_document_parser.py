@@ -1,9 +1,10 @@
+import pickle
 from pathlib import Path
 from typing import Any
 
 import pytest
 
-from flync.sdk.workspace.document import Document, parse_documents, read_file
+from flync.sdk.workspace.document import Document, PositionIndex, parse_documents, read_file, source_stamp
 
 # --- Fixtures / Helpers ---
 
@@ -105,3 +106,40 @@ def test_parse_documents_compose_ast_preserves_structure(tmp_path):
     # Verify compose_ast is a ruamel.yaml node tree
     assert hasattr(compose_ast, "start_mark")
     assert compose_ast.start_mark.line == 0
+
+
+def test_parse_documents_compact_returns_position_index(tmp_path):
+    file_path, ws_root = _make_yaml(tmp_path, "data.yaml", "items:\n  - a\n  - b")
+    _, ast, positions = parse_documents([file_path], ws_root, True, compact=True)[0]
+    assert ast == {"items": ["a", "b"]}
+    assert isinstance(positions, PositionIndex)
+    assert parse_documents([file_path], ws_root, False, compact=True)[0][2] is None
+
+
+def test_document_reads_text_lazily_and_rebuilds_compose_ast(tmp_path):
+    file_path, ws_root = _make_yaml(tmp_path, "data.yaml", "items:\n  - a\n  - b")
+    _, ast, positions = parse_documents([file_path], ws_root, True, compact=True)[0]
+    doc = Document("data.yaml", None, True, source_path=file_path)
+    doc.assign_ast(ast, positions)
+    assert doc._text is None
+    assert doc.compose_ast.value[0][0].value == "items"
+    assert doc.compose_ast.end_mark.line == 2
+    assert doc.compose_ast is doc.compose_ast
+    assert pickle.loads(pickle.dumps(doc))._compose_ast is None
+    assert doc.text == "items:\n  - a\n  - b"
+
+    doc.update_text("items: []")
+    assert doc.positions is None
+    assert doc.ast == {"items": []}
+    assert doc.compose_ast.value[0][1].value == []
+
+
+def test_document_does_not_read_text_of_a_file_changed_since_parsing(tmp_path, caplog):
+    file_path, ws_root = _make_yaml(tmp_path, "data.yaml", "items:\n  - a\n  - b")
+    stamp = source_stamp(file_path)
+    _, ast, positions = parse_documents([file_path], ws_root, True, compact=True)[0]
+    file_path.write_text("# moved down\nitems:\n  - a\n  - b\n  - c")
+    doc = Document("data.yaml", None, True, source_path=file_path, source_stamp=stamp)
+    doc.assign_ast(ast, positions)
+    assert doc.text is None
+    assert "changed on disk" in caplog.text
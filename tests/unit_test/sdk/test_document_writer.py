@@ -0,0 +1,80 @@
+import os
+import stat
+
+import pytest
+import yaml
+
+from flync.sdk.helpers.generation_helpers import dump_flync_workspace
+from flync.sdk.workspace import document_writer
+from flync.sdk.workspace.document_writer import serialize_document, write_documents, write_file
+from flync.sdk.workspace.flync_workspace import FLYNCWorkspace, WorkspaceConfiguration
+
+FAST = WorkspaceConfiguration(fast_write=True, write_workers=4, persist_config=False)
+
+
+def _files(root):
+    return {path.relative_to(root).as_posix(): path.read_bytes() for path in root.rglob("*") if path.is_file()}
+
+
+def test_fast_write_produces_the_default_output(loaded_workspace_without_object_map, tmp_path):
+    model = loaded_workspace_without_object_map.flync_model
+    dump_flync_workspace(model, tmp_path / "default", "default", WorkspaceConfiguration(persist_config=False))
+    report = dump_flync_workspace(model, tmp_path / "fast", "fast", FAST)
+
+    expected = _files(tmp_path / "default")
+    assert _files(tmp_path / "fast") == expected
+    assert (report.files_written, report.files_unchanged) == (len(expected), 0)
+    assert report.bytes_written == sum(len(content) for content in expected.values())
+
+
+def test_fast_write_only_touches_changed_files(loaded_workspace_without_object_map, tmp_path):
+    workspace = FLYNCWorkspace.load_model(loaded_workspace_without_object_map.flync_model, "fast", tmp_path, workspace_config=FAST)
+    assert not any(tmp_path.iterdir()), "fast_write leaves the writing to generate_configs"
+    written = workspace.generate_configs()
+    old = 1_000_000_000
+    for path in tmp_path.rglob("*.flync.yaml"):
+        os.utime(path, ns=(old, old))
+
+    edited = workspace.documents[str(tmp_path / "system_metadata.flync.yaml")]
+    edited.text["author"] = "someone else"
+    report = workspace.generate_configs()
+
+    assert (report.files_written, report.files_unchanged) == (1, written.files_written - 1)
+    touched = [path for path in tmp_path.rglob("*.flync.yaml") if path.stat().st_mtime_ns != old]
+    assert touched == [tmp_path / "system_metadata.flync.yaml"]
+    assert "someone else" in touched[0].read_text()
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_serialize_document_matches_the_pure_python_dumper():
+    content = {"name": "ecu", "ports": [{"name": "p0", "vlans": [1, 2]}, {"name": "ü", "description": "x" * 200}], "empty": {}}
+    expected = yaml.dump(content, sort_keys=False, default_flow_style=False, allow_unicode=True)
+    assert serialize_document(content).decode("utf-8").replace(os.linesep, "\n") == expected
+    assert serialize_document("raw: text\n") == f"raw: text{os.linesep}".encode()
+
+
+def test_write_file_keeps_permissions_and_cleans_up_on_failure(tmp_path, monkeypatch):
+    target = tmp_path / "nested" / "doc.flync.yaml"
+    assert write_file(target, b"a: 1\n") == 5
+    target.chmod(0o640)
+    assert write_file(target, b"a: 1\n", skip_unchanged=True) is None
+    assert write_file(target, b"a: 2\n", skip_unchanged=True) == 5
+    assert stat.S_IMODE(target.stat().st_mode) == 0o640
+    if hasattr(os, "fchmod"):
+        # the umask must not strip bits of the replaced file
+        target.chmod(0o664)
+        previous = os.umask(0o022)
+        try:
+            write_file(target, b"a: 2\n")
+        finally:
+            os.umask(previous)
+        assert stat.S_IMODE(target.stat().st_mode) == 0o664
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(document_writer.os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        write_documents([(target, "a: 3\n")])
+    assert target.read_bytes() == b"a: 2\n"
+    assert [path.name for path in target.parent.iterdir()] == ["doc.flync.yaml"]
@@ -42,3 +42,11 @@ def test_parent_from_child_prefers_external_parent():
     assert _Widget in graph.reverse_tree
     assert {_ExternalHost, _InlineHost} <= graph.reverse_tree[_Widget]  # both are genuine candidates
     assert graph.parent_from_child(_Widget, "widgets") is _ExternalHost
+
+
+def test_rebuild_type_from_parent_returns_the_same_object():
+    """The effective type is memoized, so the TypeAdapter cache of validate_with_policy hits on it."""
+    graph = ModelDependencyGraph(_Root)
+    rebuilt = graph.rebuild_type_from_parent(_Widget, "widgets")
+    assert rebuilt == dict[str, List[_Widget]]
+    assert graph.rebuild_type_from_parent(_Widget, "widgets") is rebuilt
@@ -1,11 +1,13 @@
 """Tests for model dependency graph cache invalidation."""
 
-from typing import Optional
+import importlib.metadata
+from typing import Annotated, Optional
 from unittest.mock import MagicMock, patch
 
 import pytest
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, BeforeValidator, Field
 
+from flync.sdk.utils import model_dependencies
 from flync.sdk.utils.model_dependencies import (
     _hash_model_structure,
     get_model_dependency_graph,
@@ -99,6 +101,23 @@ class TestModelStructureHashing:
 
         assert hash1 == hash2, "Hash should be consistent for the same model"
 
+    def test_hash_ignores_validator_addresses(self):
+        """Hash must be stable across processes, so memory addresses of validator functions must not enter it."""
+
+        def make_validator():
+            def strip(value):
+                return value
+
+            return strip
+
+        class ModelA(BaseModel):
+            name: Annotated[str, BeforeValidator(make_validator())]
+
+        class ModelB(BaseModel):
+            name: Annotated[str, BeforeValidator(make_validator())]
+
+        assert _hash_model_structure(ModelA) == _hash_model_structure(ModelB)
+
     def test_cache_key_includes_hash(self):
         """Verify that cache keys include the model structure hash."""
 
@@ -185,3 +204,60 @@ class TestCacheInvalidationWithExtendedModels:
         assert hash_dynamic is not None
         # They have different structures (DynamicModel has test_field)
         assert hash_standard != hash_dynamic
+
+
+@pytest.fixture
+def installed_release(monkeypatch):
+    """Pretend FLYNC is a regular (non-editable) install of release 1.2.3."""
+    monkeypatch.setattr(model_dependencies, "is_editable_install", lambda: False)
+    monkeypatch.setattr(model_dependencies, "flync_code_version", lambda: "1.2.3")
+    monkeypatch.setattr(model_dependencies, "_graph_cache", {})
+    model_dependencies._shipped_graphs.cache_clear()
+    yield
+    model_dependencies._shipped_graphs.cache_clear()
+
+
+class TestShippedGraphs:
+    """The graphs built with the wheel are used without hashing the sources or taking the cache lock."""
+
+    def test_installed_release_uses_the_shipped_graphs(self, installed_release, monkeypatch, tmp_path):
+        from flync.model import FLYNCModel
+        from flync.model.flync_4_ecu import ECU
+
+        artifact = tmp_path / "graphs.bin"
+        assert model_dependencies.write_graph_artifact(str(artifact), "1.2.3") > 1
+        monkeypatch.setattr(model_dependencies, "GRAPH_ARTIFACT", str(artifact))
+        monkeypatch.setattr(model_dependencies, "FileLock", MagicMock(side_effect=AssertionError("lock taken")))
+
+        graph = get_model_dependency_graph(FLYNCModel)
+        assert graph.root is FLYNCModel
+        assert graph.fields_info.keys() == model_dependencies.ModelDependencyGraph(FLYNCModel).fields_info.keys()
+        assert get_model_dependency_graph(ECU).root is ECU
+
+    def test_artifact_of_another_release_is_ignored(self, installed_release, monkeypatch, tmp_path):
+        artifact = tmp_path / "graphs.bin"
+        artifact.write_bytes(b"")
+        monkeypatch.setattr(model_dependencies, "GRAPH_ARTIFACT", str(artifact))
+        assert model_dependencies._shipped_graphs() == {}
+
+        model_dependencies._shipped_graphs.cache_clear()
+        with patch.object(model_dependencies.pickle, "load", return_value={"version": "1.0.0", "graphs": {"key": b""}}):
+            assert model_dependencies._shipped_graphs() == {}
+
+    def test_artifact_version_is_compared_normalized(self, installed_release, monkeypatch, tmp_path):
+        # hatch hands the hook the normalized version, the wheel metadata keeps the spelling of the VCS tag
+        monkeypatch.setattr(model_dependencies, "flync_code_version", lambda: "1.2.3-post.4+abc")
+        artifact = tmp_path / "graphs.bin"
+        artifact.write_bytes(b"")
+        monkeypatch.setattr(model_dependencies, "GRAPH_ARTIFACT", str(artifact))
+        with patch.object(model_dependencies.pickle, "load", return_value={"version": "1.2.3.post4+abc", "graphs": {"key": b""}}):
+            assert model_dependencies._shipped_graphs() == {"key": b""}
+
+    def test_code_version_hashes_the_sources_of_editable_installs_only(self, monkeypatch):
+        monkeypatch.setattr(model_dependencies, "hash_directory_fast", lambda directory: "hash")
+        monkeypatch.setattr(model_dependencies, "is_editable_install", lambda: True)
+        assert model_dependencies.flync_code_version.__wrapped__().endswith("-hash")
+
+        monkeypatch.setattr(model_dependencies, "hash_directory_fast", MagicMock(side_effect=AssertionError("sources hashed")))
+        monkeypatch.setattr(model_dependencies, "is_editable_install", lambda: False)
+        assert model_dependencies.flync_code_version.__wrapped__() == importlib.metadata.version("flync")
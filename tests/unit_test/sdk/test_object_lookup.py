@@ -60,7 +60,7 @@ def test_get_child_ids_works_same_in_both_modes(
     assert children_dual == children_idx
 
 
-# -- get_object (exercises _try_get_from_duplicated_id) ------------------------
+# -- get_object (name paths are aliases of the index paths) --------------------
 
 
 def test_get_object_by_index_path(loaded_workspace_with_object_map):
@@ -80,12 +80,13 @@ def test_get_object_by_name_path(loaded_workspace_with_object_map):
 def test_get_object_index_and_name_refer_to_same_semantic_object(loaded_workspace_with_object_map):
     ws = loaded_workspace_with_object_map
     # The name path resolves to the same SemanticObject instance as the index path
-    name_paths = ws._duplicated_objects_ids["ecus.0"]
-    assert len(name_paths) == 1
     obj_idx = ws.get_object("ecus.0")
+    name_paths = ws.get_semantic_objects_ids_from_model(obj_idx.model)[1:]
+    assert name_paths == [f"ecus.{obj_idx.model.name}"]
     obj_name = ws.get_object(name_paths[0])
     assert isinstance(obj_idx, SemanticObject) and isinstance(obj_name, SemanticObject)
-    assert obj_idx.model is obj_name.model
+    assert obj_idx is obj_name
+    assert ws.get_object(f"{name_paths[0]}.ports") is ws.get_object("ecus.0.ports")
 
 
 # -- list_objects backward compatibility ---------------------------------------
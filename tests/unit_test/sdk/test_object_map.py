@@ -0,0 +1,77 @@
+import pickle
+
+import pytest
+
+from flync.sdk.workspace.object_map import ROOT, ObjectMap, ObjectPaths
+
+
+@pytest.fixture
+def aliased():
+    """``ecus.0`` with the alias ``ecus.gw`` and the child ``ecus.0.ports.0`` (alias ``eth0``)."""
+    paths = ObjectPaths()
+    objects = ObjectMap(paths)
+    ecus = paths.intern("ecus")
+    paths.alias(ecus, "gw", paths.child(ecus, "0"))
+    ports = paths.intern("ecus.0.ports")
+    paths.alias(ports, "eth0", paths.child(ports, "0"))
+    for key in ("ecus", "ecus.0", "ecus.0.ports", "ecus.0.ports.0"):
+        objects[key] = key
+    return paths, objects
+
+
+def test_aliases_find_the_canonical_entry(aliased):
+    _, objects = aliased
+    for key in ("ecus.gw", "ecus.gw.ports.eth0", "ecus.0.ports.eth0", "ecus.gw.ports.0"):
+        assert key in objects
+    assert objects["ecus.gw.ports.eth0"] == "ecus.0.ports.0"
+    assert objects.get("ecus.gw.missing") is None
+    with pytest.raises(KeyError):
+        objects["ecus.1"]
+
+
+def test_iteration_covers_canonical_ids_only(aliased):
+    _, objects = aliased
+    assert list(objects) == ["ecus", "ecus.0", "ecus.0.ports", "ecus.0.ports.0"]
+    assert dict(objects.items()) == {key: key for key in objects}
+    assert len(objects) == 4
+
+
+def test_spellings_list_every_combination_canonical_first(aliased):
+    _, objects = aliased
+    assert objects.spellings("ecus.gw.ports.eth0") == ["ecus.0.ports.0", "ecus.gw.ports.0", "ecus.0.ports.eth0", "ecus.gw.ports.eth0"]
+    assert objects.spellings("ecus.1") == []
+
+
+def test_segments_containing_dots_are_found():
+    paths = ObjectPaths()
+    objects = ObjectMap(paths)
+    # e.g. an address used as a dict key, registered as one segment by the workspace
+    paths.child(paths.intern("ips"), "10.0.0.1")
+    objects["ips.10.0.0.1.mask"] = "mask"
+    assert objects["ips.10.0.0.1.mask"] == "mask"
+    assert paths.child_segments(paths.find("ips")) == ["10.0.0.1"]
+    assert "ips.10.0" not in objects
+
+
+def test_prune_drops_descendants_and_their_aliases(aliased):
+    paths, objects = aliased
+    ecus = paths.find("ecus")
+    for key in objects.ids_under("ecus.gw")[:]:
+        del objects[key]
+    paths.prune(ecus)
+    assert list(objects) == ["ecus"]
+    assert "ecus.gw" not in objects
+    assert len(paths) == 2
+    # freed nodes are reused
+    objects["ecus.1"] = "ecus.1"
+    assert len(paths) == 3 and list(objects) == ["ecus", "ecus.1"]
+
+
+def test_merge_keeps_aliases_and_survives_pickling(aliased):
+    other, other_objects = aliased
+    paths = ObjectPaths()
+    paths.intern("apps.0")
+    paths.merge(pickle.loads(pickle.dumps(other)))
+    assert paths.find("ecus.gw.ports.eth0") == paths.find("ecus.0.ports.0") != ROOT
+    assert paths.path(paths.find("ecus.gw.ports.eth0")) == "ecus.0.ports.0"
+    assert paths.child_segments(paths.find("ecus")) == ["0", "gw"]
@@ -0,0 +1,254 @@
+import random
+import struct
+from ipaddress import IPv4Address, IPv4Network, IPv6Address, IPv6Network
+
+import pytest
+
+from flync.core.datatypes.ipaddress import IPv4AddressEntry, IPv6AddressEntry
+from flync.core.datatypes.macaddress import MACAddressEntry
+from flync.core.datatypes.value_range import ValueRange
+from flync.model.flync_4_ecu.switch import TCAMRule
+from flync.model.flync_4_security.firewall import Firewall, FirewallRule
+from flync.model.flync_4_tsn.qos import FrameFilter
+from flync.sdk.classifier import FrameHeader, compile_filters, compile_firewall, compile_tcam, iter_batches, parse_frame, read_pcap
+
+MACS = ["02:00:00:00:00:01", "02:00:00:00:00:02", "02:00:00:00:01:01", "04:00:00:00:00:01"]
+IPV4S = ["10.0.0.1", "10.0.0.2", "10.0.1.1", "192.168.0.1"]
+IPV6S = ["fd00::1", "fd00::2", "fd00:0:0:1::1", "fe80::1"]
+
+
+def _random_filter(rng):
+    fields = {}
+    for name in rng.sample(["ethertype", "mac", "vlan", "pcp", "ip", "protocol", "port"], rng.randint(1, 3)):
+        if name == "ethertype":
+            fields["ethertype"] = rng.choice([0x0800, "IPv6", [0x0800, 0x86DD]])
+        elif name == "mac":
+            key = rng.choice(["src_mac", "dst_mac"])
+            fields[key] = rng.choice([rng.choice(MACS), MACAddressEntry(address=rng.choice(MACS), macmask="ff:ff:ff:ff:ff:00"), rng.sample(MACS, 2)])
+        elif name == "vlan":
+            fields["vlanid"] = rng.choice([rng.randint(1, 6), ValueRange(from_value=2, to_value=4), [1, ValueRange(from_value=5, to_value=6)]])
+        elif name == "pcp":
+            fields["pcp"] = rng.choice([rng.randint(0, 3), [1, 2]])
+        elif name == "ip" and rng.random() < 0.5:
+            entry = IPv4AddressEntry(address=rng.choice(IPV4S), ipv4netmask=rng.choice(["255.255.255.0", "255.255.255.255"]))
+            fields[rng.choice(["src_ipv4", "dst_ipv4"])] = rng.choice([entry, IPv4Address(rng.choice(IPV4S))])
+        elif name == "ip":
+            entry = IPv6AddressEntry(address=rng.choice(IPV6S), ipv6prefix=rng.choice([64, 128]))
+            fields[rng.choice(["src_ipv6", "dst_ipv6"])] = rng.choice([entry, [entry, IPv6Address(rng.choice(IPV6S))]])
+        elif name == "protocol":
+            fields["protocol"] = rng.choice(["tcp", "udp"])
+        else:
+            fields[rng.choice(["src_port", "dst_port"])] = rng.choice([rng.randint(1, 4), ValueRange(from_value=2, to_value=3)])
+    fields.setdefault("vlan_tagged", rng.choice([None, None, True, False]))
+    return FrameFilter(**fields)
+
+
+def _random_header(rng):
+    tagged, version = rng.random() < 0.6, rng.choice([4, 6, None])
+    header = dict(
+        dst_mac=int(rng.choice(MACS).replace(":", ""), 16),
+        src_mac=int(rng.choice(MACS).replace(":", ""), 16),
+        ethertype={4: 0x0800, 6: 0x86DD, None: 0x22F0}[version],
+        vlan_tagged=tagged,
+        vlanid=rng.randint(0, 7) if tagged else None,
+        pcp=rng.randint(0, 3) if tagged else None,
+    )
+    if version == 4:
+        header.update(src_ipv4=int(IPv4Address(rng.choice(IPV4S))), dst_ipv4=int(IPv4Address(rng.choice(IPV4S))))
+    elif version == 6:
+        header.update(src_ipv6=int(IPv6Address(rng.choice(IPV6S))), dst_ipv6=int(IPv6Address(rng.choice(IPV6S))))
+    if version is not None and rng.random() < 0.8:
+        header.update(protocol=rng.choice(["tcp", "udp"]), src_port=rng.randint(1, 4), dst_port=rng.randint(1, 4))
+    return FrameHeader(**header)
+
+
+def _values(value):
+    return value if isinstance(value, list) else [value]
+
+
+def _oracle(match, header):
+    """Straightforward evaluation of one frame filter, field by field."""
+    if match.ethertype is not None and header.ethertype not in [ethertype.value for ethertype in _values(match.ethertype)]:
+        return False
+    if match.vlan_tagged is not None and header.vlan_tagged != match.vlan_tagged:
+        return False
+    if match.pcp is not None and header.pcp not in _values(match.pcp):
+        return False
+    if match.protocol is not None and header.protocol != match.protocol:
+        return False
+    for name in ("vlanid", "src_port", "dst_port"):
+        value, accepted = getattr(header, name), getattr(match, name)
+        if accepted is not None and not any(
+            value is not None and (option.from_value <= value <= option.to_value if isinstance(option, ValueRange) else value == option)
+            for option in _values(accepted)
+        ):
+            return False
+    for name in ("src_mac", "dst_mac"):
+        if getattr(match, name) is None:
+            continue
+        value, options = getattr(header, name), []
+        for option in _values(getattr(match, name)):
+            address, mask = (option.address, option.macmask) if isinstance(option, MACAddressEntry) else (option, "ff:ff:ff:ff:ff:ff")
+            options.append(value & int(mask.replace(":", ""), 16) == int(address.replace(":", ""), 16) & int(mask.replace(":", ""), 16))
+        if not any(options):
+            return False
+    for name, network in [("src_ipv4", IPv4Network), ("dst_ipv4", IPv4Network), ("src_ipv6", IPv6Network), ("dst_ipv6", IPv6Network)]:
+        if getattr(match, name) is None:
+            continue
+        value, networks = getattr(header, name), []
+        for option in _values(getattr(match, name)):
+            if isinstance(option, (IPv4AddressEntry, IPv6AddressEntry)):
+                prefix = option.ipv4netmask if isinstance(option, IPv4AddressEntry) else option.ipv6prefix
+                networks.append(network(f"{option.address}/{prefix}", strict=False))
+            else:
+                networks.append(network(option))
+        if value is None or not any(network(value).subnet_of(candidate) for candidate in networks):
+            return False
+    return True
+
+
+def test_filters_agree_with_a_rule_by_rule_oracle():
+    rng = random.Random(14)
+    filters = [_random_filter(rng) for _ in range(60)]
+    classifier = compile_filters(filters)
+    for header in [_random_header(rng) for _ in range(3000)]:
+        expected = [position for position, match in enumerate(filters) if _oracle(match, header)]
+        assert classifier.match_bits(header) == sum(1 << position for position in expected)
+        assert classifier.all_matches(header) == [filters[position] for position in expected]
+        assert classifier.classify([header]) == [expected[0] if expected else None]
+    assert sum(classifier.hit_counts([_random_header(rng) for _ in range(500)]).values()) == 500
+
+
+def _frame(dst="02:00:00:00:00:01", src="02:00:00:00:00:02", vlans=(), ethertype=0x0800, payload=b""):
+    tags = b"".join(struct.pack("!HH", tpid, tci) for tpid, tci in vlans)
+    return bytes.fromhex(dst.replace(":", "")) + bytes.fromhex(src.replace(":", "")) + tags + struct.pack("!H", ethertype) + payload
+
+
+def _ipv4(protocol=17, ports=(1234, 80), options=b"", fragment=0):
+    header = struct.pack("!BBHHHBBH4s4s", 0x45 + len(options) // 4, 0, 0, 0, fragment, 64, protocol, 0, bytes([10, 0, 0, 1]), bytes([10, 0, 0, 2]))
+    return header + options + struct.pack("!HH", *ports) + bytes(4)
+
+
+def test_parse_frame_headers():
+    header = parse_frame(_frame(vlans=[(0x88A8, 0x6005), (0x8100, 0x0007)], payload=_ipv4(options=bytes(4))), port="p0")
+    assert (header.vlan_tagged, header.vlanid, header.pcp, header.ethertype, header.port) == (True, 5, 3, 0x0800, "p0")
+    assert (header.src_ipv4, header.dst_ipv4) == (int(IPv4Address("10.0.0.1")), int(IPv4Address("10.0.0.2")))
+    assert (header.protocol, header.src_port, header.dst_port) == ("udp", 1234, 80)
+
+    fragment = parse_frame(_frame(payload=_ipv4(protocol=6, fragment=0x0010)))
+    assert (fragment.protocol, fragment.src_port) == ("tcp", None)
+
+    hop_by_hop = bytes([6, 0]) + bytes(6)
+    ipv6 = struct.pack("!IHBB", 6 << 28, 0, 0, 64) + IPv6Address("fd00::1").packed + IPv6Address("fd00::2").packed + hop_by_hop
+    header = parse_frame(_frame(ethertype=0x86DD, payload=ipv6 + struct.pack("!HH", 30490, 30501)))
+    assert (header.vlan_tagged, header.src_ipv6, header.protocol, header.dst_port) == (False, int(IPv6Address("fd00::1")), "tcp", 30501)
+
+    assert parse_frame(_frame(payload=b"\x45"))[:-1] == FrameHeader(0x020000000001, 0x020000000002, 0x0800)[:-1]
+
+
+def _write_pcap(path, frames, order="<", link_type=1):
+    with open(path, "wb") as stream:
+        stream.write(struct.pack(order + "IHHiIII", 0xA1B2C3D4, 2, 4, 0, 0, 65535, link_type))
+        for number, frame in enumerate(frames):
+            stream.write(struct.pack(order + "IIII", number, 0, len(frame), len(frame)) + frame)
+
+
+def _write_pcapng(path, frames, link_type=1):
+    def block(kind, body):
+        body += bytes(-len(body) % 4)
+        return struct.pack("<II", kind, len(body) + 12) + body + struct.pack("<I", len(body) + 12)
+
+    with open(path, "wb") as stream:
+        stream.write(block(0x0A0D0D0A, struct.pack("<IHHq", 0x1A2B3C4D, 1, 0, -1)))
+        stream.write(block(1, struct.pack("<HHI", link_type, 0, 65535)))
+        for frame in frames:
+            stream.write(block(6, struct.pack("<IIIII", 0, 0, 0, len(frame), len(frame)) + frame))
+        stream.write(block(3, struct.pack("<I", len(frames[0])) + frames[0]))
+
+
+def test_read_pcap_and_pcapng(tmp_path):
+    frames = [_frame(vlans=[(0x8100, vlan)], payload=_ipv4(ports=(vlan, 80))) for vlan in range(1, 6)] + [_frame(ethertype=0x22F0, payload=bytes(3))]
+    expected = [parse_frame(frame, "p1") for frame in frames]
+    for order in "<>":
+        _write_pcap(tmp_path / f"capture{order == '<'}.pcap", frames, order)
+        assert list(read_pcap(tmp_path / f"capture{order == '<'}.pcap", port="p1")) == expected
+    _write_pcapng(tmp_path / "capture.pcapng", frames)
+    assert list(read_pcap(tmp_path / "capture.pcapng", port="p1")) == expected + expected[:1]
+    assert [len(batch) for batch in iter_batches(read_pcap(tmp_path / "capture.pcapng"), size=4)] == [4, 3]
+
+    _write_pcap(tmp_path / "wifi.pcap", frames, link_type=105)
+    _write_pcapng(tmp_path / "wifi.pcapng", frames, link_type=105)
+    (tmp_path / "text.pcap").write_text("no capture")
+    for name in ("wifi.pcap", "wifi.pcapng", "text.pcap"):
+        with pytest.raises(ValueError):
+            list(read_pcap(tmp_path / name))
+
+
+def test_tcam_rules_of_the_example_switch(loaded_workspace_without_object_map):
+    switch = next(
+        switch
+        for ecu in loaded_workspace_without_object_map.flync_model.ecus
+        for switch in ecu.get_all_switches() or []
+        if switch.name == "z2_switch1"
+    )
+    classifier = compile_tcam(switch)
+    assert [rule.id for rule in classifier.rules] == [1, 2, 3, 4, 5]
+
+    def first(frame, port, vehicle_state=None):
+        rule = classifier.first_match(parse_frame(frame, port), vehicle_state)
+        return rule.name if rule else None
+
+    tagged = _frame(vlans=[(0x8100, 0x6000 | 20)], payload=_ipv4(ports=(1234, 1234)))
+    # rule_1 is gated on the vehicle state, so without one the frame falls through to rule_2
+    assert first(tagged, "z2_s1_p0") == "rule_2"
+    assert first(tagged, "z2_s1_p0", 0xF2) == "rule_1"
+    assert [rule.name for rule in classifier.all_matches(parse_frame(tagged, "z2_s1_p0"), 0xF2)] == ["rule_1", "rule_2"]
+    assert [rule.name for rule in classifier.all_matches(parse_frame(tagged, "z2_s1_p0"), 0xF3)] == ["rule_2"]
+    assert first(tagged, "z2_s1_p1") == "rule_3"
+    assert first(_frame(payload=_ipv4(ports=(1234, 1234))), "z2_s1_p1") == "rule_3"
+    assert first(_frame(payload=_ipv4(ports=(1234, 1235))), "z2_s1_p1") is None
+
+    # rule_4 matches IPv4 with a 0x3014 (masked by 0x7FFF) version / header length / DSCP word, on port z2_s1_p2 only
+    ipv4_word = _frame(payload=bytes([0xB0, 0x14]) + bytes(20))
+    assert first(ipv4_word, "z2_s1_p2") == "rule_4"
+    assert first(ipv4_word, "z2_s1_p1") is None
+    assert first(ipv4_word[:15], "z2_s1_p2") is None
+    # rule_5 has no match_ports and so applies on every port
+    rule_5 = _frame(dst="81:00:00:00:00:01", ethertype=0xF800, payload=bytes([0x0A, 0x00]))
+    assert first(rule_5, "z2_s1_p0") == first(rule_5, None) == "rule_5"
+
+
+def test_tcam_priority_follows_the_rule_id():
+    rules = [
+        TCAMRule(name="late", id=9, match_filter=FrameFilter(pcp=3)),
+        TCAMRule(name="early", id=2, match_filter=FrameFilter(vlanid=ValueRange(from_value=10, to_value=20))),
+    ]
+    classifier = compile_tcam(rules)
+    headers = [parse_frame(_frame(vlans=[(0x8100, pcp << 13 | vlan)])) for pcp, vlan in [(3, 15), (3, 30), (0, 10), (0, 30)]]
+    assert [classifier.rules[position].name if position is not None else None for position in classifier.classify(headers)] == [
+        "early",
+        "late",
+        "early",
+        None,
+    ]
+    assert classifier.hit_counts(headers) == {0: 2, 1: 1, None: 1}
+
+
+def test_firewall_chains():
+    firewall = Firewall(
+        default_action="drop",
+        input_rules=[
+            FirewallRule(name="ssh", action="reject", pattern=FrameFilter(protocol="tcp", dst_port=22)),
+            FirewallRule(
+                name="lan", action="accept", pattern=FrameFilter(src_ipv4=IPv4AddressEntry(address="10.0.0.0", ipv4netmask="255.255.255.0"))
+            ),
+        ],
+        output_rules=[FirewallRule(name="any", action="accept", pattern=FrameFilter(ethertype="IPv4"))],
+    )
+    headers = [parse_frame(_frame(payload=_ipv4(protocol=protocol, ports=(5000, port)))) for protocol, port in [(6, 22), (6, 80), (17, 22)]]
+    headers.append(parse_frame(_frame(ethertype=0x86DD)))
+    assert compile_firewall(firewall).decide_batch(headers) == ["reject", "accept", "accept", "drop"]
+    assert compile_firewall(firewall, "output").decide(headers[0]) == "accept"
+    assert compile_firewall(firewall, "forward").decide(headers[0]) == "drop"
+    with pytest.raises(ValueError, match="unknown firewall chain"):
+        compile_firewall(firewall, "prerouting")
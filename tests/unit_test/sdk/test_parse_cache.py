@@ -0,0 +1,156 @@
+import os
+import pickle
+
+import pytest
+from ruamel.yaml import YAML
+from ruamel.yaml.nodes import MappingNode, SequenceNode
+
+from flync.sdk.workspace import parse_cache as parse_cache_module
+from flync.sdk.workspace.document import PositionIndex
+from flync.sdk.workspace.flync_workspace import FLYNCWorkspace, WorkspaceConfiguration
+from flync.sdk.workspace.parse_cache import PARSE_CACHE_DIRNAME, ParseCache
+
+SAMPLE_YAML = "name: ecu\nports:\n  - name: p0\n    mode: base_t1\n  - name: p1\nmeta:\n  nested: {a: 1, b: [x, y]}\n"
+
+
+def _marks(node):
+    return (node.start_mark.line, node.start_mark.column, node.end_mark.line, node.end_mark.column)
+
+
+def _assert_same_tree(original, rebuilt):
+    assert type(original) is type(rebuilt)
+    assert _marks(original) == _marks(rebuilt)
+    if isinstance(original, MappingNode):
+        assert [k.value for k, _ in original.value] == [k.value for k, _ in rebuilt.value]
+        for (_, left), (_, right) in zip(original.value, rebuilt.value):
+            _assert_same_tree(left, right)
+    elif isinstance(original, SequenceNode):
+        assert len(original.value) == len(rebuilt.value)
+        for left, right in zip(original.value, rebuilt.value):
+            _assert_same_tree(left, right)
+
+
+# -- PositionIndex -------------------------------------------------------------
+
+
+def test_position_index_round_trip_keeps_kinds_keys_and_marks():
+    composed = YAML(typ="rt").compose(SAMPLE_YAML)
+    index = PositionIndex.from_node(composed)
+    _assert_same_tree(composed, index.to_node())
+
+
+def test_position_index_survives_pickle_and_is_smaller_than_the_node_tree():
+    composed = YAML(typ="rt").compose(SAMPLE_YAML)
+    index = PositionIndex.from_node(composed)
+    restored = pickle.loads(pickle.dumps(index))
+    _assert_same_tree(composed, restored.to_node())
+    assert len(pickle.dumps(index)) < len(pickle.dumps(composed))
+
+
+def test_position_index_of_empty_document_is_none():
+    assert PositionIndex.from_node(None) is None
+
+
+# -- ParseCache ----------------------------------------------------------------
+
+
+def test_parse_cache_hit_and_miss(tmp_path):
+    cache = ParseCache(max_bytes=1024 * 1024, location=tmp_path)
+    key = ParseCache.content_key(SAMPLE_YAML, True)
+    assert cache.get(key) is None
+    cache.put(key, {"name": "ecu"}, PositionIndex.from_node(YAML(typ="rt").compose(SAMPLE_YAML)))
+    ast, positions = cache.get(key)
+    assert ast == {"name": "ecu"}
+    assert positions is not None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_parse_cache_key_depends_on_text_and_compose_flag():
+    assert ParseCache.content_key("a: 1", True) != ParseCache.content_key("a: 2", True)
+    assert ParseCache.content_key("a: 1", True) != ParseCache.content_key("a: 1", False)
+
+
+def test_parse_cache_discards_corrupt_entry(tmp_path):
+    cache = ParseCache(max_bytes=1024 * 1024, location=tmp_path)
+    key = ParseCache.content_key("a: 1", False)
+    (cache.directory / f"{key}.pickle").write_bytes(b"not a pickle")
+    assert cache.get(key) is None
+    assert not (cache.directory / f"{key}.pickle").exists()
+
+
+def test_parse_cache_evicts_least_recently_used(tmp_path):
+    cache = ParseCache(max_bytes=1024 * 1024, location=tmp_path)
+    keys = [ParseCache.content_key(f"value: {i}", False) for i in range(4)]
+    for age, key in enumerate(keys):
+        cache.put(key, {"payload": "x" * 1000}, None)
+        os.utime(cache.directory / f"{key}.pickle", (1000 + age, 1000 + age))
+    # touching the oldest entry makes it the most recently used one
+    assert cache.get(keys[0]) is not None
+    entry_size = (cache.directory / f"{keys[1]}.pickle").stat().st_size
+    cache.max_bytes = entry_size * 2
+
+    assert cache.evict() == 2
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[3]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is None
+
+
+def test_parse_cache_keeps_other_generations_until_they_are_least_recently_used(tmp_path):
+    other = tmp_path / PARSE_CACHE_DIRNAME / "other_generation"
+    other.mkdir(parents=True)
+    (other / "entry.pickle").write_bytes(b"x" * 1000)
+    os.utime(other / "entry.pickle", (1000, 1000))
+    cache = ParseCache(max_bytes=1024 * 1024, location=tmp_path)
+    key = ParseCache.content_key("a: 1", False)
+    cache.put(key, {"payload": "x" * 1000}, None)
+    assert cache.evict() == 0
+    assert (other / "entry.pickle").exists()
+
+    cache.max_bytes = (cache.directory / f"{key}.pickle").stat().st_size
+    assert cache.evict() == 1
+    assert not other.exists()
+    assert cache.get(key) is not None
+
+
+def test_parse_cache_put_removes_temporary_file_on_failure(tmp_path, monkeypatch):
+    cache = ParseCache(max_bytes=1024 * 1024, location=tmp_path)
+
+    def failing_replace(*_args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(parse_cache_module.os, "replace", failing_replace)
+    cache.put(ParseCache.content_key("a: 1", False), {"a": 1}, None)
+    assert list(cache.directory.iterdir()) == []
+
+
+# -- workspace integration -----------------------------------------------------
+
+
+@pytest.fixture
+def isolated_parse_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(parse_cache_module.platformdirs, "user_cache_dir", lambda *_args, **_kwargs: str(tmp_path))
+    return tmp_path
+
+
+def test_warm_load_from_parse_cache_matches_uncached_load(isolated_parse_cache, get_flync_example_path):
+    uncached = FLYNCWorkspace.load_workspace("uncached", get_flync_example_path, WorkspaceConfiguration(map_objects=True))
+    config = WorkspaceConfiguration(map_objects=True, parse_cache=True)
+    cold = FLYNCWorkspace.load_workspace("cold", get_flync_example_path, config)
+    assert cold._parse_cache.hits == 0
+    warm = FLYNCWorkspace.load_workspace("warm", get_flync_example_path, config)
+
+    assert warm._parse_cache.misses == 0
+    assert warm._parse_cache.hits == len(warm.documents)
+    assert warm.sources == uncached.sources
+    assert set(warm.objects) == set(uncached.objects)
+    assert warm.load_errors == uncached.load_errors
+
+
+def test_parse_cache_dir_moves_the_cache(isolated_parse_cache, tmp_path_factory, get_flync_example_path):
+    location = tmp_path_factory.mktemp("own_cache")
+    config = WorkspaceConfiguration(parse_cache=True, parse_cache_dir=str(location))
+    workspace = FLYNCWorkspace.load_workspace("own_cache", get_flync_example_path, config)
+    assert workspace._parse_cache.directory.is_relative_to(location)
+    assert any(workspace._parse_cache.directory.iterdir())
+    assert not (isolated_parse_cache / PARSE_CACHE_DIRNAME).exists()
@@ -0,0 +1,110 @@
+from typing import Annotated, Optional
+
+import pytest
+
+from flync.core.annotations.reference import Reference, reference_sources
+from flync.core.base_models.base_model import FLYNCBaseModel
+from flync.sdk.context.workspace_config import ListObjectsMode, WorkspaceConfiguration
+from flync.sdk.workspace.flync_workspace import FLYNCWorkspace
+from flync.sdk.workspace.ids import ObjectId
+from flync.sdk.workspace.reference_index import ReferenceIndex
+
+
+class Target(FLYNCBaseModel):
+    name: str
+
+
+class Referrer(FLYNCBaseModel):
+    target_name: Annotated[str, Reference(source="_target")]
+    other: Optional[str] = None
+
+    _target: Optional[Target] = None
+    _other: Optional[Target] = None
+
+
+def test_reference_sources_lists_private_attr_backed_fields():
+    assert reference_sources(Referrer) == {"_target": ("target_name",)}
+    assert reference_sources(Target) == {}
+
+
+def test_bind_current_indexes_only_reference_attrs():
+    index = ReferenceIndex()
+    first, second = Target(name="a"), Target(name="b")
+    unindexed = Referrer(target_name="a")
+    unindexed._target = first
+    referrer = Referrer(target_name="a")
+    referrer._target = first
+    referrer._other = second  # not backing a Reference field
+
+    index.bind_current(referrer)
+    assert index.referrers_of(first) == [(referrer, "target_name")]
+    assert index.referrers_of(second) == []
+    assert len(index) == 1
+
+
+def test_rebinding_moves_the_entry():
+    index = ReferenceIndex()
+    first, second = Target(name="a"), Target(name="b")
+    referrer = Referrer(target_name="a")
+    referrer._target = first
+    index.bind(referrer, "target_name", first)
+    referrer._target = second
+    index.bind(referrer, "target_name", second)
+    assert index.referrers_of(first) == []
+    assert index.referrers_of(second) == [(referrer, "target_name")]
+
+    # a re-binding the index did not see is filtered out at query time
+    referrer._target = first
+    assert index.referrers_of(second) == []
+    index.bind_current(referrer)
+    assert index.referrers_of(first) == [(referrer, "target_name")]
+
+
+def test_prune_drops_entries_of_dead_models():
+    index = ReferenceIndex()
+    target = Target(name="a")
+    live, temporary = Referrer(target_name="a"), Referrer(target_name="a")
+    for referrer in (live, temporary):
+        referrer._target = target
+        index.bind(referrer, "target_name", target)
+    assert index.prune(lambda model: model is live) == 1
+    assert index.referrers_of(target) == [(live, "target_name")]
+
+
+@pytest.fixture(scope="module")
+def named_workspace(example_workspace_path):
+    config = WorkspaceConfiguration(map_objects=True, list_objects_mode=ListObjectsMode.NAME)
+    return FLYNCWorkspace.load_workspace("reference_index_ws", example_workspace_path, workspace_config=config)
+
+
+def test_workspace_index_holds_only_mapped_referrers(named_workspace):
+    ws = named_workspace
+    assert len(ws._reference_index) > 0
+    for key, target in ws._reference_index._targets.items():
+        assert key[0] in ws._model_to_object_ids
+
+
+def test_get_references_of_port(named_workspace):
+    refs = named_workspace.get_references_of(ObjectId("ecus.eth_ecu.ports.ports.eth_ecu_p1"))
+    assert refs
+    for ref in refs:
+        assert named_workspace.get_object(ref).model == "eth_ecu_p1"
+
+
+def test_bindings_made_behind_pydantic_are_indexed_after_an_update(example_workspace_path):
+    assert "__setattr__" not in FLYNCBaseModel.__dict__
+    ws = FLYNCWorkspace.load_workspace("rebind_ws", example_workspace_path, workspace_config=WorkspaceConfiguration(map_objects=True))
+    connection = ws.flync_model.topology.ethernet_topology.connections[0]
+    old = connection._ecu1_port
+    other = next(port for ecu in ws.flync_model.ecus for port in ecu.ports if port is not old and port is not connection._ecu2_port)
+    (field,) = reference_sources(type(connection))["_ecu1_port"]
+
+    # as model_construct and unpickling do, without going through __setattr__
+    connection.__pydantic_private__["_ecu1_port"] = other
+    assert (connection, field) not in ws._reference_index.referrers_of(other)
+    with ws._tracking_references():
+        with ws._tracking_references():
+            pass
+        assert (connection, field) not in ws._reference_index.referrers_of(other)
+    assert (connection, field) in ws._reference_index.referrers_of(other)
+    assert (connection, field) not in ws._reference_index.referrers_of(old)
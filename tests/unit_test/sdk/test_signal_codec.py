@@ -0,0 +1,215 @@
+import random
+
+import cantools
+import pytest
+
+from flync.model.flync_4_signal.frame import CANFDFrame
+from flync.model.flync_4_signal.pdu import ContainedPDURef, ContainerPDU, ContainerPDUHeader, MultiplexedPDU, MuxGroup, PDUInstance, StandardPDU
+from flync.model.flync_4_signal.signal import Signal, SignalInstance
+from flync.sdk.codec import SignalCodec, compile_frame, compile_pdu
+from flync_converter.converters.dbc_converter import write_dbc_files
+
+
+def _instance(name, bit_position, bit_length, data_type="uint16", endianness="LE", **signal):
+    return SignalInstance(
+        bit_position=bit_position, endianness=endianness, signal=Signal(name=name, bit_length=bit_length, data_type=data_type, **signal)
+    )
+
+
+def _random_layout(rng, length):
+    """Non-overlapping integer signals of random width, position and byte order covering a ``length`` byte payload."""
+    instances, position = [], rng.randrange(3)
+    while True:
+        width = rng.randint(1, 64)
+        if position + width > length * 8:
+            return instances
+        data_type = rng.choice(["uint64", "int64"]) if width > 1 else "uint8"
+        scaling = rng.choice([{}, {"factor": 0.5, "offset": -10.0}])
+        instances.append(_instance(f"s{len(instances)}", position, width, data_type, rng.choice(["LE", "BE"]), **scaling))
+        position += width + rng.randrange(4)
+
+
+def _cantools_message(pdu):
+    """The same layout as a cantools message; cantools counts big-endian start bits in DBC sawtooth order."""
+    signals = []
+    for instance in pdu.signals:
+        start, big_endian = instance.bit_position, instance.endianness == "BE"
+        signals.append(
+            cantools.database.can.Signal(
+                name=instance.signal.name,
+                start=8 * (start // 8) + 7 - start % 8 if big_endian else start,
+                length=instance.signal.bit_length,
+                byte_order="big_endian" if big_endian else "little_endian",
+                is_signed=instance.signal.data_type.is_signed_integer(),
+                conversion=cantools.database.conversion.LinearConversion(
+                    scale=instance.signal.factor, offset=instance.signal.offset, is_float=False
+                ),
+            )
+        )
+    return cantools.database.can.Message(frame_id=1, name=pdu.name, length=pdu.length, signals=signals, strict=False)
+
+
+def test_decode_and_encode_agree_with_cantools():
+    rng = random.Random(2024)
+    for _ in range(50):
+        pdu = StandardPDU(name="Random", length=16, signals=_random_layout(rng, 16))
+        plan, message = compile_pdu(pdu), _cantools_message(pdu)
+        payload = bytes(rng.randrange(256) for _ in range(16))
+        assert plan.decode(payload, physical=False) == message.decode(payload, decode_choices=False, scaling=False)
+        assert plan.decode(payload) == pytest.approx(message.decode(payload, decode_choices=False))
+        assert plan.encode(plan.decode(payload, physical=False), payload=payload, physical=False) == payload
+
+
+def test_typed_and_scaled_signals():
+    pdu = StandardPDU(
+        name="Typed",
+        length=16,
+        signals=[
+            _instance("speed", 0, 16, factor=0.01, unit="km/h"),
+            _instance("temperature", 16, 8, "int8", offset=-40.0),
+            _instance("torque", 24, 12, "int16", "BE"),
+            _instance("ratio", 40, 32, "float32"),
+            _instance("tag", 72, 32, "char"),
+            _instance("blob", 104, 16, "bytearray", "BE"),
+        ],
+    )
+    plan = compile_pdu(pdu)
+    values = {"speed": 123.45, "temperature": -12.0, "torque": -1000, "ratio": 0.25, "tag": "AB", "blob": b"\x01\x02"}
+    payload = plan.encode(values)
+    assert payload[:2] == (12345).to_bytes(2, "little")
+    assert payload[3:5] == ((-1000 & 0xFFF) << 4).to_bytes(2, "big")
+    assert payload[9:15] == b"AB\x00\x00\x01\x02"
+    assert plan.decode(payload) == pytest.approx(values)
+    assert plan.decode(payload, physical=False)["speed"] == 12345
+
+    with pytest.raises(ValueError, match="outside the raw range"):
+        plan.encode({"temperature": 100.0})
+    with pytest.raises(KeyError, match="unknown"):
+        plan.encode({"unknown": 1})
+
+
+def _multiplexed_layout():
+    pdus = {
+        "Gear": StandardPDU(name="Gear", length=1, signals=[_instance("gear", 0, 8, "uint8")]),
+        "Slip": StandardPDU(name="Slip", length=2, signals=[_instance("slip", 0, 16, factor=0.5)]),
+        "Counter": StandardPDU(name="Counter", length=1, signals=[_instance("counter", 0, 4, "uint8")]),
+    }
+    pdus["Status"] = MultiplexedPDU(
+        name="Status",
+        length=4,
+        selector_signal=_instance("mux", 0, 4, "uint8"),
+        static_group=PDUInstance(pdu_ref="Counter", bit_position=4),
+        mux_groups=[
+            MuxGroup(selector_value=0, pdu=PDUInstance(pdu_ref="Gear", bit_position=8)),
+            MuxGroup(selector_value=1, pdu=PDUInstance(pdu_ref="Slip", bit_position=8)),
+            MuxGroup(selector_value=2, pdu=PDUInstance(pdu_ref="Gear", bit_position=16)),
+        ],
+    )
+    return pdus
+
+
+def test_multiplexed_pdu_decodes_the_selected_group():
+    pdus = _multiplexed_layout()
+    plan = compile_pdu(pdus["Status"], pdus)
+    assert plan.names == ["mux", "counter", "gear", "slip"]
+
+    assert plan.decode(bytes([0x30, 7, 9, 0])) == {"mux": 0, "counter": 3, "gear": 7}
+    assert plan.decode(bytes([0x31, 0x10, 0x00, 0])) == {"mux": 1, "counter": 3, "slip": 8.0}
+    assert plan.decode(bytes([0x02, 7, 9, 0])) == {"mux": 2, "counter": 0, "gear": 9}
+    assert plan.encode({"mux": 2, "gear": 5}) == bytes([0x02, 0, 5, 0])
+    assert plan.encode({"gear": 5}, payload=bytes([0x02, 0, 0, 0])) == bytes([0x02, 0, 5, 0])
+    with pytest.raises(ValueError, match="not active"):
+        plan.encode({"mux": 1, "gear": 5})
+
+
+def test_container_pdu_slots():
+    pdus = {
+        "A": StandardPDU(name="A", length=2, signals=[_instance("a", 0, 16)]),
+        "B": StandardPDU(name="B", length=1, signals=[_instance("b", 0, 8, "int8")]),
+    }
+    container = ContainerPDU(
+        name="Container",
+        length=16,
+        pdu_id=1,
+        header=ContainerPDUHeader(id_length_bits=16, length_field_bits=8),
+        contained_pdus=[ContainedPDURef(header_id=0x10, pdu_ref="A"), ContainedPDURef(header_id=0x20, pdu_ref="B")],
+    )
+    plan = compile_pdu(container, pdus)
+    payload = plan.encode({"a": 0x1234, "b": -2})
+    assert payload == bytes.fromhex("0010023412" "002001fe") + bytes(7)
+    assert plan.decode(payload) == {"a": 0x1234, "b": -2}
+    assert plan.decode(bytes.fromhex("002001fe")) == {"b": -2}
+
+
+def test_layout_errors():
+    pdu = StandardPDU(name="P", length=2, signals=[_instance("s", 0, 16)])
+    frame = CANFDFrame(name="F", length=2, can_id=1, id_format="standard_11bit", packed_pdus=[PDUInstance(pdu_ref="P", bit_position=8)])
+    with pytest.raises(ValueError, match="beyond the 16 bits"):
+        compile_frame(frame, {"P": pdu})
+    with pytest.raises(ValueError, match="unknown PDU 'Q'"):
+        compile_frame(frame.model_copy(update={"packed_pdus": [PDUInstance(pdu_ref="Q")]}), {"P": pdu})
+    twice = CANFDFrame(
+        name="F", length=8, can_id=1, id_format="standard_11bit", packed_pdus=[PDUInstance(pdu_ref="P"), PDUInstance(pdu_ref="P", bit_position=16)]
+    )
+    with pytest.raises(ValueError, match="placed more than once"):
+        compile_frame(twice, {"P": pdu})
+
+
+def test_batch_matches_single_payload_decoding():
+    np = pytest.importorskip("numpy")
+    rng = random.Random(7)
+    pdus = _multiplexed_layout()
+    for plan in [compile_pdu(StandardPDU(name="Random", length=16, signals=_random_layout(rng, 16))) for _ in range(20)] + [
+        compile_pdu(pdus["Status"], pdus)
+    ]:
+        payloads = np.frombuffer(rng.randbytes(500 * plan.length), dtype=np.uint8).reshape(500, plan.length).copy()
+        if plan.name == "Status":
+            payloads[:, 0] &= 0xF3  # keep the selector within the declared groups
+        for physical in (True, False):
+            columns = plan.decode_batch(payloads, physical)
+            for row in range(len(payloads)):
+                decoded = plan.decode(payloads[row].tobytes(), physical)
+                assert {name: column[row] for name, column in columns.items() if column[row] is not np.ma.masked} == pytest.approx(decoded)
+        assert np.array_equal(plan.encode_batch(plan.decode_batch(payloads, False), physical=False, base=payloads), payloads)
+
+
+def test_batch_encoding_of_mux_groups_and_byte_signals():
+    np = pytest.importorskip("numpy")
+    pdus = _multiplexed_layout()
+    plan = compile_pdu(pdus["Status"], pdus)
+    payloads = plan.encode_batch({"mux": [0, 1, 2], "gear": [4, 0, 6], "slip": np.ma.masked_array([0.0, 8.0, 0.0], mask=[True, False, True])})
+    assert [bytes(row) for row in payloads] == [bytes([0x00, 4, 0, 0]), bytes([0x01, 0x10, 0, 0]), bytes([0x02, 0, 6, 0])]
+    decoded = plan.decode_batch(payloads)
+    assert decoded["gear"].tolist() == [4, None, 6]
+    assert decoded["slip"].tolist() == [None, 8.0, None]
+
+    text = compile_pdu(StandardPDU(name="Text", length=4, signals=[_instance("tag", 0, 32, "char")]))
+    encoded = text.encode_batch({"tag": ["AB", "WXYZ"]})
+    assert [bytes(row) for row in encoded] == [b"AB\x00\x00", b"WXYZ"]
+    assert text.decode_batch(encoded)["tag"].tolist() == [b"AB", b"WXYZ"]
+    with pytest.raises(ValueError, match="outside the raw range"):
+        plan.encode_batch({"mux": [16]})
+
+
+def test_codec_decodes_example_frames_like_the_dbc_export(loaded_workspace_without_object_map, tmp_path):
+    model = loaded_workspace_without_object_map.flync_model
+    codec = SignalCodec(model)
+    write_dbc_files(model, str(tmp_path))
+    rng = random.Random(1)
+    for bus in model.communication.channels.can_buses:
+        database = cantools.database.load_file(str(tmp_path / f"{bus.name}.dbc"), strict=False)
+        for frame in bus.frames:
+            plan = codec.frame(bus.name, frame.can_id)
+            assert codec.frame(bus.name, frame.can_id) is plan
+            if any(f.conditions for f in plan.fields):
+                continue  # the DBC export does not mark multiplexers, so cantools cannot decode those frames
+            message = database.get_message_by_frame_id(frame.can_id)
+            numeric = [f.name for f in plan.fields if f.kind not in ("char", "bytes")]
+            for _ in range(20):
+                payload = rng.randbytes(frame.length)
+                expected = message.decode(payload, decode_choices=False)
+                assert {name: value for name, value in plan.decode(payload).items() if name in numeric} == pytest.approx(
+                    {name: value for name, value in expected.items() if name in numeric}
+                )
+    with pytest.raises(KeyError, match="no frame"):
+        codec.frame("PowertrainCAN", 0x7FF)
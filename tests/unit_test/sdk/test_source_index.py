@@ -0,0 +1,75 @@
+import random
+
+from flync.sdk.workspace.ids import ObjectId
+from flync.sdk.workspace.source import Position, SourceRef, get_range
+from flync.sdk.workspace.source_index import SourceIndex
+
+URI = "ecus/ecu.flync.yaml"
+
+
+def _src(start_line, start_character, end_line, end_character, uri=URI):
+    return SourceRef(uri, get_range(start_line, start_character, end_line, end_character))
+
+
+def _index(entries):
+    index = SourceIndex()
+    for oid, src in entries.items():
+        index.add(ObjectId(oid), src)
+    return index
+
+
+def _contains(src, line, character):
+    r = src.range
+    return (r.start.line, r.start.character) <= (line, character) <= (r.end.line, r.end.character)
+
+
+NESTED = {
+    "ecu.ports.0.name": _src(3, 11, 3, 14),
+    "ecu.ports.0": _src(3, 5, 5, 5),
+    "ecu.ports": _src(2, 1, 7, 1),
+    "ecu": _src(1, 1, 9, 1),
+    "ecu.ports.1": _src(5, 5, 7, 1),
+    "other": _src(1, 1, 9, 1, uri="ecus/other.flync.yaml"),
+}
+
+
+def test_point_query_returns_innermost_first():
+    index = _index(NESTED)
+    assert index.at(URI, Position(3, 12)) == ["ecu.ports.0.name", "ecu.ports.0", "ecu.ports", "ecu"]
+    # closed ranges: the shared boundary belongs to both siblings, the later-starting one first
+    assert index.at(URI, Position(5, 5)) == ["ecu.ports.1", "ecu.ports.0", "ecu.ports", "ecu"]
+    assert index.at(URI, Position(8, 1)) == ["ecu"]
+    assert index.at(URI, Position(10, 1)) == []
+    assert index.at("missing.flync.yaml", Position(1, 1)) == []
+
+
+def test_range_query_returns_overlapping_objects():
+    index = _index(NESTED)
+    assert index.overlapping(URI, Position(5, 2), Position(6, 1)) == ["ecu.ports.1", "ecu.ports.0", "ecu.ports", "ecu"]
+    assert index.overlapping(URI, Position(7, 2), Position(12, 1)) == ["ecu"]
+
+
+def test_changes_rebuild_only_on_next_query():
+    index = _index(NESTED)
+    assert index.at(URI, Position(3, 12))[0] == "ecu.ports.0.name"
+    index.discard(ObjectId("ecu.ports.0.name"), NESTED["ecu.ports.0.name"])
+    assert index.at(URI, Position(3, 12))[0] == "ecu.ports.0"
+    index.add(ObjectId("ecu.ports.0"), _src(4, 1, 4, 9), previous=NESTED["ecu.ports.0"])
+    assert index.at(URI, Position(3, 12)) == ["ecu.ports", "ecu"]
+    assert index.objects_in(URI) == ["ecu.ports", "ecu", "ecu.ports.1", "ecu.ports.0"]
+    index.clear()
+    assert index.objects_in(URI) == []
+
+
+def test_matches_linear_scan():
+    rng = random.Random(7)
+    entries = {}
+    for i in range(400):
+        start = (rng.randint(0, 60), rng.randint(0, 20))
+        end = max(start, (rng.randint(0, 60), rng.randint(0, 20)))
+        entries[f"obj{i}"] = _src(*start, *end)
+    index = _index(entries)
+    for line in range(0, 62):
+        for character in range(0, 22, 3):
+            expected = {oid for oid, src in entries.items() if _contains(src, line, character)}
+            assert set(index.at(URI, Position(line, character))) == expected
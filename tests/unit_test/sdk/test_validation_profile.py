@@ -0,0 +1,113 @@
+import json
+import pickle
+import sys
+import tracemalloc
+
+import pytest
+from pydantic import BaseModel, ValidationError, model_validator
+
+from flync.core.utils.validation_profile import ValidationProfile, active_profile, profile_scope
+from flync.sdk.context.workspace_config import WorkspaceConfiguration
+from flync.sdk.helpers.validation_helpers import validate_workspace
+
+
+class _Checked(BaseModel):
+    value: int
+
+    @model_validator(mode="after")
+    def reject_negative(self):
+        if self.value < 0:
+            raise ValueError("negative")
+        return self
+
+
+@pytest.fixture(scope="module")
+def example_profile(get_flync_example_path):
+    profile = ValidationProfile()
+    validate_workspace(get_flync_example_path, profile=profile)
+    return profile
+
+
+def _names(profile, kind):
+    return {entry.name for entry in profile.sorted_entries(kind)}
+
+
+def test_profile_records_phases_documents_and_validators(example_profile):
+    assert {"parse documents", "load", "validation round"} <= _names(example_profile, "phase")
+    assert "." in _names(example_profile, "document")
+    assert {"FLYNCModel.validate_multicast_paths", "FLYNCModel.validate_forwarders"} <= _names(example_profile, "validator")
+    load = example_profile.entries[("phase", "load")]
+    assert load.calls == 1
+    assert 0 < load.seconds <= example_profile.seconds
+    assert all(entry.peak_bytes is None for entry in example_profile.entries.values())
+
+
+def test_sorted_entries_are_slowest_first(example_profile):
+    seconds = [entry.seconds for entry in example_profile.sorted_entries()]
+    assert seconds == sorted(seconds, reverse=True)
+
+
+def test_profile_is_released_after_the_validation(example_profile):
+    assert active_profile() is None
+    assert sys.monitoring.get_tool(sys.monitoring.PROFILER_ID) is None
+    # the profiles of parallel-validation workers are pickled back to the loading process
+    assert pickle.loads(pickle.dumps(example_profile)).entries == example_profile.entries
+
+
+def test_profile_json_lists_every_entry(example_profile, tmp_path):
+    path = tmp_path / "profile.json"
+    example_profile.write_json(path)
+    data = json.loads(path.read_text())
+    assert len(data["entries"]) == len(example_profile.entries)
+    assert data["entries"][0] == vars(example_profile.sorted_entries()[0])
+
+
+def test_parallel_validation_merges_the_worker_profiles(get_flync_example_path, example_profile):
+    profile = ValidationProfile()
+    config = WorkspaceConfiguration(parallel_validation=True, validation_workers=2)
+    validate_workspace(get_flync_example_path, config, profile=profile)
+    assert _names(profile, "document") == _names(example_profile, "document")
+    assert _names(profile, "validator") == _names(example_profile, "validator")
+
+
+def test_raising_validator_closes_its_scope():
+    profile = ValidationProfile()
+    with profile.activate(), profile_scope("phase", "outer"):
+        _Checked(value=1)
+        with pytest.raises(ValidationError):
+            _Checked(value=-1)
+        assert len(profile._stack) == 1
+    assert profile.entries[("validator", "_Checked.reject_negative")].calls == 2
+    assert profile.entries[("phase", "outer")].calls == 1
+
+
+def test_memory_peaks_are_recorded_per_scope():
+    profile = ValidationProfile(trace_memory=True)
+    with profile.activate():
+        with profile_scope("phase", "allocate"):
+            data = [bytearray(1024) for _ in range(1000)]
+            del data
+        with profile_scope("phase", "idle"):
+            pass
+    assert not tracemalloc.is_tracing()
+    assert profile.entries[("phase", "allocate")].peak_bytes >= 1000 * 1024
+    assert profile.entries[("phase", "idle")].peak_bytes < 1000 * 1024
+
+
+def test_profile_without_a_free_profiler_slot_keeps_phases(caplog):
+    monitoring = sys.monitoring
+    monitoring.use_tool_id(monitoring.PROFILER_ID, "other profiler")
+    try:
+        profile = ValidationProfile()
+        with profile.activate(), profile_scope("phase", "outer"):
+            _Checked(value=1)
+    finally:
+        monitoring.free_tool_id(monitoring.PROFILER_ID)
+    assert "Another profiler is active" in caplog.text
+    assert ("phase", "outer") in profile.entries
+    assert ("validator", "_Checked.reject_negative") not in profile.entries
+
+
+def test_profile_scope_without_profile_is_a_no_op():
+    with profile_scope("phase", "unprofiled"):
+        assert active_profile() is None